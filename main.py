@@ -4,19 +4,19 @@ import datetime
 import os
 import sys
 from dotenv import load_dotenv
-from today_vn_news.scraper import scrape_and_save
+from today_vn_news.scraper import load_raw_yaml, scrape_and_save
 from today_vn_news.translator import (
     translate_and_save,
     translate_all_sources_parallel,
     save_translated_yaml,
-    translate_weather_condition,
+    build_safety_items,
 )
 from today_vn_news.tts import yaml_to_tts, TTSEngine
 from today_vn_news.engine import synthesize_video
 from today_vn_news.uploader import upload_video
 from today_vn_news.video_source.resolver import VideoSourceResolver
 from today_vn_news.video_source.archiver import MediaArchiver
-from today_vn_news.config import VideoConfig
+from today_vn_news.config import VideoConfig, ScraperConfig
 from today_vn_news.notifications.pipeline_status import (
     PipelineStatus,
     ALL_STEPS,
@@ -36,6 +36,11 @@ from today_vn_news.timestamp import (
     assert_exists_done,
 )
 from today_vn_news.exceptions import PipelineRestartError
+from today_vn_news.retry import reset_retry_budgets, retry_budget_summaries
+from today_vn_news.scraping.replay import http_replay, parse_latency, read_archive_date
+from today_vn_news.scraping.dedup import dedup_scraped_data, save_dedup_report
+from today_vn_news.scraping.seen_store import SeenStore
+from today_vn_news.scraping.registry import SAFETY_SECTION
 
 # .env 파일 로드
 load_dotenv()
@@ -241,12 +246,16 @@ async def main():
     # 파이프라인 상태 추적
     status = PipelineStatus()
 
+    # 실행당 재시도 예산 초기화
+    reset_retry_budgets()
+
     # 명령줄 인자 파싱
     if len(sys.argv) > 1:
         if sys.argv[1] in ["--help", "-h"]:
             print("""
 사용법:
   python main.py [날짜] [--tts=edge|qwen] [--voice=음성명] [--instruct="설명"] [--language=언어]
+                 [--record=아카이브] [--replay=아카이브] [--replay-latency=초|recorded]
 
 인자:
   날짜          처리할 날짜 (YYMMDD 형식, 생략 시 오늘 날짜)
@@ -257,6 +266,9 @@ async def main():
   --language    언어 (Qwen3-TTS 만 사용, 기본값: Korean)
   --instruct    음성 스타일 설명 (Qwen3-TTS VoiceDesign 만 사용)
                 예: "따뜻한 아나운서 음성", "밝은 여성 음성", "낮은 남성 음성"
+  --record      스크래핑 HTTP 요청/응답을 압축 아카이브로 저장 (.jsonl.gz)
+  --replay      네트워크 대신 녹화된 아카이브로 스크래핑 (녹화 기준일 사용)
+  --replay-latency  재생 시 요청당 지연 (초 단위 숫자 또는 recorded: 녹화된 소요 시간)
 
 예시:
   python main.py                        # 오늘 날짜, Edge TTS (기본)
@@ -265,6 +277,8 @@ async def main():
   python main.py --tts=qwen --voice=Vivian  # Qwen3-TTS Vivian 음성
   python main.py --tts=qwen --voice=Sohee --instruct="따뜻한 아나운서 음성"
   python main.py --tts=qwen --voice=Ryan --language=English
+  python main.py --record=data/replay/260319.jsonl.gz
+  python main.py --replay=data/replay/260319.jsonl.gz --replay-latency=recorded
             """)
             sys.exit(0)
 
@@ -291,6 +305,9 @@ async def main():
     tts_voice = None
     tts_language = "korean"
     tts_instruct = None
+    record_path = None
+    replay_path = None
+    replay_latency = None
 
     # 명령줄 인자에서 TTS 엔진, 음성, 언어, instruct 파싱 (전체 인자 스캔)
     for arg in sys.argv[1:]:
@@ -302,6 +319,12 @@ async def main():
             tts_language = arg.split("=")[1]
         elif arg.startswith("--instruct="):
             tts_instruct = arg.split("=", 1)[1]  # = 이후 전체를 가져옴
+        elif arg.startswith("--record="):
+            record_path = arg.split("=", 1)[1]
+        elif arg.startswith("--replay="):
+            replay_path = arg.split("=", 1)[1]
+        elif arg.startswith("--replay-latency="):
+            replay_latency = parse_latency(arg.split("=", 1)[1])
 
     # TTS 엔진 설정
     if tts_engine_name == "qwen":
@@ -320,8 +343,18 @@ async def main():
     print(f"\n📹 Media 경로: {config.media_mount_path}")
 
     # 기준일 설정 (ISO 형식)
-    today_iso = datetime.datetime.now().strftime("%Y-%m-%d")
-    today_display = datetime.datetime.now().strftime("%Y년 %m월 %d일")
+    run_date = datetime.datetime.now()
+
+    # 재생 모드: 산출물 경로/완료 마커/기준일 모두 녹화 기준일 사용 (오늘 파일 덮어쓰기 방지)
+    replay_date = read_archive_date(replay_path) if replay_path else None
+    if replay_date:
+        yymmdd = normalize_timestamp(replay_date)
+        validate_yymmdd(yymmdd)
+        run_date = datetime.datetime.strptime(yymmdd, "%y%m%d")
+        print(f"\n⏪ 재생 기준일: {replay_date} ({yymmdd})")
+
+    today_iso = run_date.strftime("%Y-%m-%d")
+    today_display = run_date.strftime("%Y년 %m월 %d일")
 
     yaml_path = f"{data_dir}/{yymmdd}.yaml"
 
@@ -334,11 +367,24 @@ async def main():
             print("[+] 1단계: 스크래핑 완료 파일이 존재합니다. 건너뜁니다.")
             # 기존 스크래핑 결과 로드
             raw_yaml_path = f"{data_dir}/{yymmdd}_raw.yaml"
-            from today_vn_news.translator import load_yaml
-            scraped_data = load_yaml(raw_yaml_path)
+            scraped_data = load_raw_yaml(raw_yaml_path)
         else:
             raw_yaml_path = f"{data_dir}/{yymmdd}_raw.yaml"
-            scraped_data = scrape_and_save(today_iso, raw_yaml_path)
+
+            # HTTP 녹화/재생 모드 (재생 시 녹화 기준일로 필터링)
+            if replay_path:
+                http_replay.start_replay(replay_path, latency=replay_latency)
+            elif record_path:
+                http_replay.start_recording(record_path, date_str=today_iso)
+
+            try:
+                # 소스별 완료 마커: 재실행 시 실패/시간 초과 소스만 다시 수집 (녹화/재생 시 미사용)
+                checkpoint_prefix = None if (replay_path or record_path) else f"{data_dir}/{yymmdd}"
+                scraped_data = scrape_and_save(
+                    today_iso, raw_yaml_path, checkpoint_prefix=checkpoint_prefix
+                )
+            finally:
+                http_replay.stop()
             create_done(yymmdd, "scraper")
             status.steps[STEP_SCRAPE] = True
 
@@ -355,42 +401,31 @@ async def main():
             # 선행 단계 확인
             assert_exists_done(yymmdd, "scraper")
 
+            # 최근 방송된 기사 제외 (이전 스크래핑 결과로 재시작한 경우 포함)
+            scraper_config = ScraperConfig.from_yaml()
+            seen_store = None
+            if scraper_config.seen_enabled:
+                seen_store = SeenStore(scraper_config.seen_path, scraper_config.seen_window_days)
+                scraped_data = seen_store.filter_scraped(scraped_data, today_iso)
+
+            # 소스 간 중복 기사 제거 (같은 기사를 한 번만 번역/낭독)
+            if scraper_config.dedup_enabled:
+                scraped_data, dedup_report = dedup_scraped_data(
+                    scraped_data, max_distance=scraper_config.dedup_max_distance
+                )
+                save_dedup_report(dedup_report, f"{data_dir}/{yymmdd}_dedup.yaml")
+                print(f"[+] {dedup_report.summary()}")
+
             # 안전 및 기상 관제는 별도 처리
             safety_section = None
-            if "안전 및 기상 관제" in scraped_data:
-                safety_items = []
-                for item in scraped_data["안전 및 기상 관제"]:
-                    if item.get("name") == "기상":
-                        condition = item.get("condition", "")
-                        translated_condition = translate_weather_condition(condition)
-                        temp = item.get("temp", "")
-                        humidity = item.get("humidity", "")
-                        content = f"{translated_condition}, 온도 {temp}, 습도 {humidity}"
-                        safety_items.append({
-                            "title": f"기상 (NCHMF)",
-                            "content": content,
-                            "url": item["url"]
-                        })
-                    elif item.get("name") == "공기":
-                        safety_items.append({
-                            "title": f"공기질 (IQAir) - AQI {item.get('aqi', '')}",
-                            "content": item["content"],
-                            "url": item["url"]
-                        })
-                    elif item.get("name") == "지진":
-                        safety_items.append({
-                            "title": item["title"],
-                            "content": item["content"],
-                            "url": item["url"]
-                        })
-
-                if safety_items:
-                    safety_section = {
-                        "id": "1",
-                        "name": "안전 및 기상 관제",
-                        "priority": "P0",
-                        "items": safety_items
-                    }
+            safety_items = build_safety_items(scraped_data.get(SAFETY_SECTION, []))
+            if safety_items:
+                safety_section = {
+                    "id": "1",
+                    "name": SAFETY_SECTION,
+                    "priority": "P0",
+                    "items": safety_items
+                }
 
             # 병렬 번역 실행
             translated_sections = await translate_all_sources_parallel(scraped_data, today_display)
@@ -410,6 +445,11 @@ async def main():
                 raise RuntimeError("YAML 저장 실패")
 
             print(f"\n[+] 번역 완료: {len(translated_sections)}개 섹션")
+
+            # 오늘 방송할 기사 기록 (다음 실행부터 제외)
+            if seen_store:
+                seen_store.mark_aired(scraped_data, today_iso)
+                seen_store.close()
             create_done(yymmdd, "translator")
             status.steps[STEP_TRANSLATE] = True
 
@@ -457,6 +497,9 @@ async def main():
         print(f"\n[!] 파이프라인 오류: {e}")
 
     finally:
+        for summary in retry_budget_summaries():
+            print(f"[*] {summary}")
+
         # 7단계: Pushover 알림 (무조건 실행)
         notifier = PushoverNotifier.from_env_or_none()
         if notifier:
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""RSS 파싱 마이크로벤치마크 (기존 함수별 루프 vs 스트리밍 파서)
+
+사용법:
+  python scripts/bench_feed_parser.py [--items=60] [--repeat=200] [--feed=path/to/feed.rss]
+
+- legacy: 기존 scrape_* 함수의 ET.fromstring + channel/item 탐색 + pubDate 정규식 루프
+- stream: today_vn_news.scraping.feed.parse_feed (iterparse, 조기 종료)
+"""
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from today_vn_news.scraping.feed import parse_feed  # noqa: E402
+
+TARGET = datetime(2026, 2, 11, 23, 0)
+
+
+def make_feed(n_items: int) -> bytes:
+    """최신순 합성 피드 (시간당 1건, 기준일 23시부터 역순)"""
+    items = []
+    for i in range(n_items):
+        pub = TARGET - timedelta(hours=i)
+        items.append(
+            f"<item><title>Tin số {i}</title>"
+            f"<link>https://vnexpress.net/tin-{i}.html</link>"
+            f"<description><![CDATA[<img src='x.jpg'/>Nội dung bài viết số {i} " + "lorem ipsum " * 30 + "]]></description>"
+            f"<pubDate>{pub.strftime('%a, %d %b %Y %H:%M:%S')} +0700</pubDate></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Feed</title>'
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def legacy_parse(body: bytes, limit: int):
+    """기존 scrape_vnexpress 등의 파싱 루프 (items[:limit] 후 당일 필터)"""
+    target_date_short = TARGET.strftime("%d %b %Y")
+    root = ET.fromstring(body.decode("utf-8"))
+    channel = None
+    for child in root:
+        if child.tag == "channel" or child.tag.endswith("channel"):
+            channel = child
+            break
+    results = []
+    items = [c for c in channel if c.tag == "item" or c.tag.endswith("item")]
+    for item in items[:limit]:
+        pub_date_elem = item.find(".//pubDate")
+        if pub_date_elem is None or not pub_date_elem.text:
+            continue
+        match = re.search(r"\d{2} \w{3} \d{4}", pub_date_elem.text.strip())
+        if not match or match.group(0) != target_date_short:
+            continue
+        title = item.find(".//title").text
+        link = item.find(".//link").text
+        description = item.find(".//description").text
+        results.append((title, link, re.sub(r"<[^>]+>", "", description).strip()[:200]))
+    return results
+
+
+def stream_parse(body: bytes, limit: int):
+    return parse_feed(body, TARGET.date(), limit=limit)
+
+
+def bench(func, body: bytes, limit: int, repeat: int) -> float:
+    func(body, limit)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(body, limit)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    args = dict(a.lstrip("-").split("=", 1) for a in sys.argv[1:] if "=" in a)
+    n_items = int(args.get("items", 60))
+    repeat = int(args.get("repeat", 200))
+    body = Path(args["feed"]).read_bytes() if "feed" in args else make_feed(n_items)
+
+    print(f"피드 크기: {len(body) / 1024:.1f} KB, 반복: {repeat}회")
+    print(f"{'limit':>6} {'legacy(ms)':>12} {'stream(ms)':>12} {'speedup':>9}")
+    for limit in (2, 5, 20):
+        legacy_ms = bench(legacy_parse, body, limit, repeat)
+        stream_ms = bench(stream_parse, body, limit, repeat)
+        print(f"{limit:>6} {legacy_ms:>12.3f} {stream_ms:>12.3f} {legacy_ms / stream_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""HTML 스크래퍼 소스별 파싱 시간 비교 (html.parser 전체 파싱 vs 빠른 백엔드 + 부분 파싱)
+
+사용법:
+  python scripts/bench_html_parser.py                 # 홈페이지 실시간 다운로드 후 측정
+  python scripts/bench_html_parser.py --dir=pages/    # 저장된 페이지 사용 (nhandan.html 등)
+  python scripts/bench_html_parser.py --repeat=20
+"""
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+
+from today_vn_news.logger import logger  # noqa: E402
+from today_vn_news.http_client import DEFAULT_USER_AGENT  # noqa: E402
+from today_vn_news.scraping.html_parser import DEFAULT_BACKEND, parse_first_match, parse_html  # noqa: E402
+from today_vn_news import scraper  # noqa: E402
+
+# (키, 소스 이름, URL, 부분 파싱 함수)
+SOURCES = [
+    ("nhandan", "Nhân Dân", "https://nhandan.vn/",
+     lambda html: parse_html(html, parse_only=scraper.NHANDAN_STRAINER)),
+    ("tuoitre", "Tuổi Trẻ", "https://tuoitre.vn/",
+     lambda html: parse_html(html)),
+    ("thanhnien", "Thanh Niên", "https://thanhnien.vn/",
+     lambda html: parse_first_match(html, scraper.THANHNIEN_STRAINERS)),
+    ("saigontimes", "The Saigon Times", "https://thesaigontimes.vn/",
+     lambda html: parse_first_match(html, scraper.SAIGONTIMES_STRAINERS)),
+    ("nchmf", "NCHMF", "https://nchmf.gov.vn/kttvsiteE/vi-VN/1/vung-tau-tp-ho-chi-minh-w31.html",
+     lambda html: parse_html(html, parse_only=scraper.NCHMF_STRAINER)),
+]
+
+
+def load_page(key: str, url: str, page_dir: Path | None) -> str | None:
+    if page_dir:
+        path = page_dir / f"{key}.html"
+        return path.read_text(encoding="utf-8") if path.exists() else None
+    try:
+        response = requests.get(url, headers={"User-Agent": DEFAULT_USER_AGENT}, timeout=15)
+        response.raise_for_status()
+        return response.text
+    except requests.RequestException as e:
+        print(f"  [!] {key} 다운로드 실패: {e}")
+        return None
+
+
+def bench(func, html: str, repeat: int) -> float:
+    func(html)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    args = dict(a.lstrip("-").split("=", 1) for a in sys.argv[1:] if "=" in a)
+    repeat = int(args.get("repeat", 10))
+    page_dir = Path(args["dir"]) if "dir" in args else None
+
+    # 파싱 시간 로그 억제 (표만 출력)
+    logger.setLevel(logging.WARNING)
+
+    print(f"백엔드: {DEFAULT_BACKEND}, 반복: {repeat}회")
+    print(f"{'소스':<18} {'크기(KB)':>9} {'html.parser(ms)':>16} {'신규(ms)':>10} {'배율':>7}")
+    for key, name, url, fast_parse in SOURCES:
+        html = load_page(key, url, page_dir)
+        if html is None:
+            continue
+        baseline_ms = bench(lambda h: BeautifulSoup(h, "html.parser"), html, repeat)
+        fast_ms = bench(fast_parse, html, repeat)
+        print(
+            f"{name:<18} {len(html.encode('utf-8')) / 1024:>9.1f} "
+            f"{baseline_ms:>16.2f} {fast_ms:>10.2f} {baseline_ms / fast_ms:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""녹화된 홈페이지로 HTML 파싱·추출 비교 (수집 스레드 인라인 vs 프로세스 풀)
+
+사용법:
+  python scripts/bench_parse_pool.py --replay=data/replay/260211.jsonl.gz [--processes=4] [--repeat=5]
+  python scripts/bench_parse_pool.py --date=260211 [--processes=4]     # 원본 페이지 보관소(data/raw_pages)
+
+- 레지스트리 HTML 소스(Nhân Dân, Tuổi Trẻ, Thanh Niên, The Saigon Times) 본문을 한 번에 추출
+  (실제 수집처럼 소스별 스레드에서 동시에 호출)
+- 인라인: GIL 때문에 사실상 코어 하나 / 풀: 소스별 프로세스에서 파싱 후 기사 딕셔너리만 반환
+- 풀은 첫 반복에서 프로세스를 띄우므로 첫 반복과 이후 반복을 따로 표시
+- 두 방식의 추출 결과가 같은지 확인
+"""
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests  # noqa: E402
+
+from today_vn_news import scraper  # noqa: E402
+from today_vn_news.config import ScraperConfig  # noqa: E402
+from today_vn_news.logger import logger  # noqa: E402
+from today_vn_news.scraping.page_store import PageStore  # noqa: E402
+from today_vn_news.scraping.parse_pool import ParsePool  # noqa: E402
+from today_vn_news.scraping.registry import default_source  # noqa: E402
+from today_vn_news.scraping.replay import load_archive  # noqa: E402
+
+# (소스 key, 추출 함수)
+EXTRACTORS = [
+    ("nhandan", scraper._extract_nhandan),
+    ("tuoitre", scraper._extract_tuoitre),
+    ("thanhnien_html", scraper._extract_thanhnien),
+    ("saigontimes", scraper._extract_saigontimes),
+]
+
+
+def load_pages(args):
+    if "replay" in args:
+        entries, date_str = load_archive(args["replay"])
+    elif "date" in args:
+        date_str = datetime.strptime(args["date"], "%y%m%d").strftime("%Y-%m-%d")
+        entries = PageStore(ScraperConfig.from_yaml().page_store_dir, enabled=False).load(date_str)
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+    tasks = []
+    for key, extractor in EXTRACTORS:
+        source = default_source(key)
+        url = requests.Request("GET", source.url).prepare().url
+        if url not in entries:
+            print(f"  [!] {source.name}: 녹화된 본문 없음 ({url})")
+            continue
+        markup = entries[url][-1].to_response().text
+        tasks.append((source, extractor, markup))
+    return tasks, date_str
+
+
+def run_once(pool: ParsePool, tasks, date_str):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(tasks)) as threads:
+        futures = [threads.submit(pool.run, extractor, markup, date_str, source) for source, extractor, markup in tasks]
+        results = [future.result() for future in futures]
+    return time.perf_counter() - start, results
+
+
+def main():
+    args = dict(a.lstrip("-").split("=", 1) for a in sys.argv[1:] if "=" in a)
+    repeat = int(args.get("repeat", 5))
+    processes = int(args.get("processes", 4))
+
+    logger.setLevel(logging.WARNING)
+    tasks, date_str = load_pages(args)
+    if not tasks:
+        sys.exit(1)
+
+    timings = {}
+    outputs = {}
+    for label, pool in (("인라인", ParsePool(0)), (f"풀 ({processes}프로세스)", ParsePool(processes))):
+        runs = [run_once(pool, tasks, date_str) for _ in range(repeat)]
+        pool.shutdown()
+        timings[label] = [elapsed for elapsed, _ in runs]
+        outputs[label] = runs[-1][1]
+
+    total_kb = sum(len(markup.encode("utf-8")) for _, _, markup in tasks) / 1024
+    print(f"기준일 {date_str}, HTML {len(tasks)}개 ({total_kb:.0f}KB), 반복 {repeat}회")
+    print(f"{'방식':<16} {'첫 반복(s)':>11} {'이후 최소(s)':>12} {'이후 평균(s)':>12}")
+    for label, values in timings.items():
+        rest = values[1:] or values
+        print(f"{label:<16} {values[0]:>11.3f} {min(rest):>12.3f} {sum(rest) / len(rest):>12.3f}")
+
+    inline, pooled = outputs.values()
+    print("\n추출 결과 일치" if inline == pooled else "\n[!] 추출 결과 불일치")
+    for (source, _, _), articles in zip(tasks, inline):
+        print(f"  {source.name}: {len(articles)}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""녹화된 HTTP 아카이브로 전체 스크래핑 반복 측정 (오프라인, 결정적)
+
+사용법:
+  python main.py --record=data/replay/260211.jsonl.gz        # 라이브 실행 1회 녹화
+  python scripts/bench_scrape_replay.py --replay=data/replay/260211.jsonl.gz [--repeat=5] [--latency=recorded|0.2]
+
+- 녹화 기준일로 scrape_and_save 실행 (HTTP 캐시/DNS 예열/방송 기사 저장소 비활성화)
+- 반복별 총 소요 시간과 섹션별 기사 수 출력 (기사 수는 반복 간 동일해야 함)
+"""
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from today_vn_news.config import ScraperConfig  # noqa: E402
+from today_vn_news.logger import logger  # noqa: E402
+from today_vn_news.scraper import scrape_and_save  # noqa: E402
+from today_vn_news.scraping.replay import http_replay, parse_latency  # noqa: E402
+
+
+def main():
+    args = dict(a.lstrip("-").split("=", 1) for a in sys.argv[1:] if "=" in a)
+    if "replay" not in args:
+        print(__doc__)
+        sys.exit(1)
+    repeat = int(args.get("repeat", 5))
+    latency = parse_latency(args.get("latency"))
+
+    # 소스별 로그 억제 (표만 출력)
+    logger.setLevel(logging.WARNING)
+    config = ScraperConfig(warm_dns=False, cache_enabled=False, seen_enabled=False)
+
+    timings = []
+    counts = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for i in range(repeat):
+            http_replay.start_replay(args["replay"], latency=latency)
+            date_str = http_replay.date_str
+            start = time.perf_counter()
+            try:
+                data = scrape_and_save(date_str, f"{tmp_dir}/raw.yaml", config)
+            finally:
+                http_replay.stop()
+            timings.append(time.perf_counter() - start)
+            counts = {name: len(items or []) for name, items in data.items()}
+
+    print(f"아카이브: {args['replay']} (기준일 {date_str}), 지연: {latency or '없음'}")
+    print(f"{'반복':>4} {'소요(s)':>9}")
+    for i, elapsed in enumerate(timings, 1):
+        print(f"{i:>4} {elapsed:>9.3f}")
+    print(f"최소 {min(timings):.3f}s / 평균 {sum(timings) / len(timings):.3f}s")
+    print("\n섹션별 기사 수:")
+    for name, count in counts.items():
+        print(f"  {name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
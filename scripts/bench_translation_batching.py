@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""번역 요청 단위 비교 (per-source vs packed vs per-article)
+
+사용법:
+  python scripts/bench_translation_batching.py --raw=data/260211_raw.yaml [--modes=per-source,packed,per-article]
+                                               [--budget=6000] [--dry-run]
+
+- 1단계 원본 YAML(안전 및 기상 관제 제외)의 기사를 요청 단위별로 계획
+- --dry-run: API 호출 없이 요청 수와 추정 입력 토큰(반복되는 지침 블록 포함)만 비교
+- 그 외: 단위별로 실제 번역(번역 캐시 비활성화)을 실행하여 소요 시간, 요청 수,
+  번역되지 않고 원문으로 남은 기사 수 비교 (API 키 필요)
+"""
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from today_vn_news import translator  # noqa: E402
+from today_vn_news.config import TranslatorConfig  # noqa: E402
+from today_vn_news.llm_scheduler import estimate_tokens, llm_scheduler  # noqa: E402
+from today_vn_news.logger import logger  # noqa: E402
+from today_vn_news.scraping.registry import SAFETY_SECTION  # noqa: E402
+from today_vn_news.translation_batch import GRANULARITIES, assign_ids, plan_batches  # noqa: E402
+
+TODAY = "2026-02-11"
+
+
+def load_raw(path):
+    sections = translator.load_yaml(path)
+    return {
+        section["name"]: section.get("items") or []
+        for section in sections
+        if section.get("name") != SAFETY_SECTION and section.get("items")
+    }
+
+
+def plan(scraped, mode, budget):
+    """(요청 수, 추정 입력 토큰 합계, 지침 블록 토큰 합계)"""
+    groups = assign_ids(list(scraped.items()))
+    overhead = estimate_tokens(translator._build_packed_prompt(translator.TranslationBatch(), TODAY))
+    batches = plan_batches(groups, mode, budget, prompt_tokens=overhead)
+    total = prefix = 0
+    for batch in batches:
+        sources = batch.sources
+        if len(sources) == 1:
+            prompt = translator._build_prompt([entry.article for entry in batch.articles], sources[0], TODAY)
+            empty = translator._build_prompt([], sources[0], TODAY)
+        else:
+            prompt = translator._build_packed_prompt(batch, TODAY)
+            empty = translator._build_packed_prompt(translator.TranslationBatch(), TODAY)
+        total += estimate_tokens(prompt)
+        prefix += estimate_tokens(empty)
+    return len(batches), total, prefix
+
+
+def run(scraped, mode, budget):
+    """(소요 시간, API 요청 수, 원문으로 남은 기사 수)"""
+    config = TranslatorConfig(cache_enabled=False, batch_granularity=mode, batch_token_budget=budget)
+    start = time.perf_counter()
+    sections = asyncio.run(translator.translate_all_sources_parallel(scraped, TODAY, config=config))
+    elapsed = time.perf_counter() - start
+
+    untranslated = 0
+    for section in sections:
+        originals = {article["title"] for article in scraped.get(section["name"], [])}
+        untranslated += sum(item.get("title") in originals for item in section["items"])
+    return elapsed, llm_scheduler.requests, untranslated
+
+
+def main():
+    args = dict(a.lstrip("-").split("=", 1) for a in sys.argv[1:] if "=" in a)
+    if "raw" not in args:
+        print(__doc__)
+        sys.exit(1)
+    modes = [mode for mode in args.get("modes", ",".join(GRANULARITIES)).split(",") if mode]
+    budget = int(args.get("budget", 6000))
+    dry_run = "--dry-run" in sys.argv
+
+    logger.setLevel(logging.WARNING)
+    scraped = load_raw(args["raw"])
+    articles = sum(len(items) for items in scraped.values())
+    print(f"소스 {len(scraped)}개, 기사 {articles}개, packed 예산 {budget}토큰")
+
+    print(f"\n{'단위':<12} {'요청':>5} {'입력 토큰(추정)':>15} {'지침 블록 비중':>14}")
+    for mode in modes:
+        requests, total, prefix = plan(scraped, mode, budget)
+        print(f"{mode:<12} {requests:>5} {total:>15} {prefix / total * 100 if total else 0:>13.0f}%")
+
+    if dry_run:
+        return
+
+    print(f"\n{'단위':<12} {'소요(s)':>8} {'API 요청':>8} {'원문 유지':>9}")
+    for mode in modes:
+        elapsed, requests, untranslated = run(scraped, mode, budget)
+        print(f"{mode:<12} {elapsed:>8.1f} {requests:>8} {untranslated:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""원본 페이지 보관소로 지난 날짜의 _raw.yaml 재생성 (네트워크 요청 없음)
+
+사용법:
+  python scripts/reparse.py 260211 [--workers=4] [--output=data/260211_raw.yaml]
+
+- 선택자 수정 후 보관된 본문(data/raw_pages, config.yaml scraper.page_store)으로 다시 추출
+- 소스별 스크래퍼를 CPU 코어 수만큼의 프로세스에서 병렬 실행
+- 기본 출력 경로는 data/YYMMDD_raw.yaml (기존 파일 덮어씀, 이후 단계는 완료 마커 삭제 후 재실행)
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from today_vn_news.scraper import reparse_raw  # noqa: E402
+
+
+def main():
+    dates = [a for a in sys.argv[1:] if not a.startswith("--")]
+    args = dict(a.lstrip("-").split("=", 1) for a in sys.argv[1:] if "=" in a)
+    if len(dates) != 1:
+        print(__doc__)
+        sys.exit(1)
+
+    yymmdd = dates[0]
+    date_str = datetime.strptime(yymmdd, "%y%m%d").strftime("%Y-%m-%d")
+    output = args.get("output", f"data/{yymmdd}_raw.yaml")
+    workers = int(args["workers"]) if "workers" in args else None
+
+    data = reparse_raw(date_str, output, workers=workers)
+
+    print(f"재생성 완료: {output} (기준일 {date_str})")
+    for name, items in data.items():
+        print(f"  {name}: {len(items or [])}")
+
+
+if __name__ == "__main__":
+    main()
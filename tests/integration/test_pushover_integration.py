@@ -50,7 +50,7 @@ def mock_pipeline_status_total_failure():
 class TestPushoverIntegration:
     """Pushover 알림 통합 테스트"""
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notification_success_all_steps(self, mock_post, mock_pipeline_status_success):
         """전체 성공 시 알림 검증"""
         # Mock API 응답
@@ -81,7 +81,7 @@ class TestPushoverIntegration:
         assert data["url"] == "https://youtu.be/dQw4w9WgXcQ"
         assert "retry" not in data  # Normal priority는 retry/expire 없음
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notification_partial_failure(self, mock_post, mock_pipeline_status_partial_failure):
         """부분 실패 시 알림 검증"""
         mock_response = Mock()
@@ -103,7 +103,7 @@ class TestPushoverIntegration:
         assert data["priority"] == 1  # High
         assert "url" not in data  # 부분 실패는 URL 없음
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notification_total_failure_emergency(self, mock_post, mock_pipeline_status_total_failure):
         """전체 실패 시 Emergency priority 알림 검증"""
         mock_response = Mock()
@@ -125,7 +125,7 @@ class TestPushoverIntegration:
         assert data["expire"] == 3600  # 1시간 후 만료
         assert "url" not in data
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notification_rate_limit_handling(self, mock_post, mock_pipeline_status_success):
         """Rate Limit (HTTP 429) 처리 검증"""
         mock_response = Mock()
@@ -138,7 +138,7 @@ class TestPushoverIntegration:
         assert result is False  # 실패 반환
         mock_post.assert_called_once()
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notification_api_error_handling(self, mock_post, mock_pipeline_status_success):
         """API 에러 (500) 처리 검증"""
         mock_response = Mock()
@@ -150,7 +150,7 @@ class TestPushoverIntegration:
 
         assert result is False  # 실패 반환
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_notification_network_error_handling(self, mock_post, mock_pipeline_status_success):
         """네트워크 에러 처리 검증"""
         mock_post.side_effect = Exception("Connection timeout")
@@ -160,7 +160,7 @@ class TestPushoverIntegration:
 
         assert result is False  # 실패 반환
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_message_truncation(self, mock_post, mock_pipeline_status_success):
         """메시지 길이 제한 초과 시 자르기 검증"""
         mock_response = Mock()
@@ -187,14 +187,14 @@ class TestPushoverIntegration:
         # prefix(17) + padding(495) = 512
         assert data["url"] == "https://youtu.be/" + "a" * 495
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_from_env_or_none_without_env(self, mock_post):
         """환경 변수 없을 때 None 반환 검증"""
         with patch.dict("os.environ", {}, clear=True):
             notifier = PushoverNotifier.from_env_or_none()
             assert notifier is None
 
-    @patch("today_vn_news.notifications.pushover.requests.post")
+    @patch("requests.Session.post")
     def test_from_env_or_none_with_env(self, mock_post):
         """환경 변수 있을 때 인스턴스 반환 검증"""
         env_vars = {
@@ -0,0 +1,166 @@
+"""
+소스 간 중복 기사 제거 단위 테스트
+"""
+
+import random
+
+import pytest
+import yaml
+
+from today_vn_news.scraping import dedup
+from today_vn_news.scraping.dedup import (
+    NearDuplicateIndex,
+    _Seen,
+    canonicalize_url,
+    dedup_scraped_data,
+    fold_vietnamese,
+    hamming_distance,
+    save_dedup_report,
+    simhash,
+)
+from today_vn_news.scraping.registry import SourceRegistry
+
+STORY = (
+    "Thủ tướng chỉ đạo đẩy nhanh tiến độ cao tốc Bắc Nam đoạn qua Đồng Nai",
+    "Thủ tướng yêu cầu các bộ ngành đẩy nhanh tiến độ giải phóng mặt bằng dự án cao tốc Bắc Nam, "
+    "bảo đảm hoàn thành đúng hạn trong năm 2026",
+)
+
+
+def article(title, content, url):
+    return {"title": title, "content": content, "url": url, "date": "2026-02-11"}
+
+
+@pytest.fixture
+def registry():
+    return SourceRegistry.default()
+
+
+@pytest.mark.unit
+class TestCanonicalizeUrl:
+    """URL 정규화 테스트"""
+
+    def test_variants_match(self):
+        base = canonicalize_url("https://vnexpress.net/tin-1.html")
+        assert canonicalize_url("http://www.vnexpress.net/tin-1.html/") == base
+        assert canonicalize_url("https://m.vnexpress.net/tin-1.html?utm_source=rss#top") == base
+        assert canonicalize_url("https://vnexpress.net/tin-1.html/amp") == base
+
+    def test_meaningful_query_kept(self):
+        assert canonicalize_url("https://a.vn/p?id=1") != canonicalize_url("https://a.vn/p?id=2")
+        assert canonicalize_url("https://a.vn/p?b=2&a=1") == canonicalize_url("https://a.vn/p?a=1&b=2")
+
+
+@pytest.mark.unit
+class TestSimHash:
+    """SimHash 테스트"""
+
+    def test_fold_vietnamese(self):
+        assert fold_vietnamese("Đồng Nai Thủ tướng") == "dong nai thu tuong"
+
+    def test_near_duplicate_close(self):
+        a = simhash(" ".join(STORY))
+        b = simhash(" ".join(STORY).replace("năm 2026", "năm nay") + "!")
+        unrelated = simhash("Giá vàng hôm nay tăng mạnh sau phiên giao dịch cuối tuần tại TP.HCM")
+
+        assert hamming_distance(a, b) <= 8
+        assert hamming_distance(a, unrelated) > 10
+
+    def test_deterministic(self):
+        assert simhash(STORY[0]) == simhash(STORY[0])
+        assert simhash("") == 0
+
+    def test_index_finds_within_distance(self):
+        index = NearDuplicateIndex(max_distance=3)
+        seen = _Seen(source="A", article={}, fingerprint=0b1011 << 40)
+        index.add(seen)
+        assert index.find(seen.fingerprint ^ 0b111)[1] == 3
+        assert index.find(seen.fingerprint ^ 0b1111) is None
+
+
+@pytest.mark.unit
+class TestDedupScrapedData:
+    """dedup_scraped_data 테스트"""
+
+    def test_url_duplicate_across_sections(self, registry):
+        data = {
+            "안전 및 기상 관제": [{"name": "기상", "content": "x", "url": "https://nchmf.gov.vn/"}],
+            "VietnamNet": [article("Tin A khác", "Nội dung", "https://vnexpress.net/tin-1.html")],
+            "VnExpress": [article("Tin A", "Nội dung A", "https://vnexpress.net/tin-1.html?utm_source=vnn")],
+        }
+        result, report = dedup_scraped_data(data, registry)
+
+        assert list(result) == list(data)
+        assert result["안전 및 기상 관제"] == data["안전 및 기상 관제"]
+        assert len(result["VietnamNet"]) == 1
+        assert result["VnExpress"] == []
+        record = report.duplicates[0]
+        assert (record.source, record.winner_source, record.reason) == ("VnExpress", "VietnamNet", "url")
+        assert result["VietnamNet"][0]["also_reported_by"] == [
+            {"source": "VnExpress", "url": "https://vnexpress.net/tin-1.html?utm_source=vnn"}
+        ]
+
+    def test_near_duplicate_priority_source_wins(self, registry):
+        """번역 순서(P0 우선)로 먼저 나온 소스가 채택"""
+        data = {
+            "Nhân Dân": [article(STORY[0], STORY[1], "https://nhandan.vn/a.html")],
+            "Sức khỏe & Đời sống": [article(STORY[0] + ".", STORY[1], "https://suckhoedoisong.vn/b.htm")],
+            "Tuổi Trẻ": [article("Giá vàng hôm nay tăng mạnh", "Giá vàng SJC tăng", "https://tuoitre.vn/c.htm")],
+        }
+        result, report = dedup_scraped_data(data, registry)
+
+        assert result["Nhân Dân"] == []
+        assert len(result["Sức khỏe & Đời sống"]) == 1
+        assert len(result["Tuổi Trẻ"]) == 1
+        assert report.total == 3 and report.kept == 2
+        assert report.duplicates[0].reason == "simhash"
+        assert report.duplicates[0].winner_source == "Sức khỏe & Đời sống"
+
+    def test_linear_scaling(self, registry, monkeypatch):
+        """고유 기사끼리는 밴드 버킷 후보만 비교 (전체 쌍 비교 없음)"""
+        comparisons = []
+
+        def counting_distance(a, b):
+            comparisons.append(1)
+            return hamming_distance(a, b)
+
+        monkeypatch.setattr(dedup, "hamming_distance", counting_distance)
+        rng = random.Random(42)
+        vocab = [f"từ{i}" for i in range(5000)]
+        n = 1000
+        data = {"VnExpress": [
+            article(" ".join(rng.choices(vocab, k=12)), " ".join(rng.choices(vocab, k=30)), f"https://x.vn/{i}")
+            for i in range(n)
+        ]}
+        _, report = dedup_scraped_data(data, registry)
+
+        assert report.kept == n
+        assert len(comparisons) < n * 4  # 전체 쌍 비교는 n²/2 = 500,000회
+
+    def test_save_report(self, tmp_path, registry):
+        data = {
+            "VietnamNet": [article("A", "B", "https://a.vn/1")],
+            "VnExpress": [article("A", "B", "https://a.vn/1")],
+        }
+        _, report = dedup_scraped_data(data, registry)
+        path = tmp_path / "dedup.yaml"
+        save_dedup_report(report, str(path))
+
+        saved = yaml.safe_load(path.read_text(encoding="utf-8"))
+        assert saved["duplicates"][0]["winner_source"] == "VietnamNet"
+
+    def test_restart_from_raw_yaml(self, tmp_path, registry):
+        """1단계 완료 후 재시작 시 원본 YAML에서 다시 읽은 기사도 중복 제거"""
+        from today_vn_news.scraper import load_raw_yaml, save_raw_yaml
+
+        data = {
+            "VietnamNet": [article(STORY[0], STORY[1], "https://vietnamnet.vn/a.html")],
+            "VnExpress": [article(STORY[0] + ".", STORY[1], "https://vnexpress.net/b.html")],
+        }
+        raw_path = str(tmp_path / "260211_raw.yaml")
+        save_raw_yaml(data, "2026-02-11", raw_path, registry=registry)
+
+        result, report = dedup_scraped_data(load_raw_yaml(raw_path), registry)
+
+        assert report.total == 2 and report.kept == 1
+        assert [len(result[name]) for name in ("VietnamNet", "VnExpress")] == [1, 0]
@@ -0,0 +1,233 @@
+"""
+RSS 스트리밍 파싱 엔진 단위 테스트
+"""
+
+from datetime import date
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from today_vn_news.scraping.stream import StreamedBody
+from today_vn_news.scraping.feed import (
+    iter_feed_items,
+    parse_feed,
+    parse_pub_date,
+    select_items,
+    strip_tags,
+)
+
+
+def make_feed(pub_dates, namespace=False):
+    """pubDate 목록으로 RSS 문서 생성 (최신순)"""
+    items = "".join(
+        f"""<item>
+  <title>Tin số {i}</title>
+  <link>https://vnexpress.net/tin-{i}.html</link>
+  <description><![CDATA[<a href="#"><img src="x.jpg"/></a>Nội dung {i}]]></description>
+  <pubDate>{pub_date}</pubDate>
+</item>"""
+        for i, pub_date in enumerate(pub_dates)
+    )
+    xmlns = ' xmlns="http://purl.org/rss/1.0/"' if namespace else ""
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss{xmlns}><channel><title>Feed</title>{items}</channel></rss>'.encode("utf-8")
+
+
+@pytest.mark.unit
+class TestParsePubDate:
+    """pubDate 파싱 테스트"""
+
+    def test_timezone_aware(self):
+        parsed = parse_pub_date("Wed, 11 Feb 2026 18:38:41 +0700")
+        assert parsed.tzinfo is not None
+        assert parsed.utcoffset().total_seconds() == 7 * 3600
+
+    def test_two_digit_year(self):
+        """Thanh Niên 형식 (2자리 연도)"""
+        assert parse_pub_date("Tue, 10 Feb 26 15:05:00 +0700").year == 2026
+
+    def test_invalid(self):
+        assert parse_pub_date("not a date") is None
+        assert parse_pub_date("") is None
+
+
+@pytest.mark.unit
+class TestIterFeedItems:
+    """iter_feed_items 테스트"""
+
+    def test_fields(self):
+        items = list(iter_feed_items(make_feed(["Wed, 11 Feb 2026 18:38:41 +0700"])))
+
+        assert len(items) == 1
+        assert items[0].title == "Tin số 0"
+        assert items[0].link == "https://vnexpress.net/tin-0.html"
+        assert strip_tags(items[0].description) == "Nội dung 0"
+        assert items[0].local_date == date(2026, 2, 11)
+
+    def test_namespaced_feed(self):
+        items = list(iter_feed_items(make_feed(["Wed, 11 Feb 2026 18:38:41 +0700"], namespace=True)))
+        assert items[0].title == "Tin số 0"
+
+    def test_utc_date_converted_to_vietnam_time(self):
+        """UTC 17:30 (2/10) = 베트남 00:30 (2/11)"""
+        items = list(iter_feed_items(make_feed(["Tue, 10 Feb 2026 17:30:00 GMT"])))
+        assert items[0].local_date == date(2026, 2, 11)
+
+
+@pytest.mark.unit
+class TestSelectItems:
+    """select_items / parse_feed 필터링 테스트"""
+
+    TARGET = date(2026, 2, 11)
+
+    def test_collects_same_day_up_to_limit(self):
+        feed = make_feed([
+            "Thu, 12 Feb 2026 08:00:00 +0700",  # 기준일 이후 (건너뜀)
+            "Wed, 11 Feb 2026 18:00:00 +0700",
+            "Wed, 11 Feb 2026 12:00:00 +0700",
+            "Wed, 11 Feb 2026 09:00:00 +0700",
+        ])
+        items = parse_feed(feed, self.TARGET, limit=2)
+        assert [i.title for i in items] == ["Tin số 1", "Tin số 2"]
+
+    def test_stops_at_older_items(self):
+        """기준일보다 오래된 item 이후는 읽지 않음"""
+        consumed = []
+
+        def tracking(items):
+            for item in items:
+                consumed.append(item.title)
+                yield item
+
+        feed = make_feed([
+            "Wed, 11 Feb 2026 18:00:00 +0700",
+            "Tue, 10 Feb 2026 18:00:00 +0700",
+            "Wed, 11 Feb 2026 09:00:00 +0700",
+        ])
+        items = select_items(tracking(iter_feed_items(feed)), self.TARGET, limit=5)
+
+        assert [i.title for i in items] == ["Tin số 0"]
+        assert consumed == ["Tin số 0", "Tin số 1"]
+
+    def test_undated_items(self):
+        feed = make_feed(["garbage", "Wed, 11 Feb 2026 18:00:00 +0700"])
+        assert len(parse_feed(feed, self.TARGET)) == 1
+        assert len(parse_feed(feed, self.TARGET, include_undated=True)) == 2
+
+    def test_no_target_date(self):
+        feed = make_feed(["Tue, 10 Feb 2026 18:00:00 +0700", "garbage"])
+        assert len(parse_feed(feed)) == 2
+
+
+@pytest.mark.unit
+class TestFeedScrapers:
+    """RSS 스크래퍼 통합 동작 테스트 (네트워크 없음)"""
+
+    def _response(self, body):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        return response
+
+    def _stream(self, body):
+        """요청마다 새 StreamedBody를 반환하는 _fetch_stream 대체"""
+        return lambda *args, **kwargs: StreamedBody(self._response(body))
+
+    def test_scrape_vnexpress_tech_uses_feed_parser(self):
+        from today_vn_news import scraper
+
+        feed = make_feed(["Wed, 11 Feb 2026 18:00:00 +0700"] * 3)
+        with patch.object(scraper, "_fetch_stream", side_effect=self._stream(feed)):
+            articles = scraper.scrape_vnexpress_tech("2026-02-11")
+
+        assert len(articles) == 2
+        assert articles[0] == {
+            "title": "Tin số 0",
+            "content": "Nội dung 0",
+            "url": "https://vnexpress.net/tin-0.html",
+            "date": "2026-02-11",
+            "normalized": True,
+        }
+
+    def test_multi_feed_dedupes_urls(self):
+        from today_vn_news import scraper
+
+        feed = make_feed(["Wed, 11 Feb 2026 18:00:00 +0700"])
+        with patch.object(scraper, "_fetch_stream", side_effect=self._stream(feed)):
+            articles = scraper.scrape_thanhnien_rss("2026-02-11")
+
+        assert len(articles) == 1
+
+
+SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+<url><loc>https://nhandan.vn/tin-cu.html</loc><news:news>
+  <news:publication><news:name>Nhân Dân</news:name><news:language>vi</news:language></news:publication>
+  <news:publication_date>2026-02-10T23:59:00+07:00</news:publication_date><news:title>Tin cũ</news:title>
+</news:news></url>
+<url><loc>https://nhandan.vn/kinh-te/tin-1.html</loc>
+  <image:image><image:loc>https://x/1.jpg</image:loc><image:title>Ảnh</image:title></image:image>
+  <news:news><news:publication_date>2026-02-11T00:10:00+07:00</news:publication_date>
+  <news:title>Tin số 1</news:title></news:news></url>
+<url><loc>https://nhandan.vn/the-thao/tin-2.html</loc><news:news>
+  <news:publication_date>2026-02-10T18:30:00Z</news:publication_date><news:title>Tin số 2</news:title>
+</news:news></url>
+</urlset>""".encode("utf-8")
+
+
+def make_stream(body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return StreamedBody(response)
+
+
+@pytest.mark.unit
+class TestNewsSitemap:
+    """Google News 사이트맵 파싱 / 스크래퍼 사이트맵 우선 경로 테스트"""
+
+    def test_filters_by_publication_date(self):
+        from today_vn_news.scraping.feed import parse_news_sitemap
+
+        items = parse_news_sitemap(SITEMAP, date(2026, 2, 11))
+
+        # 오래된 항목 뒤에 있어도 수집, 18:30Z는 베트남 시간으로 2/11 01:30
+        assert [item.title for item in items] == ["Tin số 1", "Tin số 2"]
+        assert items[0].link == "https://nhandan.vn/kinh-te/tin-1.html"
+        assert items[0].pub_date.isoformat() == "2026-02-11T00:10:00+07:00"
+
+    def test_predicate_and_limit(self):
+        from today_vn_news.scraping.feed import parse_news_sitemap
+
+        items = parse_news_sitemap(SITEMAP, date(2026, 2, 11), predicate=lambda i: "/the-thao/" in i.link)
+        assert [item.title for item in items] == ["Tin số 2"]
+        assert len(parse_news_sitemap(SITEMAP, date(2026, 2, 11), limit=1)) == 1
+
+    def test_scraper_prefers_sitemap(self):
+        from today_vn_news import scraper
+
+        fetch = Mock(side_effect=lambda url, **kwargs: make_stream(SITEMAP))
+        with patch.object(scraper, "_fetch_stream", fetch):
+            articles = scraper.scrape_nhandan("2026-02-11")
+
+        assert fetch.call_count == 1  # 홈페이지 HTML 요청 없음
+        assert "sitemap" in fetch.call_args.args[0]
+        assert articles[0] == {
+            "title": "Tin số 1",
+            "content": "Tin số 1",
+            "url": "https://nhandan.vn/kinh-te/tin-1.html",
+            "date": "11/02/2026",
+            "normalized": True,
+        }
+
+    def test_empty_sitemap_falls_back_to_html(self):
+        from today_vn_news import scraper
+
+        bodies = [SITEMAP, b"<html><body></body></html>"]
+        fetch = Mock(side_effect=lambda url, **kwargs: make_stream(bodies.pop(0)))
+        with patch.object(scraper, "_fetch_stream", fetch):
+            assert scraper.scrape_tuoitre("2026-03-01") == []
+
+        assert fetch.call_count == 2
@@ -0,0 +1,163 @@
+"""
+호스트 서킷 브레이커 / 소스 상태 점수판 단위 테스트
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from today_vn_news.scraping.health import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitOpenError,
+    HealthBoard,
+    health_board,
+    percentile,
+)
+
+
+@pytest.fixture
+def board(tmp_path):
+    board = HealthBoard()
+    board.configure(path=str(tmp_path / "health.json"), failure_threshold=2, cooldown=60)
+    return board
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """closed → open → half-open → closed 전이 테스트"""
+
+    def test_opens_after_consecutive_failures(self, board):
+        board.record_request("nhandan.vn", 10.0, 0, ok=False)
+        assert board.state_of("nhandan.vn") == CLOSED
+        board.record_request("nhandan.vn", 10.0, 0, ok=False)
+        assert board.state_of("nhandan.vn") == OPEN
+
+        with pytest.raises(CircuitOpenError):
+            board.before_request("nhandan.vn")
+        board.before_request("vnexpress.net")  # 다른 호스트는 영향 없음
+
+    def test_half_open_single_probe(self, board):
+        board.record_request("igp-vast.vn", 10.0, 0, ok=False)
+        board.record_request("igp-vast.vn", 10.0, 0, ok=False)
+
+        with patch("today_vn_news.scraping.health.time.time", return_value=10**10):
+            board.before_request("igp-vast.vn")  # cooldown 경과 → 탐색 1건 허용
+            assert board.state_of("igp-vast.vn") == HALF_OPEN
+            with pytest.raises(CircuitOpenError):
+                board.before_request("igp-vast.vn")
+
+        board.record_request("igp-vast.vn", 0.5, 100, ok=True)
+        assert board.state_of("igp-vast.vn") == CLOSED
+
+    def test_half_open_failure_reopens_immediately(self, board):
+        board.record_request("a.vn", 1.0, 0, ok=False)
+        board.record_request("a.vn", 1.0, 0, ok=False)
+        with patch("today_vn_news.scraping.health.time.time", return_value=10**10):
+            board.before_request("a.vn")
+        board.record_request("a.vn", 1.0, 0, ok=False)
+        assert board.state_of("a.vn") == OPEN
+
+    def test_persisted_across_runs(self, board, tmp_path):
+        board.record_request("nhandan.vn", 10.0, 0, ok=False)
+        board.record_request("nhandan.vn", 10.0, 0, ok=False)
+        board.record_source("Nhân Dân", 20.0, ok=False)
+        board.save()
+
+        reloaded = HealthBoard()
+        reloaded.configure(path=str(tmp_path / "health.json"), cooldown=60)
+        assert reloaded.state_of("nhandan.vn") == OPEN
+        assert reloaded.sources["Nhân Dân"].failure_rate == 1.0
+
+
+@pytest.mark.unit
+class TestScoreboard:
+    """적응형 타임아웃 / 수집 순서 테스트"""
+
+    def test_percentile(self):
+        assert percentile([], 95) == 0.0
+        assert percentile([1, 2, 3, 4], 50) == 2
+        assert percentile(list(range(1, 101)), 95) == 95
+
+    def test_adaptive_timeout(self, board):
+        assert board.timeout_for("vnexpress.net", 10) == 10  # 표본 부족
+        for latency in (0.4, 0.5, 0.6, 0.5, 0.8):
+            board.record_request("vnexpress.net", latency, 1000, ok=True)
+        assert board.timeout_for("vnexpress.net", 10) == 3.0  # min_timeout
+        for latency in (2.0, 2.5, 3.0, 2.2, 2.8):
+            board.record_request("slow.vn", latency, 1000, ok=True)
+        assert board.timeout_for("slow.vn", 10) == 9.0  # p95 3.0 × 3
+        assert board.timeout_for("slow.vn", 5) == 5  # 설정값이 상한
+
+    def test_schedule_puts_slow_and_failing_last(self, board):
+        board.record_source("fast", 0.5, ok=True)
+        board.record_source("slow", 12.0, ok=True)
+        board.record_source("dead", 30.0, ok=False)
+        assert board.schedule(["dead", "new", "slow", "fast"]) == ["new", "fast", "slow", "dead"]
+
+    def test_source_bytes(self, board):
+        board.record_request("tuoitre.vn", 0.3, 2048, ok=True, source="Tuổi Trẻ")
+        board.record_source("Tuổi Trẻ", 0.3, ok=True)
+        assert board.sources["Tuổi Trẻ"].last_bytes == 2048
+        assert "Tuổi Trẻ" in board.report()[0]
+
+
+@pytest.mark.unit
+class TestFetchWithBreaker:
+    """_fetch_url 서킷 브레이커 연동 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def global_board(self, tmp_path, monkeypatch):
+        from today_vn_news.scraping.http_cache import http_cache
+
+        monkeypatch.setattr(http_cache, "enabled", False)
+        health_board.configure(path=str(tmp_path / "health.json"), failure_threshold=1, cooldown=60)
+        yield
+        health_board.configure(path=str(tmp_path / "health.json"), enabled=False)
+
+    def test_open_circuit_fails_fast_without_retry(self):
+        from today_vn_news import scraper
+
+        session = Mock()
+        session.get.side_effect = requests.ConnectTimeout("timeout")
+        with patch.object(scraper, "get_session", return_value=session), \
+                patch("today_vn_news.retry.time.sleep"):
+            with pytest.raises(requests.RequestException):
+                scraper._fetch_url("https://nhandan.vn/a")
+            calls = session.get.call_count
+            with pytest.raises(CircuitOpenError):
+                scraper._fetch_url("https://nhandan.vn/b")
+
+        assert calls == 1  # 첫 실패로 open → 재시도 요청도 차단
+        assert session.get.call_count == 1
+
+    def test_deadline_checked_before_probe_slot(self):
+        from today_vn_news import scraper
+        from today_vn_news.scraping.engine import DeadlineExceeded
+
+        health_board.record_request("igp-vast.vn", 10.0, 0, ok=False)
+        session = Mock()
+        with patch.object(scraper, "get_session", return_value=session), \
+                patch("today_vn_news.scraping.health.time.time", return_value=10**10):
+            with patch("today_vn_news.scraping.engine.remaining_time", return_value=-1.0):
+                with pytest.raises(DeadlineExceeded):
+                    scraper._fetch_url("https://igp-vast.vn/a")
+            assert session.get.call_count == 0
+            health_board.before_request("igp-vast.vn")  # 탐색 슬롯은 그대로 남아 있음
+
+    def test_clamped_timeout_not_counted_as_failure(self):
+        from today_vn_news import scraper
+
+        session = Mock()
+        session.get.side_effect = requests.ReadTimeout("timeout")
+        with patch.object(scraper, "get_session", return_value=session), \
+                patch("today_vn_news.scraping.engine.remaining_time", return_value=0.5), \
+                patch("today_vn_news.retry.time.sleep"):
+            with pytest.raises(requests.RequestException):
+                scraper._fetch_url("https://nhandan.vn/a")
+
+        assert session.get.call_args.kwargs["timeout"] == 0.5
+        assert health_board.state_of("nhandan.vn") == CLOSED
+        assert health_board.hosts["nhandan.vn"].failures == 0
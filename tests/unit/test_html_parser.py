@@ -0,0 +1,161 @@
+"""
+HTML 추출 레이어 단위 테스트
+"""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+from bs4 import SoupStrainer
+
+from today_vn_news.scraping import html_parser
+from today_vn_news.scraping.html_parser import parse_first_match, parse_html
+from today_vn_news.scraping.stream import StreamedBody
+
+BACKENDS = ["html.parser"] + (["lxml"] if html_parser.DEFAULT_BACKEND == "lxml" else [])
+
+NHANDAN_HTML = """
+<html><head><script>var x = 1;</script></head><body>
+<nav><a href="/menu">Menu</a><h2>Không phải bài viết</h2></nav>
+<article class="story">
+  <a href="/bai-1.html">link</a><h3>Tin Nhân Dân số một</h3>
+  <time datetime="2026-02-11T17:21:16+07:00">11/02/2026</time>
+  <p class="sapo">Tóm tắt số một</p>
+</article>
+<article class="story">
+  <a href="https://nhandan.vn/bai-2.html">link</a><h3>Tin cũ</h3>
+  <time datetime="2026-02-10T08:00:00+07:00">10/02/2026</time>
+</article>
+<footer>Footer</footer>
+</body></html>
+"""
+
+
+def make_response(text):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = text.encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+def make_body(text):
+    return StreamedBody(make_response(text))
+
+
+def html_only(text):
+    """사이트맵 요청은 404, 홈페이지 요청은 HTML을 반환하는 _fetch_stream 대체 (HTML 폴백 경로)"""
+    def fetch(url, **kwargs):
+        if "sitemap" in url:
+            response = make_response("")
+            response.status_code = 404
+            raise requests.HTTPError("404", response=response)
+        return make_body(text)
+    return fetch
+
+
+@pytest.mark.unit
+class TestParseHtml:
+    """parse_html / parse_first_match 테스트"""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_strainer_keeps_only_matching_nodes(self, backend):
+        soup = parse_html(NHANDAN_HTML, parse_only=SoupStrainer("article"), backend=backend)
+
+        assert len(soup.find_all("article")) == 2
+        assert soup.find("nav") is None
+        assert soup.find("script") is None
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_first_match_falls_back(self, backend):
+        html = '<div class="news-item"><a href="/a">x</a></div>'
+        soup = parse_first_match(
+            html,
+            [SoupStrainer("article"), SoupStrainer(class_="news-item")],
+            backend=backend,
+        )
+        assert soup is not None
+        assert soup.select(".news-item")
+
+    def test_first_match_none_when_empty(self):
+        assert parse_first_match("<p>nothing</p>", [SoupStrainer("article")]) is None
+
+    def test_default_backend(self):
+        assert html_parser.DEFAULT_BACKEND in ("lxml", "html.parser")
+
+
+@pytest.mark.unit
+class TestHtmlScrapers:
+    """HTML 스크래퍼 부분 파싱 동작 테스트 (네트워크 없음)"""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_scrape_nhandan(self, backend, monkeypatch):
+        from today_vn_news import scraper
+
+        monkeypatch.setattr(html_parser, "DEFAULT_BACKEND", backend)
+        with patch.object(scraper, "_fetch_stream", side_effect=html_only(NHANDAN_HTML)):
+            articles = scraper.scrape_nhandan("2026-02-11")
+
+        assert articles == [{
+            "title": "Tin Nhân Dân số một",
+            "content": "Tóm tắt số một",
+            "url": "https://nhandan.vn/bai-1.html",
+            "date": "11/02/2026",
+            "normalized": True,
+        }]
+
+    def test_scrape_weather(self):
+        from today_vn_news import scraper
+
+        html = """<html><body><div class="menu"><ul class="list-info-wt"><li>x</li></ul></div>
+        <div class="text-weather-location"><ul class="list-info-wt">
+          <li><div class="uk-width-3-4">: 31°C</div></li>
+          <li><div class="uk-width-3-4">: Nắng</div></li>
+          <li><div class="uk-width-3-4">: 70%</div></li>
+        </ul></div></body></html>"""
+        with patch.object(scraper, "_fetch_stream", return_value=make_body(html)):
+            result = scraper.scrape_weather_hochiminh()
+
+        assert result == {"temp": "31°C", "humidity": "70%", "condition": "Nắng"}
+
+    def test_scrape_saigontimes_no_articles(self):
+        from today_vn_news import scraper
+
+        with patch.object(scraper, "_fetch_stream", side_effect=html_only("<html></html>")):
+            assert scraper.scrape_saigontimes("2026-02-11") == []
+
+
+@pytest.mark.unit
+class TestParsePool:
+    """HTML 파싱 프로세스 풀 테스트"""
+
+    def test_pooled_extraction_matches_inline(self, monkeypatch):
+        from today_vn_news import scraper
+        from today_vn_news.scraping.parse_pool import ParsePool
+
+        results = []
+        for processes in (0, 2):
+            pool = ParsePool(processes)
+            monkeypatch.setattr(scraper, "parse_pool", pool)
+            with patch.object(scraper, "_fetch_stream", side_effect=html_only(NHANDAN_HTML)):
+                results.append(scraper.scrape_nhandan("2026-02-11"))
+            assert pool.enabled == (processes > 0) and (pool._executor is not None) == pool.enabled
+            pool.shutdown()
+
+        assert results[0] == results[1]
+        assert results[1][0]["title"] == "Tin Nhân Dân số một"
+
+    def test_deadline_while_parsing(self):
+        import time
+
+        from today_vn_news.scraping import engine
+        from today_vn_news.scraping.parse_pool import ParsePool
+
+        pool = ParsePool(1)
+        engine._current.expires = time.perf_counter() + 0.2
+        try:
+            with pytest.raises(engine.DeadlineExceeded):
+                pool.run(time.sleep, 1)
+        finally:
+            engine._current.expires = None
+            pool.shutdown()
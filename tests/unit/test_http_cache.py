@@ -0,0 +1,142 @@
+"""
+HTTP 조건부 GET 캐시 단위 테스트
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from today_vn_news.scraping.http_cache import HttpCache, http_cache
+
+
+def make_response(status_code=200, body=b"<rss/>", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.mark.unit
+class TestHttpCache:
+    """HttpCache 저장/조회 테스트"""
+
+    def test_store_and_lookup(self, tmp_path):
+        cache = HttpCache(cache_dir=str(tmp_path))
+        url = "https://vnexpress.net/rss/thoi-su.rss"
+        cache.store(url, make_response(headers={"ETag": '"abc"', "Last-Modified": "Wed, 11 Feb 2026 10:00:00 GMT"}))
+
+        entry = cache.lookup(url)
+        assert entry is not None
+        assert entry.body == b"<rss/>"
+        assert entry.validators() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 11 Feb 2026 10:00:00 GMT",
+        }
+        assert entry.to_response().text == "<rss/>"
+
+    def test_non_200_is_not_stored(self, tmp_path):
+        cache = HttpCache(cache_dir=str(tmp_path))
+        cache.store("https://a.vn/", make_response(status_code=500))
+        assert cache.lookup("https://a.vn/") is None
+
+    def test_disabled_cache(self, tmp_path):
+        cache = HttpCache(cache_dir=str(tmp_path), enabled=False)
+        cache.store("https://a.vn/", make_response())
+        assert cache.lookup("https://a.vn/") is None
+
+    def test_mismatched_body_is_not_served(self, tmp_path):
+        """다른 저장의 본문과 짝지어진 메타데이터(ETag)는 사용하지 않음"""
+        cache = HttpCache(cache_dir=str(tmp_path))
+        url = "https://vnexpress.net/rss/thoi-su.rss"
+        cache.store(url, make_response(body=b"<rss>a</rss>", headers={"ETag": '"a"'}))
+        _, body_path = cache._paths(url)
+        body_path.write_bytes(b"<rss>b</rss>")  # 동시 저장 중 다른 스레드의 본문이 나중에 교체된 상태
+
+        assert cache.lookup(url) is None
+
+    def test_concurrent_stores_stay_consistent(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = HttpCache(cache_dir=str(tmp_path))
+        url = "https://vnexpress.net/rss/thoi-su.rss"
+
+        def store(i):
+            cache.store(url, make_response(body=f"<rss>{i}</rss>".encode(), headers={"ETag": f'"{i}"'}))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(store, range(64)))
+
+        entry = cache.lookup(url)
+        if entry is not None:
+            etag = entry.headers["ETag"].strip('"')
+            assert entry.body == f"<rss>{etag}</rss>".encode()
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_ttl_longest_prefix_wins(self):
+        cache = HttpCache(default_ttl=0, ttl_rules={"thanhnien.vn/": 300, "thanhnien.vn/rss/": 0})
+        assert cache.ttl_for("https://thanhnien.vn/") == 300
+        assert cache.ttl_for("https://www.thanhnien.vn/") == 300
+        assert cache.ttl_for("https://thanhnien.vn/rss/thoi-su.rss") == 0
+        assert cache.ttl_for("https://vnexpress.net/rss/a.rss") == 0
+
+    def test_is_fresh(self, tmp_path):
+        cache = HttpCache(cache_dir=str(tmp_path), ttl_rules={"igp-vast.vn": 600})
+        cache.store("http://igp-vast.vn/feed", make_response())
+        cache.store("https://vnexpress.net/rss/a.rss", make_response())
+
+        assert cache.is_fresh(cache.lookup("http://igp-vast.vn/feed"))
+        assert not cache.is_fresh(cache.lookup("https://vnexpress.net/rss/a.rss"))
+
+
+@pytest.mark.unit
+class TestCachedFetch:
+    """_fetch_url 캐시 연동 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path):
+        http_cache.configure(
+            cache_dir=str(tmp_path), default_ttl=0,
+            ttl_rules={"igp-vast.vn": 600}, enabled=True,
+        )
+        yield
+        http_cache.configure(cache_dir="data/http_cache", default_ttl=0, ttl_rules={}, enabled=True)
+
+    def test_conditional_get_serves_304_from_cache(self):
+        from today_vn_news.scraper import _fetch_url
+
+        url = "https://vnexpress.net/rss/thoi-su.rss"
+        first = make_response(body=b"<rss>v1</rss>", headers={"ETag": '"v1"'})
+        not_modified = make_response(status_code=304, body=b"")
+
+        with patch("requests.Session.get", side_effect=[first, not_modified]) as mock_get:
+            assert _fetch_url(url).content == b"<rss>v1</rss>"
+            second = _fetch_url(url)
+
+        assert second.content == b"<rss>v1</rss>"
+        assert mock_get.call_args_list[1][1]["headers"]["If-None-Match"] == '"v1"'
+        assert http_cache.stats.misses == 1
+        assert http_cache.stats.revalidated == 1
+
+    def test_fresh_entry_skips_network(self):
+        from today_vn_news.scraper import _fetch_url
+
+        url = "http://igp-vast.vn/index.php/en/earthquake-news?format=feed"
+        with patch("requests.Session.get", return_value=make_response(body=b"<rss/>")) as mock_get:
+            _fetch_url(url)
+            _fetch_url(url)
+
+        assert mock_get.call_count == 1
+        assert http_cache.stats.fresh_hits == 1
+
+    def test_params_are_part_of_cache_key(self):
+        from today_vn_news.scraper import _fetch_url_with_params
+
+        url = "https://air-quality-api.open-meteo.com/v1/air-quality"
+        responses = [make_response(body=b'{"a": 1}'), make_response(body=b'{"a": 2}')]
+        with patch("requests.Session.get", side_effect=responses):
+            assert _fetch_url_with_params(url, params={"latitude": 1}).json() == {"a": 1}
+            assert _fetch_url_with_params(url, params={"latitude": 2}).json() == {"a": 2}
@@ -0,0 +1,149 @@
+"""
+공유 HTTP 커넥션 풀 단위 테스트
+"""
+
+import socket
+from unittest.mock import Mock, patch
+
+import pytest
+
+from today_vn_news import http_client
+from today_vn_news.http_client import (
+    DEFAULT_USER_AGENT,
+    DnsCache,
+    build_session,
+    configure_session,
+    get_session,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_session():
+    """테스트 간 공유 세션 격리"""
+    http_client.close_session()
+    yield
+    http_client.close_session()
+
+
+@pytest.mark.unit
+class TestSession:
+    """세션 생성 테스트"""
+
+    def test_default_user_agent(self):
+        session = build_session()
+        assert session.headers["User-Agent"] == DEFAULT_USER_AGENT
+
+    def test_host_pool_sizes_mount_dedicated_adapter(self):
+        session = build_session(pool_maxsize=2, host_pool_sizes={"vnexpress.net": 6})
+
+        host_adapter = session.get_adapter("https://vnexpress.net/rss/thoi-su.rss")
+        default_adapter = session.get_adapter("https://tuoitre.vn/")
+
+        assert host_adapter is not default_adapter
+        assert host_adapter._pool_maxsize == 6
+        assert default_adapter._pool_maxsize == 2
+        assert session.get_adapter("http://vnexpress.net/") is host_adapter
+        assert session.get_adapter("https://vnexpress.net.evil/") is default_adapter
+        assert session.get_adapter("https://vnexpress.netx.com/") is default_adapter
+
+    def test_get_session_is_shared(self):
+        assert get_session() is get_session()
+
+    def test_configure_session_replaces_shared(self):
+        first = get_session()
+        second = configure_session(user_agent="test-agent")
+
+        assert first is not second
+        assert get_session() is second
+        assert second.headers["User-Agent"] == "test-agent"
+
+    def test_fetch_url_uses_shared_session(self):
+        """_fetch_url이 공유 세션을 통해 요청"""
+        from today_vn_news.scraper import _fetch_url
+
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            assert _fetch_url("https://vnexpress.net/rss/thoi-su.rss") is mock_response
+            mock_get.assert_called_once()
+
+
+@pytest.mark.unit
+class TestDnsCache:
+    """DnsCache 테스트"""
+
+    def test_caches_lookups(self):
+        cache = DnsCache(ttl=60)
+        calls = []
+
+        def fake_getaddrinfo(host, port, *args, **kwargs):
+            calls.append(host)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("203.0.113.1", port))]
+
+        with patch("socket.getaddrinfo", fake_getaddrinfo):
+            cache.install()
+            try:
+                socket.getaddrinfo("vnexpress.net", 443)
+                socket.getaddrinfo("vnexpress.net", 443)
+                socket.getaddrinfo("tuoitre.vn", 443)
+            finally:
+                cache.uninstall()
+
+        assert calls == ["vnexpress.net", "tuoitre.vn"]
+
+    def test_ports_share_one_lookup(self):
+        """https(443) 예열 결과를 http(80) 요청이 포트만 바꿔 재사용"""
+        cache = DnsCache(ttl=60)
+        calls = []
+
+        def fake_getaddrinfo(host, port, *args, **kwargs):
+            calls.append((host, port))
+            return [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("203.0.113.1", port)),
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", port, 0, 0)),
+            ]
+
+        with patch("socket.getaddrinfo", fake_getaddrinfo):
+            try:
+                cache.warm(["igp-vast.vn"])
+                result = socket.getaddrinfo("igp-vast.vn", 80, 0, socket.SOCK_STREAM)
+            finally:
+                cache.uninstall()
+
+        assert calls == [("igp-vast.vn", 443)]
+        assert [info[4] for info in result] == [("203.0.113.1", 80), ("2001:db8::1", 80, 0, 0)]
+
+    def test_expired_entry_is_refreshed(self):
+        cache = DnsCache(ttl=0)
+        calls = []
+
+        def fake_getaddrinfo(host, port, *args, **kwargs):
+            calls.append(host)
+            return []
+
+        with patch("socket.getaddrinfo", fake_getaddrinfo):
+            cache.install()
+            try:
+                socket.getaddrinfo("vnexpress.net", 443)
+                socket.getaddrinfo("vnexpress.net", 443)
+            finally:
+                cache.uninstall()
+
+        assert len(calls) == 2
+
+    def test_warm_counts_failures(self):
+        cache = DnsCache()
+
+        def fake_getaddrinfo(host, port, *args, **kwargs):
+            if host == "bad.invalid":
+                raise socket.gaierror("not found")
+            return []
+
+        with patch("socket.getaddrinfo", fake_getaddrinfo):
+            try:
+                resolved = cache.warm(["vnexpress.net", "bad.invalid", "vnexpress.net"])
+            finally:
+                cache.uninstall()
+
+        assert resolved == 1
@@ -0,0 +1,182 @@
+"""
+LLM 요청 스케줄러 단위 테스트
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from today_vn_news.config import TranslatorConfig
+from today_vn_news.llm_scheduler import LLMScheduler, TokenBucket
+
+
+class QuotaError(Exception):
+    """HTTP 상태 코드를 가진 API 예외"""
+
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """분당 한도 토큰 버킷 테스트"""
+
+    def test_delay_until_refill(self):
+        with patch("today_vn_news.llm_scheduler.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(per_minute=60)
+            assert bucket.delay(60) == 0.0
+            bucket.take(60)
+            assert bucket.delay(1) == pytest.approx(1.0)
+        with patch("today_vn_news.llm_scheduler.time.monotonic", return_value=110.0):
+            assert bucket.delay(10) == 0.0
+            assert bucket.delay(1000) == pytest.approx(50.0)  # 용량(60)으로 제한
+
+    def test_disabled(self):
+        bucket = TokenBucket(0)
+        bucket.take(10)
+        assert bucket.delay(10 ** 6) == 0.0
+
+
+@pytest.mark.unit
+class TestAIMD:
+    """적응형 동시성 테스트"""
+
+    def test_additive_increase_up_to_max(self):
+        scheduler = LLMScheduler(max_concurrency=3, initial_concurrency=1, latency_target=0)
+        for _ in range(10):
+            scheduler.release(scheduler.acquire())
+        assert int(scheduler.limit) == 3
+
+    def test_throttle_halves_once_per_congestion(self):
+        scheduler = LLMScheduler(max_concurrency=8, initial_concurrency=8)
+        started = [scheduler.acquire() for _ in range(4)]
+        for value in started:
+            scheduler.release(value, QuotaError(429))
+        assert scheduler.limit == 4.0
+        assert scheduler.throttled == 4
+
+        scheduler.release(scheduler.acquire(), QuotaError(503))
+        assert scheduler.limit == 2.0
+        scheduler.release(scheduler.acquire(), QuotaError(400))
+        assert scheduler.limit == 2.0
+
+    def test_latency_over_target_decreases_to_min(self):
+        scheduler = LLMScheduler(max_concurrency=4, min_concurrency=1, initial_concurrency=2, latency_target=5)
+        with patch("today_vn_news.llm_scheduler.time.monotonic", side_effect=[0.0, 10.0, 10.0, 10.0, 30.0, 30.0]):
+            scheduler.release(scheduler.acquire())
+            scheduler.release(scheduler.acquire())
+        assert scheduler.limit == 1.0
+        assert scheduler.slow == 2
+        assert "지연 초과 2회" in scheduler.summary()
+
+
+@pytest.mark.unit
+class TestSharedLimit:
+    """공유 동시성 제한 테스트"""
+
+    def test_threads_wait_for_slots(self):
+        scheduler = LLMScheduler(max_concurrency=2, initial_concurrency=2, latency_target=0)
+
+        def call():
+            with scheduler.request():
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert scheduler.requests == 6
+        assert scheduler.max_in_flight == 2
+        assert scheduler.max_queued >= 1
+        assert scheduler.in_flight == 0
+
+    def test_async_and_thread_callers_share_slots(self):
+        scheduler = LLMScheduler(max_concurrency=1, initial_concurrency=1, latency_target=0)
+        order = []
+
+        def thread_call():
+            with scheduler.request():
+                order.append("thread")
+                time.sleep(0.05)
+
+        async def main():
+            started = await scheduler.aacquire()
+            thread = threading.Thread(target=thread_call)
+            thread.start()
+            await asyncio.sleep(0.05)
+            assert scheduler.queued == 1  # 스레드는 async 호출이 점유한 슬롯을 기다림
+            order.append("async")
+            scheduler.release(started)
+            async with scheduler.arequest():
+                order.append("async-2")
+            await asyncio.to_thread(thread.join)
+
+        asyncio.run(main())
+        assert order[0] == "async" and sorted(order[1:]) == ["async-2", "thread"]
+        assert scheduler.max_in_flight == 1
+
+
+@pytest.mark.unit
+class TestAsyncStage:
+    """네이티브 async 번역 단계 테스트"""
+
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_one_client_no_threads_shared_limit(self, mock_get_client):
+        from today_vn_news.scraping.registry import SourceRegistry
+        from today_vn_news.translator import translate_all_sources_parallel
+
+        keys = [f"s{i}" for i in range(8)]
+        active = []
+        peak = []
+        threads = []
+
+        async def generate_content(model, contents, config=None):
+            active.append(1)
+            peak.append(len(active))
+            threads.append(threading.active_count())
+            await asyncio.sleep(0.02)
+            active.pop()
+            return MagicMock(text='items:\n  - title: "뉴스"\n    content: "요약"\n    url: "u"\n')
+
+        client = MagicMock()
+        client.aio = AsyncMock()
+        client.aio.models.generate_content.side_effect = generate_content
+        mock_get_client.return_value = (client, "gemma")
+        registry = SourceRegistry.from_dict({key: {"name": key, "type": "rss", "urls": ["x"]} for key in keys})
+        scraped = {key: [{"title": key, "content": "nội dung", "url": "u"}] for key in keys}
+        config = TranslatorConfig(cache_enabled=False, llm_max_concurrency=2, llm_initial_concurrency=2)
+
+        baseline = threading.active_count()
+        sections = asyncio.run(translate_all_sources_parallel(scraped, "2026-02-11", registry, config))
+
+        assert len(sections) == 8
+        assert mock_get_client.call_count == 1
+        assert client.aio.models.generate_content.await_count == 8
+        client.aio.aclose.assert_awaited_once()
+        assert max(peak) == 2
+        assert max(threads) == baseline
+
+    @patch("today_vn_news.retry.random.uniform", return_value=0.0)
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_async_retry_on_throttle(self, mock_get_client, _uniform):
+        from today_vn_news.translator import translate_articles_async
+
+        client = MagicMock()
+        client.aio = AsyncMock()
+        client.aio.models.generate_content.side_effect = [
+            QuotaError(429),
+            MagicMock(text='items:\n  - title: "뉴스"\n    content: "요약"\n    url: "u"\n'),
+        ]
+        article = {"title": "Tin", "content": "nội dung", "url": "u"}
+
+        result = asyncio.run(translate_articles_async([article], "VnExpress", "2026-02-11", client=client, model_name="g"))
+
+        assert result == [{"title": "뉴스", "content": "요약", "url": "u"}]
+        assert client.aio.models.generate_content.await_count == 2
+        mock_get_client.assert_not_called()
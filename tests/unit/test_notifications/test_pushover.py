@@ -48,7 +48,7 @@ class TestPushoverNotifierSend:
         mock_response.status_code = 200
         mock_response.json.return_value = {"status": 1}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             notifier = PushoverNotifier.from_env()
             status = PipelineStatus()
             status.steps[STEP_SCRAPE] = True
@@ -70,19 +70,36 @@ class TestPushoverNotifierSend:
         mock_response = Mock()
         mock_response.status_code = 429
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             notifier = PushoverNotifier.from_env()
             status = PipelineStatus()
 
             result = notifier.send_notification(status)
             assert result is False
 
+    def test_send_notification_retries_server_error(self, monkeypatch):
+        """5xx 응답은 재시도 후 성공 (429는 재시도하지 않음)"""
+        monkeypatch.setenv("PUSHOVER_TOKEN", "test_token")
+        monkeypatch.setenv("PUSHOVER_USER", "test_user")
+
+        unavailable = Mock(status_code=503, headers={})
+        ok = Mock(status_code=200)
+        ok.json.return_value = {"status": 1}
+
+        with patch("requests.Session.post", side_effect=[unavailable, ok]) as mock_post, \
+                patch("today_vn_news.retry.time.sleep"):
+            notifier = PushoverNotifier.from_env()
+            result = notifier.send_notification(PipelineStatus())
+
+            assert result is True
+            assert mock_post.call_count == 2
+
     def test_send_notification_api_error_returns_false(self, monkeypatch):
         """API 에러 시 False 반환 (예외 없음)"""
         monkeypatch.setenv("PUSHOVER_TOKEN", "test_token")
         monkeypatch.setenv("PUSHOVER_USER", "test_user")
 
-        with patch("requests.post", side_effect=Exception("Network error")):
+        with patch("requests.Session.post", side_effect=Exception("Network error")):
             notifier = PushoverNotifier.from_env()
             status = PipelineStatus()
 
@@ -98,7 +115,7 @@ class TestPushoverNotifierSend:
         mock_response.status_code = 200
         mock_response.json.return_value = {"status": 1}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             notifier = PushoverNotifier.from_env()
             status = PipelineStatus()
             status.errors[STEP_SCRAPE] = "Network error"  # 전체 실패 = Emergency
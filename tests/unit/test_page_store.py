@@ -0,0 +1,134 @@
+"""
+원본 페이지 보관소 / 재파싱 단위 테스트
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+import requests
+import yaml
+from requests.structures import CaseInsensitiveDict
+
+from today_vn_news.config import ScraperConfig
+from today_vn_news.scraping.http_cache import http_cache
+from today_vn_news.scraping.page_store import PageStore
+from today_vn_news.scraping.registry import SourceRegistry, load_source_configs
+
+SOURCES = load_source_configs()
+
+FEED = (
+    '<?xml version="1.0" encoding="UTF-8"?><rss><channel>'
+    + "".join(
+        f"<item><title>Tin {i}</title><link>https://vnexpress.net/tin-{i}.html</link>"
+        f"<description>Nội dung {i}</description><pubDate>Wed, 11 Feb 2026 08:00:00 +0700</pubDate></item>"
+        for i in range(3)
+    )
+    + "</channel></rss>"
+).encode("utf-8")
+
+
+def make_response(body, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/rss+xml"})
+    response.encoding = "utf-8"
+    return response
+
+
+def live_response(body):
+    response = make_response(None)
+    response._content = False
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.mark.unit
+class TestPageStore:
+    """콘텐츠 주소 저장/색인 테스트"""
+
+    def test_same_body_stored_once(self, tmp_path):
+        store = PageStore(str(tmp_path), codec="gz")
+        store.begin("2026-02-11")
+        store.record("https://a.vn/rss", make_response(FEED))
+        store.record("https://b.vn/rss", make_response(FEED))
+        store.end()
+
+        objects = list((tmp_path / "objects").rglob("*.gz"))
+        assert len(objects) == 1
+        assert len(store.index("2026-02-11")) == 2
+        assert store.get(objects[0].stem) == FEED
+
+    def test_inactive_and_error_responses_skipped(self, tmp_path):
+        store = PageStore(str(tmp_path), codec="gz")
+        store.record("https://a.vn/rss", make_response(FEED))  # begin 전
+        store.begin("2026-02-11")
+        store.record("https://a.vn/rss", make_response(b"not found", status=404))
+        assert store.index("2026-02-11") == []
+
+        disabled = PageStore(str(tmp_path), enabled=False)
+        disabled.begin("2026-02-11")
+        assert not disabled.active
+
+    def test_load_uses_latest_record(self, tmp_path):
+        store = PageStore(str(tmp_path), codec="gz")
+        store.begin("2026-02-11")
+        store.record("https://a.vn/rss", make_response(b"old"))
+        store.record("https://a.vn/rss", make_response(b"new"), complete=False)
+
+        entries = store.load("2026-02-11")
+        assert entries["https://a.vn/rss"][0].body == b"new"
+        assert entries["https://a.vn/rss"][0].to_response().headers["Content-Type"] == "application/rss+xml"
+        assert store.index("2026-02-11")[-1]["complete"] is False
+        assert store.load("2026-02-12") == {}
+
+
+@pytest.mark.unit
+class TestReparse:
+    """scrape_and_save 보관 → reparse_raw 재생성 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path):
+        http_cache.configure(cache_dir=str(tmp_path / "http"), default_ttl=0, ttl_rules={}, enabled=False)
+        yield
+        http_cache.configure(cache_dir="data/http_cache", default_ttl=0, ttl_rules={}, enabled=True)
+
+    def _setup(self, tmp_path):
+        registry = SourceRegistry.from_dict({
+            **{key: {**SOURCES[key], "enabled": False} for key in ("weather", "air_quality", "cities", "earthquake")},
+            "vnexpress": {"name": "VnExpress", "type": "rss", "urls": ["https://vnexpress.net/rss/tin-moi-nhat.rss"]},
+        })
+        config = ScraperConfig(
+            warm_dns=False, health_enabled=False, safety_cache_enabled=False, seen_enabled=False,
+            cache_enabled=False, page_store_dir=str(tmp_path / "raw_pages"),
+        )
+        return registry, config
+
+    def test_reparse_rebuilds_raw_yaml_without_network(self, tmp_path):
+        from today_vn_news import scraper
+
+        registry, config = self._setup(tmp_path)
+        live = tmp_path / "live_raw.yaml"
+        with patch("requests.Session.get", side_effect=lambda *a, **k: live_response(FEED)):
+            scraper.scrape_and_save("2026-02-11", str(live), config, registry)
+
+        index = PageStore(config.page_store_dir).index("2026-02-11")
+        assert [(entry["source"], entry["url"]) for entry in index] == [
+            ("VnExpress", "https://vnexpress.net/rss/tin-moi-nhat.rss")
+        ]
+
+        rebuilt = tmp_path / "rebuilt_raw.yaml"
+        with patch("requests.Session.get", side_effect=AssertionError("network")):
+            data = scraper.reparse_raw("2026-02-11", str(rebuilt), config, registry, workers=2)
+
+        assert [article["title"] for article in data["VnExpress"]] == ["Tin 0", "Tin 1", "Tin 2"]
+        live_sections = yaml.safe_load(live.read_text(encoding="utf-8"))["sections"]
+        assert yaml.safe_load(rebuilt.read_text(encoding="utf-8"))["sections"] == live_sections
+
+    def test_reparse_without_index_raises(self, tmp_path):
+        from today_vn_news import scraper
+
+        registry, config = self._setup(tmp_path)
+        with pytest.raises(scraper.ScrapingError):
+            scraper.reparse_raw("2026-02-11", str(tmp_path / "raw.yaml"), config, registry)
@@ -0,0 +1,154 @@
+"""
+HTTP 녹화/재생 모드 단위 테스트
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from today_vn_news.retry import classify_error
+from today_vn_news.scraping.replay import (
+    RECORDED_LATENCY,
+    HttpReplay,
+    ReplayMissError,
+    http_replay,
+    load_archive,
+    parse_latency,
+    read_archive_date,
+)
+from today_vn_news.timestamp import normalize_timestamp
+
+FEED = (
+    b'<?xml version="1.0"?><rss><channel><item><title>Tin 1</title>'
+    b"<link>https://vnexpress.net/tin-1.html</link><description>Noi dung</description>"
+    b"<pubDate>Wed, 11 Feb 2026 18:00:00 +0700</pubDate></item></channel></rss>"
+)
+
+
+def make_response(status_code=200, body=FEED, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {"Content-Type": "application/rss+xml"})
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    from today_vn_news.scraping.http_cache import http_cache
+
+    monkeypatch.setattr(http_cache, "enabled", False)
+    yield
+    http_replay.stop()
+
+
+@pytest.mark.unit
+class TestHttpReplay:
+    """HttpReplay 녹화/재생 테스트"""
+
+    def test_round_trip(self, tmp_path):
+        archive = tmp_path / "run.jsonl.gz"
+        recorder = HttpReplay()
+        recorder.start_recording(str(archive), date_str="2026-02-11")
+        recorder.record("https://a.vn/feed", make_response(), 0.25)
+        recorder.record_error("https://b.vn/", requests.ConnectionError("down"), 1.0)
+        assert recorder.stop() == archive
+
+        entries, date_str = load_archive(str(archive))
+        assert date_str == "2026-02-11"
+        assert entries["https://a.vn/feed"][0].body == FEED
+
+        player = HttpReplay()
+        player.start_replay(str(archive))
+        response = player.serve("https://a.vn/feed")
+        assert response.content == FEED
+        assert response.headers["Content-Type"] == "application/rss+xml"
+
+        with pytest.raises(requests.ConnectionError) as recorded:
+            player.serve("https://b.vn/")  # 녹화된 네트워크 오류 (재시도 대상)
+        assert classify_error(recorded.value).retryable
+        with pytest.raises(ReplayMissError) as miss:
+            player.serve("https://c.vn/")  # 아카이브에 없음 (재시도하지 않음)
+        assert not classify_error(miss.value).retryable
+
+    def test_replays_retry_sequence(self, tmp_path):
+        """같은 URL은 녹화 순서대로 (실패 후 성공), 이후 마지막 응답 반복"""
+        archive = tmp_path / "run.jsonl.gz"
+        recorder = HttpReplay()
+        recorder.start_recording(str(archive))
+        error = requests.HTTPError(response=make_response(status_code=503, body=b""))
+        recorder.record_error("https://a.vn/", error, 0.1)
+        recorder.record("https://a.vn/", make_response(), 0.1)
+        recorder.stop()
+
+        player = HttpReplay()
+        player.start_replay(str(archive))
+        with pytest.raises(requests.HTTPError):
+            player.serve("https://a.vn/")
+        assert player.serve("https://a.vn/").content == FEED
+        assert player.serve("https://a.vn/").content == FEED
+
+    def test_latency(self, tmp_path):
+        archive = tmp_path / "run.jsonl.gz"
+        recorder = HttpReplay()
+        recorder.start_recording(str(archive))
+        recorder.record("https://a.vn/", make_response(), 0.75)
+        recorder.stop()
+
+        player = HttpReplay()
+        with patch("today_vn_news.scraping.replay.time.sleep") as sleep:
+            player.start_replay(str(archive), latency=RECORDED_LATENCY)
+            player.serve("https://a.vn/")
+            player.start_replay(str(archive), latency=0.2)
+            player.serve("https://a.vn/")
+        assert [c.args[0] for c in sleep.call_args_list] == [0.75, 0.2]
+
+    def test_read_archive_date(self, tmp_path):
+        """재생 실행의 YYMMDD 경로/완료 마커는 벽시계가 아닌 녹화 기준일에서 산출"""
+        archive = tmp_path / "run.jsonl.gz"
+        recorder = HttpReplay()
+        recorder.start_recording(str(archive), date_str="2026-02-11")
+        recorder.record("https://a.vn/feed", make_response(), 0.25)
+        recorder.stop()
+
+        replay_date = read_archive_date(str(archive))
+        assert replay_date == "2026-02-11"
+        assert normalize_timestamp(replay_date) == "260211"
+
+        undated = tmp_path / "undated.jsonl.gz"
+        recorder.start_recording(str(undated))
+        recorder.stop()
+        assert read_archive_date(str(undated)) is None
+
+    def test_parse_latency(self):
+        assert parse_latency(None) is None
+        assert parse_latency("recorded") == RECORDED_LATENCY
+        assert parse_latency("0.5") == 0.5
+
+
+@pytest.mark.unit
+class TestScraperReplay:
+    """_fetch_url 녹화 → 오프라인 재생 테스트"""
+
+    def test_record_then_replay_offline(self, tmp_path, no_cache):
+        from today_vn_news import scraper
+
+        archive = tmp_path / "run.jsonl.gz"
+        session = Mock()
+        session.get.return_value = make_response()
+
+        http_replay.start_recording(str(archive), date_str="2026-02-11")
+        with patch.object(scraper, "get_session", return_value=session):
+            recorded = scraper.scrape_vnexpress_tech("2026-02-11")
+        http_replay.stop()
+
+        # 재생 중에는 네트워크 세션을 사용하지 않음
+        http_replay.start_replay(str(archive))
+        with patch.object(scraper, "get_session", side_effect=AssertionError("network")):
+            replayed = scraper.scrape_vnexpress_tech(http_replay.date_str)
+
+        assert replayed == recorded
+        assert replayed[0]["title"] == "Tin 1"
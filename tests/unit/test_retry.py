@@ -0,0 +1,146 @@
+"""
+재시도 정책 단위 테스트
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from today_vn_news.retry import (
+    RetryBudget,
+    RetryPolicy,
+    classify_error,
+    get_retry_budget,
+    parse_retry_after,
+    reset_retry_budgets,
+    with_api_retry,
+    with_http_retry,
+)
+
+
+def http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    return requests.HTTPError(f"HTTP {status}", response=response)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    reset_retry_budgets()
+    with patch("today_vn_news.retry.time.sleep") as sleep:
+        yield sleep
+
+
+@pytest.mark.unit
+class TestClassifyError:
+    """재시도 분류 테스트"""
+
+    @pytest.mark.parametrize("status,retryable", [
+        (400, False), (403, False), (404, False), (408, True),
+        (429, True), (500, True), (501, False), (503, True),
+    ])
+    def test_http_status(self, status, retryable):
+        assert classify_error(http_error(status)).retryable is retryable
+
+    def test_exception_types(self):
+        assert classify_error(requests.ConnectionError("down")).retryable
+        assert classify_error(requests.Timeout("slow")).retryable
+        assert not classify_error(ValueError("bug")).retryable
+
+    def test_api_error_code(self):
+        """google-genai APIError 처럼 code 속성을 가진 예외"""
+        error = Exception("quota")
+        error.code = 429
+        assert classify_error(error).retryable
+        error.code = 400
+        assert not classify_error(error).retryable
+
+    def test_retry_after(self):
+        assert parse_retry_after(http_error(429, {"Retry-After": "7"})) == 7.0
+        assert parse_retry_after(http_error(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+        assert parse_retry_after(http_error(503)) is None
+        assert classify_error(http_error(429, {"Retry-After": "3"})).retry_after == 3.0
+
+
+@pytest.mark.unit
+class TestRetryPolicy:
+    """RetryPolicy 재시도 동작 테스트"""
+
+    def test_client_error_not_retried(self, no_sleep):
+        """4xx는 즉시 실패 (기존 isinstance(e, requests.Response) 버그 회귀 방지)"""
+        func = Mock(side_effect=http_error(404), __name__="fetch")
+        with pytest.raises(requests.HTTPError):
+            with_http_retry(max_attempts=3)(func)()
+        assert func.call_count == 1
+        no_sleep.assert_not_called()
+
+    def test_server_error_retried_with_full_jitter(self, no_sleep):
+        func = Mock(side_effect=[http_error(503), requests.ConnectionError("reset"), "ok"], __name__="fetch")
+        with patch("today_vn_news.retry.random.uniform", side_effect=lambda lo, hi: hi / 2) as uniform:
+            assert with_http_retry(max_attempts=3, initial_delay=1.0)(func)() == "ok"
+        assert [c.args for c in uniform.call_args_list] == [(0, 1.0), (0, 2.0)]
+        assert [c.args[0] for c in no_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_honors_retry_after(self, no_sleep):
+        func = Mock(side_effect=[http_error(429, {"Retry-After": "4"}), "ok"], __name__="fetch")
+        assert with_http_retry()(func)() == "ok"
+        no_sleep.assert_called_once_with(4.0)
+
+        too_long = Mock(side_effect=http_error(429, {"Retry-After": "3600"}), __name__="fetch")
+        with pytest.raises(requests.HTTPError):
+            with_http_retry()(too_long)()
+        assert too_long.call_count == 1
+
+    def test_max_attempts(self, no_sleep):
+        func = Mock(side_effect=requests.Timeout("slow"), __name__="fetch")
+        with pytest.raises(requests.Timeout):
+            with_http_retry(max_attempts=3)(func)()
+        assert func.call_count == 3
+
+    def test_api_retry_respects_exception_filter(self):
+        func = Mock(side_effect=KeyError("x"), __name__="call")
+        with pytest.raises(KeyError):
+            with_api_retry(exceptions=(ConnectionError,))(func)()
+        assert func.call_count == 1
+
+    async def test_async_uses_asyncio_sleep(self, no_sleep):
+        calls = []
+
+        @RetryPolicy(max_attempts=3, jitter=False, initial_delay=0.5)
+        async def fetch():
+            calls.append(1)
+            if len(calls) < 2:
+                raise requests.ConnectionError("reset")
+            return "ok"
+
+        with patch("today_vn_news.retry.asyncio.sleep", new_callable=AsyncMock) as async_sleep:
+            assert await fetch() == "ok"
+        async_sleep.assert_awaited_once_with(0.5)
+        no_sleep.assert_not_called()
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    """실행당 재시도 예산 테스트"""
+
+    def test_budget_stops_retries(self, no_sleep):
+        policy = RetryPolicy(max_attempts=10, jitter=False, initial_delay=1.0, backoff_factor=1.0, budget="test")
+        get_retry_budget("test").reset(max_seconds=2.5)
+        func = Mock(side_effect=requests.ConnectionError("dead site"), __name__="fetch")
+
+        with pytest.raises(requests.ConnectionError):
+            policy.call(func)
+
+        budget = get_retry_budget("test")
+        assert func.call_count == 3  # 재시도 2회(2초) 후 예산 소진
+        assert (budget.retries, budget.denied, budget.spent) == (2, 1, 2.0)
+
+    def test_reset(self):
+        budget = RetryBudget("x", 1.0)
+        assert budget.try_spend(1.0)
+        assert not budget.try_spend(0.1)
+        budget.reset()
+        assert budget.remaining == 1.0
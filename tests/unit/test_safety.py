@@ -0,0 +1,199 @@
+"""
+안전 데이터 결과 캐시·도시 패널·지진 필터 단위 테스트
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from today_vn_news.scraping.safety import SafetyCache, is_cacheable
+
+
+@pytest.mark.unit
+class TestSafetyCache:
+    """소스별 TTL 캐시 테스트"""
+
+    def test_ttl_and_date(self, tmp_path):
+        cache = SafetyCache(str(tmp_path / "safety.json"))
+        with patch("today_vn_news.scraping.safety.time.time", return_value=1000.0):
+            cache.put("air_quality", "2026-02-11", {"aqi": "87"})
+
+        with patch("today_vn_news.scraping.safety.time.time", return_value=1000.0 + 3599):
+            assert cache.get("air_quality", "2026-02-11", ttl=3600) == (True, {"aqi": "87"})
+            assert cache.get("air_quality", "2026-02-12", ttl=3600) == (False, None)
+            assert cache.get("earthquake", "2026-02-11", ttl=3600) == (False, None)
+        with patch("today_vn_news.scraping.safety.time.time", return_value=1000.0 + 3600):
+            assert cache.get("air_quality", "2026-02-11", ttl=3600) == (False, None)
+
+    def test_persisted_and_corrupt_file(self, tmp_path):
+        path = tmp_path / "safety.json"
+        SafetyCache(str(path)).put("earthquake", "2026-02-11", [])
+        assert SafetyCache(str(path)).get("earthquake", "2026-02-11", ttl=600) == (True, [])
+
+        path.write_text("{broken", encoding="utf-8")
+        assert SafetyCache(str(path)).get("earthquake", "2026-02-11", ttl=600) == (False, None)
+
+    def test_is_cacheable(self):
+        assert is_cacheable([])  # 지진 0건은 정상 결과
+        assert is_cacheable({"temp": "31°C", "humidity": "", "condition": ""})
+        assert not is_cacheable({"aqi": "", "status": "", "pm25": "", "pm10": ""})
+        assert not is_cacheable(None)
+
+
+def open_meteo(payload):
+    response = Mock()
+    response.json.return_value = payload
+    return response
+
+
+@pytest.mark.unit
+class TestCityPanel:
+    """도시별 기상·공기질 패널 테스트 (네트워크 없음)"""
+
+    WEATHER = [
+        {"current": {"temperature_2m": 31.4, "relative_humidity_2m": 70, "weather_code": 2}},
+        {"current": {"temperature_2m": 18.0, "relative_humidity_2m": 85, "weather_code": 61}},
+        {"current": {"temperature_2m": 26.6, "relative_humidity_2m": 78, "weather_code": 0}},
+    ]
+    AIR = [
+        {"current": {"us_aqi": 87, "pm2_5": 28.04, "pm10": 40.0}},
+        {"current": {"us_aqi": 162, "pm2_5": 75.5, "pm10": 99.1}},
+        {"current": {"us_aqi": None, "pm2_5": None, "pm10": None}},
+    ]
+
+    def test_classify_aqi_vectorized(self):
+        from today_vn_news.scraper import classify_aqi
+
+        assert classify_aqi([0, 50, 51, 150, 151, 301, None]) == [
+            "Good", "Good", "Moderate", "Unhealthy for Sensitive Groups", "Unhealthy", "Hazardous", "",
+        ]
+
+    def test_one_request_per_api_for_all_cities(self):
+        from today_vn_news import scraper
+
+        fetch = Mock(side_effect=[open_meteo(self.WEATHER), open_meteo(self.AIR)])
+        with patch.object(scraper, "_fetch_url_with_params", fetch):
+            cities = scraper.scrape_city_panel("2026-02-11")
+
+        assert fetch.call_count == 2
+        params = fetch.call_args_list[0].kwargs["params"]
+        assert params["latitude"] == "10.78069,21.02851,16.05441"
+        assert [c["city"] for c in cities] == ["Hồ Chí Minh", "Hà Nội", "Đà Nẵng"]
+        assert cities[0] == {
+            "city": "Hồ Chí Minh", "temp": "31°C", "humidity": "70%", "condition": "구름 조금",
+            "aqi": "87", "status": "Moderate", "pm25": "28.0", "pm10": "40.0",
+        }
+        assert (cities[1]["status"], cities[2]["aqi"], cities[2]["status"]) == ("Unhealthy", "", "")
+
+    def test_partial_when_one_request_fails(self):
+        import requests
+
+        from today_vn_news import scraper
+
+        fetch = Mock(side_effect=[requests.ConnectionError("down"), open_meteo(self.AIR)])
+        with patch.object(scraper, "_fetch_url_with_params", fetch):
+            cities = scraper.scrape_city_panel("2026-02-11")
+        assert cities[0]["temp"] == "" and cities[0]["aqi"] == "87"
+
+        fetch = Mock(side_effect=requests.ConnectionError("down"))
+        with patch.object(scraper, "_fetch_url_with_params", fetch):
+            with pytest.raises(scraper.ScrapingError):
+                scraper.scrape_city_panel("2026-02-11")
+
+    def test_one_safety_item_per_city(self, tmp_path, monkeypatch):
+        import yaml
+
+        from today_vn_news import scraper
+        from today_vn_news.config import ScraperConfig
+        from today_vn_news.scraping.registry import SourceRegistry, load_source_configs
+
+        fetch = Mock(side_effect=[open_meteo(self.WEATHER), open_meteo(self.AIR)])
+        monkeypatch.setattr(scraper, "_fetch_url_with_params", fetch)
+        registry = SourceRegistry.from_dict({"cities": load_source_configs()["cities"]})
+        output = tmp_path / "raw.yaml"
+        config = ScraperConfig(warm_dns=False, health_enabled=False, safety_cache_enabled=False, page_store_enabled=False, seen_enabled=False)
+        scraper.scrape_and_save("2026-02-11", str(output), config, registry)
+
+        items = yaml.safe_load(output.read_text(encoding="utf-8"))["sections"][0]["items"]
+        assert [item["title"] for item in items] == [
+            "Hồ Chí Minh 기상·공기질 - AQI 87", "Hà Nội 기상·공기질 - AQI 162", "Đà Nẵng 기상·공기질",
+        ]
+        assert items[0]["content"] == "구름 조금, 온도 31°C, 습도 70% / AQI 87 (Moderate), PM2.5: 28.0, PM10: 40.0"
+        assert items[2]["content"] == "맑음, 온도 27°C, 습도 78% / 공기질 정보 없음"
+
+
+def quake_feed(*descriptions):
+    import requests
+
+    items = "".join(
+        f"<item><title>Earthquake {i}</title><link>http://igp-vast.vn/tin-{i}</link>"
+        f"<description>{text}</description><pubDate>Wed, 11 Feb 2026 08:00:00 +0700</pubDate></item>"
+        for i, text in enumerate(descriptions)
+    )
+    response = requests.Response()
+    response.status_code = 200
+    response._content = f"<rss><channel>{items}</channel></rss>".encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.mark.unit
+class TestQuakeRelevance:
+    """지진 구조화 + 거리 대비 규모 필터 테스트"""
+
+    CITIES = [
+        {"name": "Hà Nội", "latitude": 21.02851, "longitude": 105.85420},
+        {"name": "Đà Nẵng", "latitude": 16.05441, "longitude": 108.20217},
+    ]
+
+    def test_parse_english_and_vietnamese(self):
+        from today_vn_news.scraping.quake import parse_quake
+
+        event = parse_quake("An earthquake of magnitude 3.8 occurred at 15.21N, 108.05E, depth 10 km")
+        assert (event.magnitude, event.latitude, event.longitude, event.depth_km) == (3.8, 15.21, 108.05, 10.0)
+
+        event = parse_quake("Động đất có độ lớn 4,2 tại vĩ độ 21,3 độ vĩ Bắc, kinh độ 103,9 độ kinh Đông, độ sâu 12 km")
+        assert (event.magnitude, event.latitude, event.longitude, event.depth_km) == (4.2, 21.3, 103.9, 12.0)
+        assert not parse_quake("Thông báo động đất").located
+
+    def test_haversine_broadcasts(self):
+        import numpy as np
+
+        from today_vn_news.scraping.quake import haversine_km
+
+        distances = haversine_km(np.array([[21.02851], [0.0]]), np.array([[105.85420], [0.0]]), [16.05441], [108.20217])
+        assert distances.shape == (2, 1)
+        assert distances[0, 0] == pytest.approx(606, abs=5)  # 하노이-다낭
+
+    def test_mask_by_distance_tier(self):
+        from today_vn_news.scraping.quake import QuakeEvent, relevant_mask
+
+        events = [
+            QuakeEvent(3.0, 16.2, 108.1),  # 다낭 근처 소규모 → 유지
+            QuakeEvent(3.0, 24.5, 99.0),  # 멀리 소규모 → 제외
+            QuakeEvent(7.2, 38.0, 142.0),  # 멀리 대규모 → 유지
+            QuakeEvent(None, None, None),  # 판단 불가 → 유지
+        ]
+        keep, nearest, distance = relevant_mask(events, self.CITIES)
+        assert keep.tolist() == [True, False, True, True]
+        assert nearest[0] == 1 and distance[0] < 100
+        assert distance[3] != distance[3]  # NaN
+
+    def test_scrape_earthquake_filters_and_summarizes(self):
+        from today_vn_news import scraper
+        from today_vn_news.scraping.registry import SourceRegistry, load_source_configs
+        from today_vn_news.scraping.stream import StreamedBody
+
+        feed = quake_feed(
+            "Magnitude 3.1 at 16.10N, 108.15E, depth 8 km",
+            "Magnitude 3.4 at 24.50N, 99.00E, depth 10 km",
+            "Thông báo động đất khu vực miền Trung",
+        )
+        source = SourceRegistry.from_dict({"earthquake": load_source_configs()["earthquake"]}).get("earthquake")
+        with patch.object(scraper, "_fetch_stream", return_value=StreamedBody(feed)):
+            quakes = scraper.scrape_earthquake("2026-02-11", source=source)
+
+        assert [quake["title"] for quake in quakes] == ["Earthquake 0", "Earthquake 2"]
+        assert quakes[0]["content"] == "규모 3.1, 깊이 8km, Đà Nẵng에서 약 8km"
+        assert quakes[0]["nearest_city"] == "Đà Nẵng" and quakes[0]["magnitude"] == 3.1
+        assert quakes[1]["content"] == "Thông báo động đất khu vực miền Trung"
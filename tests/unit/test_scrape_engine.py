@@ -0,0 +1,350 @@
+"""
+소스 병렬 수집 엔진 단위 테스트
+"""
+
+import threading
+import time
+
+import pytest
+import yaml
+
+from today_vn_news.config import ScraperConfig
+from today_vn_news.scraping.engine import (
+    DeadlineExceeded,
+    HostLimiter,
+    clamp_timeout,
+    remaining_time,
+    run_sources,
+)
+from today_vn_news.scraping.registry import SourceRegistry, load_source_configs
+
+SOURCES = load_source_configs()
+
+
+@pytest.mark.unit
+class TestRunSources:
+    """run_sources 테스트"""
+
+    def test_preserves_task_order(self):
+        """결과 순서는 완료 순서가 아닌 tasks 삽입 순서"""
+        tasks = {
+            "slow": lambda: time.sleep(0.05) or "a",
+            "fast": lambda: "b",
+        }
+        results = run_sources(tasks, max_workers=4)
+
+        assert list(results) == ["slow", "fast"]
+        assert results["slow"].value == "a"
+        assert results["fast"].value == "b"
+
+    def test_runs_concurrently(self):
+        """소요 시간이 합계가 아닌 최댓값에 가까움"""
+        tasks = {f"src{i}": (lambda: time.sleep(0.2)) for i in range(5)}
+
+        start = time.perf_counter()
+        results = run_sources(tasks, max_workers=5)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.6
+        assert all(r.elapsed >= 0.2 for r in results.values())
+
+    def test_error_is_captured_per_source(self):
+        """한 소스의 예외가 다른 소스 수집을 막지 않음"""
+        def boom():
+            raise ValueError("boom")
+
+        results = run_sources({"bad": boom, "good": lambda: 1})
+
+        assert not results["bad"].ok
+        assert isinstance(results["bad"].error, ValueError)
+        assert results["good"].ok
+        assert results["good"].value == 1
+
+    def test_empty_tasks(self):
+        assert run_sources({}) == {}
+
+    def test_deadline_returns_partial_results(self):
+        """마감 시간까지 끝나지 않은 소스는 timeout, 끝난 소스는 결과 유지"""
+        release = threading.Event()
+        seen_remaining = []
+
+        def stuck():
+            seen_remaining.append(remaining_time())
+            release.wait(2)
+            return "late"
+
+        start = time.perf_counter()
+        results = run_sources({"fast": lambda: 1, "stuck": stuck}, max_workers=2, deadline=0.2, grace=0.1)
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        assert elapsed < 1.0  # 유예 시간 후에도 끝나지 않는 스레드는 기다리지 않음
+        assert results["fast"].status == "ok"
+        assert results["stuck"].status == "timeout"
+        assert isinstance(results["stuck"].error, DeadlineExceeded)
+        assert 0 < seen_remaining[0] <= 0.2
+
+    def test_stragglers_stop_before_return(self):
+        """마감 후 새 요청을 시작하려는 소스는 중단되고, 반환 전에 종료까지 대기"""
+        stopped = threading.Event()
+
+        def polling():
+            try:
+                while True:
+                    clamp_timeout(10)
+                    time.sleep(0.02)
+            finally:
+                stopped.set()
+
+        results = run_sources({"poll": polling}, deadline=0.1, grace=1.0)
+
+        assert stopped.is_set()
+        assert results["poll"].status == "timeout"
+
+    def test_clamp_timeout(self):
+        """요청 타임아웃은 남은 마감 시간으로 제한, 마감 후 새 요청은 DeadlineExceeded"""
+        assert clamp_timeout(10) == 10  # 마감 없음
+        assert run_sources({"a": lambda: clamp_timeout(10)}, deadline=5)["a"].value <= 5
+
+        errors = []
+        finished = threading.Event()
+
+        def late():
+            time.sleep(0.15)
+            try:
+                clamp_timeout(10)
+            except DeadlineExceeded as e:
+                errors.append(e)
+            finished.set()
+
+        assert run_sources({"a": late}, deadline=0.1)["a"].status == "timeout"
+        assert finished.wait(1)
+        assert len(errors) == 1
+
+
+@pytest.mark.unit
+class TestHostLimiter:
+    """HostLimiter 테스트"""
+
+    def test_limits_same_host(self):
+        """같은 호스트 동시 요청 수가 per_host를 넘지 않음"""
+        limiter = HostLimiter(per_host=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch():
+            nonlocal active, peak
+            with limiter.limit("https://vnexpress.net/rss/a.rss"):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.05)
+                with lock:
+                    active -= 1
+
+        run_sources({f"feed{i}": fetch for i in range(6)}, max_workers=6)
+        assert peak == 2
+
+    def test_hosts_are_independent(self):
+        """다른 호스트는 서로의 슬롯을 점유하지 않음"""
+        limiter = HostLimiter(per_host=1)
+        with limiter.limit("https://vnexpress.net/"):
+            acquired = threading.Event()
+
+            def other():
+                with limiter.limit("https://tuoitre.vn/"):
+                    acquired.set()
+
+            thread = threading.Thread(target=other)
+            thread.start()
+            thread.join(timeout=1)
+            assert acquired.is_set()
+
+
+@pytest.mark.unit
+class TestScraperConfig:
+    """ScraperConfig 로딩 테스트"""
+
+    def test_default_values(self):
+        config = ScraperConfig()
+        assert config.max_workers == 8
+        assert config.per_host_limit == 2
+
+    def test_from_yaml(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            yaml.dump({"scraper": {"concurrency": {"max_workers": 3, "per_host_limit": 1}}})
+        )
+        config = ScraperConfig.from_yaml(str(config_file))
+        assert config.max_workers == 3
+        assert config.per_host_limit == 1
+
+    def test_from_yaml_missing_file(self):
+        config = ScraperConfig.from_yaml("nonexistent.yaml")
+        assert config.max_workers == 8
+
+
+@pytest.mark.unit
+class TestScrapeAndSaveConcurrent:
+    """scrape_and_save 병렬 수집 테스트 (네트워크 없음)"""
+
+    def test_keeps_section_order(self, tmp_path, monkeypatch):
+        from today_vn_news import scraper
+
+        def fake_source(name, delay):
+            def _scrape(date_str, source=None):
+                time.sleep(delay)
+                return [{
+                    "title": f"{name} 기사 제목입니다",
+                    "content": "내용",
+                    "url": f"https://example.com/{name}",
+                    "date": date_str,
+                }]
+            return _scrape
+
+        monkeypatch.setattr(scraper, "scrape_b", fake_source("B", 0.1), raising=False)
+        monkeypatch.setattr(scraper, "scrape_a", fake_source("A", 0.0), raising=False)
+        monkeypatch.setattr(scraper, "scrape_weather_hochiminh",
+                            lambda date_str, source=None: {"temp": "30", "humidity": "70", "condition": "Nắng"})
+        monkeypatch.setattr(scraper, "scrape_air_quality",
+                            lambda date_str, source=None: {"aqi": "50", "status": "Good", "pm25": "1.0", "pm10": "2.0"})
+        registry = SourceRegistry.from_dict({
+            "weather": SOURCES["weather"],
+            "air_quality": {**SOURCES["air_quality"], "enabled": True},
+            "earthquake": {**SOURCES["earthquake"], "enabled": False},
+            "b": {"name": "B", "scraper": "today_vn_news.scraper:scrape_b"},
+            "a": {"name": "A", "scraper": "today_vn_news.scraper:scrape_a"},
+        })
+
+        output = tmp_path / "raw.yaml"
+        config = ScraperConfig(warm_dns=False, health_enabled=False, safety_cache_enabled=False, page_store_enabled=False)
+        data = scraper.scrape_and_save("2026-02-11", str(output), config, registry=registry)
+
+        assert list(data) == ["안전 및 기상 관제", "B", "A"]
+        assert len(data["안전 및 기상 관제"]) == 2  # 기상 + 공기 (지진 비활성)
+        saved = yaml.safe_load(output.read_text(encoding="utf-8"))
+        assert [s["name"] for s in saved["sections"]] == ["안전 및 기상 관제", "B", "A"]
+        assert saved["source_status"]["B"]["status"] == "ok"
+        assert saved["source_status"]["B"]["items"] == 1
+
+    def _registry(self, monkeypatch, news):
+        from today_vn_news import scraper
+
+        for key, func in news.items():
+            monkeypatch.setattr(scraper, f"scrape_{key}", func, raising=False)
+        return SourceRegistry.from_dict({
+            **{key: {**SOURCES[key], "enabled": False} for key in ("weather", "air_quality", "cities", "earthquake")},
+            **{key: {"name": key.upper(), "scraper": f"today_vn_news.scraper:scrape_{key}"} for key in news},
+        })
+
+    @staticmethod
+    def _article(name, date_str):
+        return [{"title": f"{name} 기사 제목입니다", "content": "내용", "url": f"https://example.com/{name}"}]
+
+    def test_partial_results_and_rerun_fetches_failed_only(self, tmp_path, monkeypatch):
+        from today_vn_news import scraper
+
+        calls = []
+
+        def ok_source(date_str, source=None):
+            calls.append("a")
+            return self._article("A", date_str)
+
+        def flaky(date_str, source=None):
+            calls.append("b")
+            if calls.count("b") == 1:
+                raise scraper.ScrapingError("down")
+            return self._article("B", date_str)
+
+        registry = self._registry(monkeypatch, {"a": ok_source, "b": flaky})
+        config = ScraperConfig(warm_dns=False, health_enabled=False, safety_cache_enabled=False, page_store_enabled=False)
+        output = tmp_path / "raw.yaml"
+        prefix = str(tmp_path / "260211")
+
+        data = scraper.scrape_and_save("2026-02-11", str(output), config, registry, checkpoint_prefix=prefix)
+        assert data["B"] == [] and len(data["A"]) == 1
+        status = yaml.safe_load(output.read_text(encoding="utf-8"))["source_status"]
+        assert (status["A"]["status"], status["B"]["status"]) == ("ok", "failed")
+        assert status["B"]["error"] == "down"
+        assert (tmp_path / "260211.scraper.a.done").exists()
+        assert not (tmp_path / "260211.scraper.b.done").exists()
+
+        # 재실행: 완료 마커가 있는 A는 재사용, B만 다시 수집
+        data = scraper.scrape_and_save("2026-02-11", str(output), config, registry, checkpoint_prefix=prefix)
+        assert calls == ["a", "b", "b"]
+        assert len(data["B"]) == 1
+        status = yaml.safe_load(output.read_text(encoding="utf-8"))["source_status"]
+        assert (status["A"]["status"], status["B"]["status"]) == ("reused", "ok")
+
+    def test_too_few_news_sources_raises_after_saving(self, tmp_path, monkeypatch):
+        from today_vn_news import scraper
+
+        def down(date_str, source=None):
+            raise scraper.ScrapingError("down")
+
+        registry = self._registry(monkeypatch, {"a": down})
+        output = tmp_path / "raw.yaml"
+        with pytest.raises(scraper.ScrapingError, match="성공 0/1"):
+            config = ScraperConfig(warm_dns=False, health_enabled=False, safety_cache_enabled=False, page_store_enabled=False)
+            scraper.scrape_and_save("2026-02-11", str(output), config, registry)
+        assert yaml.safe_load(output.read_text(encoding="utf-8"))["source_status"]["A"]["status"] == "failed"
+
+    def test_empty_result_is_not_checkpointed_or_counted(self, tmp_path, monkeypatch):
+        from today_vn_news import scraper
+
+        calls = []
+
+        def all_feeds_down(date_str, source=None):
+            calls.append("a")
+            return []
+
+        registry = self._registry(monkeypatch, {"a": all_feeds_down})
+        config = ScraperConfig(warm_dns=False, health_enabled=False, safety_cache_enabled=False, page_store_enabled=False)
+        output = tmp_path / "raw.yaml"
+        prefix = str(tmp_path / "260211")
+
+        with pytest.raises(scraper.ScrapingError, match="성공 0/1"):
+            scraper.scrape_and_save("2026-02-11", str(output), config, registry, checkpoint_prefix=prefix)
+        assert not (tmp_path / "260211.scraper.a.done").exists()
+
+        # 재실행 시 빈 결과였던 소스를 다시 수집
+        with pytest.raises(scraper.ScrapingError):
+            scraper.scrape_and_save("2026-02-11", str(output), config, registry, checkpoint_prefix=prefix)
+        assert calls == ["a", "a"]
+
+    def test_safety_results_reused_within_ttl(self, tmp_path, monkeypatch):
+        from today_vn_news import scraper
+
+        calls = []
+
+        def weather(date_str, source=None):
+            calls.append("weather")
+            return {"temp": "31°C", "humidity": "70%", "condition": "Nắng"}
+
+        monkeypatch.setattr(scraper, "scrape_weather_hochiminh", weather)
+        monkeypatch.setattr(scraper, "scrape_air_quality",
+                            lambda date_str, source=None: {"aqi": "", "status": "", "pm25": "", "pm10": ""})
+        monkeypatch.setattr(scraper, "scrape_a", lambda date_str, source=None: self._article("A", date_str),
+                            raising=False)
+        registry = SourceRegistry.from_dict({
+            "weather": SOURCES["weather"],
+            "air_quality": {**SOURCES["air_quality"], "enabled": True},
+            "earthquake": {**SOURCES["earthquake"], "enabled": False},
+            "a": {"name": "A", "scraper": "today_vn_news.scraper:scrape_a"},
+        })
+        config = ScraperConfig(
+            warm_dns=False, health_enabled=False, safety_cache_path=str(tmp_path / "safety.json")
+        )
+        output = tmp_path / "raw.yaml"
+
+        scraper.scrape_and_save("2026-02-11", str(output), config, registry)
+        scraper.scrape_and_save("2026-02-11", str(output), config, registry)
+
+        assert calls == ["weather"]  # 두 번째 실행은 캐시 재사용
+        status = yaml.safe_load(output.read_text(encoding="utf-8"))["source_status"]
+        assert status["기상"]["status"] == "cached"
+        assert status["공기"]["status"] == "ok"  # 빈 결과(수집 실패)는 캐시하지 않음
+
+        scraper.scrape_and_save("2026-02-12", str(output), config, registry)
+        assert calls == ["weather", "weather"]  # 기준일이 바뀌면 다시 수집
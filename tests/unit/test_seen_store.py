@@ -0,0 +1,118 @@
+"""
+방송된 기사 저장소 단위 테스트
+"""
+
+import sqlite3
+
+import pytest
+
+from today_vn_news.scraping.seen_store import SeenStore, content_hash, url_hash
+
+SAFETY = "안전 및 기상 관제"
+
+
+def article(title, url):
+    return {"title": title, "content": "Nội dung", "url": url, "date": "2026-02-10"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SeenStore(str(tmp_path / "seen.sqlite3"), window_days=3)
+    yield store
+    store.close()
+
+
+@pytest.mark.unit
+class TestHashes:
+    """URL/제목 지문 테스트"""
+
+    def test_url_hash_uses_canonical_url(self):
+        assert url_hash("https://www.tuoitre.vn/a.htm?utm_source=rss") == url_hash("http://tuoitre.vn/a.htm")
+        assert url_hash("") == ""
+
+    def test_content_hash_folds_vietnamese(self):
+        assert content_hash("Giá vàng  tăng mạnh") == content_hash("gia vang tang manh")
+        assert content_hash("") == ""
+
+
+@pytest.mark.unit
+class TestSeenStore:
+    """SeenStore 조회/기록/정리 테스트"""
+
+    def test_missing_db_is_not_created_by_filter(self, store, tmp_path):
+        data = {"Tuổi Trẻ": [article("Tin A", "https://tuoitre.vn/a.htm")]}
+        assert store.filter_scraped(data, "2026-02-11") is data
+        assert not (tmp_path / "seen.sqlite3").exists()
+
+    def test_skips_articles_aired_in_window(self, store):
+        store.mark_aired({
+            SAFETY: [{"name": "기상", "url": "https://nchmf.gov.vn/"}],
+            "Tuổi Trẻ": [article("Tin A", "https://tuoitre.vn/a.htm")],
+        }, "2026-02-10")
+
+        data = {
+            SAFETY: [{"name": "기상", "url": "https://nchmf.gov.vn/"}],
+            "Tuổi Trẻ": [
+                article("Tin A", "https://tuoitre.vn/a.htm?utm_source=home"),
+                article("Tin B", "https://tuoitre.vn/b.htm"),
+            ],
+            "VnExpress": [article("TIN A", "https://vnexpress.net/a.html")],  # 같은 제목, 다른 URL
+        }
+        result = store.filter_scraped(data, "2026-02-11")
+
+        assert list(result) == list(data)
+        assert result[SAFETY] == data[SAFETY]
+        assert [a["title"] for a in result["Tuổi Trẻ"]] == ["Tin B"]
+        assert result["VnExpress"] == []
+
+    def test_same_day_rerun_and_window_boundary(self, store):
+        data = {"Tuổi Trẻ": [article("Tin A", "https://tuoitre.vn/a.htm")]}
+        store.mark_aired(data, "2026-02-10")
+
+        assert store.filter_scraped(data, "2026-02-10") == data  # 같은 날 재실행
+        assert store.first_aired(data["Tuổi Trẻ"][0], "2026-02-13") == "2026-02-10"
+        assert store.first_aired(data["Tuổi Trẻ"][0], "2026-02-14") is None  # 3일 초과
+
+    def test_keeps_first_aired_and_records_also_reported_by(self, store):
+        winner = article("Tin A", "https://tuoitre.vn/a.htm")
+        winner["also_reported_by"] = [{"source": "VnExpress", "url": "https://vnexpress.net/x.html"}]
+        assert store.mark_aired({"Tuổi Trẻ": [winner]}, "2026-02-10") == 2
+        assert store.mark_aired({"Tuổi Trẻ": [winner]}, "2026-02-11") == 0
+
+        other = article("Tiêu đề khác", "https://vnexpress.net/x.html")
+        assert store.first_aired(other, "2026-02-12") == "2026-02-10"
+
+    def test_prunes_old_rows(self, store, tmp_path):
+        store.mark_aired({"A": [article("Tin cũ", "https://a.vn/1")]}, "2026-02-01")
+        store.mark_aired({"A": [article("Tin mới", "https://a.vn/2")]}, "2026-02-10")
+        store.close()
+
+        conn = sqlite3.connect(tmp_path / "seen.sqlite3")
+        rows = conn.execute("SELECT title FROM seen_articles").fetchall()
+        conn.close()
+        assert rows == [("Tin mới",)]
+
+    def test_restart_from_raw_yaml(self, store, tmp_path):
+        from today_vn_news.scraper import load_raw_yaml, save_raw_yaml
+        from today_vn_news.scraping.registry import SourceRegistry
+
+        registry = SourceRegistry.from_dict({"tuoitre": {"name": "Tuổi Trẻ", "type": "rss", "urls": ["x"]}})
+        scraped = {
+            SAFETY: [{"name": "지진", "title": "Động đất", "content": "규모 4.0", "url": "https://igp-vast.vn/"}],
+            "Tuổi Trẻ": [
+                article("Tin A đã phát sóng hôm qua", "https://tuoitre.vn/a.htm"),
+                article("Tin B mới của hôm nay", "https://tuoitre.vn/b.htm"),
+            ],
+        }
+        raw_path = str(tmp_path / "260211_raw.yaml")
+        save_raw_yaml(scraped, "2026-02-11", raw_path, registry=registry)
+        store.mark_aired({"Tuổi Trẻ": scraped["Tuổi Trẻ"][:1]}, "2026-02-10")
+
+        # 1단계 완료 후 재시작: 원본 YAML을 scrape_and_save 결과 형태로 로드
+        restarted = load_raw_yaml(raw_path)
+        assert list(restarted) == [SAFETY, "Tuổi Trẻ"]
+
+        result = store.filter_scraped(restarted, "2026-02-11")
+        assert [a["title"] for a in result["Tuổi Trẻ"]] == ["Tin B mới của hôm nay"]
+        assert store.mark_aired(result, "2026-02-11") == 1
+        assert store.first_aired(scraped["Tuổi Trẻ"][1], "2026-02-12") == "2026-02-11"
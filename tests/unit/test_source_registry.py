@@ -0,0 +1,178 @@
+"""
+소스 레지스트리 단위 테스트
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+import requests
+import yaml
+
+from today_vn_news.exceptions import TodayVnNewsError
+from today_vn_news.scraping import registry as registry_module
+from today_vn_news.scraping.registry import (
+    SourceRegistry,
+    SourceSpec,
+    default_source,
+    load_source_configs,
+)
+from today_vn_news.scraping.stream import StreamedBody
+
+SOURCES = load_source_configs()
+
+
+@pytest.mark.unit
+class TestSourceSpec:
+    """SourceSpec 변환 테스트"""
+
+    def test_labeled_urls_and_hosts(self):
+        spec = SourceSpec.from_dict("vnexpress", SOURCES["vnexpress"])
+
+        assert spec.urls[0] == ("경제", "https://vnexpress.net/rss/kinh-doanh.rss")
+        assert spec.hosts == ["vnexpress.net"]
+        assert spec.scraper == "today_vn_news.scraper:scrape_rss_source"
+
+    def test_plain_url_list_uses_name_as_label(self):
+        spec = SourceSpec.from_dict("x", {"name": "X", "type": "rss", "urls": ["https://x.vn/a.rss"]})
+        assert spec.urls == [("X", "https://x.vn/a.rss")]
+        assert spec.url == "https://x.vn/a.rss"
+
+    @pytest.mark.parametrize("data", [
+        {"type": "xml", "scraper": "m:f"},
+        {"type": "html"},  # html 유형은 scraper 필수
+        {"scraper": "m:f", "priority": "P9"},
+    ])
+    def test_invalid(self, data):
+        with pytest.raises(TodayVnNewsError):
+            SourceSpec.from_dict("bad", data)
+
+    def test_load_scraper_error(self):
+        spec = SourceSpec.from_dict("bad", {"scraper": "today_vn_news.scraper:no_such_func"})
+        with pytest.raises(TodayVnNewsError):
+            spec.load_scraper()
+
+
+@pytest.mark.unit
+class TestSourceRegistry:
+    """SourceRegistry 테스트"""
+
+    def test_default_is_project_config(self):
+        """기본 소스 = 프로젝트 config.yaml의 scraper.sources (코드에 소스 정의 없음)"""
+        assert SourceRegistry.from_yaml("config.yaml").sources == SourceRegistry.default().sources
+        assert SourceRegistry.from_yaml("nonexistent.yaml").sources == SourceRegistry.default().sources
+
+    def test_default_source_uses_global_registry(self, monkeypatch):
+        registry = SourceRegistry.from_dict({"weather": {**SOURCES["weather"], "urls": ["https://mirror.vn/w"]}})
+        monkeypatch.setattr(registry_module, "_registry", registry)
+
+        assert default_source("weather").url == "https://mirror.vn/w"
+        with pytest.raises(TodayVnNewsError):
+            default_source("vnexpress")
+
+    def test_translation_order_by_priority(self):
+        registry = SourceRegistry.default()
+        order = registry.translation_order()
+
+        assert order[0] == "Sức khỏe & Đời sống"
+        assert order[1:3] == ["Nhân Dân", "Tuổi Trẻ"]
+        assert "기상" not in order
+        assert registry.priority_of("안전 및 기상 관제") == "P0"
+        assert registry.priority_of("Unknown") == "P2"
+
+    def test_disabled_sources_excluded(self):
+        registry = SourceRegistry.default()
+        names = [spec.key for spec in registry.enabled("news")]
+
+        assert "thanhnien_html" not in names
+        assert registry.get("Thanh Niên").key == "thanhnien"
+
+    def test_duplicate_enabled_names(self):
+        with pytest.raises(TodayVnNewsError):
+            SourceRegistry.from_dict({
+                "thanhnien": SOURCES["thanhnien"],
+                "thanhnien_html": {**SOURCES["thanhnien_html"], "enabled": True},
+            })
+
+    def test_from_yaml_without_sources(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"scraper": {"concurrency": {"max_workers": 4}}}), encoding="utf-8")
+        assert len(SourceRegistry.from_yaml(str(path)).sources) == len(SOURCES)
+
+    def test_heavy_dependencies_imported_on_use(self):
+        """RSS 소스 스크래퍼 로드는 bs4/NumPy/지진 필터를 import하지 않음 (새 프로세스에서 확인)"""
+        code = (
+            "import sys\n"
+            "from today_vn_news.scraping.registry import SourceRegistry\n"
+            "SourceRegistry.default().get('VnExpress').load_scraper()\n"
+            "heavy = ('numpy', 'bs4', 'today_vn_news.scraping.quake', 'today_vn_news.scraping.html_parser')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ""
+
+    def test_disabled_scraper_not_imported(self, tmp_path):
+        """비활성 소스의 스크래퍼 모듈은 import하지 않음"""
+        from today_vn_news import scraper
+
+        registry = SourceRegistry.from_dict({
+            "weather": {**SOURCES["weather"], "enabled": False},
+            "air_quality": {**SOURCES["air_quality"], "enabled": False},
+            "cities": {**SOURCES["cities"], "enabled": False},
+            "plugin": {"name": "Plugin", "scraper": "vn_city_plugin_not_installed:scrape", "enabled": False},
+        })
+        with patch("today_vn_news.scraper.save_raw_yaml"):
+            data = scraper.scrape_and_save(
+                "2026-02-11", str(tmp_path / "raw.yaml"),
+                scraper.ScraperConfig(warm_dns=False, health_enabled=False, safety_cache_enabled=False, page_store_enabled=False), registry=registry,
+            )
+
+        assert "vn_city_plugin_not_installed" not in sys.modules
+        assert list(data) == ["안전 및 기상 관제"]
+
+
+@pytest.mark.unit
+class TestRssSource:
+    """레지스트리 설정 기반 RSS 스크래퍼 테스트"""
+
+    FEED = (
+        '<?xml version="1.0"?><rss><channel>'
+        + "".join(
+            f"<item><title>Tin {i}</title><link>https://x.vn/{i}</link>"
+            f"<description>Nội dung {i}</description>"
+            f"<pubDate>Wed, 11 Feb 2026 1{i}:00:00 +0700</pubDate></item>"
+            for i in range(5)
+        )
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+    def _response(self):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.FEED
+        return response
+
+    def test_limits_from_spec(self):
+        from today_vn_news import scraper
+
+        spec = SourceSpec.from_dict("x", {
+            "name": "X", "type": "rss", "limit": 3, "timeout": 5,
+            "urls": {"a": "https://x.vn/a.rss", "b": "https://x.vn/b.rss"},
+            "per_feed_limit": 2,
+        })
+        with patch.object(scraper, "_fetch_stream", side_effect=lambda *a, **k: StreamedBody(self._response())) as fetch:
+            articles = scraper.scrape_rss_source("2026-02-11", spec)
+
+        # 두 피드 모두 같은 기사 → URL 중복 제거 후 2개
+        assert [a["title"] for a in articles] == ["Tin 0", "Tin 1"]
+        assert fetch.call_args.kwargs["timeout"] == 5
+
+    def test_single_feed_request_error(self):
+        from today_vn_news import scraper
+        from today_vn_news.exceptions import ScrapingError
+
+        spec = SourceSpec.from_dict("x", {"name": "X", "type": "rss", "urls": ["https://x.vn/a.rss"]})
+        with patch.object(scraper, "_fetch_stream", side_effect=requests.ConnectionError("down")):
+            with pytest.raises(ScrapingError):
+                scraper.scrape_rss_source("2026-02-11", spec)
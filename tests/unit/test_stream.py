@@ -0,0 +1,186 @@
+"""
+제한 스트리밍 수집 단위 테스트
+"""
+
+import io
+import time
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from today_vn_news.scraping.feed import parse_feed
+from today_vn_news.scraping.http_cache import http_cache
+from today_vn_news.scraping.stream import StreamedBody, StreamStats, stream_stats
+
+TARGET = date(2026, 2, 11)
+
+
+def make_feed(count):
+    items = "".join(
+        f"<item><title>Tin {i}</title><link>https://vnexpress.net/tin-{i}.html</link>"
+        f"<description>{'Nội dung ' * 40}</description>"
+        f"<pubDate>Wed, 11 Feb 2026 18:00:00 +0700</pubDate></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss><channel>{items}</channel></rss>'.encode("utf-8")
+
+
+def live_response(body, content_length=True):
+    """stream=True 응답 흉내 (raw에서 청크 단위로 읽음)"""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    response.headers = CaseInsensitiveDict({"Content-Length": str(len(body))} if content_length else {})
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.mark.unit
+class TestStreamedBody:
+    """StreamedBody 조기 종료/최대 바이트 테스트"""
+
+    def test_parser_stops_download_after_limit(self):
+        feed = make_feed(300)
+        with StreamedBody(live_response(feed), chunk_size=4096) as body:
+            items = parse_feed(body, TARGET, limit=5)
+
+        assert [item.title for item in items] == [f"Tin {i}" for i in range(5)]
+        assert body.stopped_early and not body.truncated
+        assert body.wire_bytes < len(feed) // 10
+        assert body.closed
+
+    def test_stops_receiving_after_deadline(self):
+        """마감이 지난 소스는 다음 청크를 받지 않음"""
+        from today_vn_news.scraping.engine import DeadlineExceeded, run_sources
+
+        errors = []
+
+        def read_late():
+            with StreamedBody(live_response(make_feed(50)), chunk_size=1024) as body:
+                body.read(10)
+                time.sleep(0.15)
+                try:
+                    body.read()
+                except DeadlineExceeded as e:
+                    errors.append(e)
+                    raise
+
+        assert run_sources({"late": read_late}, deadline=0.1, grace=1.0)["late"].timed_out
+        assert len(errors) == 1  # 유예 시간 안에 종료 (반환 전 기록됨)
+
+    def test_max_bytes_keeps_items_before_cut(self):
+        feed = make_feed(50)
+        with StreamedBody(live_response(feed), max_bytes=len(feed) // 2) as body:
+            items = parse_feed(body, TARGET)
+
+        assert body.truncated
+        assert 0 < len(items) < 50
+        assert len(body.data) == len(feed) // 2
+
+    def test_malformed_complete_feed_still_raises(self):
+        import xml.etree.ElementTree as ET
+
+        with pytest.raises(ET.ParseError):
+            with StreamedBody(live_response(b"<rss><channel><item>")) as body:
+                parse_feed(body, TARGET)
+
+    def test_text_and_in_memory_response(self):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = "<p>Tin Việt</p>".encode("utf-8")
+        response.encoding = "utf-8"
+
+        body = StreamedBody(response, max_bytes=10)  # "ệ" 첫 바이트에서 잘림
+        assert not body.live
+        assert body.text() == "<p>Tin Vi\ufffd"
+        assert body.truncated
+
+    def test_stats_estimate_saved_bytes_and_time(self):
+        feed = make_feed(300)
+        stats = StreamStats()
+        with StreamedBody(live_response(feed), chunk_size=4096) as body:
+            parse_feed(body, TARGET, limit=1)
+        stats.record("VnExpress", body, elapsed=0.5)
+
+        saved = stats.sources["VnExpress"]
+        assert saved.bytes_saved == len(feed) - body.wire_bytes
+        assert saved.time_saved == pytest.approx(0.5 * saved.bytes_saved / body.wire_bytes)
+        assert "VnExpress" in stats.report()[0]
+
+    def test_stats_without_content_length(self):
+        stats = StreamStats()
+        with StreamedBody(live_response(make_feed(300), content_length=False), chunk_size=4096) as body:
+            parse_feed(body, TARGET, limit=1)
+        stats.record("x", body, elapsed=1.0)
+        assert stats.sources["x"].bytes_saved == 0
+        assert stats.sources["x"].early_stops == 1
+
+
+@pytest.mark.unit
+class TestFetchStream:
+    """_fetch_stream 캐시/녹화 연동 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path):
+        http_cache.configure(cache_dir=str(tmp_path), default_ttl=0, ttl_rules={}, enabled=True)
+        stream_stats.reset()
+        yield
+        http_cache.configure(cache_dir="data/http_cache", default_ttl=0, ttl_rules={}, enabled=True)
+        stream_stats.reset()
+
+    def test_partial_body_cached_with_validators(self):
+        """조기 종료 본문도 검증자와 함께 partial로 저장 → 다음 요청은 조건부 GET (304)"""
+        from today_vn_news import scraper
+
+        url = "https://vnexpress.net/rss/so-hoa.rss"
+        first = live_response(make_feed(300))
+        first.headers["ETag"] = '"v1"'
+        with patch("requests.Session.get", return_value=first) as mock_get:
+            with scraper._fetch_stream(url) as body:
+                parse_feed(body, TARGET, limit=2)
+
+        assert mock_get.call_args.kwargs["stream"] is True
+        cached = http_cache.lookup(url)
+        assert cached.partial and cached.etag == '"v1"'
+        assert len(cached.body) < len(make_feed(300))
+        assert stream_stats.sources[url.split("/")[2]].bytes_saved > 0
+
+        not_modified = requests.Response()
+        not_modified.status_code = 304
+        not_modified.raw = io.BytesIO(b"")
+        with patch("requests.Session.get", return_value=not_modified) as mock_get:
+            with scraper._fetch_stream(url) as body:
+                items = parse_feed(body, TARGET, limit=2)
+            assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert [item.title for item in items] == ["Tin 0", "Tin 1"]
+
+        # 전체 본문이 필요한 일반 요청은 partial 본문을 쓰지 않음
+        with patch("requests.Session.get", return_value=live_response(make_feed(1))) as mock_get:
+            scraper._fetch_url(url)
+        assert "If-None-Match" not in (mock_get.call_args.kwargs["headers"] or {})
+
+    def test_failed_body_not_cached(self):
+        from today_vn_news import scraper
+
+        url = "https://vnexpress.net/rss/so-hoa.rss"
+        with patch("requests.Session.get", return_value=live_response(make_feed(300))):
+            with pytest.raises(ValueError):
+                with scraper._fetch_stream(url) as body:
+                    body.read(100)
+                    raise ValueError("parser bug")
+
+        assert http_cache.lookup(url) is None
+
+    def test_complete_body_cached(self):
+        from today_vn_news import scraper
+
+        url = "https://vnexpress.net/rss/so-hoa.rss"
+        feed = make_feed(2)
+        with patch("requests.Session.get", return_value=live_response(feed)):
+            with scraper._fetch_stream(url) as body:
+                assert len(parse_feed(body, TARGET)) == 2
+
+        assert http_cache.lookup(url).body == feed
@@ -0,0 +1,86 @@
+"""
+텍스트 정규화 파이프라인 단위 테스트
+"""
+
+import html
+import re
+import unicodedata
+from unittest.mock import patch
+
+import pytest
+
+from today_vn_news.scraping import text
+from today_vn_news.scraping.text import (
+    clean_text,
+    is_normalized,
+    normalize_article,
+    normalize_articles,
+)
+
+
+def legacy_clean_text(value):
+    """기존 scraper.clean_text 구현 (동작 비교용)"""
+    if not value:
+        return value
+    value = unicodedata.normalize("NFKC", value)
+    value = html.unescape(value)
+    value = value.replace("'", "").replace("’", "").replace("‘", "")
+    value = re.sub(r"\s+", " ", value)
+    value = value.strip()
+    return value.replace("\n", " ").replace("\r", " ")
+
+
+@pytest.mark.unit
+class TestCleanText:
+    """clean_text 테스트"""
+
+    @pytest.mark.parametrize("value", [
+        "",
+        None,
+        "  Tin   mới\n\tnhất  ",
+        "Bộ Y tế &amp; WHO &#39;cảnh báo&#39;",
+        "Nhân dân‘s ’quote’ l'ok",
+        "ﬁ ligature ＡＢＣ full-width",
+        "plain ascii title",
+        " nbsp&nbsp;entity\r\n",
+    ])
+    def test_matches_legacy(self, value):
+        assert clean_text(value) == legacy_clean_text(value)
+
+    def test_no_repeated_imports(self):
+        """정규식은 모듈 로드 시 한 번만 컴파일"""
+        with patch.object(re, "sub", side_effect=AssertionError("uncompiled re.sub")):
+            assert clean_text("a  b") == "a b"
+        assert isinstance(text._WHITESPACE_RE, re.Pattern)
+
+
+@pytest.mark.unit
+class TestNormalizeArticles:
+    """normalize_article / normalize_articles 테스트"""
+
+    def test_sets_flag_and_skips_renormalization(self):
+        article = {"title": " A  &amp; B ", "content": "x", "url": "u"}
+        normalize_article(article)
+
+        assert article == {"title": "A & B", "content": "x", "url": "u", "normalized": True}
+
+        with patch.object(text, "clean_text", side_effect=AssertionError("re-cleaned")):
+            assert normalize_article(article) is article
+
+    def test_batch_with_max_lengths(self):
+        articles = [
+            {"title": "T1", "content": "a  " * 200},
+            {"title": "T2", "content": "short"},
+        ]
+        result = normalize_articles(articles, max_lengths={"content": 200})
+
+        assert result is not articles
+        assert len(result[0]["content"]) == 200
+        assert result[1]["content"] == "short"
+        assert all(is_normalized(a) for a in result)
+
+    def test_non_string_fields_untouched(self):
+        item = {"name": "공기", "content": "AQI  50", "aqi": 50}
+        normalize_article(item)
+        assert item["content"] == "AQI 50"
+        assert item["aqi"] == 50
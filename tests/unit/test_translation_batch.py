@@ -0,0 +1,172 @@
+"""
+번역 요청 묶음 계획 단위 테스트
+"""
+
+import asyncio
+import json
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from today_vn_news.config import TranslatorConfig
+from today_vn_news.translation_batch import (
+    TranslationBatch,
+    article_tokens,
+    assign_ids,
+    plan_batches,
+    split_items,
+)
+
+
+def make_articles(source, count, words=10):
+    return [
+        {"title": f"{source} tin {i}", "content": "nội dung " * words, "url": f"https://{source}.vn/{i}"}
+        for i in range(1, count + 1)
+    ]
+
+
+GROUPS = [("A", make_articles("a", 2)), ("B", make_articles("b", 3)), ("C", make_articles("c", 1))]
+
+
+@pytest.mark.unit
+class TestPlanBatches:
+    """요청 단위별 계획 테스트"""
+
+    def test_ids_are_stable(self):
+        entries = assign_ids(GROUPS)
+        assert [entry.id for entry in entries[1]] == ["2-1", "2-2", "2-3"]
+        assert [[e.id for e in group] for group in assign_ids(GROUPS)] == [[e.id for e in group] for group in entries]
+
+    def test_per_source_and_per_article(self):
+        entries = assign_ids(GROUPS)
+        assert [len(b.articles) for b in plan_batches(entries, "per-source")] == [2, 3, 1]
+        assert [len(b.articles) for b in plan_batches(entries, "per-article")] == [1] * 6
+
+    def test_packed_fills_budget_in_order(self):
+        entries = assign_ids(GROUPS)
+        cost = article_tokens(GROUPS[0][1][0])
+        batches = plan_batches(entries, "packed", token_budget=100 + cost * 4, prompt_tokens=100)
+
+        assert [[e.id for e in b.articles] for b in batches] == [["1-1", "1-2", "2-1", "2-2"], ["2-3", "3-1"]]
+        assert batches[0].sources == ["A", "B"]
+        assert all(b.tokens <= 100 + cost * 4 for b in batches)
+
+    def test_packed_oversized_article_goes_alone(self):
+        groups = [("A", make_articles("a", 1)), ("B", make_articles("b", 1, words=2000)), ("C", make_articles("c", 1))]
+        batches = plan_batches(assign_ids(groups), "packed", token_budget=500)
+        assert [[e.id for e in b.articles] for b in batches] == [["1-1"], ["2-1"], ["3-1"]]
+
+    def test_unknown_granularity(self):
+        with pytest.raises(ValueError):
+            plan_batches(assign_ids(GROUPS), "per-word")
+
+
+@pytest.mark.unit
+class TestSplitItems:
+    """응답 항목 → 기사 ID 대응 테스트"""
+
+    def setup_method(self):
+        self.batch = TranslationBatch(assign_ids(GROUPS)[1])
+
+    def test_by_id_then_url(self):
+        items = [
+            {"id": "2-3", "title": "셋", "content": "c", "url": "wrong"},
+            {"title": "하나", "content": "c", "url": "https://b.vn/1"},
+        ]
+        result = split_items(self.batch, items)
+        assert result == {
+            "2-3": {"title": "셋", "content": "c", "url": "https://b.vn/3"},
+            "2-1": {"title": "하나", "content": "c", "url": "https://b.vn/1"},
+        }
+
+    def test_positional_when_counts_match(self):
+        items = [{"title": t, "content": "c"} for t in ("하나", "둘", "셋")]
+        result = split_items(self.batch, items)
+        assert [result[i]["title"] for i in ("2-1", "2-2", "2-3")] == ["하나", "둘", "셋"]
+
+
+def echo_client(drop=()):
+    """프롬프트의 기사 ID를 읽어 번역 항목을 돌려주는 async 클라이언트 Mock"""
+
+    async def generate_content(model, contents, config=None):
+        ids = re.findall(r"^\[(\d+-\d+)\]", contents, flags=re.M)
+        items = [{"id": i, "title": f"번역 {i}", "content": "요약", "url": "x"} for i in ids if i not in drop]
+        return MagicMock(text=json.dumps({"items": items}, ensure_ascii=False))
+
+    client = MagicMock()
+    client.aio = AsyncMock()
+    client.aio.models.generate_content.side_effect = generate_content
+    return client
+
+
+@pytest.mark.unit
+class TestPackedStage:
+    """packed 번역 단계 테스트"""
+
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_packed_splits_back_into_sections(self, mock_get_client, tmp_path):
+        from today_vn_news.scraping.registry import SourceRegistry
+        from today_vn_news.translator import translate_all_sources_parallel
+
+        client = echo_client(drop={"2-2"})
+        mock_get_client.return_value = (client, "gemma")
+        registry = SourceRegistry.from_dict({k.lower(): {"name": k, "type": "rss", "urls": ["x"]} for k, _ in GROUPS})
+        scraped = dict(GROUPS)
+        config = TranslatorConfig(
+            cache_path=str(tmp_path / "cache.sqlite3"), batch_granularity="packed", batch_token_budget=100000
+        )
+
+        sections = asyncio.run(translate_all_sources_parallel(scraped, "2026-02-11", registry, config))
+
+        assert client.aio.models.generate_content.await_count == 1
+        assert [s["name"] for s in sections] == ["A", "B", "C"]
+        assert [i["title"] for i in sections[1]["items"]] == ["번역 2-1", "b tin 2", "번역 2-3"]
+        assert sections[1]["items"][0]["url"] == "https://b.vn/1"
+
+        # 누락된 기사만 다시 요청 (나머지는 캐시 적중)
+        asyncio.run(translate_all_sources_parallel(scraped, "2026-02-11", registry, config))
+        prompt = client.aio.models.generate_content.call_args.kwargs["contents"]
+        assert client.aio.models.generate_content.await_count == 2
+        assert "b tin 2" in prompt and "a tin 1" not in prompt
+
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_failed_batch_falls_back_to_original(self, mock_get_client):
+        from today_vn_news.scraping.registry import SourceRegistry
+        from today_vn_news.translator import translate_all_sources_parallel
+
+        client = MagicMock()
+        client.aio = AsyncMock()
+        client.aio.models.generate_content.return_value = MagicMock(text="không phải yaml: [")
+        mock_get_client.return_value = (client, "gemma")
+        registry = SourceRegistry.from_dict({k.lower(): {"name": k, "type": "rss", "urls": ["x"]} for k, _ in GROUPS})
+        config = TranslatorConfig(cache_enabled=False, batch_granularity="per-article")
+
+        sections = asyncio.run(translate_all_sources_parallel(dict(GROUPS), "2026-02-11", registry, config))
+
+        assert client.aio.models.generate_content.await_count == 6
+        assert [i["title"] for i in sections[0]["items"]] == ["a tin 1", "a tin 2"]
+
+    @patch("today_vn_news.retry.random.uniform", return_value=0.0)
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_failed_batch_keeps_cached_items(self, mock_get_client, _uniform, tmp_path):
+        from today_vn_news.scraping.registry import SourceRegistry
+        from today_vn_news.translator import translate_all_sources_parallel
+
+        mock_get_client.return_value = (echo_client(), "gemma")
+        registry = SourceRegistry.from_dict({k.lower(): {"name": k, "type": "rss", "urls": ["x"]} for k in "AB"})
+        config = TranslatorConfig(cache_path=str(tmp_path / "cache.sqlite3"), batch_granularity="packed")
+        scraped = {"A": make_articles("a", 2), "B": make_articles("b", 1)}
+        asyncio.run(translate_all_sources_parallel(scraped, "2026-02-11", registry, config))
+
+        # 새 기사의 요청만 실패: 캐시 적중 기사는 번역본, 실패한 기사만 원문
+        client = MagicMock()
+        client.aio = AsyncMock()
+        client.aio.models.generate_content.side_effect = RuntimeError("down")
+        mock_get_client.return_value = (client, "gemma")
+        scraped["A"] = make_articles("a", 3)
+        sections = asyncio.run(translate_all_sources_parallel(scraped, "2026-02-11", registry, config))
+
+        assert client.aio.models.generate_content.await_count >= 1
+        assert [i["title"] for i in sections[0]["items"]] == ["번역 1-1", "번역 1-2", "a tin 3"]
+        assert [i["title"] for i in sections[1]["items"]] == ["번역 2-1"]
@@ -0,0 +1,143 @@
+"""
+번역 결과 캐시 단위 테스트
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from today_vn_news.config import TranslatorConfig
+from today_vn_news.translation_cache import TranslationCache, article_hash
+
+ARTICLES = [
+    {"title": "Tin một", "content": "Nội dung một", "url": "https://vnexpress.net/1.html"},
+    {"title": "Tin hai", "content": "Nội dung hai", "url": "https://vnexpress.net/2.html"},
+]
+
+
+def gemma_client(*responses):
+    """응답 YAML을 순서대로 반환하는 GenAI 클라이언트 Mock"""
+    client = MagicMock()
+    client.models.generate_content.side_effect = [MagicMock(text=text) for text in responses]
+    return client
+
+
+def items_yaml(*pairs):
+    return "items:\n" + "".join(
+        f'  - title: "{title}"\n    content: "{title} 요약"\n    url: "{url}"\n' for title, url in pairs
+    )
+
+
+@pytest.mark.unit
+class TestTranslationCache:
+    """키/저장/정리 테스트"""
+
+    def test_key_ignores_url_and_whitespace(self):
+        assert article_hash(ARTICLES[0]) == article_hash(
+            {"title": " Tin  một ", "content": "Nội dung\nmột", "url": "https://other.vn/x"}
+        )
+        assert article_hash(ARTICLES[0]) != article_hash(ARTICLES[1])
+
+    def test_lookup_by_model_and_prompt_version(self, tmp_path):
+        cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+        cache.store([(ARTICLES[0], {"title": "뉴스 하나", "content": "요약", "url": "x"})], "gemma", "1")
+
+        moved = {**ARTICLES[0], "url": "https://vnexpress.net/moved.html"}
+        assert cache.lookup([moved, ARTICLES[1]], "gemma", "1") == [
+            {"title": "뉴스 하나", "content": "요약", "url": "https://vnexpress.net/moved.html"},
+            None,
+        ]
+        assert cache.lookup([ARTICLES[0]], "gemma", "2") == [None]
+        assert cache.lookup([ARTICLES[0]], "other-model", "1") == [None]
+        assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+        assert "적중률 25%" in cache.stats.summary()
+
+    def test_prune_by_age_and_size(self, tmp_path):
+        cache = TranslationCache(str(tmp_path / "cache.sqlite3"), max_age_days=1, max_entries=1)
+        with patch("today_vn_news.translation_cache.time.time", return_value=0.0):
+            cache.store([(ARTICLES[0], {"title": "old"})], "gemma", "1")
+        with patch("today_vn_news.translation_cache.time.time", return_value=86400.0 * 2):
+            cache.store([(ARTICLES[1], {"title": "new"})], "gemma", "1")
+            cache.store([({"title": "ba", "content": ""}, {"title": "newer"})], "gemma", "1")
+            assert cache.prune() == 2
+
+        assert cache.lookup(ARTICLES, "gemma", "1") == [None, None]
+
+
+@pytest.mark.unit
+class TestTranslateWithCache:
+    """translate_articles 캐시 적중/미스 묶음 번역 테스트"""
+
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_hits_skip_api_and_misses_are_batched(self, mock_get_client, tmp_path):
+        from today_vn_news.translator import translate_articles
+
+        cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+        client = gemma_client(
+            items_yaml(("뉴스 하나", ARTICLES[0]["url"]), ("뉴스 둘", ARTICLES[1]["url"])),
+            items_yaml(("뉴스 셋", "https://vnexpress.net/3.html")),
+        )
+        mock_get_client.return_value = (client, "gemma")
+
+        first = translate_articles(ARTICLES, "VnExpress", "2026-02-11", 2, cache=cache)
+        second = translate_articles(ARTICLES, "VnExpress", "2026-02-12", 2, cache=cache)
+        assert client.models.generate_content.call_count == 1
+        assert second == first
+
+        third_article = {"title": "Tin ba", "content": "Nội dung ba", "url": "https://vnexpress.net/3.html"}
+        result = translate_articles([ARTICLES[0], third_article], "VnExpress", "2026-02-12", 2, cache=cache)
+        assert client.models.generate_content.call_count == 2
+        prompt = client.models.generate_content.call_args.kwargs["contents"]
+        assert "Tin ba" in prompt and "Tin một" not in prompt
+        assert [item["title"] for item in result] == ["뉴스 하나", "뉴스 셋"]
+
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_stage_reuses_cache_across_runs(self, mock_get_client, tmp_path):
+        import asyncio
+
+        from today_vn_news.scraping.registry import SourceRegistry
+        from today_vn_news.translator import translate_all_sources_parallel
+
+        client = MagicMock()
+        client.aio = AsyncMock()
+        client.aio.models.generate_content.return_value = MagicMock(
+            text=items_yaml(("뉴스 하나", ARTICLES[0]["url"]), ("뉴스 둘", ARTICLES[1]["url"]))
+        )
+        mock_get_client.return_value = (client, "gemma")
+        registry = SourceRegistry.from_dict({"vnexpress": {"name": "VnExpress", "type": "rss", "urls": ["x"]}})
+        config = TranslatorConfig(cache_path=str(tmp_path / "cache.sqlite3"))
+
+        for _ in range(2):
+            sections = asyncio.run(
+                translate_all_sources_parallel({"VnExpress": ARTICLES}, "2026-02-11", registry, config)
+            )
+            assert [item["title"] for item in sections[0]["items"]] == ["뉴스 하나", "뉴스 둘"]
+        assert client.aio.models.generate_content.await_count == 1
+
+    @patch("today_vn_news.retry.random.uniform", return_value=0.0)
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_failed_misses_keep_cached_items(self, mock_get_client, _uniform, tmp_path):
+        """per-source 기본 경로: 미스 요청 실패 시 캐시 적중은 번역본, 미스만 원문"""
+        import asyncio
+
+        from today_vn_news.scraping.registry import SourceRegistry
+        from today_vn_news.translator import translate_all_sources_parallel
+
+        client = MagicMock()
+        client.aio = AsyncMock()
+        client.aio.models.generate_content.return_value = MagicMock(
+            text=items_yaml(("뉴스 하나", ARTICLES[0]["url"]), ("뉴스 둘", ARTICLES[1]["url"]))
+        )
+        mock_get_client.return_value = (client, "gemma")
+        registry = SourceRegistry.from_dict({"vnexpress": {"name": "VnExpress", "type": "rss", "urls": ["x"]}})
+        config = TranslatorConfig(cache_path=str(tmp_path / "cache.sqlite3"))
+        assert config.batch_granularity == "per-source"
+        asyncio.run(translate_all_sources_parallel({"VnExpress": ARTICLES}, "2026-02-11", registry, config))
+
+        client.aio.models.generate_content.side_effect = RuntimeError("down")
+        third_article = {"title": "Tin ba", "content": "Nội dung ba", "url": "https://vnexpress.net/3.html"}
+        sections = asyncio.run(
+            translate_all_sources_parallel({"VnExpress": ARTICLES + [third_article]}, "2026-02-11", registry, config)
+        )
+
+        assert [item["title"] for item in sections[0]["items"]] == ["뉴스 하나", "뉴스 둘", "Tin ba"]
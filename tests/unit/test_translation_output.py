@@ -0,0 +1,118 @@
+"""
+번역 응답 구조화 출력 단위 테스트
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from today_vn_news.translation_output import JsonItemStream, StructuredOutput, parse_items
+
+ITEMS_JSON = (
+    '{"items": ['
+    '{"id": "1", "title": "하나", "content": "요약 {괄호}", "url": "u1"}, '
+    '{"id": "2", "title": "둘", "content": "그가 "인용" 했다", "url": "u2"}, '
+    '{"id": "3", "title": "셋", "content": "줄\n바꿈", "url": "u3",}'
+    "]}"
+)
+
+
+class BadRequest(Exception):
+    code = 400
+
+
+@pytest.mark.unit
+class TestJsonItemStream:
+    """관대한 항목 파서 테스트"""
+
+    def test_broken_item_only_costs_itself(self):
+        result = parse_items("결과입니다:\n```json\n" + ITEMS_JSON + "\n```")
+        assert [item["id"] for item in result.items] == ["1", "3"]
+        assert result.items[0]["content"] == "요약 {괄호}"
+        assert result.items[1]["content"] == "줄\n바꿈"
+        assert result.failed == 1
+
+    def test_truncated_response(self):
+        result = parse_items('[{"id": "1", "title": "하나", "content": "c"}, {"id": "2", "title": "둘", "cont')
+        assert [item["id"] for item in result.items] == ["1"]
+        assert result.failed == 1
+
+    def test_feed_chunks_yields_completed_items(self):
+        stream = JsonItemStream()
+        assert stream.feed('{"items": [{"id": "1", "title": "하') == []
+        assert stream.feed('나", "content": "c"}, {"id": "2"') == [{"id": "1", "title": "하나", "content": "c"}]
+        assert stream.feed(', "title": "둘", "content": "c"}]}') == [{"id": "2", "title": "둘", "content": "c"}]
+        assert stream.close().failed == 0
+
+    def test_not_json(self):
+        result = parse_items('items:\n  - title: "제목"\n')
+        assert not result.found_json
+
+
+@pytest.mark.unit
+class TestStructuredOutput:
+    """스키마 설정 + 모델별 성공률 테스트"""
+
+    def test_config_and_unsupported_model(self):
+        output = StructuredOutput()
+        assert output.config_for("gemma")["response_mime_type"] == "application/json"
+        output.mark_unsupported("gemma", BadRequest())
+        assert output.config_for("gemma") is None
+        assert output.config_for("other") is not None
+        output.configure(False)
+        assert output.config_for("other") is None
+
+    def test_success_rate_per_model(self):
+        output = StructuredOutput()
+        output.record("gemma", 3, 1)
+        output.record("gemma", 4, 0)
+        output.record("other", 0, 1)
+        assert output.stats("gemma").success_rate == pytest.approx(7 / 8)
+        assert output.summaries() == [
+            "번역 응답 파싱 [gemma]: 항목 7/8개 성공 (88%)",
+            "번역 응답 파싱 [other]: 항목 0/1개 성공 (0%)",
+        ]
+
+
+@pytest.mark.unit
+class TestTranslateStructured:
+    """번역 경로의 구조화 출력 테스트"""
+
+    ARTICLES = [{"title": f"Tin {i}", "content": "nội dung", "url": f"https://vn/{i}"} for i in (1, 2, 3)]
+
+    @patch("today_vn_news.translator.structured_output", new_callable=StructuredOutput)
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_partial_parse_keeps_other_items(self, mock_get_client, output):
+        from today_vn_news.translator import translate_articles
+
+        client = MagicMock()
+        client.models.generate_content.return_value = MagicMock(text=ITEMS_JSON)
+        mock_get_client.return_value = (client, "gemma")
+
+        result = translate_articles(self.ARTICLES, "VnExpress", "2026-02-11", 3)
+
+        assert result == [
+            {"title": "하나", "content": "요약 {괄호}", "url": "https://vn/1"},
+            {"title": "셋", "content": "줄\n바꿈", "url": "https://vn/3"},
+        ]
+        assert client.models.generate_content.call_count == 1
+        config = client.models.generate_content.call_args.kwargs["config"]
+        assert config["response_schema"]["properties"]["items"]["type"] == "ARRAY"
+        assert (output.stats("gemma").ok, output.stats("gemma").failed) == (2, 1)
+
+    @patch("today_vn_news.translator.structured_output", new_callable=StructuredOutput)
+    @patch("today_vn_news.translator.get_genai_client")
+    def test_schema_rejected_falls_back_to_prompt_only(self, mock_get_client, output):
+        from today_vn_news.translator import translate_articles
+
+        response = MagicMock(text='{"items": [{"id": "1", "title": "하나", "content": "c"}]}')
+        client = MagicMock()
+        client.models.generate_content.side_effect = [BadRequest("schema"), response, response]
+        mock_get_client.return_value = (client, "gemma")
+
+        assert translate_articles(self.ARTICLES[:1], "VnExpress", "2026-02-11", 1)[0]["title"] == "하나"
+        translate_articles(self.ARTICLES[:1], "VnExpress", "2026-02-11", 1)
+
+        calls = client.models.generate_content.call_args_list
+        assert "config" in calls[0].kwargs
+        assert "config" not in calls[1].kwargs and "config" not in calls[2].kwargs
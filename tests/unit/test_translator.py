@@ -5,7 +5,13 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
-from today_vn_news.translator import translate_weather_condition, translate_and_save, translate_articles
+from today_vn_news.config import TranslatorConfig
+from today_vn_news.translator import (
+    build_safety_items,
+    translate_and_save,
+    translate_articles,
+    translate_weather_condition,
+)
 from today_vn_news.exceptions import TranslationError
 import os
 
@@ -31,6 +37,36 @@ class TestWeatherTranslation:
         assert result == expected
 
 
+@pytest.mark.unit
+class TestSafetyItems:
+    """안전 및 기상 관제 항목 변환 테스트"""
+
+    CITY = {
+        "name": "도시",
+        "source": "Open-Meteo",
+        "city": "Hà Nội",
+        "aqi": "152",
+        "content": "흐림, 온도 24°C, 습도 81% / AQI 152 (나쁨), PM2.5: 55.1, PM10: 70.2",
+        "url": "https://open-meteo.com/",
+    }
+    PLACEHOLDER = {"name": "플레이스홀더", "content": "기상 및 공기질 정보를 수집 중입니다...", "url": "u"}
+
+    def test_city_item(self):
+        assert build_safety_items([self.CITY]) == [
+            {
+                "title": "Hà Nội 기상·공기질 - AQI 152",
+                "content": "흐림, 온도 24°C, 습도 81% / AQI 152 (나쁨), PM2.5: 55.1, PM10: 70.2",
+                "url": "https://open-meteo.com/",
+            }
+        ]
+        assert build_safety_items([{**self.CITY, "aqi": ""}])[0]["title"] == "Hà Nội 기상·공기질"
+
+    def test_placeholder_and_raw_items(self):
+        raw = {"title": "지진 규모 4.0", "content": "c", "url": "u"}
+        assert build_safety_items([self.PLACEHOLDER, raw]) == [raw]
+        assert build_safety_items([self.PLACEHOLDER], include_placeholder=True)[0]["title"] == "안전 및 기상 관제"
+
+
 @pytest.mark.unit
 @pytest.mark.slow
 class TestTranslationRealAPI:
@@ -59,7 +95,9 @@ class TestTranslationRealAPI:
         }
 
         yaml_path = test_data_dir / f"{test_timestamp}.yaml"
-        success = translate_and_save(scraped_data, TODAY_KO, str(yaml_path))
+        success = translate_and_save(
+            scraped_data, TODAY_KO, str(yaml_path), config=TranslatorConfig(cache_enabled=False)
+        )
 
         assert success
         assert yaml_path.exists()
@@ -1,6 +1,8 @@
 from .video_config import VideoConfig
+from .scraper_config import ScraperConfig
+from .translator_config import TranslatorConfig
 
 # YouTube 재생목록 ID
 YOUTUBE_PLAYLIST_ID = "PLzMxB6D1eypIA_JNasD_MNISMEUtMbHvK"
 
-__all__ = ["VideoConfig", "YOUTUBE_PLAYLIST_ID"]
+__all__ = ["VideoConfig", "ScraperConfig", "TranslatorConfig", "YOUTUBE_PLAYLIST_ID"]
@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict
+import yaml
+from today_vn_news.logger import logger
+from today_vn_news.exceptions import TodayVnNewsError
+from today_vn_news.http_client import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_USER_AGENT,
+)
+
+
+@dataclass
+class ScraperConfig:
+    """스크래핑 설정"""
+
+    # 병렬 수집
+    max_workers: int = 8
+    per_host_limit: int = 2
+    parse_processes: int = 0  # 홈페이지 HTML 파싱 프로세스 수 (0이면 수집 스레드에서 파싱)
+
+    # 전체 수집 마감 시간 (초, 0이면 제한 없음) / 진행에 필요한 최소 성공 뉴스 소스 수
+    scrape_deadline: float = 180.0
+    min_news_sources: int = 1
+
+    # HTTP 커넥션 풀
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    host_pool_sizes: Dict[str, int] = field(default_factory=dict)
+    user_agent: str = DEFAULT_USER_AGENT
+    warm_dns: bool = True
+
+    # HTTP 조건부 GET 캐시 (ttl: URL prefix → 초)
+    cache_enabled: bool = True
+    cache_dir: str = "data/http_cache"
+    cache_default_ttl: int = 0
+    cache_ttl: Dict[str, int] = field(default_factory=dict)
+
+    # 호스트 서킷 브레이커 + 소스 상태 점수판 (실행 간 유지)
+    health_enabled: bool = True
+    health_path: str = "data/scrape_health.json"
+    breaker_failure_threshold: int = 3
+    breaker_cooldown: float = 1800.0
+    adaptive_timeout_multiplier: float = 3.0
+    min_timeout: float = 3.0
+
+    # 소스 간 중복 기사 제거 (번역 전)
+    dedup_enabled: bool = True
+    dedup_max_distance: int = 3
+
+    # 방송된 기사 저장소 (최근 window_days일 내 방송 기사 제외)
+    seen_enabled: bool = True
+    seen_path: str = "data/seen_articles.sqlite3"
+    seen_window_days: int = 7
+
+    # 안전 데이터 결과 캐시 (소스별 TTL은 레지스트리 result_ttl)
+    safety_cache_enabled: bool = True
+    safety_cache_path: str = "data/safety_cache.json"
+
+    # 원본 페이지 보관소 (콘텐츠 주소 압축 저장, scripts/reparse.py로 재파싱)
+    page_store_enabled: bool = True
+    page_store_dir: str = "data/raw_pages"
+
+    @classmethod
+    def from_yaml(cls, path: str = "config.yaml") -> "ScraperConfig":
+        """
+        YAML 설정 로딩 (scraper 섹션)
+
+        Args:
+            path: 설정 파일 경로
+
+        Returns:
+            ScraperConfig: 로드된 설정 (파일 없으면 기본값)
+
+        Raises:
+            TodayVnNewsError: YAML 파싱 실패 (파일 있지만 잘못됨)
+        """
+        config_path = Path(path)
+
+        if not config_path.exists():
+            logger.warning(f"설정 파일 없음 ({path}), 기본값 사용")
+            return cls()
+
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
+
+            scraper_config = data.get("scraper", {}) or {}
+            concurrency = scraper_config.get("concurrency", {}) or {}
+            http = scraper_config.get("http", {}) or {}
+            cache = scraper_config.get("cache", {}) or {}
+            deadline = scraper_config.get("deadline", {}) or {}
+            health = scraper_config.get("health", {}) or {}
+            dedup = scraper_config.get("dedup", {}) or {}
+            seen = scraper_config.get("seen", {}) or {}
+            safety_cache = scraper_config.get("safety_cache", {}) or {}
+            page_store = scraper_config.get("page_store", {}) or {}
+            return cls(
+                max_workers=concurrency.get("max_workers", 8),
+                per_host_limit=concurrency.get("per_host_limit", 2),
+                parse_processes=concurrency.get("parse_processes", 0),
+                scrape_deadline=deadline.get("total", 180.0),
+                min_news_sources=deadline.get("min_news_sources", 1),
+                pool_connections=http.get("pool_connections", DEFAULT_POOL_CONNECTIONS),
+                pool_maxsize=http.get("pool_maxsize", DEFAULT_POOL_MAXSIZE),
+                host_pool_sizes=http.get("host_pool_sizes", {}) or {},
+                user_agent=http.get("user_agent", DEFAULT_USER_AGENT),
+                warm_dns=http.get("warm_dns", True),
+                cache_enabled=cache.get("enabled", True),
+                cache_dir=cache.get("dir", "data/http_cache"),
+                cache_default_ttl=cache.get("default_ttl", 0),
+                cache_ttl=cache.get("ttl", {}) or {},
+                health_enabled=health.get("enabled", True),
+                health_path=health.get("path", "data/scrape_health.json"),
+                breaker_failure_threshold=health.get("failure_threshold", 3),
+                breaker_cooldown=health.get("cooldown", 1800.0),
+                adaptive_timeout_multiplier=health.get("timeout_multiplier", 3.0),
+                min_timeout=health.get("min_timeout", 3.0),
+                dedup_enabled=dedup.get("enabled", True),
+                dedup_max_distance=dedup.get("max_distance", 3),
+                seen_enabled=seen.get("enabled", True),
+                seen_path=seen.get("path", "data/seen_articles.sqlite3"),
+                seen_window_days=seen.get("window_days", 7),
+                safety_cache_enabled=safety_cache.get("enabled", True),
+                safety_cache_path=safety_cache.get("path", "data/safety_cache.json"),
+                page_store_enabled=page_store.get("enabled", True),
+                page_store_dir=page_store.get("dir", "data/raw_pages"),
+            )
+        except yaml.YAMLError as e:
+            logger.error(f"YAML 파싱 실패: {e}")
+            raise TodayVnNewsError(f"설정 파일 파싱 실패: {e}")
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from pathlib import Path
+import yaml
+from today_vn_news.logger import logger
+from today_vn_news.exceptions import TodayVnNewsError
+
+
+@dataclass
+class TranslatorConfig:
+    """번역 설정"""
+
+    # 번역 결과 캐시 (기사 내용 해시 + 모델 + 프롬프트 버전 단위)
+    cache_enabled: bool = True
+    cache_path: str = "data/translation_cache.sqlite3"
+    cache_max_age_days: int = 30
+    cache_max_entries: int = 5000
+
+    # LLM 요청 스케줄러 (모든 Gemma 호출 공유, AIMD 동시성 + 선택적 RPM/TPM 한도)
+    llm_max_concurrency: int = 4
+    llm_min_concurrency: int = 1
+    llm_initial_concurrency: int = 2
+    llm_latency_target: float = 90.0
+    llm_rpm: int = 0
+    llm_tpm: int = 0
+
+    # 번역 요청 단위 (per-source | packed | per-article) 및 packed 요청당 입력 토큰 예산
+    batch_granularity: str = "per-source"
+    batch_token_budget: int = 6000
+
+    # 응답 스키마(JSON) 요청 (미지원 모델은 자동으로 프롬프트 지시만 사용)
+    structured_output: bool = True
+
+    @classmethod
+    def from_yaml(cls, path: str = "config.yaml") -> "TranslatorConfig":
+        """
+        YAML 설정 로딩 (translator 섹션)
+
+        Args:
+            path: 설정 파일 경로
+
+        Returns:
+            TranslatorConfig: 로드된 설정 (파일 없으면 기본값)
+
+        Raises:
+            TodayVnNewsError: YAML 파싱 실패 (파일 있지만 잘못됨)
+        """
+        config_path = Path(path)
+
+        if not config_path.exists():
+            logger.warning(f"설정 파일 없음 ({path}), 기본값 사용")
+            return cls()
+
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
+
+            translator_config = data.get("translator", {}) or {}
+            cache = translator_config.get("cache", {}) or {}
+            scheduler = translator_config.get("scheduler", {}) or {}
+            batching = translator_config.get("batching", {}) or {}
+            output = translator_config.get("output", {}) or {}
+            granularity = batching.get("granularity", "per-source")
+            if granularity not in ("per-source", "packed", "per-article"):
+                logger.warning(f"알 수 없는 번역 요청 단위 ({granularity}), per-source 사용")
+                granularity = "per-source"
+            return cls(
+                cache_enabled=cache.get("enabled", True),
+                cache_path=cache.get("path", "data/translation_cache.sqlite3"),
+                cache_max_age_days=cache.get("max_age_days", 30),
+                cache_max_entries=cache.get("max_entries", 5000),
+                llm_max_concurrency=scheduler.get("max_concurrency", 4),
+                llm_min_concurrency=scheduler.get("min_concurrency", 1),
+                llm_initial_concurrency=scheduler.get("initial_concurrency", 2),
+                llm_latency_target=scheduler.get("latency_target", 90.0),
+                llm_rpm=scheduler.get("rpm", 0),
+                llm_tpm=scheduler.get("tpm", 0),
+                batch_granularity=granularity,
+                batch_token_budget=batching.get("token_budget", 6000),
+                structured_output=output.get("structured", True),
+            )
+        except yaml.YAMLError as e:
+            logger.error(f"YAML 파싱 실패: {e}")
+            raise TodayVnNewsError(f"설정 파일 파싱 실패: {e}")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+공유 HTTP 커넥션 풀
+- 목적: 스크래퍼, Open-Meteo, Pushover 요청이 하나의 keep-alive 세션을 재사용
+- 기능: 호스트별 풀 크기 설정, 기본 User-Agent, DNS 캐시 및 시작 시 예열
+"""
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from today_vn_news.logger import logger
+
+# 모든 요청에 사용하는 기본 User-Agent
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# 풀 기본값
+DEFAULT_POOL_CONNECTIONS = 16  # 풀을 유지할 호스트 수
+DEFAULT_POOL_MAXSIZE = 4  # 호스트당 유지할 커넥션 수
+
+# DNS 캐시 유효 시간 (초)
+DEFAULT_DNS_TTL = 300
+
+
+class DnsCache:
+    """
+    socket.getaddrinfo 결과 캐시.
+
+    install() 호출 시 socket.getaddrinfo를 캐시 래퍼로 교체합니다.
+    같은 호스트를 반복 요청할 때 DNS 조회를 생략하며, warm()으로
+    파이프라인 시작 시 미리 조회해 둘 수 있습니다. 캐시 키에는 포트를 넣지 않고
+    반환 시 주소의 포트만 바꾸므로 http://(80)와 https://(443)가 한 번의 조회를 공유합니다.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_DNS_TTL):
+        self.ttl = ttl
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+        self._original = None
+
+    def install(self) -> None:
+        """socket.getaddrinfo를 캐시 래퍼로 교체 (중복 호출 무시)"""
+        if self._original is not None:
+            return
+        self._original = socket.getaddrinfo
+        socket.getaddrinfo = self._getaddrinfo
+
+    def uninstall(self) -> None:
+        """원래 socket.getaddrinfo 복원"""
+        if self._original is None:
+            return
+        socket.getaddrinfo = self._original
+        self._original = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _getaddrinfo(self, host, port, *args, **kwargs):
+        number = _port_number(port)
+        if number is None:
+            # 서비스 이름 포트는 주소의 포트를 바꿔 끼울 수 없으므로 캐시하지 않음
+            return self._original(host, port, *args, **kwargs)
+
+        key = (host, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                return _with_port(entry[1], number)
+
+        result = self._original(host, port, *args, **kwargs)
+        with self._lock:
+            self._entries[key] = (now + self.ttl, result)
+        return result
+
+    def warm(self, hosts: Iterable[str], port: int = 443) -> int:
+        """
+        호스트 목록을 병렬로 미리 조회 (캐시는 포트와 무관하게 호스트 단위로 적중)
+
+        Args:
+            hosts: 호스트 이름 목록
+            port: 조회 포트 (기본값: 443)
+
+        Returns:
+            조회 성공한 호스트 수
+        """
+        hosts = sorted(set(h for h in hosts if h))
+        if not hosts:
+            return 0
+
+        self.install()
+
+        def resolve(host: str) -> bool:
+            try:
+                # urllib3와 같은 인자 형태로 조회해야 캐시 키가 일치
+                socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+                return True
+            except OSError as e:
+                logger.warning(f"DNS 예열 실패: {host} ({e})")
+                return False
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(8, len(hosts))) as executor:
+            resolved = sum(executor.map(resolve, hosts))
+        logger.info(
+            f"DNS 예열 완료: {resolved}/{len(hosts)}개 호스트 ({time.perf_counter() - start:.2f}초)"
+        )
+        return resolved
+
+
+def _port_number(port) -> Optional[int]:
+    """getaddrinfo 포트 인자를 숫자로 변환 (서비스 이름이면 None)"""
+    if isinstance(port, int):
+        return port
+    if isinstance(port, (str, bytes)) and port.isdigit():
+        return int(port)
+    return None
+
+
+def _with_port(result: list, port: int) -> list:
+    """getaddrinfo 결과의 sockaddr 포트만 교체 (IPv4 (ip, port), IPv6 (ip, port, flow, scope))"""
+    return [
+        (family, type_, proto, canonname, (sockaddr[0], port) + tuple(sockaddr[2:]))
+        for family, type_, proto, canonname, sockaddr in result
+    ]
+
+
+dns_cache = DnsCache()
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def build_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    host_pool_sizes: Optional[Dict[str, int]] = None,
+    user_agent: str = DEFAULT_USER_AGENT,
+) -> requests.Session:
+    """
+    keep-alive 커넥션 풀 세션 생성
+
+    Args:
+        pool_connections: 풀을 유지할 호스트 수
+        pool_maxsize: 호스트당 기본 커넥션 수
+        host_pool_sizes: 호스트별 커넥션 수 재정의 {"vnexpress.net": 6}
+        user_agent: 기본 User-Agent 헤더
+
+    Returns:
+        requests.Session: 설정된 세션
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = user_agent
+
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # 호스트별 어댑터 (requests는 가장 긴 prefix를 우선 사용, 끝의 /로 호스트 이름 전체만 일치)
+    for host, maxsize in (host_pool_sizes or {}).items():
+        host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+        session.mount(f"http://{host}/", host_adapter)
+        session.mount(f"https://{host}/", host_adapter)
+
+    return session
+
+
+def configure_session(**kwargs) -> requests.Session:
+    """
+    공유 세션을 새 설정으로 교체 (build_session 인자와 동일)
+
+    Returns:
+        requests.Session: 새 공유 세션
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = build_session(**kwargs)
+        return _session
+
+
+def get_session() -> requests.Session:
+    """
+    공유 세션 반환 (최초 호출 시 기본 설정으로 생성)
+
+    Returns:
+        requests.Session: 프로세스 전체에서 재사용하는 세션
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def close_session() -> None:
+    """공유 세션의 커넥션 풀 정리"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
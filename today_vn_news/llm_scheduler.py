@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+LLM 요청 스케줄러
+- 목적: 소스별 번역 작업이 모두 동시에 Aperture/AI Studio를 호출하여 429/503이 나는 문제 해소
+        (translate_all_sources_parallel의 세마포어가 작업에 전달되지 않아 제한이 없었음)
+- 기능: 모든 Gemma 호출이 공유하는 전역 동시성 제한, 지연 시간과 429/503 응답 기반
+        AIMD 적응형 동시성(성공 시 +1/limit, 제한 응답·지연 초과 시 ×decrease_factor),
+        선택적 RPM/TPM 토큰 버킷(쿼터 맞춤), 대기열 깊이·진행 중 요청 수 로그,
+        동기(스레드) 호출과 async 호출이 같은 한도를 공유
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+
+from today_vn_news.logger import logger
+from today_vn_news.retry import status_of
+
+# 동시성 축소 대상 응답 (요청 과다, 일시적 과부하)
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    프롬프트 토큰 수 추정 (TPM 버킷용, 베트남어/한국어 혼합 기준 약 3자당 1토큰)
+
+    Args:
+        text: 프롬프트
+
+    Returns:
+        추정 토큰 수 (최소 1)
+    """
+    return max(1, len(text) // 3)
+
+
+class TokenBucket:
+    """
+    분당 한도 토큰 버킷 (스레드 안전하지 않음, LLMScheduler 잠금 안에서 사용).
+
+    용량은 분당 한도와 같고 초당 per_minute/60씩 채워집니다. per_minute가 0이면 비활성화.
+
+    Args:
+        per_minute: 분당 허용량 (요청 수 또는 토큰 수)
+    """
+
+    def __init__(self, per_minute: float = 0):
+        self.per_minute = max(0.0, float(per_minute))
+        self.tokens = self.per_minute
+        self.updated = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.per_minute > 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.per_minute, self.tokens + (now - self.updated) * self.per_minute / 60.0)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """
+        amount만큼 꺼내려면 기다려야 하는 시간
+
+        Args:
+            amount: 필요량 (용량보다 크면 용량으로 제한)
+
+        Returns:
+            대기 시간(초, 0이면 즉시 가능)
+        """
+        if not self.enabled:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.per_minute)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) * 60.0 / self.per_minute
+
+    def take(self, amount: float) -> None:
+        """amount만큼 차감 (delay()가 0일 때 호출)"""
+        if self.enabled:
+            self.tokens -= min(amount, self.per_minute)
+
+
+class LLMScheduler:
+    """
+    LLM 요청 공유 스케줄러 (스레드 안전).
+
+    동시성 한도(limit)는 AIMD로 조정됩니다: 지연 목표 안에 성공하면 limit += 1/limit
+    (한도만큼 성공하면 약 +1), 429/503 또는 지연 목표 초과 시 limit *= decrease_factor.
+    같은 혼잡으로 여러 번 줄지 않도록 마지막 축소 이전에 시작한 요청의 신호는 무시합니다.
+    async 대기자는 스레드를 점유하지 않고 future로 깨어납니다 (다른 스레드의 release도 전달).
+
+    Args:
+        max_concurrency: 동시성 상한
+        min_concurrency: 동시성 하한
+        initial_concurrency: 시작 동시성
+        latency_target: 지연 목표 (초, 초과 시 축소, 0이면 지연 기반 축소 없음)
+        decrease_factor: 축소 배율
+        rpm: 분당 요청 한도 (0이면 무제한)
+        tpm: 분당 토큰 한도 (0이면 무제한, 프롬프트 길이로 추정)
+
+    Example:
+        >>> llm_scheduler.configure(max_concurrency=4, rpm=30)
+        >>> with llm_scheduler.request(tokens=estimate_tokens(prompt)):
+        ...     response = client.models.generate_content(model=model, contents=prompt)
+        >>> async with llm_scheduler.arequest(tokens=estimate_tokens(prompt)):
+        ...     response = await client.aio.models.generate_content(model=model, contents=prompt)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        min_concurrency: int = 1,
+        initial_concurrency: int = 2,
+        latency_target: float = 90.0,
+        decrease_factor: float = 0.5,
+        rpm: float = 0,
+        tpm: float = 0,
+    ):
+        self._cond = threading.Condition()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.configure(
+            max_concurrency, min_concurrency, initial_concurrency, latency_target, decrease_factor, rpm, tpm
+        )
+
+    def configure(
+        self,
+        max_concurrency: int = 4,
+        min_concurrency: int = 1,
+        initial_concurrency: int = 2,
+        latency_target: float = 90.0,
+        decrease_factor: float = 0.5,
+        rpm: float = 0,
+        tpm: float = 0,
+    ) -> None:
+        """
+        한도 변경 및 통계 초기화 (번역 단계 시작 시)
+
+        Args:
+            max_concurrency: 동시성 상한
+            min_concurrency: 동시성 하한
+            initial_concurrency: 시작 동시성
+            latency_target: 지연 목표 (초)
+            decrease_factor: 축소 배율
+            rpm: 분당 요청 한도 (0이면 무제한)
+            tpm: 분당 토큰 한도 (0이면 무제한)
+        """
+        with self._cond:
+            self.max_concurrency = max(1, max_concurrency)
+            self.min_concurrency = min(max(1, min_concurrency), self.max_concurrency)
+            self.limit = float(min(max(initial_concurrency, self.min_concurrency), self.max_concurrency))
+            self.latency_target = latency_target
+            self.decrease_factor = min(max(decrease_factor, 0.1), 0.9)
+            self.rpm_bucket = TokenBucket(rpm)
+            self.tpm_bucket = TokenBucket(tpm)
+            self.in_flight = getattr(self, "in_flight", 0)
+            self.queued = getattr(self, "queued", 0)
+            self._last_decrease = float("-inf")
+            self.requests = 0
+            self.throttled = 0
+            self.slow = 0
+            self.max_queued = 0
+            self.max_in_flight = 0
+            self.total_latency = 0.0
+            self._wake()
+
+    def _wake(self) -> None:
+        """대기 중인 스레드와 async 대기자 깨우기 (잠금 안에서 호출)"""
+        self._cond.notify_all()
+        for loop, waiter in self._waiters:
+            loop.call_soon_threadsafe(_resolve, waiter)
+        self._waiters.clear()
+
+    def _enqueue(self) -> None:
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+
+    def _admit(self, tokens: int) -> Tuple[bool, Optional[float]]:
+        """
+        슬롯 + RPM/TPM 여유가 있으면 점유 (잠금 안에서 호출)
+
+        Returns:
+            (점유 여부, 다시 시도할 때까지 대기 시간 — None이면 슬롯 반환까지)
+        """
+        if self.in_flight >= int(self.limit):
+            return False, None
+        wait = max(self.rpm_bucket.delay(1), self.tpm_bucket.delay(tokens))
+        if wait > 0:
+            return False, wait
+        self.rpm_bucket.take(1)
+        self.tpm_bucket.take(tokens)
+        self.in_flight += 1
+        self.requests += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return True, None
+
+    def _log_start(self, waited: bool) -> None:
+        log = logger.info if waited or self.queued else logger.debug
+        log(f"LLM 요청 시작: 진행 {self.in_flight}/{int(self.limit)}, 대기열 {self.queued}")
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        슬롯 + RPM/TPM 여유가 생길 때까지 대기 후 점유 (호출 스레드 차단)
+
+        Args:
+            tokens: 이번 요청의 추정 토큰 수
+
+        Returns:
+            요청 시작 시각 (release()에 전달)
+        """
+        with self._cond:
+            self._enqueue()
+            waited = False
+            try:
+                while True:
+                    admitted, wait = self._admit(tokens)
+                    if admitted:
+                        break
+                    waited = True
+                    self._cond.wait(timeout=wait)
+            finally:
+                self.queued -= 1
+            self._log_start(waited)
+            return time.monotonic()
+
+    async def aacquire(self, tokens: int = 1) -> float:
+        """
+        acquire()의 async 버전 (대기 중 스레드를 점유하지 않음)
+
+        Args:
+            tokens: 이번 요청의 추정 토큰 수
+
+        Returns:
+            요청 시작 시각 (release()에 전달)
+        """
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            self._enqueue()
+        waited = False
+        try:
+            while True:
+                with self._cond:
+                    admitted, wait = self._admit(tokens)
+                    if admitted:
+                        self.queued -= 1
+                        self._log_start(waited)
+                        return time.monotonic()
+                    waiter = loop.create_future()
+                    self._waiters.append((loop, waiter))
+                waited = True
+                try:
+                    await asyncio.wait({waiter}, timeout=wait)
+                finally:
+                    with self._cond:
+                        if (loop, waiter) in self._waiters:
+                            self._waiters.remove((loop, waiter))
+        except BaseException:
+            with self._cond:
+                self.queued -= 1
+            raise
+
+    def release(self, started: float, error: Optional[BaseException] = None) -> None:
+        """
+        슬롯 반환 + 결과로 동시성 한도 조정
+
+        Args:
+            started: acquire() 반환값
+            error: 요청 예외 (성공이면 None)
+        """
+        latency = time.monotonic() - started
+        status = status_of(error) if error is not None else None
+        throttled = status in THROTTLE_STATUSES
+        slow = error is None and self.latency_target > 0 and latency > self.latency_target
+
+        with self._cond:
+            self.in_flight -= 1
+            self.total_latency += latency
+            if throttled or slow:
+                self.throttled += throttled
+                self.slow += slow
+                if started > self._last_decrease:
+                    old = self.limit
+                    self.limit = max(float(self.min_concurrency), self.limit * self.decrease_factor)
+                    self._last_decrease = time.monotonic()
+                    reason = f"HTTP {status}" if throttled else f"지연 {latency:.1f}초 > {self.latency_target:.0f}초"
+                    logger.warning(
+                        f"LLM 동시성 축소 {int(old)} → {int(self.limit)} ({reason}), "
+                        f"진행 {self.in_flight}, 대기열 {self.queued}"
+                    )
+            elif error is None:
+                old = int(self.limit)
+                self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+                if int(self.limit) > old:
+                    logger.info(f"LLM 동시성 확대 {old} → {int(self.limit)} (지연 {latency:.1f}초)")
+            self._wake()
+
+    @contextmanager
+    def request(self, tokens: int = 1) -> Iterator[None]:
+        """
+        요청 하나를 스케줄러 안에서 실행하는 컨텍스트 매니저
+
+        Args:
+            tokens: 이번 요청의 추정 토큰 수
+        """
+        started = self.acquire(tokens)
+        try:
+            yield
+        except BaseException as e:
+            self.release(started, e)
+            raise
+        self.release(started)
+
+    @asynccontextmanager
+    async def arequest(self, tokens: int = 1) -> AsyncIterator[None]:
+        """
+        request()의 async 버전
+
+        Args:
+            tokens: 이번 요청의 추정 토큰 수
+        """
+        started = await self.aacquire(tokens)
+        try:
+            yield
+        except BaseException as e:
+            self.release(started, e)
+            raise
+        self.release(started)
+
+    def summary(self) -> str:
+        with self._cond:
+            average = self.total_latency / self.requests if self.requests else 0.0
+            return (
+                f"LLM 스케줄러: 요청 {self.requests}개, 제한 응답 {self.throttled}회, 지연 초과 {self.slow}회, "
+                f"최대 동시 {self.max_in_flight}, 최대 대기열 {self.max_queued}, "
+                f"평균 지연 {average:.1f}초, 최종 동시성 {int(self.limit)}"
+            )
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# 전역 LLM 스케줄러 (번역 단계 시작 시 TranslatorConfig로 설정)
+llm_scheduler = LLMScheduler()
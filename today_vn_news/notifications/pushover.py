@@ -1,9 +1,12 @@
 # today_vn_news/notifications/pushover.py
 import os
 from typing import Optional
+
 import requests
 
 from today_vn_news.logger import logger
+from today_vn_news.http_client import get_session
+from today_vn_news.retry import RetryPolicy
 from today_vn_news.notifications.pipeline_status import PipelineStatus
 from today_vn_news.notifications import STEP_SCRAPE
 from today_vn_news.config import YOUTUBE_PLAYLIST_ID
@@ -17,6 +20,15 @@ MAX_MESSAGE_LENGTH = 1024
 MAX_TITLE_LENGTH = 250
 MAX_URL_LENGTH = 512
 
+# 일시적 서버 오류/네트워크 오류만 재시도 (429는 월간 한도 초과라 재시도 무의미)
+NOTIFY_RETRY = RetryPolicy(
+    max_attempts=3,
+    initial_delay=1.0,
+    retry_statuses=frozenset({500, 502, 503, 504}),
+    catch=(requests.RequestException,),
+    budget="notify",
+)
+
 # YouTube 재생목록 URL (업로드 URL fallback)
 PLAYLIST_URL = f"https://www.youtube.com/playlist?list={YOUTUBE_PLAYLIST_ID}"
 
@@ -92,7 +104,10 @@ class PushoverNotifier:
             data["retry"] = DEFAULT_RETRY
             data["expire"] = DEFAULT_EXPIRE
 
-        response = requests.post(self.API_URL, data=data, timeout=10)
+        try:
+            response = NOTIFY_RETRY.call(self._post, data)
+        except requests.HTTPError as e:
+            response = e.response
 
         if response.status_code == 429:
             logger.warning("Pushover Rate Limit 초과 (HTTP 429)")
@@ -110,6 +125,13 @@ class PushoverNotifier:
         logger.info("Pushover 알림 전송 성공")
         return True
 
+    def _post(self, data: dict) -> requests.Response:
+        """Pushover API POST (재시도 대상 상태 코드는 HTTPError로 변환)"""
+        response = get_session().post(self.API_URL, data=data, timeout=10)
+        if response.status_code in NOTIFY_RETRY.retry_statuses:
+            raise requests.HTTPError(f"Pushover HTTP {response.status_code}", response=response)
+        return response
+
     def _format_message(self, status: PipelineStatus) -> tuple[str, str, int, str | None]:
         """메시지 포맷팅 및 우선순위 결정"""
         if status.success:
@@ -1,32 +1,380 @@
 #!/usr/bin/env python3
 """
 API 호출 재시도 메커니즘
-- 목적: Gemma API 등 외부 API 호출 실패 시 자동 재시도
-- 기능: 지수 백오프(Exponential Backoff) 적용
+- 목적: 스크래퍼·번역·업로드·알림의 외부 호출 실패 시 자동 재시도 (공통 정책)
+- 기능: 상태 코드/예외 타입 기반 재시도 분류, Retry-After 준수,
+        지수 백오프 + full jitter, async 함수는 asyncio.sleep 사용,
+        실행당 재시도 예산(죽은 사이트가 파이프라인 시간을 잡아먹지 않도록)
 """
 
-import time
+import asyncio
+import email.utils
 import functools
-from typing import Callable, Any, Type
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type
+
+import requests
+
 from today_vn_news.logger import logger
 
+# 재시도할 HTTP 상태 코드 (408 요청 시간 초과, 425 Too Early, 429 요청 과다, 5xx 일시적 서버 오류)
+RETRYABLE_STATUSES: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# 상태 코드 없이 재시도할 예외 타입 (네트워크/타임아웃)
+RETRYABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+)
+
+# Retry-After가 이 값보다 길면 기다리지 않고 실패 처리 (초)
+DEFAULT_MAX_RETRY_AFTER = 60.0
+
+# 실행당 재시도 대기 예산 (초): 예산 이름 → 총 대기 시간
+DEFAULT_BUDGETS: Dict[str, float] = {
+    "http": 60.0,     # 스크래퍼
+    "api": 120.0,     # 번역 (LLM)
+    "upload": 120.0,  # YouTube 업로드
+    "notify": 10.0,   # Pushover 알림
+}
+
+
+def status_of(error: BaseException) -> Optional[int]:
+    """
+    예외에서 HTTP 상태 코드 추출 (requests, google-genai, googleapiclient 공통)
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        HTTP 상태 코드 또는 None
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        return status
+    for attr in ("status_code", "code"):
+        status = getattr(error, attr, None)
+        if isinstance(status, int) and 100 <= status < 600:
+            return status
+    resp = getattr(error, "resp", None)  # googleapiclient.errors.HttpError
+    status = getattr(resp, "status", None)
+    if status is not None:
+        try:
+            return int(status)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def parse_retry_after(error: BaseException) -> Optional[float]:
+    """
+    응답의 Retry-After 헤더 파싱 (초 또는 HTTP-date)
+
+    Args:
+        error: 발생한 예외 (response.headers 또는 resp 헤더 사용)
+
+    Returns:
+        대기 시간(초) 또는 None
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        headers = getattr(error, "resp", None)  # googleapiclient: resp는 dict 하위 클래스
+    if not headers or not hasattr(headers, "get"):
+        return None
+
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass(frozen=True)
+class RetryDecision:
+    """재시도 분류 결과"""
+
+    retryable: bool
+    reason: str
+    retry_after: Optional[float] = None
+
+
+def classify_error(
+    error: BaseException,
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES,
+    retry_exceptions: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS,
+) -> RetryDecision:
+    """
+    예외를 재시도 가능 여부로 분류
+
+    상태 코드가 있으면 상태 코드로만 판단하고(4xx 즉시 실패), 없으면 예외 타입으로 판단합니다.
+    retryable = False 속성을 가진 예외(예: 재생 아카이브 미스)는 타입과 관계없이 재시도하지 않습니다.
+
+    Args:
+        error: 발생한 예외
+        retry_statuses: 재시도할 HTTP 상태 코드
+        retry_exceptions: 상태 코드가 없을 때 재시도할 예외 타입
+
+    Returns:
+        RetryDecision
+    """
+    status = status_of(error)
+    if status is not None:
+        if status in retry_statuses:
+            return RetryDecision(True, f"HTTP {status}", parse_retry_after(error))
+        return RetryDecision(False, f"HTTP {status}")
+    if isinstance(error, retry_exceptions) and getattr(error, "retryable", True):
+        return RetryDecision(True, type(error).__name__)
+    return RetryDecision(False, type(error).__name__)
+
+
+class RetryBudget:
+    """
+    실행당 재시도 대기 예산 (스레드 안전).
+
+    재시도 대기 시간을 합산하여 한도를 넘으면 더 이상 재시도하지 않습니다.
+
+    Args:
+        name: 예산 이름 (로그용)
+        max_seconds: 실행당 총 재시도 대기 시간 (초)
+    """
+
+    def __init__(self, name: str, max_seconds: float):
+        self.name = name
+        self.max_seconds = max_seconds
+        self.spent = 0.0
+        self.retries = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.max_seconds - self.spent)
+
+    def try_spend(self, delay: float) -> bool:
+        """
+        재시도 대기 시간 차감
+
+        Args:
+            delay: 이번 재시도 대기 시간 (초)
+
+        Returns:
+            예산 안이면 True (차감됨), 초과면 False
+        """
+        with self._lock:
+            if self.spent + delay > self.max_seconds:
+                self.denied += 1
+                return False
+            self.spent += delay
+            self.retries += 1
+            return True
+
+    def reset(self, max_seconds: Optional[float] = None) -> None:
+        """예산 초기화 (실행 시작 시)"""
+        with self._lock:
+            if max_seconds is not None:
+                self.max_seconds = max_seconds
+            self.spent = 0.0
+            self.retries = 0
+            self.denied = 0
+
+    def summary(self) -> str:
+        return (
+            f"재시도 예산[{self.name}]: {self.retries}회 재시도, "
+            f"{self.spent:.1f}/{self.max_seconds:.0f}초 사용, {self.denied}회 거부"
+        )
+
+
+_budgets: Dict[str, RetryBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_retry_budget(name: str) -> RetryBudget:
+    """
+    이름별 전역 재시도 예산 조회 (없으면 DEFAULT_BUDGETS 한도로 생성)
+
+    Args:
+        name: 예산 이름 ("http", "api", "upload", "notify" 등)
+
+    Returns:
+        RetryBudget
+    """
+    with _budgets_lock:
+        if name not in _budgets:
+            _budgets[name] = RetryBudget(name, DEFAULT_BUDGETS.get(name, 60.0))
+        return _budgets[name]
+
+
+def reset_retry_budgets() -> None:
+    """모든 재시도 예산 초기화 (파이프라인 실행 시작 시 호출)"""
+    with _budgets_lock:
+        budgets = list(_budgets.values())
+    for budget in budgets:
+        budget.reset()
+
+
+def retry_budget_summaries() -> List[str]:
+    """재시도가 발생한 예산의 요약 문자열 목록"""
+    with _budgets_lock:
+        budgets = list(_budgets.values())
+    return [b.summary() for b in budgets if b.retries or b.denied]
+
+
+@dataclass
+class RetryPolicy:
+    """
+    재시도 정책.
+
+    지연 시간 = uniform(0, min(max_delay, initial_delay * backoff_factor ** attempt)) (full jitter).
+    Retry-After가 있으면 그 값을 따르되 max_retry_after보다 길면 재시도하지 않습니다.
+    async 함수를 감싸면 asyncio.sleep으로 대기하여 이벤트 루프를 막지 않습니다.
+
+    Example:
+        >>> policy = RetryPolicy(max_attempts=3, budget="http")
+        >>> response = policy.call(session.get, url, timeout=10)
+        >>> @policy
+        ... async def fetch(): ...
+    """
+
+    max_attempts: int = 3
+    initial_delay: float = 1.0
+    backoff_factor: float = 2.0
+    max_delay: float = 30.0
+    jitter: bool = True
+    max_retry_after: float = DEFAULT_MAX_RETRY_AFTER
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+    retry_exceptions: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS
+    catch: Tuple[Type[BaseException], ...] = (Exception,)
+    budget: Optional[str] = None
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 재시도 대기 시간 (0부터, jitter 적용)"""
+        ceiling = min(self.max_delay, self.initial_delay * (self.backoff_factor ** attempt))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    def next_delay(self, error: BaseException, attempt: int, name: str) -> Optional[float]:
+        """
+        재시도 여부 판단 및 대기 시간 계산 (예산 차감 포함)
+
+        Args:
+            error: 발생한 예외
+            attempt: 실패한 시도 번호 (0부터)
+            name: 호출 이름 (로그용)
+
+        Returns:
+            대기 시간(초) 또는 None (재시도하지 않음)
+        """
+        decision = classify_error(error, self.retry_statuses, self.retry_exceptions)
+        if not decision.retryable:
+            logger.error(f"{name} 실패 (재시도 불가, {decision.reason}): {error}")
+            return None
+        if attempt >= self.max_attempts - 1:
+            logger.error(f"{name} 실패: 최대 시도 횟수 초과 ({self.max_attempts}회)")
+            return None
+
+        if decision.retry_after is not None:
+            if decision.retry_after > self.max_retry_after:
+                logger.error(
+                    f"{name} 실패: Retry-After {decision.retry_after:.0f}초가 한도"
+                    f"({self.max_retry_after:.0f}초) 초과"
+                )
+                return None
+            delay = decision.retry_after
+        else:
+            delay = self.backoff(attempt)
+
+        if self.budget:
+            budget = get_retry_budget(self.budget)
+            if not budget.try_spend(delay):
+                logger.error(
+                    f"{name} 실패: 재시도 예산[{budget.name}] 소진 "
+                    f"(남은 {budget.remaining:.1f}초 < {delay:.1f}초)"
+                )
+                return None
+
+        logger.warning(
+            f"{name} 실패 (시도 {attempt + 1}/{self.max_attempts}, {decision.reason}): {error}. "
+            f"{delay:.1f}초 후 재시도..."
+        )
+        return delay
+
+    def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """동기 함수 호출 (재시도 적용)"""
+        name = getattr(func, "__name__", repr(func))
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except self.catch as e:
+                delay = self.next_delay(e, attempt, name)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def acall(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """비동기 함수 호출 (재시도 적용, asyncio.sleep으로 대기)"""
+        name = getattr(func, "__name__", repr(func))
+        attempt = 0
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except self.catch as e:
+                delay = self.next_delay(e, attempt, name)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def __call__(self, func: Callable) -> Callable:
+        """데코레이터 (async 함수는 acall, 그 외는 call)"""
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await self.acall(func, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.call(func, *args, **kwargs)
+
+        return wrapper
+
 
 def with_http_retry(
     max_attempts: int = 3,
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
+    budget: Optional[str] = "http",
 ):
     """
     HTTP 요청 재시도 데코레이터.
 
-    타임아웃, 5xx 서버 에러, 네트워크 오류 시 자동 재시도합니다.
-    4xx 클라이언트 에러는 즉시 실패 처리합니다.
+    타임아웃, 네트워크 오류, 408/425/429/5xx 응답 시 자동 재시도합니다.
+    그 외 4xx 클라이언트 에러는 즉시 실패 처리합니다.
 
     Args:
         max_attempts: 최대 시도 횟수 (기본값: 3, 초기 호출 포함)
         initial_delay: 초기 대기 시간(초) (기본값: 1.0)
         backoff_factor: 백오프 배수 (기본값: 2.0)
-            지연 시간 = initial_delay * (backoff_factor ** attempt)
+            지연 시간 = uniform(0, initial_delay * (backoff_factor ** attempt))
+        budget: 재시도 예산 이름 (None이면 예산 없음)
 
     Returns:
         Callable: 함수 데코레이터
@@ -40,44 +388,13 @@ def with_http_retry(
         ... def fetch_data():
         ...     return requests.get("https://api.example.com")
     """
-    import requests
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception = None
-
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except requests.RequestException as e:
-                    last_exception = e
-
-                    # 4xx 클라이언트 에러는 즉시 실패 (재시도 무의미)
-                    if isinstance(e, requests.Response) and 400 <= e.response.status_code < 500:
-                        logger.error(f"{func.__name__} 실패: 클라이언트 에러 {e.response.status_code}")
-                        raise
-
-                    # 타임아웃, 5xx, 네트워크 오류는 재시도
-                    if attempt < max_attempts - 1:
-                        # 지수 백오프 계산
-                        delay = initial_delay * (backoff_factor ** attempt)
-                        logger.warning(
-                            f"{func.__name__} 실패 (시도 {attempt + 1}/{max_attempts}): {str(e)}. "
-                            f"{delay:.1f}초 후 재시도..."
-                        )
-                        time.sleep(delay)
-                    else:
-                        logger.error(
-                            f"{func.__name__} 실패: 최대 시도 횟수 초과 ({max_attempts}회)"
-                        )
-
-            # 모든 시도 실패 시 마지막 예외 재발생
-            raise last_exception
-
-        return wrapper
-
-    return decorator
+    return RetryPolicy(
+        max_attempts=max_attempts,
+        initial_delay=initial_delay,
+        backoff_factor=backoff_factor,
+        catch=(requests.RequestException,),
+        budget=budget,
+    )
 
 
 def with_api_retry(
@@ -85,19 +402,21 @@ def with_api_retry(
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
     exceptions: tuple = (Exception,),
+    budget: Optional[str] = "api",
 ):
     """
     일반적인 API 호출 재시도 데코레이터.
 
-    지정된 예외 타입 발생 시 지수 백오프를 적용하여 자동 재시도합니다.
-    Gemma API 등 외부 API 호출에 사용합니다.
+    지정된 예외 타입 발생 시 재시도합니다. 예외에 HTTP 상태 코드가 있으면
+    (google-genai APIError 등) 상태 코드로 분류하여 4xx는 즉시 실패합니다.
 
     Args:
         max_attempts: 최대 시도 횟수 (기본값: 3, 초기 호출 포함)
         initial_delay: 초기 대기 시간(초) (기본값: 1.0)
         backoff_factor: 백오프 배수 (기본값: 2.0)
-            지연 시간 = initial_delay * (backoff_factor ** attempt)
+            지연 시간 = uniform(0, initial_delay * (backoff_factor ** attempt))
         exceptions: 재시도할 예외 타입 튜플 (기본값: (Exception,))
+        budget: 재시도 예산 이름 (None이면 예산 없음)
 
     Returns:
         Callable: 함수 데코레이터
@@ -110,34 +429,11 @@ def with_api_retry(
         ... def call_api():
         ...     return external_api_client.request()
     """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception = None
-
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-
-                    if attempt < max_attempts - 1:
-                        # 지수 백오프 계산
-                        delay = initial_delay * (backoff_factor ** attempt)
-                        logger.warning(
-                            f"{func.__name__} 실패 (시도 {attempt + 1}/{max_attempts}): {str(e)}. "
-                            f"{delay:.1f}초 후 재시도..."
-                        )
-                        time.sleep(delay)
-                    else:
-                        logger.error(
-                            f"{func.__name__} 실패: 최대 시도 횟수 초과 ({max_attempts}회)"
-                        )
-
-            # 모든 시도 실패 시 마지막 예외 재발생
-            raise last_exception
-
-        return wrapper
-
-    return decorator
+    return RetryPolicy(
+        max_attempts=max_attempts,
+        initial_delay=initial_delay,
+        backoff_factor=backoff_factor,
+        retry_exceptions=tuple(exceptions),
+        catch=tuple(exceptions),
+        budget=budget,
+    )
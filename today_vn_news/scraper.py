@@ -6,93 +6,277 @@
 """
 
 import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache, partial
+from typing import List, Dict, Optional, Union
+from urllib.parse import urlsplit
 import re
-import xml.etree.ElementTree as ET
 import html
 
 from today_vn_news.logger import logger
 from today_vn_news.exceptions import ScrapingError
 from today_vn_news.retry import with_http_retry
+from today_vn_news.config import ScraperConfig
+from today_vn_news.http_client import configure_session, dns_cache, get_session
+from today_vn_news.scraping.engine import (
+    DeadlineExceeded,
+    SourceResult,
+    clamp_timeout,
+    current_source,
+    host_limiter,
+    run_sources,
+)
+from today_vn_news.scraping.checkpoint import SourceCheckpoint
+from today_vn_news.scraping.health import CircuitOpenError, health_board
+from today_vn_news.scraping.http_cache import http_cache
+from today_vn_news.scraping.page_store import PageStore, page_store
+from today_vn_news.scraping.parse_pool import parse_pool
+from today_vn_news.scraping.replay import http_replay
+from today_vn_news.scraping.stream import DEFAULT_MAX_BYTES, StreamedBody, stream_stats
+from today_vn_news.scraping.feed import (
+    VN_TZ,
+    FeedItem,
+    parse_feed,
+    parse_news_sitemap,
+    strip_tags,
+)
+from today_vn_news.scraping.text import (  # clean_text: 기존 import 경로 호환
+    clean_text,
+    normalize_article,
+    normalize_articles,
+)
+from today_vn_news.scraping.registry import (
+    SAFETY_SECTION,
+    SourceRegistry,
+    SourceSpec,
+    default_source,
+    get_registry,
+)
+from today_vn_news.scraping.safety import SafetyCache, is_cacheable
+from today_vn_news.scraping.seen_store import SeenStore
 
 
-def clean_text(text: str) -> str:
+# ============================================================================
+# HTTP 요청 헬퍼 함수 (재시도 메커니즘 적용)
+# ============================================================================
+
+def _cached_get(
+    url: str,
+    headers: dict = None,
+    params: dict = None,
+    timeout: int = 10,
+) -> requests.Response:
     """
-    텍스트 정제 및 정규화 (저장 전 필수 처리)
+    HTTP 캐시를 거치는 GET 요청 (녹화/재생 모드 지원)
+
+    TTL 이내 캐시는 요청 없이 반환하고, 그 외에는 저장된 검증자로
+    조건부 요청을 보내 304 응답 시 캐시 본문을 반환합니다.
+    재생 모드에서는 네트워크/캐시 대신 아카이브의 응답을 반환하고,
+    녹화 모드에서는 최종 응답(또는 실패)을 아카이브에 기록합니다.
+    받은 본문은 원본 페이지 보관소에도 저장합니다 (page_store 활성 시).
 
     Args:
-        text: 정제할 텍스트
+        url: 요청 URL
+        headers: 추가 HTTP 헤더
+        params: 쿼리 파라미터
+        timeout: 타임아웃 (초)
 
     Returns:
-        정제된 텍스트
-        - 연속된 공백 → 단일 공백
-        - 앞뒤 공백 제거
-        - 개행문자 제거
-        - 탭 문자 제거
-        - 홑따옴표(') 제거
-        - HTML 엔티티 변환
-        - 유니코드 정규화 (NFKC)
+        Response 객체 (캐시/재생 응답 포함)
     """
-    if not text:
-        return text
+    cache_key = requests.Request("GET", url, params=params).prepare().url
 
-    # 유니코드 정규화 (호환성 문제 해결)
-    import unicodedata
-    text = unicodedata.normalize("NFKC", text)
+    if http_replay.replaying:
+        return http_replay.serve(cache_key)
 
-    # HTML 엔티티 변환
-    import html
-    text = html.unescape(text)
+    start = time.perf_counter()
+    try:
+        response = _conditional_get(cache_key, url, headers, params, timeout)
+    except requests.RequestException as e:
+        http_replay.record_error(cache_key, e, time.perf_counter() - start)
+        raise
+    http_replay.record(cache_key, response, time.perf_counter() - start)
+    page_store.record(cache_key, response)
+    return response
 
-    # 홑따옴표 제거
-    text = text.replace("'", "").replace("\u2019", "").replace("\u2018", "")
 
-    # 연속된 공백 → 단일 공백
-    import re
-    text = re.sub(r'\s+', ' ', text)
+def _cached_stream(url: str, timeout: int = 10, max_bytes: Optional[int] = None) -> StreamedBody:
+    """
+    HTTP 캐시를 거치는 스트리밍 GET 요청 (녹화/재생 모드 지원)
 
-    # 앞뒤 공백 제거
-    text = text.strip()
+    캐시/재생 응답은 메모리 본문을, 네트워크 응답은 stream=True 본문을
+    같은 StreamedBody로 반환합니다. 녹화·캐시 저장·바이트 집계는 본문을
+    닫을 때 실제로 읽은 만큼만 반영합니다 (조기 종료 본문은 partial로 캐시에
+    저장하여 다음 요청도 조건부 GET으로 재검증, 오류로 끊긴 본문은 저장하지 않음).
 
-    # 개행문자 제거
-    text = text.replace('\n', ' ').replace('\r', ' ')
+    Args:
+        url: 요청 URL
+        timeout: 타임아웃 (초, 청크 사이 대기 시간에도 적용)
+        max_bytes: 최대 바이트 (None이면 DEFAULT_MAX_BYTES)
 
-    return text
+    Returns:
+        StreamedBody (호출 측에서 close 또는 with 사용)
+    """
+    cache_key = requests.Request("GET", url).prepare().url
+    max_bytes = max_bytes or DEFAULT_MAX_BYTES
 
+    if http_replay.replaying:
+        return StreamedBody(http_replay.serve(cache_key), max_bytes)
+
+    start = time.perf_counter()
+    try:
+        return _conditional_get(cache_key, url, None, None, timeout, stream=True, max_bytes=max_bytes)
+    except requests.RequestException as e:
+        http_replay.record_error(cache_key, e, time.perf_counter() - start)
+        raise
+
+
+def _finish_stream(cache_key: str, host: Optional[str], start: float, body: StreamedBody) -> None:
+    """
+    스트리밍 본문 종료 처리 (녹화·원본 보관, 네트워크 응답이면 캐시 저장·바이트 집계)
+
+    Args:
+        cache_key: 캐시 키 (쿼리 포함 URL)
+        host: 요청 호스트 (캐시 응답이면 None)
+        start: 요청 시작 시각 (perf_counter)
+        body: 닫힌 스트리밍 본문
+    """
+    elapsed = time.perf_counter() - start
+    response = body.to_response()
+    http_replay.record(cache_key, response, elapsed)
+    page_store.record(cache_key, response, complete=body.complete)
+    if host is None:
+        return
+    source = current_source()
+    health_board.record_bytes(host, body.wire_bytes, source=source)
+    stream_stats.record(source or host, body, elapsed)
+    if not body.failed:
+        http_cache.store(cache_key, response, partial=not body.complete)
+
+
+def _conditional_get(
+    cache_key: str,
+    url: str,
+    headers: Optional[dict],
+    params: Optional[dict],
+    timeout: int,
+    stream: bool = False,
+    max_bytes: Optional[int] = None,
+) -> Union[requests.Response, StreamedBody]:
+    """
+    조건부 GET 캐시 조회 및 네트워크 요청
+
+    Args:
+        cache_key: 캐시 키 (쿼리 포함 URL)
+        url: 요청 URL
+        headers: 추가 HTTP 헤더
+        params: 쿼리 파라미터
+        timeout: 타임아웃 (초)
+        stream: True면 본문을 받지 않고 StreamedBody로 반환
+        max_bytes: 스트리밍 최대 바이트
+
+    Returns:
+        Response 객체 (캐시 응답 포함), stream=True면 StreamedBody
+    """
+    start = time.perf_counter()
+
+    def wrap(response: requests.Response, host: Optional[str] = None):
+        if not stream:
+            return response
+        return StreamedBody(response, max_bytes, on_close=partial(_finish_stream, cache_key, host, start))
+
+    cached = http_cache.lookup(cache_key)
+    if cached is not None and cached.partial and not stream:
+        cached = None  # 앞부분만 저장된 본문은 전체 본문이 필요한 요청에 쓰지 않음
+
+    if cached is not None and http_cache.is_fresh(cached):
+        http_cache.stats.record("fresh_hits")
+        logger.debug(f"HTTP 캐시 적중 (TTL): {cache_key}")
+        return wrap(cached.to_response())
+
+    request_headers = dict(headers or {})
+    if cached is not None:
+        request_headers.update(cached.validators())
+
+    # 마감 확인을 서킷 확인보다 먼저 (마감 초과로 half-open 탐색 슬롯을 잡은 채 끝나지 않도록)
+    host = urlsplit(url).hostname or ""
+    adaptive_timeout = health_board.timeout_for(host, timeout)
+    timeout = clamp_timeout(adaptive_timeout)
+    clamped = timeout < adaptive_timeout
+
+    # 서킷이 열린 호스트는 요청하지 않음 (만료된 캐시가 있으면 그대로 사용)
+    try:
+        health_board.before_request(host)
+    except CircuitOpenError:
+        if cached is None:
+            raise
+        logger.warning(f"서킷 열림, 만료된 캐시 사용: {cache_key}")
+        return wrap(cached.to_response())
+
+    with host_limiter.limit(url):
+        start = time.perf_counter()
+        try:
+            response = get_session().get(
+                url, headers=request_headers, params=params, timeout=timeout, stream=stream
+            )
+        except requests.RequestException as e:
+            if isinstance(e, DeadlineExceeded) or (clamped and isinstance(e, requests.Timeout)):
+                # 수집 마감으로 잘린 요청은 호스트 실패로 집계하지 않음
+                health_board.release(host)
+            else:
+                health_board.record_request(host, time.perf_counter() - start, 0, ok=False, source=current_source())
+            raise
+    if health_board.enabled:
+        # 스트리밍 본문 바이트는 닫을 때 record_bytes로 추가
+        health_board.record_request(
+            host,
+            time.perf_counter() - start,
+            0 if stream else len(response.content),
+            ok=response.status_code < 500,
+            source=current_source(),
+        )
+
+    if response.status_code == 304 and cached is not None:
+        if stream:
+            response.close()
+        http_cache.stats.record("revalidated")
+        http_cache.touch(cached, response)
+        logger.debug(f"HTTP 캐시 적중 (304): {cache_key}")
+        return wrap(cached.to_response())
+
+    if stream and response.status_code >= 400:
+        response.content  # 오류 본문은 끝까지 읽음 (녹화 시 보존, 연결 반환)
+    response.raise_for_status()
+    http_cache.stats.record("misses")
+    if stream:
+        return wrap(response, host)
+    http_cache.store(cache_key, response)
+    return response
 
-# ============================================================================
-# HTTP 요청 헬퍼 함수 (재시도 메커니즘 적용)
-# ============================================================================
 
 @with_http_retry(max_attempts=3)
 def _fetch_url(url: str, headers: dict = None, timeout: int = 10) -> requests.Response:
     """
-    HTTP GET 요청 (재시도 적용)
+    HTTP GET 요청 (공유 커넥션 풀, 조건부 GET 캐시, 재시도 적용)
 
     Args:
         url: 요청 URL
-        headers: HTTP 헤더
+        headers: 추가 HTTP 헤더 (기본 User-Agent는 세션에 설정됨)
         timeout: 타임아웃 (초)
 
     Returns:
         Response 객체
     """
-    if headers is None:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-    response = requests.get(url, headers=headers, timeout=timeout)
-    response.raise_for_status()
-    return response
+    return _cached_get(url, headers=headers, timeout=timeout)
 
 
 @with_http_retry(max_attempts=3)
 def _fetch_url_with_params(url: str, params: dict = None, timeout: int = 10) -> requests.Response:
     """
-    HTTP GET 요청 (쿼리 파라미터 포함, 재시도 적용)
+    HTTP GET 요청 (쿼리 파라미터 포함, 공유 커넥션 풀, 조건부 GET 캐시, 재시도 적용)
 
     Args:
         url: 요청 URL
@@ -102,559 +286,547 @@ def _fetch_url_with_params(url: str, params: dict = None, timeout: int = 10) ->
     Returns:
         Response 객체
     """
-    response = requests.get(url, params=params, timeout=timeout)
-    response.raise_for_status()
-    return response
+    return _cached_get(url, params=params, timeout=timeout)
+
+
+@with_http_retry(max_attempts=3)
+def _fetch_stream(url: str, timeout: int = 10, max_bytes: Optional[int] = None) -> StreamedBody:
+    """
+    스트리밍 HTTP GET 요청 (필요한 바이트만 다운로드, 조건부 GET 캐시, 재시도 적용)
+
+    재시도는 응답 헤더 수신까지만 적용되며, 본문을 읽는 중 발생한 오류는
+    호출 측으로 전달됩니다.
+
+    Args:
+        url: 요청 URL
+        timeout: 타임아웃 (초)
+        max_bytes: 최대 바이트 (None이면 DEFAULT_MAX_BYTES)
+
+    Returns:
+        StreamedBody (with 문으로 사용)
+    """
+    return _cached_stream(url, timeout=timeout, max_bytes=max_bytes)
 
 
 # ============================================================================
-# 스크래핑 함수
+# RSS 피드 헬퍼 함수
 # ============================================================================
 
-def scrape_nhandan(date_str: str) -> List[Dict[str, str]]:
+def _feed_article(item: FeedItem, date_str: str) -> Dict[str, str]:
     """
-    Nhân Dân(정부 기관지) 스크래핑
+    RSS item → 기사 딕셔너리 변환 (정규화 전, HTML 태그만 제거)
 
     Args:
-        date_str: 기준일 (YYYY-MM-DD 형식)
+        item: 파싱된 RSS item
+        date_str: 기사 날짜로 기록할 기준일
 
     Returns:
-        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+        {'title': str, 'content': str, 'url': str, 'date': str}
     """
-    logger.info("Nhân Dân 스크래핑 시작", extra={"url": "https://nhandan.vn/"})
+    return {
+        "title": item.title,
+        "content": strip_tags(item.description),
+        "url": item.link,
+        "date": date_str,
+    }
 
-    url = "https://nhandan.vn/"
-    articles = []
 
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = _fetch_url(url, headers=headers)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # 오늘 날짜 형식 (예: 09/02/2025)
-        today_pattern = (
-            date_str.split("-")[2]
-            + "/"
-            + date_str.split("-")[1]
-            + "/"
-            + date_str.split("-")[0]
-        )
+def _scrape_rss_feeds(
+    rss_feeds: List[tuple],
+    date_str: str,
+    per_feed_limit: Optional[int],
+    timeout: int = 10,
+    max_bytes: Optional[int] = None,
+) -> List[Dict[str, str]]:
+    """
+    카테고리별 RSS 피드 순차 파싱 (URL 중복 제거)
 
-        # 기사 리스트 찾기
-        article_elements = (
-            soup.find_all("article", class_="story")
-            or soup.find_all("article", class_="news-item")
-            or soup.find_all("div", class_="article")
-            or soup.select(".article-content, .news-list article")
-        )
+    피드 하나의 실패는 경고 후 건너뛰고 나머지 피드를 계속 처리합니다.
 
-        for article in article_elements[:5]:  # 최대 5개 기사 체크
-            # 링크 찾기
-            link_tag = article.find("a")
-            if not link_tag:
-                continue
-
-            article_url = link_tag.get("href", "")
-            if not article_url.startswith("http"):
-                article_url = "https://nhandan.vn" + article_url
-
-            # 제목 찾기
-            title_tag = article.find(["h2", "h3", "h4"])
-            title = title_tag.get_text(strip=True) if title_tag else ""
-            title = clean_text(title)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
-
-            # 날짜 찾기
-            date_tag = (
-                article.find("time")
-                or article.find("span", class_="date")
-                or article.find("div", class_="article-date")
-            )
+    Args:
+        rss_feeds: [(카테고리 이름, RSS URL)] 리스트
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        per_feed_limit: 카테고리별 최대 기사 수 (None이면 제한 없음)
+        timeout: 피드별 타임아웃 (초)
+        max_bytes: 피드별 최대 바이트 (None이면 기본값)
 
-            # 오늘 날짜 확인
-            is_today = False
-            if date_tag and date_tag.name == "time":
-                # ISO 8601 형식 (datetime 속성): 2026-02-11T17:21:16+07:00
-                datetime_str = date_tag.get("datetime", "")
-                if datetime_str:
-                    try:
-                        article_dt = datetime.fromisoformat(datetime_str.replace("+07:00", ""))
-                        target_dt = datetime.strptime(date_str, "%Y-%m-%d")
-                        is_today = article_dt.date() == target_dt.date()
-                        article_date = article_dt.strftime("%d/%m/%Y")
-                    except:
-                        article_date = date_tag.get_text(strip=True)
-                else:
-                    article_date = date_tag.get_text(strip=True)
-            else:
-                article_date = date_tag.get_text(strip=True) if date_tag else ""
-                # 기존 패턴 매칭 (텍스트 날짜)
-                if today_pattern in article_date:
-                    is_today = True
-
-            if is_today:
-                # 본문 미리보기 요약
-                summary_tag = article.find("p", class_="sapo") or article.find(
-                    "div", class_="summary"
-                )
-                content = summary_tag.get_text(strip=True) if summary_tag else title
-                content = clean_text(content)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
+    Returns:
+        기사 리스트
+    """
+    target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    articles = []
+    seen_urls = set()  # 중복 방지를 위한 URL 추적
 
-                articles.append(
-                    {
-                        "title": title,
-                        "content": content[:200],  # 200자 제한
-                        "url": article_url,
-                        "date": article_date,
-                    }
-                )
+    for category_name, rss_url in rss_feeds:
+        try:
+            # 기준일 item을 per_feed_limit개 확보하면 나머지 피드는 받지 않음
+            with _fetch_stream(rss_url, timeout=timeout, max_bytes=max_bytes) as body:
+                items = parse_feed(body, target_date, limit=per_feed_limit)
 
-        logger.info(f"Nhân Dân 스크래핑 완료: {len(articles)}개 기사 수집")
-        return articles
+            for item in items:
+                # 중복 체크 (URL 기반)
+                if item.link in seen_urls:
+                    continue
+                seen_urls.add(item.link)
+                articles.append(_feed_article(item, date_str))
 
-    except requests.RequestException as e:
-        logger.error(f"Nhân Dân 스크래핑 실패", exc_info=True)
-        raise ScrapingError(f"Failed to scrape Nhân Dân: {str(e)}")
+            logger.debug(f"{category_name} RSS: {len(items)}개 기사")
 
+        except Exception as e:
+            logger.warning(f"{category_name} RSS 파싱 실패: {str(e)}", extra={"url": rss_url})
+
+    return articles
 
-def scrape_suckhoedoisong(date_str: str) -> List[Dict[str, str]]:
+
+def scrape_rss_source(date_str: str, source: SourceSpec) -> List[Dict[str, str]]:
     """
-    Sức khỏe & Đời living(보건부 관보) RSS 파싱
+    레지스트리 RSS 소스 파싱 (type: rss 기본 스크래퍼)
+
+    피드가 하나면 요청 실패 시 ScrapingError를 발생시키고, 카테고리별 다중 피드는
+    실패한 피드만 건너뛰며 URL 중복을 제거합니다.
 
     Args:
         date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (urls, per_feed_limit, limit, timeout)
 
     Returns:
         기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+
+    Raises:
+        ScrapingError: 단일 피드 요청 실패 시
     """
-    logger.info("Sức khỏe & Đời living RSS 파싱 시작", extra={"url": "https://suckhoedoisong.vn/y-te.rss"})
+    logger.info(f"{source.name} RSS 파싱 시작", extra={"url": source.url})
 
-    rss_url = "https://suckhoedoisong.vn/y-te.rss"
-    articles = []
+    if len(source.urls) == 1:
+        try:
+            target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            with _fetch_stream(source.url, timeout=source.timeout, max_bytes=source.max_bytes) as body:
+                items = parse_feed(
+                    body, target_date, limit=source.per_feed_limit or source.limit
+                )
+            articles = [_feed_article(item, date_str) for item in items]
+        except requests.RequestException as e:
+            logger.error(f"{source.name} RSS 파싱 실패", exc_info=True)
+            raise ScrapingError(f"Failed to parse {source.name} RSS: {str(e)}")
+    else:
+        articles = _scrape_rss_feeds(
+            source.urls,
+            date_str,
+            source.per_feed_limit,
+            timeout=source.timeout,
+            max_bytes=source.max_bytes,
+        )
 
-    try:
-        # date_str 변환 (2026-02-11 → 11 Feb 2026)
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        target_date_short = date_obj.strftime("%d %b %Y")  # "11 Feb 2026"
+    # 소스 전체 기사 수 제한 후 일괄 정규화 (본문 200자 제한)
+    if source.limit is not None:
+        articles = articles[: source.limit]
+    articles = normalize_articles(articles, max_lengths={"content": 200})
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = _fetch_url(rss_url, headers=headers)
+    logger.info(f"{source.name} RSS 파싱 완료: {len(articles)}개 기사 수집")
+    return articles
 
-        # XML 파싱
-        root = ET.fromstring(response.text)
 
-        # channel 찾기
-        channel = None
-        for child in root:
-            if child.tag == "channel" or child.tag.endswith("channel"):
-                channel = child
-                break
+def _scrape_news_sitemap(
+    source: SourceSpec, date_str: str, categories: Optional[List[str]] = None
+) -> Optional[List[Dict[str, str]]]:
+    """
+    Google News 사이트맵 기반 수집 (HTML 스크래퍼보다 먼저 시도)
 
-        if channel is not None:
-            # items 찾기
-            items = []
-            for child in channel:
-                if child.tag == "item" or child.tag.endswith("item"):
-                    items.append(child)
-
-            for item in items[:5]:  # 최대 5개 (건강 관련 이슈 전수 수집)
-                # pubDate 찾기
-                pub_date_elem = item.find(".//pubDate")
-                if pub_date_elem is not None and pub_date_elem.text:
-                    try:
-                        # pubDate 파싱: "Wed, 11 Feb 2026 18:38:41 +0700"
-                        pub_date_text = pub_date_elem.text.strip()
-
-                        # "11 Feb 2026" 추출
-                        date_match = re.search(r"\d{2} \w{3} \d{4}", pub_date_text)
-                        pub_date_short = date_match.group(0) if date_match else ""
-
-                        # 필터링: 당일 기사만
-                        if pub_date_short != target_date_short:
-                            continue
-                    except Exception:
-                        continue
-                else:
-                    continue
+    news:publication_date로 기준일 기사를 고르므로 DOM 파싱과 날짜 추정이
+    필요 없습니다. 요약이 없어 본문은 제목으로 채웁니다 (HTML 경로에서 요약이
+    없을 때와 동일).
 
-                # title 찾기
-                title_elem = item.find(".//title")
-                title = title_elem.text if title_elem is not None else ""
-                title = clean_text(title)
+    Args:
+        source: 소스 설정 (sitemap, limit/scan_limit, timeout, max_bytes)
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        categories: 기사 URL에 포함되어야 할 카테고리 경로 (None이면 전체)
 
-                # link 찾기
-                link_elem = item.find(".//link")
-                article_url = link_elem.text if link_elem is not None else ""
+    Returns:
+        정규화된 기사 리스트, 사이트맵 미설정·요청/파싱 실패·당일 기사 0건이면 None (HTML 폴백)
+    """
+    if not source.sitemap:
+        return None
 
-                # description 찾기
-                desc_elem = item.find(".//description")
-                description = desc_elem.text if desc_elem is not None else ""
+    target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    predicate = None
+    if categories:
+        predicate = lambda item: any(cat in item.link for cat in categories)  # noqa: E731
 
-                # HTML 태그 제거
-                content = re.sub(r"<[^>]+>", "", description).strip()
-                content = content[:200]
-                content = clean_text(content)
+    try:
+        with _fetch_stream(source.sitemap, timeout=source.timeout, max_bytes=source.max_bytes) as body:
+            items = parse_news_sitemap(
+                body, target_date, limit=source.limit or source.scan_limit, predicate=predicate
+            )
+    except Exception as e:
+        logger.warning(f"{source.name} 사이트맵 수집 실패, HTML로 대체: {e}", extra={"url": source.sitemap})
+        return None
+
+    if not items:
+        logger.info(f"{source.name} 사이트맵에 당일 기사 없음, HTML로 대체", extra={"url": source.sitemap})
+        return None
+
+    articles = [
+        {
+            "title": item.title,
+            "content": item.title,
+            "url": item.link,
+            "date": item.pub_date.astimezone(VN_TZ).strftime("%d/%m/%Y"),
+        }
+        for item in items
+    ]
+    articles = normalize_articles(articles, max_lengths={"content": 200})
+    logger.info(f"{source.name} 사이트맵 수집 완료: {len(articles)}개 기사 수집")
+    return articles
 
-                articles.append(
-                    {
-                        "title": title,
-                        "content": content,
-                        "url": article_url,
-                        "date": date_str,
-                    }
-                )
 
-        logger.info(f"Sức khỏe & Đời living RSS 파싱 완료: {len(articles)}개 기사 수집")
-        return articles
+# ============================================================================
+# 스크래핑 함수
+# ============================================================================
 
-    except requests.RequestException as e:
-        logger.error(f"Sức khỏe & Đời living RSS 파싱 실패", exc_info=True)
-        raise ScrapingError(f"Failed to parse Sức khỏe & Đời living RSS: {str(e)}")
+# 무거운 의존성(bs4, NumPy, 지진 필터)은 해당 소스를 실제로 수집할 때 import합니다.
+# 비활성 소스는 import 비용도 들지 않습니다 (SourceSpec.load_scraper는 이 모듈을 공유).
+
+
+@lru_cache(maxsize=1)
+def _html_strainers() -> Dict[str, object]:
+    """HTML 부분 파싱 필터 (각 스크래퍼의 셀렉터 폴백이 참조하는 요소만 파싱, 첫 사용 시 생성)"""
+    from bs4 import SoupStrainer
+
+    return {
+        "NHANDAN_STRAINER": SoupStrainer(
+            class_=["story", "news-item", "article", "article-content", "news-list"]
+        ),
+        "NCHMF_STRAINER": SoupStrainer(class_="text-weather-location"),
+        "THANHNIEN_STRAINERS": [
+            SoupStrainer("article"),
+            SoupStrainer(class_=["news-item", "article-item", "story"]),
+        ],
+        "SAIGONTIMES_STRAINERS": [
+            SoupStrainer("article"),
+            SoupStrainer(class_=["news-item", "article-item", "story-item"]),
+        ],
+    }
 
 
-def scrape_tuoitre(date_str: str) -> List[Dict[str, str]]:
+def __getattr__(name: str):
+    """기존 모듈 속성(NHANDAN_STRAINER 등) 호환: 접근 시 필터 생성"""
+    strainers = _html_strainers() if name.endswith(("_STRAINER", "_STRAINERS")) else {}
+    if name in strainers:
+        return strainers[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _extract_nhandan(markup: str, date_str: str, source: SourceSpec) -> List[Dict[str, str]]:
     """
-    Tuổi Trẻ(호치민 로컬) 스크래핑
+    Nhân Dân 홈페이지 HTML에서 당일 기사 추출 (파싱 프로세스 풀에서 실행 가능)
 
     Args:
+        markup: 홈페이지 HTML 본문
         date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정
 
     Returns:
-        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+        정규화된 기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
     """
-    logger.info("Tuổi Trẻ 스크래핑 시작", extra={"url": "https://tuoitre.vn/"})
+    from today_vn_news.scraping.html_parser import parse_html
 
-    url = "https://tuoitre.vn/"
+    soup = parse_html(markup, parse_only=_html_strainers()["NHANDAN_STRAINER"], source="Nhân Dân")
     articles = []
 
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = _fetch_url(url, headers=headers)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # 오늘 날짜 형식
-        today_pattern = (
-            date_str.split("-")[2]
-            + "/"
-            + date_str.split("-")[1]
-            + "/"
-            + date_str.split("-")[0]
+    # 오늘 날짜 형식 (예: 09/02/2025)
+    today_pattern = (
+        date_str.split("-")[2]
+        + "/"
+        + date_str.split("-")[1]
+        + "/"
+        + date_str.split("-")[0]
+    )
+
+    # 기사 리스트 찾기
+    article_elements = (
+        soup.find_all("article", class_="story")
+        or soup.find_all("article", class_="news-item")
+        or soup.find_all("div", class_="article")
+        or soup.select(".article-content, .news-list article")
+    )
+
+    for article in article_elements[: source.scan_limit]:  # 후보 기사 체크 (기본 5개)
+        # 링크 찾기
+        link_tag = article.find("a")
+        if not link_tag:
+            continue
+
+        article_url = link_tag.get("href", "")
+        if not article_url.startswith("http"):
+            article_url = "https://nhandan.vn" + article_url
+
+        # 제목 찾기
+        title_tag = article.find(["h2", "h3", "h4"])
+        title = title_tag.get_text(strip=True) if title_tag else ""
+
+        # 날짜 찾기
+        date_tag = (
+            article.find("time")
+            or article.find("span", class_="date")
+            or article.find("div", class_="article-date")
         )
 
-        # 기사 리스트 찾기 (h2 태그 안에 링크가 있는 구조)
-        h2_tags = soup.find_all("h2")[:5]  # 최대 5개 기사 체크
+        # 오늘 날짜 확인
+        is_today = False
+        if date_tag and date_tag.name == "time":
+            # ISO 8601 형식 (datetime 속성): 2026-02-11T17:21:16+07:00
+            datetime_str = date_tag.get("datetime", "")
+            if datetime_str:
+                try:
+                    article_dt = datetime.fromisoformat(datetime_str.replace("+07:00", ""))
+                    target_dt = datetime.strptime(date_str, "%Y-%m-%d")
+                    is_today = article_dt.date() == target_dt.date()
+                    article_date = article_dt.strftime("%d/%m/%Y")
+                except:
+                    article_date = date_tag.get_text(strip=True)
+            else:
+                article_date = date_tag.get_text(strip=True)
+        else:
+            article_date = date_tag.get_text(strip=True) if date_tag else ""
+            # 기존 패턴 매칭 (텍스트 날짜)
+            if today_pattern in article_date:
+                is_today = True
+
+        if is_today:
+            # 본문 미리보기 요약
+            summary_tag = article.find("p", class_="sapo") or article.find(
+                "div", class_="summary"
+            )
+            content = summary_tag.get_text(strip=True) if summary_tag else title
+
+            articles.append(
+                {
+                    "title": title,
+                    "content": content,
+                    "url": article_url,
+                    "date": article_date,
+                }
+            )
 
-        for h2_tag in h2_tags:
-            # 링크 찾기
-            link_tag = h2_tag.find("a")
-            if not link_tag:
-                continue
+    # 일괄 정규화 (홑따옴표 + HTML 엔티티, 본문 200자 제한)
+    return normalize_articles(articles[: source.limit], max_lengths={"content": 200})
 
-            article_url = link_tag.get("href", "")
-            if not article_url.startswith("http"):
-                article_url = "https://tuoitre.vn" + article_url
 
-            # 제목 찾기
-            title = link_tag.get_text(strip=True)
-            title = clean_text(title)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
+def scrape_nhandan(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
+    """
+    Nhân Dân(정부 기관지) 스크래핑 (Google News 사이트맵 우선, 실패 시 홈페이지 HTML)
 
-            # 날짜 찾기 (h2 주변 또는 부모 요소)
-            parent = h2_tag.parent
-            date_tag = (
-                parent.find("time")
-                if parent
-                else None or h2_tag.find_next_sibling("span", class_="date")
-                or h2_tag.find_next_sibling("div", class_="article-date")
-            )
-            article_date = date_tag.get_text(strip=True) if date_tag else ""
+    Args:
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
-            # 오늘 날짜가 포함되어 있는지 확인
-            if (
-                today_pattern in article_date or not article_date
-            ):  # 날짜가 없으면 최신 기사로 간주
-                # 본문 미리보기 요약
-                summary_tag = (
-                    parent.find("p", class_="sapo")
-                    if parent
-                    else None or h2_tag.find_next("p")
-                )
-                content = summary_tag.get_text(strip=True) if summary_tag else title
-                content = clean_text(content)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
+    Returns:
+        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+    """
+    source = source or default_source("nhandan")
+    url = source.url
+    logger.info("Nhân Dân 스크래핑 시작", extra={"url": url})
 
-                articles.append(
-                    {
-                        "title": title,
-                        "content": content[:200],  # 200자 제한
-                        "url": article_url,
-                        "date": article_date,
-                    }
-                )
+    articles = _scrape_news_sitemap(source, date_str)
+    if articles is not None:
+        return articles
 
-        logger.info(f"Tuổi Trẻ 스크래핑 완료: {len(articles)}개 기사 수집")
+    try:
+        with _fetch_stream(url, timeout=source.timeout, max_bytes=source.max_bytes) as body:
+            markup = body.text()
+
+        # 파싱·추출·정규화 (parse_pool 활성 시 별도 프로세스, 기사 딕셔너리만 반환)
+        articles = parse_pool.run(_extract_nhandan, markup, date_str, source)
+        logger.info(f"Nhân Dân 스크래핑 완료: {len(articles)}개 기사 수집")
         return articles
 
     except requests.RequestException as e:
-        logger.error(f"Tuổi Trẻ 스크래핑 실패", exc_info=True)
-        raise ScrapingError(f"Failed to scrape Tuổi Trẻ: {str(e)}")
+        logger.error(f"Nhân Dân 스크래핑 실패", exc_info=True)
+        raise ScrapingError(f"Failed to scrape Nhân Dân: {str(e)}")
 
 
-def scrape_vietnamnet(date_str: str) -> List[Dict[str, str]]:
+def scrape_suckhoedoisong(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
     """
-    VietnamNet(종합 뉴스) RSS 파싱
-    - 정치 (chinh-tri.rss)
-    - 법률 (phap-luat.rss)
-    - 시사 (thoi-su.rss)
+    Sức khỏe & Đời sống(보건부 관보) RSS 파싱 (건강 관련 이슈 당일 최대 5개)
 
     Args:
         date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
     Returns:
         기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
     """
-    logger.info("VietnamNet RSS 파싱 시작")
-
-    # RSS 피드 리스트
-    rss_feeds = [
-        ("정치", "https://vietnamnet.vn/rss/chinh-tri.rss"),
-        ("법률", "https://vietnamnet.vn/rss/phap-luat.rss"),
-        ("시사", "https://vietnamnet.vn/rss/thoi-su.rss"),
-    ]
-
-    articles = []
-    seen_urls = set()  # 중복 방지를 위한 URL 추적
-
-    # date_str 변환 (2026-02-11 → 11 Feb 2026)
-    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-    target_date_short = date_obj.strftime("%d %b %Y")  # "11 Feb 2026"
-
-    for category_name, rss_url in rss_feeds:
-        try:
-            # RSS 가져오기
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-            response = _fetch_url(rss_url, headers=headers)
-
-            # XML 파싱
-            root = ET.fromstring(response.text)
-
-            # channel 찾기
-            channel = None
-            for child in root:
-                if child.tag == "channel" or child.tag.endswith("channel"):
-                    channel = child
-                    break
-
-            if channel is None:
-                continue
-
-            # items 찾기
-            items = []
-            for child in channel:
-                if child.tag == "item" or child.tag.endswith("item"):
-                    items.append(child)
-
-            for item in items[:2]:  # 카테고리별 최대 2개
-                # pubDate 찾기
-                pub_date_elem = item.find(".//pubDate")
-                if pub_date_elem is not None and pub_date_elem.text:
-                    try:
-                        # pubDate 파싱: "Wed, 11 Feb 2026 18:38:41 +0700"
-                        pub_date_text = pub_date_elem.text.strip()
-
-                        # "11 Feb 2026" 추출 (정규 표현식)
-                        date_match = re.search(r"\d{2} \w{3} \d{4}", pub_date_text)
-                        pub_date_short = date_match.group(0) if date_match else ""
-
-                        # 필터링: 당일 기사만
-                        if pub_date_short != target_date_short:
-                            continue  # 당일 기사가 아니면 건너뜀
-                    except Exception as e:
-                        continue
-                else:
-                    continue
-
-                # entry_date 설정
-                entry_date = date_str
-
-                # title 찾기
-                title_elem = item.find(".//title")
-                title = title_elem.text if title_elem is not None else ""
-                title = clean_text(title)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
+    return scrape_rss_source(date_str, source or default_source("suckhoedoisong"))
 
-                # link 찾기
-                link_elem = item.find(".//link")
-                article_url = link_elem.text if link_elem is not None else ""
 
-                # description 찾기
-                desc_elem = item.find(".//description")
-                description = desc_elem.text if desc_elem is not None else ""
+def _extract_tuoitre(markup: str, date_str: str, source: SourceSpec) -> List[Dict[str, str]]:
+    """
+    Tuổi Trẻ 홈페이지 HTML에서 당일 기사 추출 (파싱 프로세스 풀에서 실행 가능)
 
-                # HTML 태그 제거
-                content = re.sub(r"<[^>]+>", "", description).strip()
-                content = content[:200]  # 200자 제한
-                content = clean_text(content)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
+    Args:
+        markup: 홈페이지 HTML 본문
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정
 
-                # 중복 체크 (URL 기반)
-                if article_url not in seen_urls:
-                    seen_urls.add(article_url)
-                    articles.append(
-                        {
-                            "title": title,
-                            "content": content,
-                            "url": article_url,
-                            "date": entry_date,
-                        }
-                    )
+    Returns:
+        정규화된 기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+    """
+    # h2 부모/형제 요소를 참조하므로 전체 파싱 (빠른 백엔드만 적용)
+    from today_vn_news.scraping.html_parser import parse_html
 
-            logger.debug(f"{category_name} RSS: 기사 수집 완료")
+    soup = parse_html(markup, source="Tuổi Trẻ")
+    articles = []
 
-        except Exception as e:
-            logger.warning(f"{category_name} RSS 파싱 실패: {str(e)}", extra={"url": rss_url})
+    # 오늘 날짜 형식
+    today_pattern = (
+        date_str.split("-")[2]
+        + "/"
+        + date_str.split("-")[1]
+        + "/"
+        + date_str.split("-")[0]
+    )
+
+    # 기사 리스트 찾기 (h2 태그 안에 링크가 있는 구조)
+    h2_tags = soup.find_all("h2")[: source.scan_limit]  # 후보 기사 체크 (기본 5개)
+
+    for h2_tag in h2_tags:
+        # 링크 찾기
+        link_tag = h2_tag.find("a")
+        if not link_tag:
+            continue
+
+        article_url = link_tag.get("href", "")
+        if not article_url.startswith("http"):
+            article_url = "https://tuoitre.vn" + article_url
+
+        # 제목 찾기
+        title = link_tag.get_text(strip=True)
+
+        # 날짜 찾기 (h2 주변 또는 부모 요소)
+        parent = h2_tag.parent
+        date_tag = (
+            parent.find("time")
+            if parent
+            else None or h2_tag.find_next_sibling("span", class_="date")
+            or h2_tag.find_next_sibling("div", class_="article-date")
+        )
+        article_date = date_tag.get_text(strip=True) if date_tag else ""
+
+        # 오늘 날짜가 포함되어 있는지 확인
+        if (
+            today_pattern in article_date or not article_date
+        ):  # 날짜가 없으면 최신 기사로 간주
+            # 본문 미리보기 요약
+            summary_tag = (
+                parent.find("p", class_="sapo")
+                if parent
+                else None or h2_tag.find_next("p")
+            )
+            content = summary_tag.get_text(strip=True) if summary_tag else title
+
+            articles.append(
+                {
+                    "title": title,
+                    "content": content,
+                    "url": article_url,
+                    "date": article_date,
+                }
+            )
 
-    logger.info(f"VietnamNet RSS 파싱 완료: 총 {len(articles)}개 기사 수집")
-    return articles[:2]  # 전체 2개 제한
+    # 일괄 정규화 (홑따옴표 + HTML 엔티티, 본문 200자 제한)
+    return normalize_articles(articles[: source.limit], max_lengths={"content": 200})
 
 
-def scrape_vnexpress(date_str: str) -> List[Dict[str, str]]:
+def scrape_tuoitre(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
     """
-    VnExpress(종합 뉴스) RSS 파싱
-    - 시사 (thoi-su.rss)
-    - 경제 (kinh-doanh.rss)
-    - 뉴스 (tin-moi-nhat.rss)
+    Tuổi Trẻ(호치민 로컬) 스크래핑 (Google News 사이트맵 우선, 실패 시 홈페이지 HTML)
 
     Args:
         date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
     Returns:
         기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
     """
-    logger.info("VnExpress RSS 파싱 시작")
+    source = source or default_source("tuoitre")
+    url = source.url
+    logger.info("Tuổi Trẻ 스크래핑 시작", extra={"url": url})
 
-    # RSS 피드 리스트 (ContextFile.md 4.6 기준)
-    rss_feeds = [
-        ("경제", "https://vnexpress.net/rss/kinh-doanh.rss"),
-        ("호치민시보", "https://vnexpress.net/rss/thoi-su.rss"),
-        ("자동차", "https://vnexpress.net/rss/oto-xe-may.rss"),
-        ("부동산", "https://vnexpress.net/rss/bat-dong-san.rss"),
-    ]
+    articles = _scrape_news_sitemap(source, date_str)
+    if articles is not None:
+        return articles
 
-    articles = []
-    seen_urls = set()  # 중복 방지를 위한 URL 추적
+    try:
+        with _fetch_stream(url, timeout=source.timeout, max_bytes=source.max_bytes) as body:
+            markup = body.text()
 
-    # date_str 변환 (2026-02-11 → 11 Feb 2026)
-    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-    target_date_short = date_obj.strftime("%d %b %Y")  # "11 Feb 2026"
+        # 파싱·추출·정규화 (parse_pool 활성 시 별도 프로세스, 기사 딕셔너리만 반환)
+        articles = parse_pool.run(_extract_tuoitre, markup, date_str, source)
+        logger.info(f"Tuổi Trẻ 스크래핑 완료: {len(articles)}개 기사 수집")
+        return articles
 
-    for category_name, rss_url in rss_feeds:
-        try:
-            # RSS 가져오기
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-            response = _fetch_url(rss_url, headers=headers)
-
-            # XML 파싱
-            root = ET.fromstring(response.text)
-
-            # channel 찾기
-            channel = None
-            for child in root:
-                if child.tag == "channel" or child.tag.endswith("channel"):
-                    channel = child
-                    break
-
-            if channel is None:
-                continue
-
-            # items 찾기
-            items = []
-            for child in channel:
-                if child.tag == "item" or child.tag.endswith("item"):
-                    items.append(child)
-
-            for item in items[:2]:  # 카테고리별 최대 2개
-                # pubDate 찾기
-                pub_date_elem = item.find(".//pubDate")
-                if pub_date_elem is not None and pub_date_elem.text:
-                    try:
-                        # pubDate 파싱: "Wed, 11 Feb 2026 18:38:41 +0700"
-                        pub_date_text = pub_date_elem.text.strip()
-
-                        # "11 Feb 2026" 추출
-                        date_match = re.search(r"\d{2} \w{3} \d{4}", pub_date_text)
-                        pub_date_short = date_match.group(0) if date_match else ""
-
-                        # 필터링: 당일 기사만
-                        if pub_date_short != target_date_short:
-                            continue
-                    except Exception as e:
-                        continue
-                else:
-                    continue
+    except requests.RequestException as e:
+        logger.error(f"Tuổi Trẻ 스크래핑 실패", exc_info=True)
+        raise ScrapingError(f"Failed to scrape Tuổi Trẻ: {str(e)}")
 
-                # title 찾기
-                title_elem = item.find(".//title")
-                title = title_elem.text if title_elem is not None else ""
-                title = clean_text(title)
 
-                # link 찾기
-                link_elem = item.find(".//link")
-                article_url = link_elem.text if link_elem is not None else ""
+def scrape_vietnamnet(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
+    """
+    VietnamNet(종합 뉴스) RSS 파싱
+    - 정치 (chinh-tri.rss)
+    - 법률 (phap-luat.rss)
+    - 시사 (thoi-su.rss)
 
-                # description 찾기
-                desc_elem = item.find(".//description")
-                description = desc_elem.text if desc_elem is not None else ""
+    Args:
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
-                # HTML 태그 제거
-                content = re.sub(r"<[^>]+>", "", description).strip()
-                content = content[:200]
-                content = clean_text(content)
+    Returns:
+        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+    """
+    return scrape_rss_source(date_str, source or default_source("vietnamnet"))
 
-                # 중복 체크 (URL 기반)
-                if article_url not in seen_urls:
-                    seen_urls.add(article_url)
-                    articles.append(
-                        {
-                            "title": title,
-                            "content": content,
-                            "url": article_url,
-                            "date": date_str,
-                        }
-                    )
 
-            logger.debug(f"{category_name} RSS: 기사 수집 완료")
+def scrape_vnexpress(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
+    """
+    VnExpress(종합 뉴스) RSS 파싱 (ContextFile.md 4.6 기준)
+    - 경제 (kinh-doanh.rss)
+    - 시사 (thoi-su.rss)
+    - 자동차 (oto-xe-may.rss)
+    - 부동산 (bat-dong-san.rss)
 
-        except Exception as e:
-            logger.warning(f"{category_name} RSS 파싱 실패: {str(e)}", extra={"url": rss_url})
+    Args:
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
-    logger.info(f"VnExpress RSS 파싱 완료: 총 {len(articles)}개 기사 수집")
-    return articles[:2]  # 전체 2개 제한
+    Returns:
+        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+    """
+    return scrape_rss_source(date_str, source or default_source("vnexpress"))
 
 
-def scrape_weather_hochiminh() -> Dict[str, str]:
+def scrape_weather_hochiminh(
+    date_str: Optional[str] = None, source: Optional[SourceSpec] = None
+) -> Dict[str, str]:
     """
     NCHMF 기상 스크래핑 (호치민 지역)
 
+    Args:
+        date_str: 기준일 (레지스트리 호출 규약용, 현재 관측값만 제공하므로 미사용)
+        source: 소스 설정 (None이면 기본 설정)
+
     Returns:
         기상 정보 딕셔너리 {'temp': str, 'humidity': str, 'condition': str}
     """
-    logger.info("NCHMF 기상 정보 수집 시작", extra={"url": "https://nchmf.gov.vn/kttvsiteE/vi-VN/1/vung-tau-tp-ho-chi-minh-w31.html"})
+    source = source or default_source("weather")
+    logger.info("NCHMF 기상 정보 수집 시작", extra={"url": source.url})
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-
         # NCHMF 호치민 날씨 페이지
-        url = "https://nchmf.gov.vn/kttvsiteE/vi-VN/1/vung-tau-tp-ho-chi-minh-w31.html"
-        response = _fetch_url(url, headers=headers)
-        soup = BeautifulSoup(response.text, "html.parser")
+        with _fetch_stream(source.url, timeout=source.timeout, max_bytes=source.max_bytes) as body:
+            from today_vn_news.scraping.html_parser import parse_html
+
+            soup = parse_html(body.text(), parse_only=_html_strainers()["NCHMF_STRAINER"], source="NCHMF")
 
         # 기상 데이터 추출 (explore agent 분석 기반 CSS 선택자 사용)
         temp = ""
@@ -674,58 +846,204 @@ def scrape_weather_hochiminh() -> Dict[str, str]:
             temp = temp.lstrip(":").strip()
             logger.debug(f"온도: {temp}")
 
-        # 날씨 상태 찾기 (.text-weather-location .list-info-wt li:nth-child(2) .uk-width-3-4)
-        condition_element = soup.select_one(
-            ".text-weather-location .list-info-wt li:nth-child(2) .uk-width-3-4"
-        )
-        if condition_element:
-            condition = condition_element.get_text(strip=True)
-            # 불필요한 콜론 제거
-            condition = condition.lstrip(":").strip()
-            logger.debug(f"상태: {condition}")
+        # 날씨 상태 찾기 (.text-weather-location .list-info-wt li:nth-child(2) .uk-width-3-4)
+        condition_element = soup.select_one(
+            ".text-weather-location .list-info-wt li:nth-child(2) .uk-width-3-4"
+        )
+        if condition_element:
+            condition = condition_element.get_text(strip=True)
+            # 불필요한 콜론 제거
+            condition = condition.lstrip(":").strip()
+            logger.debug(f"상태: {condition}")
+
+        # 습도 찾기 (.text-weather-location .list-info-wt li:nth-child(3) .uk-width-3-4)
+        humidity_element = soup.select_one(
+            ".text-weather-location .list-info-wt li:nth-child(3) .uk-width-3-4"
+        )
+        if humidity_element:
+            humidity = humidity_element.get_text(strip=True)
+            # 불필요한 콜론 제거
+            humidity = humidity.lstrip(":").strip()
+            logger.debug(f"습도: {humidity}")
+
+        logger.debug(f"수집된 데이터: temp={temp}, humidity={humidity}, condition={condition}")
+        logger.info("NCHMF 기상 정보 수집 완료")
+        return {"temp": temp, "humidity": humidity, "condition": condition}
+
+    except requests.RequestException as e:
+        logger.error(f"NCHMF 기상 정보 스크래핑 실패", exc_info=True)
+        return {"temp": "", "humidity": "", "condition": ""}
+
+
+# US AQI 등급 (상한 포함 구간 경계 → 상태)
+AQI_BREAKPOINTS = (50, 100, 150, 200, 300)
+AQI_STATUSES = (
+    "Good",
+    "Moderate",
+    "Unhealthy for Sensitive Groups",
+    "Unhealthy",
+    "Very Unhealthy",
+    "Hazardous",
+)
+
+# WMO 날씨 코드 → 상태 (Open-Meteo weather_code)
+WMO_CONDITIONS = {
+    0: "맑음",
+    1: "대체로 맑음",
+    2: "구름 조금",
+    3: "흐림",
+    45: "안개",
+    48: "안개",
+    51: "이슬비",
+    53: "이슬비",
+    55: "이슬비",
+    61: "비",
+    63: "비",
+    65: "강한 비",
+    80: "소나기",
+    81: "소나기",
+    82: "강한 소나기",
+    95: "뇌우",
+    96: "뇌우(우박)",
+    99: "뇌우(우박)",
+}
+
+
+def classify_aqi(values) -> List[str]:
+    """
+    US AQI 상태 분류 (배열 단위)
+
+    Args:
+        values: AQI 값 배열 (None/NaN은 빈 상태)
+
+    Returns:
+        상태 문자열 리스트 (입력 순서)
+    """
+    import numpy as np
+
+    aqi = np.array([np.nan if v is None else v for v in values], dtype=float)
+    statuses = np.array(AQI_STATUSES)[np.searchsorted(AQI_BREAKPOINTS, np.nan_to_num(aqi), side="left")]
+    return np.where(np.isnan(aqi), "", statuses).tolist()
+
+
+def _open_meteo_current(url: str, locations: List[Dict], current: str, timeout: int) -> List[Dict]:
+    """
+    여러 좌표의 Open-Meteo current 값을 한 번의 요청으로 조회
+
+    Args:
+        url: Open-Meteo API URL (forecast 또는 air-quality)
+        locations: [{'name', 'latitude', 'longitude'}] 리스트
+        current: current 변수 목록 (쉼표 구분)
+        timeout: 타임아웃 (초)
+
+    Returns:
+        좌표 순서대로 current 딕셔너리 리스트
+    """
+    params = {
+        "latitude": ",".join(str(loc["latitude"]) for loc in locations),
+        "longitude": ",".join(str(loc["longitude"]) for loc in locations),
+        "current": current,
+        "timezone": "auto",
+    }
+    data = _fetch_url_with_params(url, params=params, timeout=timeout).json()
+    # 좌표가 하나면 객체, 여러 개면 좌표 순서의 배열로 응답
+    if isinstance(data, dict):
+        data = [data]
+    if len(data) != len(locations):
+        raise ScrapingError(f"Open-Meteo 응답 좌표 수 불일치: {len(data)}/{len(locations)}")
+    return [entry.get("current", {}) for entry in data]
+
+
+def _format_number(value, digits: int = 1) -> str:
+    return "" if value is None else f"{value:.{digits}f}"
+
+
+def scrape_city_panel(
+    date_str: Optional[str] = None, source: Optional[SourceSpec] = None
+) -> List[Dict[str, str]]:
+    """
+    도시별 기상·공기질 패널 (Open-Meteo 다중 좌표 요청)
+
+    params.locations의 모든 도시를 기상 1회 + 공기질 1회 요청으로 조회하므로
+    도시를 추가해도 요청 수는 늘지 않습니다. 한쪽 요청이 실패하면 나머지
+    값만으로 도시 항목을 만듭니다.
 
-        # 습도 찾기 (.text-weather-location .list-info-wt li:nth-child(3) .uk-width-3-4)
-        humidity_element = soup.select_one(
-            ".text-weather-location .list-info-wt li:nth-child(3) .uk-width-3-4"
-        )
-        if humidity_element:
-            humidity = humidity_element.get_text(strip=True)
-            # 불필요한 콜론 제거
-            humidity = humidity.lstrip(":").strip()
-            logger.debug(f"습도: {humidity}")
+    Args:
+        date_str: 기준일 (레지스트리 호출 규약용, 현재 관측값만 제공하므로 미사용)
+        source: 소스 설정 (urls: weather/air_quality, params.locations, None이면 기본 설정)
 
-        logger.debug(f"수집된 데이터: temp={temp}, humidity={humidity}, condition={condition}")
-        logger.info("NCHMF 기상 정보 수집 완료")
-        return {"temp": temp, "humidity": humidity, "condition": condition}
+    Returns:
+        도시 리스트 [{'city', 'temp', 'humidity', 'condition', 'aqi', 'status', 'pm25', 'pm10'}]
 
-    except requests.RequestException as e:
-        logger.error(f"NCHMF 기상 정보 스크래핑 실패", exc_info=True)
-        return {"temp": "", "humidity": "", "condition": ""}
+    Raises:
+        ScrapingError: 도시 설정이 없거나 두 요청이 모두 실패한 경우
+    """
+    source = source or default_source("cities")
+    urls = dict(source.urls)
+    locations = source.params.get("locations") or []
+    if not locations:
+        raise ScrapingError(f"{source.name}: params.locations 설정 필요")
+    logger.info(f"도시별 기상·공기질 수집 시작: {', '.join(loc['name'] for loc in locations)}")
+
+    empty = [{}] * len(locations)
+    weather, air, errors = empty, empty, []
+    try:
+        weather = _open_meteo_current(
+            urls["weather"], locations, "temperature_2m,relative_humidity_2m,weather_code", source.timeout
+        )
+    except (requests.RequestException, ValueError, ScrapingError) as e:
+        logger.warning(f"도시별 기상 요청 실패: {e}")
+        errors.append(e)
+    try:
+        air = _open_meteo_current(urls["air_quality"], locations, "us_aqi,pm2_5,pm10", source.timeout)
+    except (requests.RequestException, ValueError, ScrapingError) as e:
+        logger.warning(f"도시별 공기질 요청 실패: {e}")
+        errors.append(e)
+    if len(errors) == 2:
+        raise ScrapingError(f"Failed to fetch city panel: {errors[-1]}")
+
+    statuses = classify_aqi([entry.get("us_aqi") for entry in air])
+    cities = []
+    for loc, current, quality, status in zip(locations, weather, air, statuses):
+        temp = _format_number(current.get("temperature_2m"), 0)
+        humidity = _format_number(current.get("relative_humidity_2m"), 0)
+        cities.append(
+            {
+                "city": loc["name"],
+                "temp": f"{temp}°C" if temp else "",
+                "humidity": f"{humidity}%" if humidity else "",
+                "condition": WMO_CONDITIONS.get(current.get("weather_code"), ""),
+                "aqi": _format_number(quality.get("us_aqi"), 0),
+                "status": status,
+                "pm25": _format_number(quality.get("pm2_5")),
+                "pm10": _format_number(quality.get("pm10")),
+            }
+        )
+    logger.info(f"도시별 기상·공기질 수집 완료: {len(cities)}개 도시 (요청 {2 - len(errors)}회)")
+    return cities
 
 
-def scrape_air_quality() -> Dict[str, str]:
+def scrape_air_quality(
+    date_str: Optional[str] = None, source: Optional[SourceSpec] = None
+) -> Dict[str, str]:
     """
     Open-Meteo Air Quality API (AQI, PM2.5, PM10)
 
+    Args:
+        date_str: 기준일 (레지스트리 호출 규약용, 현재 관측값만 제공하므로 미사용)
+        source: 소스 설정 (params에 좌표/측정 항목, None이면 기본 설정)
+
     Returns:
         공기질 정보 딕셔너리 {'aqi': str, 'status': str, 'pm25': str, 'pm10': str}
     """
+    source = source or default_source("air_quality")
     logger.info("Open-Meteo 공기질 정보 수집 시작")
 
     try:
-        # 호치민 시 좌표 (Quan Mot 관측소)
-        lat, lon = 10.78069, 106.69944
-
-        # Open-Meteo Air Quality API
-        openmeteo_url = "https://air-quality-api.open-meteo.com/v1/air-quality"
-        openmeteo_params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current": "us_aqi,pm2_5,pm10",
-            "timezone": "auto"
-        }
-
-        openmeteo_response = _fetch_url_with_params(openmeteo_url, params=openmeteo_params)
+        # Open-Meteo Air Quality API (기본 좌표: 호치민 Quan Mot 관측소)
+        openmeteo_response = _fetch_url_with_params(
+            source.url, params=source.params, timeout=source.timeout
+        )
         openmeteo_data = openmeteo_response.json()
 
         current = openmeteo_data.get("current", {})
@@ -734,23 +1052,8 @@ def scrape_air_quality() -> Dict[str, str]:
         pm10 = current.get("pm10")
 
         # AQI 상태 계산
-        if us_aqi is not None:
-            aqi = str(us_aqi)
-            if us_aqi <= 50:
-                status = "Good"
-            elif us_aqi <= 100:
-                status = "Moderate"
-            elif us_aqi <= 150:
-                status = "Unhealthy for Sensitive Groups"
-            elif us_aqi <= 200:
-                status = "Unhealthy"
-            elif us_aqi <= 300:
-                status = "Very Unhealthy"
-            else:
-                status = "Hazardous"
-        else:
-            aqi = ""
-            status = ""
+        aqi = "" if us_aqi is None else str(us_aqi)
+        status = classify_aqi([us_aqi])[0]
 
         # PM2.5, PM10 포맷팅
         if pm25 is not None:
@@ -771,231 +1074,140 @@ def scrape_air_quality() -> Dict[str, str]:
         return {"aqi": "", "status": "", "pm25": "", "pm10": ""}
 
 
-def scrape_thanhnien_rss(date_str: str) -> List[Dict[str, str]]:
+def scrape_thanhnien_rss(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
     """
-    Thanh Niên 카테고리별 RSS 파싱 (시사, 경제, 생활)
+    Thanh Niên 카테고리별 RSS 파싱 (ContextFile.md 4.7 기준)
     - 시사 (/rss/thoi-su.rss)
-    - 경제 (/rss/kinh-te.rss)
     - 생활 (/rss/doi-song.rss)
 
     Args:
         date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
     Returns:
         기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
     """
-    logger.info("Thanh Niên RSS 파싱 시작")
-
-    # RSS 피드 리스트 (ContextFile.md 4.7 기준)
-    rss_feeds = [
-        ("민생/시사", "https://thanhnien.vn/rss/thoi-su.rss"),
-        ("생활", "https://thanhnien.vn/rss/doi-song.rss"),
-    ]
-
-    articles = []
-    seen_urls = set()  # 중복 방지를 위한 URL 추적
-
-    # date_str 변환 (2026-02-10 → 10 Feb 26)
-    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-    target_date_short = date_obj.strftime("%d %b %y")  # "10 Feb 26"
-
-    for category_name, rss_url in rss_feeds:
-        try:
-            # RSS 가져오기
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-            response = _fetch_url(rss_url, headers=headers)
-
-            # XML 파싱
-            root = ET.fromstring(response.text)
-
-            # RSS 네임스페이스
-            # ElementTree는 기본적으로 네임스페이스를 처리하지 않음
-            # 네임스페이스 접두사를 빈 문자열로 처리
-
-            # channel 찾기 (전체 네임스페이스에서 검색)
-            channel = None
-            for child in root:
-                if child.tag == "channel" or child.tag.endswith("channel"):
-                    channel = child
-                    break
-
-            if channel is None:
-                continue
-
-            # items 찾기
-            items = []
-            for child in channel:
-                if child.tag == "item" or child.tag.endswith("item"):
-                    items.append(child)
-
-            for item in items[:2]:  # 카테고리별 최대 2개
-                # pubDate 찾기
-                pub_date_elem = item.find(".//pubDate")
-                if pub_date_elem is not None and pub_date_elem.text:
-                    try:
-                        # pubDate 파싱: "Tue, 10 Feb26 15:05:00 +0700"
-                        pub_date_text = pub_date_elem.text.strip()
-
-                        # "10 Feb 26" 추출 (정규 표현식)
-                        date_match = re.search(r"\d{2} \w{3} \d{2}", pub_date_text)
-                        pub_date_short = date_match.group(0) if date_match else ""
-
-                        # 필터링: 당일 기사만
-                        if pub_date_short != target_date_short:
-                            continue  # 당일 기사가 아니면 건너뜀기
-                    except Exception as e:
-                        continue
-                else:
-                    continue
+    return scrape_rss_source(date_str, source or default_source("thanhnien"))
 
-                # entry_date 설정 (원본 형식 유지)
-                entry_date = date_str
 
-                # title 찾기
-                title_elem = item.find(".//title")
-                title = title_elem.text if title_elem is not None else ""
-                title = clean_text(title)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
-
-                # link 찾기
-                link_elem = item.find(".//link")
-                article_url = link_elem.text if link_elem is not None else ""
+def _extract_thanhnien(markup: str, date_str: str, source: SourceSpec) -> List[Dict[str, str]]:
+    """
+    Thanh Niên 홈페이지 HTML에서 우선 카테고리 당일 기사 추출 (파싱 프로세스 풀에서 실행 가능)
 
-                # description 찾기
-                desc_elem = item.find(".//description")
-                description = desc_elem.text if desc_elem is not None else ""
+    Args:
+        markup: 홈페이지 HTML 본문
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정
 
-                # HTML 태그 제거
-                content = re.sub(r"<[^>]+>", "", description).strip()
-                content = content[:200]  # 200자 제한
-                content = clean_text(content)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
+    Returns:
+        정규화된 기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+    """
+    from today_vn_news.scraping.html_parser import parse_first_match
 
-                # 중복 체크 (URL 기반)
-                if article_url not in seen_urls:
-                    seen_urls.add(article_url)
-                    articles.append(
-                        {
-                            "title": title,
-                            "content": content,
-                            "url": article_url,
-                            "date": entry_date,
-                        }
-                    )
+    soup = parse_first_match(markup, _html_strainers()["THANHNIEN_STRAINERS"], source="Thanh Niên")
+    articles = []
 
-            logger.debug(f"{category_name} RSS: {len([a for a in articles if a['url'] in seen_urls])}개 기사")
+    # 오늘 날짜 형식
+    today_pattern = (
+        date_str.split("-")[2]
+        + "/"
+        + date_str.split("-")[1]
+        + "/"
+        + date_str.split("-")[0]
+    )
+
+    # 카테고리 필터링 설정 (우선 카테고리: 시사, 경제/비즈니스)
+    priority_categories = source.selectors.get("categories", [])
+
+    # 기사 리스트 찾기
+    article_elements = (
+        soup.find_all("article") or soup.select(".news-item, .article-item, .story")
+        if soup is not None
+        else []
+    )
+
+    for article in article_elements[: source.scan_limit]:  # 후보 체크 후 필터링 (기본 10개)
+        # 링크 찾기
+        link_tag = article.find("a")
+        if not link_tag:
+            continue
+
+        article_url = link_tag.get("href", "")
+        if not article_url.startswith("http"):
+            article_url = "https://thanhnien.vn" + article_url
+
+        # 카테고리 필터링
+        # 우선 카테고리가 포함된 경우만 수집
+        in_priority = any(cat in article_url for cat in priority_categories)
+
+        if not in_priority:
+            # 우선 카테고리가 아니면 스킵 (우선 카테고리 우선)
+            continue
+
+        # 제목 찾기
+        title_tag = article.find(["h2", "h3", "h4"])
+        title = title_tag.get_text(strip=True) if title_tag else ""
+        # 자극적인 문장 부호 제거 (TTS 최적화)
+        title = re.sub(r"!{2,}", "!", title).replace("??", "?")
+
+        # 날짜 찾기
+        date_tag = (
+            article.find("time")
+            or article.find("span", class_="date")
+            or article.find("div", class_="article-date")
+        )
+        article_date = date_tag.get_text(strip=True) if date_tag else ""
+
+        # 오늘 날짜가 포함되어 있는지 확인
+        if (
+            today_pattern in article_date or not article_date
+        ):  # 날짜가 없으면 최신 기사로 간주
+            # 본문 미리보기 요약
+            summary_tag = article.find("p", class_="sapo") or article.find(
+                "div", class_="summary"
+            )
+            content = summary_tag.get_text(strip=True) if summary_tag else title
+            # 자극적인 문장 부호 제거 (TTS 최적화)
+            content = re.sub(r"!{2,}", "!", content).replace("??", "?")
+
+            articles.append(
+                {
+                    "title": title,
+                    "content": content,
+                    "url": article_url,
+                    "date": article_date,
+                }
+            )
 
-        except Exception as e:
-            logger.warning(f"{category_name} RSS 파싱 실패: {str(e)}", extra={"url": rss_url})
+            if source.limit is not None and len(articles) >= source.limit:  # 최대 기사 수 (기본 2개)
+                break
 
-    logger.info(f"Thanh Niên RSS 파싱 완료: 총 {len(articles)}개 기사 수집")
-    return articles
+    # 일괄 정규화 (홑따옴표 + HTML 엔티티, 본문 200자 제한)
+    return normalize_articles(articles, max_lengths={"content": 200})
 
 
-def scrape_thanhnien(date_str: str) -> List[Dict[str, str]]:
+def scrape_thanhnien(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
     """
     Thanh Niên(사회/청년) 스크래핑 (RSS 파싱 실패 시 폴백)
     - 시사, 뉴스, 경제, 비즈니스 카테고리 우선 필터링
 
     Args:
         date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
     Returns:
         기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
     """
-    logger.info("Thanh Niên 스크래핑 시작", extra={"url": "https://thanhnien.vn/"})
-
-    url = "https://thanhnien.vn/"
-    articles = []
+    source = source or default_source("thanhnien_html")
+    url = source.url
+    logger.info("Thanh Niên 스크래핑 시작", extra={"url": url})
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = _fetch_url(url, headers=headers)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # 오늘 날짜 형식
-        today_pattern = (
-            date_str.split("-")[2]
-            + "/"
-            + date_str.split("-")[1]
-            + "/"
-            + date_str.split("-")[0]
-        )
-
-        # 카테고리 필터링 설정
-        # 우선 카테고리 (포함)
-        priority_categories = [
-            "/thoi-su/",  # 시사
-            "/kinh-te/",  # 경제/비즈니스
-        ]
-
-        # 기사 리스트 찾기
-        article_elements = soup.find_all("article") or soup.select(
-            ".news-item, .article-item, .story"
-        )
-
-        for article in article_elements[:10]:  # 최대 10개 체크 후 필터링
-            # 링크 찾기
-            link_tag = article.find("a")
-            if not link_tag:
-                continue
-
-            article_url = link_tag.get("href", "")
-            if not article_url.startswith("http"):
-                article_url = "https://thanhnien.vn" + article_url
-
-            # 카테고리 필터링
-            # 우선 카테고리가 포함된 경우만 수집
-            in_priority = any(cat in article_url for cat in priority_categories)
-
-            if not in_priority:
-                # 우선 카테고리가 아니면 스킵 (우선 카테고리 우선)
-                continue
-
-            # 제목 찾기
-            title_tag = article.find(["h2", "h3", "h4"])
-            title = title_tag.get_text(strip=True) if title_tag else ""
-            # 텍스트 정제 (홑따옴표 제거 + HTML 엔티티 변환)
-            title = clean_text(title)
-            # 자극적인 문장 부호 제거 (TTS 최적화)
-            title = re.sub(r"!{2,}", "!", title).replace("??", "?")
-
-            # 날짜 찾기
-            date_tag = (
-                article.find("time")
-                or article.find("span", class_="date")
-                or article.find("div", class_="article-date")
-            )
-            article_date = date_tag.get_text(strip=True) if date_tag else ""
-
-            # 오늘 날짜가 포함되어 있는지 확인
-            if (
-                today_pattern in article_date or not article_date
-            ):  # 날짜가 없으면 최신 기사로 간주
-                # 본문 미리보기 요약
-                summary_tag = article.find("p", class_="sapo") or article.find(
-                    "div", class_="summary"
-                )
-                content = summary_tag.get_text(strip=True) if summary_tag else title
-                # 텍스트 정제 (홑따옴표 제거 + HTML 엔티티 변환)
-                content = clean_text(content)
-                # 자극적인 문장 부호 제거 (TTS 최적화)
-                content = re.sub(r"!{2,}", "!", content).replace("??", "?")
-
-                articles.append(
-                    {
-                        "title": title,
-                        "content": content[:200],  # 200자 제한
-                        "url": article_url,
-                        "date": article_date,
-                    }
-                )
-
-                if len(articles) >= 2:  # 최대 2개 제한
-                    break
+        with _fetch_stream(url, timeout=source.timeout, max_bytes=source.max_bytes) as body:
+            markup = body.text()
 
+        # 파싱·추출·정규화 (parse_pool 활성 시 별도 프로세스, 기사 딕셔너리만 반환)
+        articles = parse_pool.run(_extract_thanhnien, markup, date_str, source)
         logger.info(f"Thanh Niên 스크래핑 완료: {len(articles)}개 기사 수집")
         return articles
 
@@ -1004,329 +1216,226 @@ def scrape_thanhnien(date_str: str) -> List[Dict[str, str]]:
         raise ScrapingError(f"Failed to scrape Thanh Niên: {str(e)}")
 
 
-def scrape_vietnamnet_ttt(date_str: str) -> List[Dict[str, str]]:
+def scrape_vietnamnet_ttt(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
     """
     VietnamNet 정보통신(Thông tin và Truyền thông) RSS 파싱
 
     Args:
         date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
     Returns:
         기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
     """
-    logger.info("VietnamNet 정보통신 RSS 파싱 시작", extra={"url": "https://vietnamnet.vn/rss/thong-tin-truyen-thong.rss"})
-
-    rss_url = "https://vietnamnet.vn/rss/thong-tin-truyen-thong.rss"
-    articles = []
-
-    try:
-        # date_str 변환 (2026-02-11 → 11 Feb 2026)
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        target_date_short = date_obj.strftime("%d %b %Y")  # "11 Feb 2026"
+    return scrape_rss_source(date_str, source or default_source("vietnamnet_ttt"))
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = _fetch_url(rss_url, headers=headers)
-
-        # XML 파싱
-        root = ET.fromstring(response.text)
-
-        # channel 찾기
-        channel = None
-        for child in root:
-            if child.tag == "channel" or child.tag.endswith("channel"):
-                channel = child
-                break
-
-        if channel is not None:
-            # items 찾기
-            items = []
-            for child in channel:
-                if child.tag == "item" or child.tag.endswith("item"):
-                    items.append(child)
-
-            for item in items[:2]:  # 최대 2개
-                # pubDate 찾기
-                pub_date_elem = item.find(".//pubDate")
-                if pub_date_elem is not None and pub_date_elem.text:
-                    try:
-                        # pubDate 파싱: "Wed, 11 Feb 2026 18:38:41 +0700"
-                        pub_date_text = pub_date_elem.text.strip()
-
-                        # "11 Feb 2026" 추출
-                        date_match = re.search(r"\d{2} \w{3} \d{4}", pub_date_text)
-                        pub_date_short = date_match.group(0) if date_match else ""
-
-                        # 필터링: 당일 기사만
-                        if pub_date_short != target_date_short:
-                            continue
-                    except Exception:
-                        continue
-                else:
-                    continue
-
-                # title 찾기
-                title_elem = item.find(".//title")
-                title = title_elem.text if title_elem is not None else ""
-                title = clean_text(title)
-
-                # link 찾기
-                link_elem = item.find(".//link")
-                article_url = link_elem.text if link_elem is not None else ""
 
-                # description 찾기
-                desc_elem = item.find(".//description")
-                description = desc_elem.text if desc_elem is not None else ""
-
-                # HTML 태그 제거
-                content = re.sub(r"<[^>]+>", "", description).strip()
-                content = content[:200]
-                content = clean_text(content)
-
-                articles.append(
-                    {
-                        "title": title,
-                        "content": content,
-                        "url": article_url,
-                        "date": date_str,
-                    }
-                )
+def scrape_vnexpress_tech(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
+    """
+    VnExpress IT/과학(Khoa học công nghệ) RSS 파싱
 
-        logger.info(f"VietnamNet 정보통신 RSS 파싱 완료: {len(articles)}개 기사 수집")
-        return articles
+    Args:
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
-    except requests.RequestException as e:
-        logger.error(f"VietnamNet 정보통신 RSS 파싱 실패", exc_info=True)
-        raise ScrapingError(f"Failed to parse VietnamNet 정보통신 RSS: {str(e)}")
+    Returns:
+        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+    """
+    return scrape_rss_source(date_str, source or default_source("vnexpress_tech"))
 
 
-def scrape_vnexpress_tech(date_str: str) -> List[Dict[str, str]]:
+def _extract_saigontimes(markup: str, date_str: str, source: SourceSpec) -> List[Dict[str, str]]:
     """
-    VnExpress IT/과학(Khoa học công nghệ) RSS 파싱
+    The Saigon Times 홈페이지 HTML에서 우선 카테고리 당일 기사 추출 (파싱 프로세스 풀에서 실행 가능)
 
     Args:
+        markup: 홈페이지 HTML 본문
         date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정
 
     Returns:
-        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+        정규화된 기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
     """
-    logger.info("VnExpress IT/과학 RSS 파싱 시작", extra={"url": "https://vnexpress.net/rss/khoa-hoc-cong-nghe.rss"})
+    from today_vn_news.scraping.html_parser import parse_first_match
 
-    rss_url = "https://vnexpress.net/rss/khoa-hoc-cong-nghe.rss"
+    soup = parse_first_match(markup, _html_strainers()["SAIGONTIMES_STRAINERS"], source="The Saigon Times")
     articles = []
 
-    try:
-        # date_str 변환 (2026-02-11 → 11 Feb 2026)
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        target_date_short = date_obj.strftime("%d %b %Y")  # "11 Feb 2026"
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = _fetch_url(rss_url, headers=headers)
+    # 카테고리 필터링 (기획/경제/재무/부동산만 수집)
+    priority_categories = source.selectors.get("categories", [])
+
+    # 오늘 날짜 형식
+    today_pattern = (
+        date_str.split("-")[2]
+        + "/"
+        + date_str.split("-")[1]
+        + "/"
+        + date_str.split("-")[0]
+    )
+
+    # 기사 리스트 찾기
+    article_elements = (
+        soup.find_all("article") or soup.select(".news-item, .article-item, .story-item")
+        if soup is not None
+        else []
+    )
+
+    for article in article_elements[: source.scan_limit]:  # 후보 기사 체크 (기본 5개)
+        # 링크 찾기
+        link_tag = article.find("a")
+        if not link_tag:
+            continue
+
+        article_url = link_tag.get("href", "")
+        if not article_url.startswith("http"):
+            article_url = "https://thesaigontimes.vn" + article_url
+
+        in_priority = any(cat in article_url for cat in priority_categories)
+
+        if not in_priority:
+            continue
+
+        # 제목 찾기
+        title_tag = article.find(["h2", "h3", "h4"])
+        title = title_tag.get_text(strip=True) if title_tag else ""
+
+        # 날짜 찾기
+        date_tag = (
+            article.find("time")
+            or article.find("span", class_="date")
+            or article.find("div", class_="article-date")
+        )
+        article_date = date_tag.get_text(strip=True) if date_tag else ""
+
+        # 오늘 날짜가 포함되어 있는지 확인
+        if (
+            today_pattern in article_date or not article_date
+        ):  # 날짜가 없으면 최신 기사로 간주
+            # 본문 미리보기 요약
+            summary_tag = article.find("p", class_="sapo") or article.find(
+                "div", class_="summary"
+            )
+            content = summary_tag.get_text(strip=True) if summary_tag else title
+
+            articles.append(
+                {
+                    "title": title,
+                    "content": content,
+                    "url": article_url,
+                    "date": article_date,
+                }
+            )
 
-        # XML 파싱
-        root = ET.fromstring(response.text)
+    # 일괄 정규화 (홑따옴표 + HTML 엔티티, 본문 200자 제한)
+    return normalize_articles(articles[: source.limit], max_lengths={"content": 200})
 
-        # channel 찾기
-        channel = None
-        for child in root:
-            if child.tag == "channel" or child.tag.endswith("channel"):
-                channel = child
-                break
 
-        if channel is not None:
-            # items 찾기
-            items = []
-            for child in channel:
-                if child.tag == "item" or child.tag.endswith("item"):
-                    items.append(child)
-
-            for item in items[:2]:  # 최대 2개
-                # pubDate 찾기
-                pub_date_elem = item.find(".//pubDate")
-                if pub_date_elem is not None and pub_date_elem.text:
-                    try:
-                        # pubDate 파싱: "Wed, 11 Feb 2026 18:38:41 +0700"
-                        pub_date_text = pub_date_elem.text.strip()
-
-                        # "11 Feb 2026" 추출
-                        date_match = re.search(r"\d{2} \w{3} \d{4}", pub_date_text)
-                        pub_date_short = date_match.group(0) if date_match else ""
-
-                        # 필터링: 당일 기사만
-                        if pub_date_short != target_date_short:
-                            continue
-                    except Exception:
-                        continue
-                else:
-                    continue
+def scrape_saigontimes(date_str: str, source: Optional[SourceSpec] = None) -> List[Dict[str, str]]:
+    """
+    The Saigon Times(경제) 스크래핑 (Google News 사이트맵 우선, 실패 시 홈페이지 HTML)
 
-                # title 찾기
-                title_elem = item.find(".//title")
-                title = title_elem.text if title_elem is not None else ""
-                title = clean_text(title)
+    Args:
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        source: 소스 설정 (None이면 기본 설정)
 
-                # link 찾기
-                link_elem = item.find(".//link")
-                article_url = link_elem.text if link_elem is not None else ""
+    Returns:
+        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+    """
+    source = source or default_source("saigontimes")
+    url = source.url
+    logger.info("The Saigon Times 스크래핑 시작", extra={"url": url})
 
-                # description 찾기
-                desc_elem = item.find(".//description")
-                description = desc_elem.text if desc_elem is not None else ""
+    # 카테고리 필터링 (기획/경제/재무/부동산만 수집)
+    priority_categories = source.selectors.get("categories", [])
 
-                # HTML 태그 제거
-                content = re.sub(r"<[^>]+>", "", description).strip()
-                content = content[:200]
-                content = clean_text(content)
+    articles = _scrape_news_sitemap(source, date_str, categories=priority_categories)
+    if articles is not None:
+        return articles
 
-                articles.append(
-                    {
-                        "title": title,
-                        "content": content,
-                        "url": article_url,
-                        "date": date_str,
-                    }
-                )
+    try:
+        with _fetch_stream(url, timeout=source.timeout, max_bytes=source.max_bytes) as body:
+            markup = body.text()
 
-        logger.info(f"VnExpress IT/과학 RSS 파싱 완료: {len(articles)}개 기사 수집")
+        # 파싱·추출·정규화 (parse_pool 활성 시 별도 프로세스, 기사 딕셔너리만 반환)
+        articles = parse_pool.run(_extract_saigontimes, markup, date_str, source)
+        logger.info(f"The Saigon Times 스크래핑 완료: {len(articles)}개 기사 수집")
         return articles
 
     except requests.RequestException as e:
-        logger.error(f"VnExpress IT/과학 RSS 파싱 실패", exc_info=True)
-        raise ScrapingError(f"Failed to parse VnExpress IT/과학 RSS: {str(e)}")
+        logger.error(f"The Saigon Times 스크래핑 실패", exc_info=True)
+        raise ScrapingError(f"Failed to scrape The Saigon Times: {str(e)}")
 
 
-def scrape_saigontimes(date_str: str) -> List[Dict[str, str]]:
+def _filter_relevant_quakes(earthquakes: List[Dict], source: SourceSpec) -> List[Dict]:
     """
-    The Saigon Times(경제) 스크래핑
+    지진 목록에 구조화 필드를 추가하고 거리 대비 규모 기준 미달 지진 제외
 
     Args:
-        date_str: 기준일 (YYYY-MM-DD 형식)
+        earthquakes: 지진 딕셔너리 리스트 (title/content 필수, 제자리 수정)
+        source: 소스 설정 (params.locations, params.rules)
 
     Returns:
-        기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+        기준을 넘거나 위치를 판단할 수 없는 지진 리스트 (원래 순서 유지)
     """
-    logger.info("The Saigon Times 스크래핑 시작", extra={"url": "https://thesaigontimes.vn/"})
+    locations = source.params.get("locations") or []
+    if not earthquakes or not locations:
+        return earthquakes
 
-    url = "https://thesaigontimes.vn/"
-    articles = []
+    from today_vn_news.scraping.quake import DEFAULT_RULES as QUAKE_RULES, parse_quake, relevant_mask
 
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = _fetch_url(url, headers=headers)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # 오늘 날짜 형식
-        today_pattern = (
-            date_str.split("-")[2]
-            + "/"
-            + date_str.split("-")[1]
-            + "/"
-            + date_str.split("-")[0]
-        )
+    events = [parse_quake(f"{quake['title']} {quake['content']}") for quake in earthquakes]
+    rules = [tuple(rule) for rule in source.params.get("rules") or QUAKE_RULES]
+    keep, nearest, distance = relevant_mask(events, locations, rules)
 
-        # 기사 리스트 찾기
-        article_elements = soup.find_all("article") or soup.select(
-            ".news-item, .article-item, .story-item"
+    relevant = []
+    for quake, event, kept, city_index, km in zip(earthquakes, events, keep, nearest, distance):
+        if not kept:
+            logger.debug(f"지진 제외 (규모 {event.magnitude}, {locations[city_index]['name']}에서 {km:.0f}km)")
+            continue
+        quake.update(
+            {
+                "magnitude": event.magnitude,
+                "latitude": event.latitude,
+                "longitude": event.longitude,
+                "depth_km": event.depth_km,
+            }
         )
+        if event.located:
+            city = locations[city_index]["name"]
+            quake.update({"nearest_city": city, "distance_km": round(float(km), 1)})
+            depth = f", 깊이 {event.depth_km:g}km" if event.depth_km is not None else ""
+            quake["content"] = f"규모 {event.magnitude:.1f}{depth}, {city}에서 약 {km:.0f}km"
+        relevant.append(quake)
 
-        for article in article_elements[:5]:  # 최대 5개 기사 체크
-            # 링크 찾기
-            link_tag = article.find("a")
-            if not link_tag:
-                continue
-
-            article_url = link_tag.get("href", "")
-            if not article_url.startswith("http"):
-                article_url = "https://thesaigontimes.vn" + article_url
-
-            # 카테고리 필터링 (기획/경제/재무/부동산만 수집)
-            priority_categories = [
-                "/noi-bat-2/",  # 기획/하이라이트
-                "/kinh-doanh/",  # 경제
-                "/tai-chinh-ngan-hang/",  # 재무-금융
-                "/dia-oc/",  # 부동산
-            ]
-
-            in_priority = any(cat in article_url for cat in priority_categories)
-
-            if not in_priority:
-                continue
-
-            # 제목 찾기
-            title_tag = article.find(["h2", "h3", "h4"])
-            title = title_tag.get_text(strip=True) if title_tag else ""
-            title = clean_text(title)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
-
-            # 날짜 찾기
-            date_tag = (
-                article.find("time")
-                or article.find("span", class_="date")
-                or article.find("div", class_="article-date")
-            )
-            article_date = date_tag.get_text(strip=True) if date_tag else ""
-
-            # 오늘 날짜가 포함되어 있는지 확인
-            if (
-                today_pattern in article_date or not article_date
-            ):  # 날짜가 없으면 최신 기사로 간주
-                # 본문 미리보기 요약
-                summary_tag = article.find("p", class_="sapo") or article.find(
-                    "div", class_="summary"
-                )
-                content = summary_tag.get_text(strip=True) if summary_tag else title
-                content = clean_text(content)  # 텍스트 정제 (홑따옴표 + HTML 엔티티)
-
-                articles.append(
-                    {
-                        "title": title,
-                        "content": content[:200],  # 200자 제한
-                        "url": article_url,
-                        "date": article_date,
-                    }
-                )
-
-        logger.info(f"The Saigon Times 스크래핑 완료: {len(articles)}개 기사 수집")
-        return articles
-
-    except requests.RequestException as e:
-        logger.error(f"The Saigon Times 스크래핑 실패", exc_info=True)
-        raise ScrapingError(f"Failed to scrape The Saigon Times: {str(e)}")
+    if len(relevant) < len(earthquakes):
+        logger.info(f"지진 관련성 필터: {len(earthquakes)}건 중 {len(earthquakes) - len(relevant)}건 제외")
+    return relevant
 
 
-def scrape_earthquake(date_str: Optional[str] = None) -> List[Dict[str, str]]:
+def scrape_earthquake(
+    date_str: Optional[str] = None, source: Optional[SourceSpec] = None
+) -> List[Dict[str, str]]:
     """
     IGP-VAST 지진 정보 스크래핑 (RSS 피드, 당일 지진만 필터링)
 
+    설명문에서 규모/위도/경도/깊이를 추출하고, params.locations 도시 중 가장 가까운
+    도시까지의 거리에 따른 최소 규모(params.rules) 미만인 지진은 제외합니다.
+    위치를 추출한 지진은 본문을 요약문으로 대체하고, 추출하지 못한 지진은 원문을 유지합니다.
+
     Args:
         date_str: 기준일 (YYYY-MM-DD 형식, None이면 필터링 없음)
+        source: 소스 설정 (params.locations 없으면 거리 필터 없음, None이면 기본 설정)
 
     Returns:
-        지진 정보 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
+        지진 정보 리스트 [{'title': str, 'content': str, 'url': str, 'date': str,
+        'magnitude', 'latitude', 'longitude', 'depth_km', 'nearest_city', 'distance_km'}]
     """
-    logger.info("IGP-VAST 지진 정보 수집 시작", extra={"url": "http://igp-vast.vn/index.php/en/earthquake-news?format=feed"})
+    source = source or default_source("earthquake")
+    logger.info("IGP-VAST 지진 정보 수집 시작", extra={"url": source.url})
 
     earthquakes = []
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-
-        # IGP-VAST RSS 피드 (영어)
-        url = "http://igp-vast.vn/index.php/en/earthquake-news?format=feed"
-        response = _fetch_url(url, headers=headers)
-
-        # XML 파싱
-        root = ET.fromstring(response.content)
-
-        # item 태그 찾기
-        items = root.findall(".//item")
-
         # 필터링을 위한 날짜 파싱
         target_date = None
         if date_str:
@@ -1335,59 +1444,31 @@ def scrape_earthquake(date_str: Optional[str] = None) -> List[Dict[str, str]]:
             except ValueError:
                 logger.warning(f"날짜 형식 오류: {date_str}")
 
+        # IGP-VAST RSS 피드 (영어), 당일 지진만 (pubDate 파싱 실패 시 포함)
+        with _fetch_stream(source.url, timeout=source.timeout, max_bytes=source.max_bytes) as body:
+            items = parse_feed(body, target_date, limit=source.limit, include_undated=True)
+
         for item in items:
-            # 직접 자식 요소에서 데이터 추출
-            title = ""
-            description = ""
-            article_url = ""
-            pub_date = ""
-
-            for child in item:
-                tag_name = child.tag.split('}')[-1]  # 네임스페이스 제거
-                if tag_name == "title":
-                    title = child.text or ""
-                elif tag_name == "description":
-                    description = child.text or ""
-                elif tag_name == "link":
-                    article_url = child.text or ""
-                elif tag_name == "pubDate":
-                    pub_date = child.text or ""
-
-            # 날짜 필터링 (pubDate 파싱: "Tue, 10 Feb 2026 09:20:17 +0700")
-            if target_date and pub_date:
-                try:
-                    # RSS 날짜 파싱
-                    from email.utils import parsedate_to_datetime
-                    earthquake_datetime = parsedate_to_datetime(pub_date)
-                    # GMT+7 (베트남 시간)으로 변환 후 날짜 비교
-                    earthquake_date = earthquake_datetime.date()
-                    if earthquake_date != target_date:
-                        continue  # 당일이 아니면 스킵
-                except Exception:
-                    pass  # 날짜 파싱 실패 시 포함
-
-            # HTML 엔티티 디코딩 및 태그 제거
-            description = html.unescape(description)
-            # HTML 태그 제거
-            description = re.sub(r'<[^>]+>', ' ', description)
-            description = re.sub(r'\s+', ' ', description).strip()
-
-            # 제목이 없으면 description에서 첫 문장 사용
-            if not title:
-                title = "Earthquake Report"
-            else:
-                title = html.unescape(title)
+            # 이스케이프된 태그 디코딩 후 태그 제거 (공백 정리는 정규화 단계에서 처리)
+            description = strip_tags(html.unescape(item.description), " ")
 
-            if description:
+            # 제목이 없으면 기본 제목 사용
+            title = item.title or "Earthquake Report"
+
+            if description.strip():
                 earthquakes.append(
                     {
                         "title": title,
-                        "content": description[:500],  # 500자 제한
-                        "url": article_url,
-                        "date": pub_date,
+                        "content": description,
+                        "url": item.link,
+                        "date": item.raw_pub_date,
                     }
                 )
 
+        earthquakes = _filter_relevant_quakes(earthquakes, source)
+
+        # 일괄 정규화 (본문 500자 제한)
+        earthquakes = normalize_articles(earthquakes, max_lengths={"content": 500})
         logger.info(f"IGP-VAST 지진 정보 수집 완료: {len(earthquakes)}개 지진 정보 수집")
         return earthquakes
 
@@ -1396,23 +1477,161 @@ def scrape_earthquake(date_str: Optional[str] = None) -> List[Dict[str, str]]:
         return []
 
 
-def scrape_and_save(date_str: str, output_path: str) -> Dict[str, List[Dict[str, str]]]:
+def scrape_and_save(
+    date_str: str,
+    output_path: str,
+    config: Optional[ScraperConfig] = None,
+    registry: Optional[SourceRegistry] = None,
+    checkpoint_prefix: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, List[Dict[str, str]]]:
     """
     모든 소스 스크래핑 및 원본 YAML 저장
 
+    레지스트리에서 활성화된 안전/뉴스 소스를 스레드 풀에서 동시에 수집합니다.
+    결과 딕셔너리와 YAML 섹션 순서는 레지스트리 설정 순서를 따릅니다.
+    전체 마감 시간(config.scrape_deadline)까지 끝난 소스만 저장하며(부분 결과),
+    소스별 상태는 원본 YAML의 source_status 블록에 기록합니다.
+    result_ttl이 있는 안전 데이터 소스는 TTL 이내 결과를 재사용합니다 (config.safety_cache_*).
+    받은 본문은 원본 페이지 보관소(config.page_store_*)에 저장합니다 (재생 모드 제외).
+    config.parse_processes > 0이면 홈페이지 HTML 파싱·추출을 프로세스 풀에서 실행합니다.
+
     Args:
         date_str: 기준일 (YYYY-MM-DD 형식)
         output_path: 원본 YAML 저장 경로
+        config: 스크래핑 설정 (None이면 config.yaml에서 로드)
+        registry: 소스 레지스트리 (None이면 config.yaml에서 로드)
+        checkpoint_prefix: 소스별 완료 마커 경로 접두사 (예: "data/260211").
+            지정하면 데이터를 수집한 소스를 마커로 저장하고, 재실행 시 마커가 있는 소스는 재사용
+        executor: 소스 실행기 (None이면 스레드 풀, 재파싱은 ProcessPoolExecutor)
 
     Returns:
-        스크래핑된 기사 데이터 딕셔너리
+        스크래핑된 기사 데이터 딕셔너리 (실패/시간 초과 뉴스 소스는 빈 리스트)
+
+    Raises:
+        ScrapingError: 기사를 수집한 뉴스 소스가 config.min_news_sources개 미만일 때 (원본 YAML 저장 후 발생)
     """
     logger.info(f"모든 소스 스크래핑 시작 ({date_str})")
 
-    # 안전 및 기상 관제 데이터 스크래핑
-    weather_data = scrape_weather_hochiminh()
-    air_data = scrape_air_quality()
-    earthquake_data = scrape_earthquake(date_str)
+    if config is None:
+        config = ScraperConfig.from_yaml()
+    if registry is None:
+        registry = get_registry()
+    host_limiter.configure(config.per_host_limit)
+    http_cache.configure(
+        cache_dir=config.cache_dir,
+        default_ttl=config.cache_default_ttl,
+        ttl_rules=config.cache_ttl,
+        enabled=config.cache_enabled,
+    )
+
+    health_board.configure(
+        path=config.health_path,
+        enabled=config.health_enabled and not http_replay.replaying,
+        failure_threshold=config.breaker_failure_threshold,
+        cooldown=config.breaker_cooldown,
+        timeout_multiplier=config.adaptive_timeout_multiplier,
+        min_timeout=config.min_timeout,
+    )
+
+    # 이전 실행에서 완료된 소스는 완료 마커의 결과 재사용
+    sources = {spec.name: spec for spec in registry.enabled()}
+    checkpoint = SourceCheckpoint(checkpoint_prefix) if checkpoint_prefix else None
+    reused: Dict[str, SourceResult] = {}
+    if checkpoint:
+        for name, spec in sources.items():
+            loaded, value = checkpoint.load(spec.key)
+            if loaded:
+                reused[name] = SourceResult(name=name, value=value)
+        if reused:
+            logger.info(f"완료 마커가 있는 소스 {len(reused)}개 재사용: {', '.join(reused)}")
+
+    # 안전 데이터는 소스별 TTL(result_ttl) 이내 결과 재사용 (녹화/재생 모드는 항상 수집)
+    safety_cache = None
+    if config.safety_cache_enabled and not (http_replay.replaying or http_replay.recording):
+        safety_cache = SafetyCache(config.safety_cache_path)
+    cached: Dict[str, SourceResult] = {}
+    if safety_cache:
+        for name, spec in sources.items():
+            if spec.result_ttl and name not in reused:
+                hit, value = safety_cache.get(spec.key, date_str, spec.result_ttl)
+                if hit:
+                    cached[name] = SourceResult(name=name, value=value)
+        if cached:
+            logger.info(f"TTL 이내 안전 데이터 {len(cached)}개 재사용: {', '.join(cached)}")
+    reused.update(cached)
+
+    # 안전 데이터 + 뉴스 소스 동시 수집 (활성 소스의 스크래퍼만 import)
+    # 느리거나 불안정했던 소스는 뒤로 배치
+    tasks = {
+        name: partial(sources[name].load_scraper(), date_str, source=sources[name])
+        for name in health_board.schedule(sources)
+        if name not in reused
+    }
+
+    # 공유 커넥션 풀 구성 및 DNS 예열
+    configure_session(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        host_pool_sizes=config.host_pool_sizes,
+        user_agent=config.user_agent,
+    )
+    if config.warm_dns and not http_replay.replaying:
+        dns_cache.warm(registry.hosts())
+
+    # 원본 페이지 보관 (재생/재파싱은 이미 보관된 본문이므로 제외)
+    page_store.configure(config.page_store_dir, enabled=config.page_store_enabled)
+    if not http_replay.replaying:
+        page_store.begin(date_str)
+    parse_pool.configure(config.parse_processes)
+
+    stream_stats.reset()
+    try:
+        fetched = run_sources(
+            tasks,
+            max_workers=config.max_workers,
+            deadline=config.scrape_deadline or None,
+            executor=executor,
+        )
+    finally:
+        page_store.end()
+        parse_pool.shutdown()
+    if http_cache.enabled:
+        logger.info(http_cache.stats.summary())
+    for line in stream_stats.report():
+        logger.info(f"[스트리밍] {line}")
+    if health_board.enabled:
+        for result in fetched.values():
+            health_board.record_source(result.name, result.elapsed, result.ok)
+        health_board.save()
+        for line in health_board.report():
+            logger.info(f"[소스 상태] {line}")
+    if checkpoint:
+        # 실패를 빈 값으로 삼킨 결과({}, [])는 마커를 남기지 않음 (재실행 시 다시 수집)
+        for name, result in fetched.items():
+            if _collected(result):
+                checkpoint.save(sources[name].key, result.value)
+    if safety_cache:
+        for name, result in fetched.items():
+            spec = sources[name]
+            if spec.result_ttl and result.ok and is_cacheable(result.value):
+                safety_cache.put(spec.key, date_str, result.value)
+
+    # 레지스트리 순서로 결과 정리 (실패/시간 초과 소스는 value=None)
+    results = {name: reused.get(name) or fetched[name] for name in sources}
+    source_status = _source_status(sources, results, reused, cached)
+    for result in results.values():
+        if not result.ok:
+            logger.warning(f"소스 수집 {result.status}: {result.name} - {result.error}")
+
+    # 안전 및 기상 관제 데이터 스크래핑 결과 (비활성/실패 소스는 빈 값)
+    safety_results = {
+        spec.key: results[spec.name].value for spec in registry.enabled("safety")
+    }
+    weather_data = safety_results.get("weather")
+    air_data = safety_results.get("air_quality")
+    city_data = safety_results.get("cities") or []
+    earthquake_data = safety_results.get("earthquake") or []
 
     # 안전 및 기상 관제 데이터 통합
     safety_items = []
@@ -1471,6 +1690,35 @@ def scrape_and_save(date_str: str, output_path: str) -> Dict[str, List[Dict[str,
         )
         logger.info(f"공기질 정보 추가됨: AQI {aqi_str}, {status_str}, PM2.5: {pm25_str}, PM10: {pm10_str}")
 
+    # 도시별 기상·공기질 (도시당 1개 항목)
+    for city in city_data:
+        weather_str = ", ".join(
+            part
+            for part in (
+                city["condition"],
+                f"온도 {city['temp']}" if city["temp"] else "",
+                f"습도 {city['humidity']}" if city["humidity"] else "",
+            )
+            if part
+        )
+        air_str = (
+            f"AQI {city['aqi']} ({city['status']}), PM2.5: {city['pm25'] or 'N/A'}, PM10: {city['pm10'] or 'N/A'}"
+            if city["aqi"]
+            else "공기질 정보 없음"
+        )
+        safety_items.append(
+            {
+                "name": "도시",
+                "source": "Open-Meteo",
+                "city": city["city"],
+                "aqi": city["aqi"],
+                "content": f"{weather_str or '기상 정보 없음'} / {air_str}",
+                "url": "https://open-meteo.com/",
+            }
+        )
+    if city_data:
+        logger.info(f"도시별 기상·공기질 추가됨: {', '.join(city['city'] for city in city_data)}")
+
     # 지진 정보 (최근 3개)
     for quake in earthquake_data:
         safety_items.append(
@@ -1497,26 +1745,178 @@ def scrape_and_save(date_str: str, output_path: str) -> Dict[str, List[Dict[str,
     else:
         logger.info(f"안전 데이터 {len(safety_items)}개 추가됨")
 
-    scraped_data = {
-        "안전 및 기상 관제": safety_items,
-        "Nhân Dân": scrape_nhandan(date_str),
-        "Sức khỏe & Đời sống": scrape_suckhoedoisong(date_str),
-        "Tuổi Trẻ": scrape_tuoitre(date_str),
-        "VietnamNet": scrape_vietnamnet(date_str),
-        "VnExpress": scrape_vnexpress(date_str),
-        "Thanh Niên": scrape_thanhnien_rss(date_str),
-        "The Saigon Times": scrape_saigontimes(date_str),
-        "VietnamNet 정보통신": scrape_vietnamnet_ttt(date_str),
-        "VnExpress IT/과학": scrape_vnexpress_tech(date_str),
-    }
-
-    # 원본 YAML 저장
-    save_raw_yaml(scraped_data, date_str, output_path)
+    scraped_data = {SAFETY_SECTION: normalize_articles(safety_items)}
+    for spec in registry.enabled("news"):
+        scraped_data[spec.name] = results[spec.name].value or []
+
+    # 최근 방송된 기사 제외 (홈페이지에 며칠씩 남아 있는 기사)
+    if config.seen_enabled:
+        seen_store = SeenStore(config.seen_path, config.seen_window_days)
+        scraped_data = seen_store.filter_scraped(scraped_data, date_str)
+        seen_store.close()
+
+    # 원본 YAML 저장 (부분 결과 + 소스별 상태)
+    save_raw_yaml(
+        scraped_data, date_str, output_path, registry=registry, source_status=source_status
+    )
+
+    news = [spec.name for spec in registry.enabled("news")]
+    failed = [name for name in news if not _collected(results[name])]
+    succeeded = len(news) - len(failed)
+    if news and succeeded < config.min_news_sources:
+        raise ScrapingError(
+            f"뉴스 소스 수집 실패: 성공 {succeeded}/{len(news)}개 "
+            f"(최소 {config.min_news_sources}개 필요) - 실패: {', '.join(failed)}"
+        )
+    if failed:
+        hint = (
+            f" (재수집: rm {checkpoint_prefix}.scraper.done 후 재실행 - 실패 소스만 다시 수집, "
+            f"완료 소스는 {checkpoint_prefix}.scraper.{{key}}.done 재사용)"
+            if checkpoint
+            else ""
+        )
+        logger.warning(f"부분 수집 결과로 진행: 실패 {', '.join(failed)}{hint}")
 
     return scraped_data
 
 
-def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
+def _init_reparse_worker(root: str, date_str: str) -> None:
+    """재파싱 작업 프로세스 초기화 (보관된 본문으로 재생 모드 시작, 작업 프로세스 안에서 파싱)"""
+    parse_pool.configure(0)
+    entries = PageStore(root, enabled=False).load(date_str)
+    http_replay.start_replay_entries(entries, date_str, label=f"{root} ({date_str})")
+
+
+def reparse_raw(
+    date_str: str,
+    output_path: str,
+    config: Optional[ScraperConfig] = None,
+    registry: Optional[SourceRegistry] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, List[Dict[str, str]]]:
+    """
+    원본 페이지 보관소의 본문으로 원본 YAML 재생성 (네트워크 요청 없음)
+
+    선택자 수정 후 지난 날짜 기사를 다시 추출할 때 사용합니다. 보관소 색인으로
+    재생 모드를 구성하고, 소스별 스크래퍼를 CPU 코어 수만큼의 프로세스에서
+    병렬로 실행합니다 (파싱은 CPU 작업이므로 스레드 대신 프로세스 사용).
+    보관소에 없는 URL은 네트워크 오류로 처리됩니다.
+
+    Args:
+        date_str: 기준일 (YYYY-MM-DD 형식)
+        output_path: 원본 YAML 저장 경로
+        config: 스크래핑 설정 (None이면 config.yaml에서 로드)
+        registry: 소스 레지스트리 (None이면 config.yaml에서 로드)
+        workers: 프로세스 수 (None이면 CPU 코어 수)
+
+    Returns:
+        스크래핑된 기사 데이터 딕셔너리
+
+    Raises:
+        ScrapingError: 기준일 색인이 없거나 성공한 뉴스 소스가 부족할 때
+    """
+    if config is None:
+        config = ScraperConfig.from_yaml()
+    entries = PageStore(config.page_store_dir, enabled=False).load(date_str)
+    if not entries:
+        raise ScrapingError(f"원본 페이지 보관소에 {date_str} 본문 없음: {config.page_store_dir}")
+
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"원본 페이지 재파싱 시작 ({date_str}): 본문 {len(entries)}개, 프로세스 {workers}개")
+    http_replay.start_replay_entries(entries, date_str, label=f"{config.page_store_dir} ({date_str})")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_reparse_worker,
+            initargs=(config.page_store_dir, date_str),
+        ) as pool:
+            return scrape_and_save(date_str, output_path, config, registry, executor=pool)
+    finally:
+        http_replay.stop()
+
+
+def _collected(result: SourceResult) -> bool:
+    """
+    소스가 실제로 데이터를 수집했는지 판단
+
+    기상/공기질/지진 스크래퍼와 RSS 수집은 실패 시 예외 대신 빈 값({}, [])을
+    반환하므로, 성공(result.ok)이더라도 빈 결과는 수집 실패로 봅니다.
+
+    Args:
+        result: 소스 실행 결과
+
+    Returns:
+        수집 여부
+    """
+    return result.ok and bool(result.value) and is_cacheable(result.value)
+
+
+def _source_status(
+    sources: Dict[str, SourceSpec],
+    results: Dict[str, SourceResult],
+    reused: Dict[str, SourceResult],
+    cached: Optional[Dict[str, SourceResult]] = None,
+) -> Dict[str, Dict]:
+    """
+    원본 YAML source_status 블록 생성
+
+    Args:
+        sources: {소스 이름: SourceSpec}
+        results: {소스 이름: SourceResult}
+        reused: 재사용한 소스 결과 (완료 마커 + 안전 데이터 캐시)
+        cached: 그중 안전 데이터 캐시에서 재사용한 결과
+
+    Returns:
+        {소스 이름: {key, status, elapsed, items, error}}
+    """
+    status = {}
+    for name, spec in sources.items():
+        result = results[name]
+        value = result.value
+        if isinstance(value, list):
+            items = len(value)
+        else:
+            items = 1 if value else 0
+        if name in (cached or {}):
+            state = "cached"
+        elif name in reused:
+            state = "reused"
+        else:
+            state = result.status
+        entry = {
+            "key": spec.key,
+            "status": state,
+            "elapsed": round(result.elapsed, 2),
+            "items": items,
+        }
+        if not result.ok:
+            entry["error"] = str(result.error)
+        status[name] = entry
+    return status
+
+
+# 비뉴스성 제목 키워드 (소문자, 메뉴/페이지 이름)
+EXCLUDE_TITLE_KEYWORDS = tuple(
+    keyword.lower()
+    for keyword in (
+        "Videos",
+        "TuoitrePodcast",
+        "Podcast",
+        "Thời tiết hôm nay",
+        "Kinh doanh",
+        "Thể thao",
+        "Giải trí",
+    )
+)
+
+
+def save_raw_yaml(
+    scraped_data: Dict,
+    date_str: str,
+    output_path: str,
+    registry: Optional[SourceRegistry] = None,
+    source_status: Optional[Dict[str, Dict]] = None,
+) -> bool:
     """
     스크래핑된 원본 데이터를 YAML로 저장
 
@@ -1524,6 +1924,8 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
         scraped_data: 스크래핑된 데이터
         date_str: 기준일 표시용
         output_path: 출력 파일 경로
+        registry: 섹션 우선순위 조회용 소스 레지스트리 (None이면 전역 레지스트리)
+        source_status: 소스별 수집 상태 (지정 시 source_status 블록으로 저장)
 
     Returns:
         성공 여부
@@ -1540,7 +1942,7 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
         - 짧은 제목 (10자 미만)
 
         Args:
-            title: 기사 제목
+            title: 기사 제목 (정규화 완료)
 
         Returns:
             유효 여부
@@ -1549,19 +1951,9 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
             return False
 
         # 제외할 비뉴스성 키워드
-        exclude_keywords = [
-            "Videos",
-            "TuoitrePodcast",
-            "Podcast",
-            "Thời tiết hôm nay",
-            "Kinh doanh",
-            "Thể thao",
-            "Giải trí",
-        ]
-
-        for keyword in exclude_keywords:
-            if keyword.lower() in title.lower():
-                return False
+        title_lower = title.lower()
+        if any(keyword in title_lower for keyword in EXCLUDE_TITLE_KEYWORDS):
+            return False
 
         # 너무 짧은 제목 제외 (10자 미만)
         if len(title.strip()) < 10:
@@ -1571,18 +1963,23 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
 
     logger.info("원본 YAML 저장 시작")
 
+    if registry is None:
+        registry = get_registry()
+
     yaml_data = {
         "metadata": {
             "date": date_str,
             "time": datetime.now().strftime("%H:%M"),
             "location": "Ho Chi Minh City",
         },
-        "sections": [],
     }
+    if source_status:
+        yaml_data["source_status"] = source_status
+    yaml_data["sections"] = []
 
     section_id = 1
     for source_name, articles in scraped_data.items():
-        if source_name == "안전 및 기상 관제":
+        if source_name == SAFETY_SECTION:
             # 안전 및 기상 관제 섹션 처리
             section = {
                 "id": str(section_id),
@@ -1592,9 +1989,12 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
             }
 
             for item in articles:
+                # 정규화되지 않은 항목만 정제 (scrape_and_save 결과는 정규화 완료)
+                item = normalize_article(item)
+                content = item.get("content", "")
+
                 # 기상/공기질/지진 데이터 형식 변환
                 if item.get("name") == "기상":
-                    content = clean_text(item.get("content", ""))
                     section["items"].append(
                         {
                             "title": "기상 (NCHMF)",
@@ -1603,7 +2003,6 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
                         }
                     )
                 elif item.get("name") == "공기":
-                    content = clean_text(item.get("content", ""))
                     section["items"].append(
                         {
                             "title": f"공기질 (IQAir) - AQI {item.get('aqi', '')}",
@@ -1611,18 +2010,24 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
                             "url": item.get("url", ""),
                         }
                     )
+                elif item.get("name") == "도시":
+                    aqi = item.get("aqi", "")
+                    section["items"].append(
+                        {
+                            "title": f"{item.get('city', '')} 기상·공기질" + (f" - AQI {aqi}" if aqi else ""),
+                            "content": content,
+                            "url": item.get("url", ""),
+                        }
+                    )
                 elif item.get("name") == "지진":
-                    title = clean_text(item.get("title", ""))
-                    content = clean_text(item.get("content", ""))
                     section["items"].append(
                         {
-                            "title": title,
+                            "title": item.get("title", ""),
                             "content": content,
                             "url": item.get("url", ""),
                         }
                     )
                 elif item.get("name") == "플레이스홀더":
-                    content = clean_text(item.get("content", ""))
                     section["items"].append(
                         {
                             "title": "안전 및 기상 관제",
@@ -1639,25 +2044,22 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
             section = {
                 "id": str(section_id),
                 "name": source_name,
-                "priority": "P0"
-                if "안전" in source_name or "Sức khỏe" in source_name
-                else "P2",
+                "priority": registry.priority_of(source_name),
                 "items": [],
             }
 
             for article in articles:
+                # title과 content 정규화 (스크래퍼에서 정규화된 기사는 생략)
+                article = normalize_article(article)
+
                 # 비뉴스성 항목 필터링
                 if not is_valid_news_article(article.get("title", "")):
                     continue
 
-                # title과 content 정규화 적용
-                clean_title = clean_text(article["title"])
-                clean_content = clean_text(article["content"])
-
                 section["items"].append(
                     {
-                        "title": clean_title,
-                        "content": clean_content,
+                        "title": article["title"],
+                        "content": article["content"],
                         "url": article["url"],
                     }
                 )
@@ -1677,3 +2079,23 @@ def save_raw_yaml(scraped_data: Dict, date_str: str, output_path: str) -> bool:
 
     logger.info(f"원본 YAML 저장 완료: {output_path}")
     return True
+
+
+def load_raw_yaml(path: str) -> Dict[str, List[Dict[str, str]]]:
+    """
+    원본 YAML을 scrape_and_save 결과와 같은 형태로 로드 (1단계 완료 후 재시작용)
+
+    Args:
+        path: 원본 YAML 경로
+
+    Returns:
+        {섹션 이름: 기사 리스트} 딕셔너리 (파일이 없으면 빈 딕셔너리)
+    """
+    import yaml
+
+    if not os.path.exists(path):
+        logger.warning(f"원본 YAML 없음: {path}")
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return {section["name"]: section.get("items") or [] for section in data.get("sections", [])}
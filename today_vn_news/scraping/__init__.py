@@ -0,0 +1,93 @@
+"""
+스크래핑 인프라 패키지
+- engine: 소스 병렬 수집 엔진 (호스트별 동시성 제한, 전체 마감 시간)
+- http_cache: HTTP 조건부 GET 디스크 캐시
+- feed: RSS 스트리밍 파싱 엔진
+- html_parser: HTML 부분 파싱 (lxml 백엔드 + SoupStrainer)
+- registry: 선언형 소스 레지스트리 (config.yaml scraper.sources)
+- text: 텍스트 정규화 파이프라인 (1회 정규화 + normalized 플래그)
+- replay: HTTP 녹화/재생 모드 (오프라인 벤치마크)
+- page_store: 원본 페이지 보관소 (콘텐츠 주소 압축 저장, 재수집 없이 재파싱)
+- parse_pool: HTML 파싱 프로세스 풀 (CPU 작업을 GIL 밖에서 실행, 기사 딕셔너리만 반환)
+- dedup: 소스 간 중복 기사 제거 (URL 정규화 + SimHash)
+- seen_store: 방송된 기사 저장소 (SQLite, 최근 N일 방송 기사 제외)
+- health: 호스트 서킷 브레이커 + 소스 상태 점수판
+- checkpoint: 소스별 수집 완료 마커 (재실행 시 실패 소스만 재수집)
+- safety: 안전 데이터 결과 캐시 (소스별 TTL 이내 재실행은 재수집 없음)
+- quake: 지진 관련성 필터 (설명문 구조화 + 도시까지 거리 대비 규모 기준)
+- stream: 제한 스트리밍 수집 (필요한 item 확보 시 다운로드 중단, 소스별 최대 바이트)
+"""
+
+from .engine import SourceResult, HostLimiter, DeadlineExceeded, host_limiter, run_sources
+from .http_cache import HttpCache, CachedResponse, http_cache
+from .feed import FeedItem, parse_feed, iter_feed_items
+from .registry import SourceSpec, SourceRegistry, get_registry
+from .text import clean_text, normalize_article, normalize_articles
+from .replay import HttpReplay, http_replay
+from .page_store import PageStore, page_store
+from .parse_pool import ParsePool, parse_pool
+from .dedup import DedupReport, dedup_scraped_data
+from .seen_store import SeenStore
+from .health import HealthBoard, CircuitOpenError, health_board
+from .checkpoint import SourceCheckpoint
+from .stream import StreamedBody, stream_stats
+from .safety import SafetyCache
+
+# bs4/lxml, NumPy를 쓰는 모듈은 첫 접근 시 import (소스가 비활성이면 import 비용 없음)
+_LAZY = {
+    "parse_html": "html_parser",
+    "parse_first_match": "html_parser",
+    "QuakeEvent": "quake",
+    "parse_quake": "quake",
+    "relevant_mask": "quake",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        return getattr(importlib.import_module(f"{__name__}.{_LAZY[name]}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "SourceResult",
+    "HostLimiter",
+    "DeadlineExceeded",
+    "host_limiter",
+    "run_sources",
+    "HttpCache",
+    "CachedResponse",
+    "http_cache",
+    "FeedItem",
+    "parse_feed",
+    "iter_feed_items",
+    "parse_html",
+    "parse_first_match",
+    "SourceSpec",
+    "SourceRegistry",
+    "get_registry",
+    "clean_text",
+    "normalize_article",
+    "normalize_articles",
+    "HttpReplay",
+    "http_replay",
+    "PageStore",
+    "page_store",
+    "ParsePool",
+    "parse_pool",
+    "DedupReport",
+    "dedup_scraped_data",
+    "SeenStore",
+    "HealthBoard",
+    "CircuitOpenError",
+    "health_board",
+    "SourceCheckpoint",
+    "StreamedBody",
+    "stream_stats",
+    "SafetyCache",
+    "QuakeEvent",
+    "parse_quake",
+    "relevant_mask",
+]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+소스별 수집 완료 마커
+- 목적: 일부 소스만 실패/시간 초과한 경우 재실행 시 실패한 소스만 다시 수집
+- 기능: data/{YYMMDD}.scraper.{소스 key}.done 파일에 소스 수집 결과(JSON) 저장,
+        재실행 시 마커가 있는 소스는 저장된 결과 재사용
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from today_vn_news.logger import logger
+
+
+class SourceCheckpoint:
+    """
+    소스별 완료 마커 저장소.
+
+    마커 파일 자체가 완료 표시이자 결과 저장소입니다. 파이프라인 단계 완료 파일
+    (data/{YYMMDD}.scraper.done)과 같은 위치·이름 규칙을 따르므로
+    `rm data/{YYMMDD}.*.done`으로 함께 정리됩니다.
+
+    Args:
+        prefix: 마커 경로 접두사 (예: "data/260211")
+
+    Example:
+        >>> checkpoint = SourceCheckpoint("data/260211")
+        >>> checkpoint.save("vnexpress", articles)
+        >>> checkpoint.load("vnexpress")
+        (True, [...])
+    """
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def path(self, key: str) -> Path:
+        """소스 마커 경로"""
+        return Path(f"{self.prefix}.scraper.{key}.done")
+
+    def exists(self, key: str) -> bool:
+        """소스 완료 여부"""
+        return self.path(key).exists()
+
+    def load(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """
+        저장된 소스 결과 로드
+
+        Args:
+            key: 소스 key
+
+        Returns:
+            (로드 성공 여부, 수집 결과) — 마커가 없거나 손상되면 (False, None)
+        """
+        path = self.path(key)
+        if not path.exists():
+            return False, None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return True, data["value"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"소스 완료 마커 손상, 다시 수집합니다 ({path}): {e}")
+            return False, None
+
+    def save(self, key: str, value: Any) -> None:
+        """
+        소스 결과 저장 (임시 파일 후 원자적 교체)
+
+        Args:
+            key: 소스 key
+            value: JSON 직렬화 가능한 수집 결과
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        payload = {"key": key, "saved": time.time(), "value": value}
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
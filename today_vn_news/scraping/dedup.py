@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+소스 간 중복 기사 제거
+- 목적: 여러 매체가 같은 기사를 실을 때 번역(LLM)·TTS·인코딩을 한 번만 수행
+- 기능: URL 정규화 완전 일치 + 베트남어 정규화 텍스트 SimHash 근사 일치,
+        밴드 버킷(LSH)으로 기사 수에 선형 비례하는 후보 탐색, 채택 소스 기록
+"""
+
+import hashlib
+import os
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import yaml
+
+from today_vn_news.logger import logger
+from today_vn_news.scraping.registry import SAFETY_SECTION, SourceRegistry, get_registry
+
+SIMHASH_BITS = 64
+
+# 해밍 거리 max_distance 이하 쌍은 (max_distance + 1)개 밴드 중 최소 하나가 일치 (비둘기집 원리)
+DEFAULT_MAX_DISTANCE = 3
+
+# 제거할 추적용 쿼리 파라미터
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "zarsrc", "zacc", "ref", "cid")
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL 정규화 (비교용)
+
+    - 스킴 무시, 호스트 소문자 + www./m./amp. 제거
+    - 추적용 쿼리(utm_*, fbclid 등)와 프래그먼트 제거, 나머지 쿼리 정렬
+    - 끝 슬래시 및 /amp 접미사 제거
+
+    Args:
+        url: 기사 URL
+
+    Returns:
+        정규화된 URL 문자열 (빈 URL은 빈 문자열)
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+
+    path = parts.path.rstrip("/")
+    if path.endswith("/amp"):
+        path = path[: -len("/amp")]
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunsplit(("", host, path, urlencode(query), ""))
+
+
+def fold_vietnamese(text: str) -> str:
+    """
+    베트남어 비교용 정규화 (소문자, 성조/모음 부호 제거, đ → d)
+
+    Args:
+        text: 원문 텍스트
+
+    Returns:
+        ASCII에 가까운 소문자 텍스트
+    """
+    decomposed = unicodedata.normalize("NFD", text.lower().replace("đ", "d"))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def _features(text: str) -> List[str]:
+    """SimHash 특징: 단어 unigram + bigram"""
+    tokens = _TOKEN_RE.findall(fold_vietnamese(text))
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def simhash(text: str) -> int:
+    """
+    64비트 SimHash (프로세스 간 동일한 blake2b 특징 해시)
+
+    Args:
+        text: 제목 + 요약
+
+    Returns:
+        64비트 정수 지문 (특징이 없으면 0)
+    """
+    weights = [0] * SIMHASH_BITS
+    for feature in _features(text):
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 해밍 거리"""
+    return (a ^ b).bit_count()
+
+
+@dataclass
+class DuplicateRecord:
+    """제거된 중복 기사 하나"""
+
+    source: str
+    title: str
+    url: str
+    winner_source: str
+    winner_title: str
+    winner_url: str
+    reason: str  # "url" | "simhash"
+    distance: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "source": self.source,
+            "title": self.title,
+            "url": self.url,
+            "winner_source": self.winner_source,
+            "winner_url": self.winner_url,
+            "reason": self.reason,
+            "distance": self.distance,
+        }
+
+
+@dataclass
+class DedupReport:
+    """중복 제거 결과"""
+
+    total: int = 0
+    duplicates: List[DuplicateRecord] = field(default_factory=list)
+
+    @property
+    def kept(self) -> int:
+        return self.total - len(self.duplicates)
+
+    def summary(self) -> str:
+        return f"중복 기사 제거: {self.total}개 중 {len(self.duplicates)}개 제거, {self.kept}개 유지"
+
+    def to_dict(self) -> Dict:
+        return {
+            "total": self.total,
+            "kept": self.kept,
+            "duplicates": [record.to_dict() for record in self.duplicates],
+        }
+
+
+@dataclass
+class _Seen:
+    """채택된 기사 인덱스 항목"""
+
+    source: str
+    article: Dict
+    fingerprint: int
+
+
+class NearDuplicateIndex:
+    """
+    SimHash 밴드 버킷 인덱스.
+
+    64비트 지문을 (max_distance + 1)개 밴드로 나누어 밴드 값이 같은 기사만
+    후보로 비교하므로, 전체 쌍 비교 없이 기사 수에 선형 비례합니다.
+
+    Args:
+        max_distance: 근사 중복으로 판단할 최대 해밍 거리
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = SIMHASH_BITS // self.bands
+        self._buckets: Dict[Tuple[int, int], List[_Seen]] = {}
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        mask = (1 << self.band_bits) - 1
+        return [
+            (band, fingerprint >> (band * self.band_bits) & mask)
+            for band in range(self.bands)
+        ]
+
+    def find(self, fingerprint: int) -> Optional[Tuple[_Seen, int]]:
+        """
+        근사 중복 조회
+
+        Args:
+            fingerprint: SimHash 지문
+
+        Returns:
+            (채택된 기사, 해밍 거리) 또는 None
+        """
+        best = None
+        for key in self._band_keys(fingerprint):
+            for seen in self._buckets.get(key, ()):
+                distance = hamming_distance(fingerprint, seen.fingerprint)
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (seen, distance)
+        return best
+
+    def add(self, seen: _Seen) -> None:
+        """채택된 기사 등록"""
+        for key in self._band_keys(seen.fingerprint):
+            self._buckets.setdefault(key, []).append(seen)
+
+
+def dedup_scraped_data(
+    scraped_data: Dict[str, List[Dict]],
+    registry: Optional[SourceRegistry] = None,
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> Tuple[Dict[str, List[Dict]], DedupReport]:
+    """
+    섹션 간 중복 기사 제거 (번역 전 단계)
+
+    번역 순서(우선순위 → 설정 순서)대로 기사를 훑으며 먼저 나온 기사를 채택하고,
+    이후 같은 기사(정규화 URL 일치 또는 SimHash 근사 일치)는 제거합니다.
+    채택된 기사에는 also_reported_by에 제거된 소스를 병합합니다.
+
+    Args:
+        scraped_data: {섹션 이름: 기사 리스트} (안전 및 기상 관제는 그대로 유지)
+        registry: 우선순위 조회용 소스 레지스트리 (None이면 전역 레지스트리)
+        max_distance: 근사 중복 최대 해밍 거리
+
+    Returns:
+        (중복 제거된 데이터, DedupReport) — 섹션 순서는 입력 순서 유지
+    """
+    if registry is None:
+        registry = get_registry()
+
+    order = [name for name in registry.translation_order() if name in scraped_data]
+    order += [name for name in scraped_data if name not in order and name != SAFETY_SECTION]
+
+    report = DedupReport()
+    by_url: Dict[str, _Seen] = {}
+    index = NearDuplicateIndex(max_distance)
+    kept: Dict[str, List[Dict]] = {}
+
+    for source_name in order:
+        kept[source_name] = []
+        for article in scraped_data.get(source_name) or []:
+            report.total += 1
+            url_key = canonicalize_url(article.get("url", ""))
+            fingerprint = simhash(f"{article.get('title', '')} {article.get('content', '')}")
+
+            # 1차: 정규화 URL 완전 일치, 2차: SimHash 근사 일치
+            match = by_url.get(url_key) if url_key else None
+            reason, distance = "url", 0
+            if match is None and fingerprint:
+                found = index.find(fingerprint)
+                if found:
+                    match, distance = found
+                    reason = "simhash"
+
+            if match is not None:
+                record = DuplicateRecord(
+                    source=source_name,
+                    title=article.get("title", ""),
+                    url=article.get("url", ""),
+                    winner_source=match.source,
+                    winner_title=match.article.get("title", ""),
+                    winner_url=match.article.get("url", ""),
+                    reason=reason,
+                    distance=distance,
+                )
+                report.duplicates.append(record)
+                match.article.setdefault("also_reported_by", []).append(
+                    {"source": source_name, "url": record.url}
+                )
+                logger.info(
+                    f"중복 기사 제거 ({reason}, 거리 {distance}): "
+                    f"{source_name} → {match.source} 채택 | {record.title}"
+                )
+                continue
+
+            seen = _Seen(source=source_name, article=article, fingerprint=fingerprint)
+            if url_key:
+                by_url[url_key] = seen
+            if fingerprint:
+                index.add(seen)
+            kept[source_name].append(article)
+
+    # 원래 섹션 순서 유지 (안전 섹션 포함)
+    result = {
+        name: (kept[name] if name in kept else articles)
+        for name, articles in scraped_data.items()
+    }
+    logger.info(report.summary())
+    return result, report
+
+
+def save_dedup_report(report: DedupReport, output_path: str) -> bool:
+    """
+    중복 제거 결과를 YAML로 저장 (어떤 소스가 채택되었는지 기록)
+
+    Args:
+        report: 중복 제거 결과
+        output_path: 출력 파일 경로
+
+    Returns:
+        성공 여부
+    """
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        yaml.dump(
+            report.to_dict(), f, allow_unicode=True, default_flow_style=False, sort_keys=False
+        )
+    logger.info(f"중복 제거 기록 저장 완료: {output_path}")
+    return True
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+소스 병렬 수집 엔진
+- 목적: 모든 뉴스/안전 소스를 동시에 수집하여 지연 시간을 sum(source) → max(source)로 단축
+- 기능: 제한된 스레드 풀 실행, 호스트별 동시 요청 제한, 소스별 소요 시간 측정,
+        전체 마감 시간(deadline) 초과 소스 취소 및 부분 결과 반환
+"""
+
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from today_vn_news.logger import logger
+
+
+# 마감 후 실행 중인 소스가 협조적으로 종료되기를 기다리는 시간 (초)
+DEFAULT_GRACE = 5.0
+
+
+class DeadlineExceeded(requests.RequestException):
+    """수집 마감 시간 초과 (재시도하지 않음)"""
+
+
+@dataclass
+class SourceResult:
+    """소스 하나의 수집 결과"""
+
+    name: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """예외 없이 완료되었는지 여부"""
+        return self.error is None
+
+    @property
+    def status(self) -> str:
+        """수집 상태 (ok | failed | timeout)"""
+        if self.timed_out:
+            return "timeout"
+        return "ok" if self.ok else "failed"
+
+
+class HostLimiter:
+    """
+    호스트별 동시 요청 수 제한.
+
+    같은 호스트(vnexpress.net 등)에 여러 피드를 동시에 요청할 때
+    서버에 과도한 부하를 주지 않도록 세마포어로 제한합니다.
+
+    Example:
+        >>> limiter = HostLimiter(per_host=2)
+        >>> with limiter.limit("https://vnexpress.net/rss/thoi-su.rss"):
+        ...     pass
+    """
+
+    def __init__(self, per_host: int = 2):
+        self.per_host = per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, per_host: int) -> None:
+        """
+        호스트별 제한값 변경 (이미 생성된 세마포어는 초기화)
+
+        Args:
+            per_host: 호스트당 최대 동시 요청 수
+        """
+        with self._lock:
+            self.per_host = max(1, per_host)
+            self._semaphores.clear()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """
+        URL의 호스트 슬롯을 점유하는 컨텍스트 매니저
+
+        Args:
+            url: 요청 URL
+        """
+        host = urlsplit(url).hostname or ""
+        semaphore = self._semaphore(host)
+        with semaphore:
+            yield
+
+
+# 전역 호스트 제한기 (scraper._fetch_url에서 사용)
+host_limiter = HostLimiter()
+
+
+# 현재 스레드에서 수집 중인 소스 이름과 마감 시각 (소스별 취소 토큰)
+_current = threading.local()
+
+
+def current_source() -> Optional[str]:
+    """현재 스레드에서 실행 중인 소스 이름 (run_sources 밖이면 None)"""
+    return getattr(_current, "name", None)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    현재 소스의 마감까지 남은 시간
+
+    Returns:
+        남은 시간(초, 음수면 초과) 또는 None (마감 없음)
+    """
+    expires = getattr(_current, "expires", None)
+    if expires is None:
+        return None
+    return expires - time.perf_counter()
+
+
+def clamp_timeout(timeout: float) -> float:
+    """
+    요청 타임아웃을 남은 마감 시간으로 제한
+
+    Args:
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        적용할 타임아웃 (초)
+
+    Raises:
+        DeadlineExceeded: 이미 마감 시간이 지난 경우 (새 요청 시작 금지)
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded(f"수집 마감 시간 초과: {current_source()}")
+    return min(timeout, remaining)
+
+
+def _run_timed(name: str, func: Callable[[], Any], expires: Optional[float] = None) -> SourceResult:
+    _current.name = name
+    _current.expires = expires
+    start = time.perf_counter()
+    try:
+        value = func()
+        return SourceResult(name=name, value=value, elapsed=time.perf_counter() - start)
+    except Exception as e:
+        return SourceResult(name=name, error=e, elapsed=time.perf_counter() - start)
+    finally:
+        _current.name = None
+        _current.expires = None
+
+
+def run_sources(
+    tasks: Dict[str, Callable[[], Any]],
+    max_workers: int = 8,
+    deadline: Optional[float] = None,
+    executor: Optional[Executor] = None,
+    grace: float = DEFAULT_GRACE,
+) -> Dict[str, SourceResult]:
+    """
+    소스 수집 함수들을 스레드 풀에서 동시에 실행
+
+    Args:
+        tasks: {소스 이름: 인자 없는 수집 함수} (삽입 순서가 결과 순서)
+        max_workers: 최대 동시 실행 스레드 수
+        deadline: 전체 수집 마감 시간 (초, None이면 제한 없음)
+        executor: 외부 실행기 (예: 재파싱용 ProcessPoolExecutor, 종료는 호출 측 담당).
+            None이면 max_workers 스레드 풀 생성. 프로세스 실행기는 tasks가 pickle 가능해야 함
+        grace: 마감 후 실행 중인 소스의 종료를 기다리는 시간 (초)
+
+    Returns:
+        {소스 이름: SourceResult} (tasks와 같은 순서)
+
+    Note:
+        개별 소스의 예외는 SourceResult.error에 담겨 반환되며,
+        다른 소스의 수집을 중단시키지 않습니다. 마감 시간까지 끝나지 않은 소스는
+        timed_out 결과로 반환됩니다. 실행 중인 소스는 요청 타임아웃이 마감 시각으로
+        제한되고 마감 후 새 요청·청크 수신이 DeadlineExceeded로 중단되므로, grace초
+        동안 종료를 기다린 뒤 반환합니다 (호출 측 마무리 저장과 겹치지 않도록).
+    """
+    if not tasks:
+        return {}
+
+    start = time.perf_counter()
+    expires = start + deadline if deadline else None
+    workers = max(1, min(max_workers, len(tasks)))
+
+    owned = executor is None
+    if owned:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape")
+    futures = {
+        name: executor.submit(_run_timed, name, func, expires) for name, func in tasks.items()
+    }
+    done, pending = wait(futures.values(), timeout=deadline)
+
+    results = {}
+    for name, future in futures.items():
+        if future in done:
+            results[name] = future.result()
+            continue
+        future.cancel()
+        results[name] = SourceResult(
+            name=name,
+            error=DeadlineExceeded(f"수집 마감 시간({deadline:.0f}초) 초과: {name}"),
+            elapsed=time.perf_counter() - start,
+            timed_out=True,
+        )
+    # 마감을 넘긴 소스가 협조적으로 종료되기를 유예 시간만큼 대기 (결과는 timeout 유지)
+    stragglers = wait(pending, timeout=grace).not_done if pending else set()
+    if owned:
+        executor.shutdown(wait=not stragglers, cancel_futures=True)
+
+    wall_time = time.perf_counter() - start
+    total_time = sum(r.elapsed for r in results.values())
+
+    for result in results.values():
+        status = "완료" if result.ok else f"실패 ({result.error})"
+        logger.info(f"[수집 시간] {result.name}: {result.elapsed:.2f}초 - {status}")
+    logger.info(
+        f"병렬 수집 완료: 소스 {len(results)}개, 소요 {wall_time:.2f}초 "
+        f"(순차 실행 시 {total_time:.2f}초)"
+    )
+    if pending:
+        logger.warning(f"수집 마감 시간 초과로 {len(pending)}개 소스 중단")
+    if stragglers:
+        logger.warning(f"유예 시간({grace:.0f}초) 후에도 {len(stragglers)}개 소스 실행 중 (결과는 사용하지 않음)")
+
+    return results
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+RSS 스트리밍 파싱 엔진
+- 목적: 피드 스크래퍼마다 복사된 ET.fromstring + channel/item 탐색 + pubDate 정규식 처리를 하나로 통합
+- 기능: iterparse 기반 점진적 파싱, 시간대 인식 pubDate, 당일 기사 N개 확보 시 조기 종료,
+        Google News 사이트맵(news:publication_date) 파싱
+"""
+
+import io
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import IO, Callable, Iterable, Iterator, List, Optional, Union
+
+# 베트남 표준시 (UTC+7)
+VN_TZ = timezone(timedelta(hours=7), "ICT")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@dataclass
+class FeedItem:
+    """RSS item 하나"""
+
+    title: str
+    link: str
+    description: str
+    pub_date: Optional[datetime]  # 시간대 포함 (파싱 실패 시 None)
+    raw_pub_date: str = ""
+
+    @property
+    def local_date(self) -> Optional[date]:
+        """베트남 시간 기준 발행일"""
+        if self.pub_date is None:
+            return None
+        return self.pub_date.astimezone(VN_TZ).date()
+
+
+def parse_pub_date(text: str) -> Optional[datetime]:
+    """
+    RFC 822 pubDate 파싱 (시간대 포함)
+
+    Args:
+        text: pubDate 문자열 (예: "Wed, 11 Feb 2026 18:38:41 +0700")
+
+    Returns:
+        시간대 포함 datetime (시간대 없으면 베트남 시간으로 간주), 실패 시 None
+    """
+    if not text:
+        return None
+    try:
+        parsed = parsedate_to_datetime(text.strip())
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=VN_TZ)
+    return parsed
+
+
+def parse_iso_datetime(text: str) -> Optional[datetime]:
+    """
+    W3C Datetime(ISO 8601) 파싱 (사이트맵 news:publication_date)
+
+    Args:
+        text: 날짜 문자열 (예: "2026-02-11T17:21:16+07:00", "2026-02-11")
+
+    Returns:
+        시간대 포함 datetime (시간대 없으면 베트남 시간으로 간주), 실패 시 None
+    """
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=VN_TZ)
+    return parsed
+
+
+def strip_tags(text: str, replacement: str = "") -> str:
+    """HTML 태그 제거"""
+    return _TAG_RE.sub(replacement, text or "")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_feed_items(source: Union[bytes, str, IO[bytes]]) -> Iterator[FeedItem]:
+    """
+    RSS 문서를 점진적으로 파싱하여 item을 순서대로 반환
+
+    item 요소가 닫힐 때마다 FeedItem을 만들고 요소를 비워 메모리를 회수합니다.
+    호출 측에서 순회를 멈추면 나머지 문서는 파싱하지 않습니다.
+
+    Args:
+        source: XML 본문 (bytes/str) 또는 바이너리 파일 객체 (StreamedBody 포함)
+
+    Yields:
+        FeedItem
+
+    Raises:
+        xml.etree.ElementTree.ParseError: 잘못된 XML (최대 바이트에서 잘린 스트림은 제외)
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    try:
+        for _, elem in ET.iterparse(source, events=("end",)):
+            if _local_name(elem.tag) != "item":
+                continue
+
+            fields = {"title": "", "link": "", "description": "", "pubDate": ""}
+            for child in elem:
+                name = _local_name(child.tag)
+                if name in fields and not fields[name]:
+                    fields[name] = child.text or ""
+
+            yield FeedItem(
+                title=fields["title"],
+                link=fields["link"].strip(),
+                description=fields["description"],
+                pub_date=parse_pub_date(fields["pubDate"]),
+                raw_pub_date=fields["pubDate"],
+            )
+            elem.clear()
+    except ET.ParseError:
+        # StreamedBody가 max_bytes에서 잘렸으면 그 전에 닫힌 item까지만 사용
+        if not getattr(source, "truncated", False):
+            raise
+
+
+def iter_sitemap_items(source: Union[bytes, str, IO[bytes]]) -> Iterator[FeedItem]:
+    """
+    Google News 사이트맵(urlset)을 점진적으로 파싱하여 url 항목을 순서대로 반환
+
+    loc → link, news:title → title, news:publication_date → pub_date로 옮기고
+    요약이 없으므로 description은 비워 둡니다.
+
+    Args:
+        source: XML 본문 (bytes/str) 또는 바이너리 파일 객체 (StreamedBody 포함)
+
+    Yields:
+        FeedItem
+
+    Raises:
+        xml.etree.ElementTree.ParseError: 잘못된 XML (최대 바이트에서 잘린 스트림은 제외)
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    try:
+        for _, elem in ET.iterparse(source, events=("end",)):
+            if _local_name(elem.tag) != "url":
+                continue
+
+            fields = {"loc": "", "title": "", "publication_date": ""}
+            for child in elem.iter():
+                if "sitemap-image" in child.tag:  # image:title 등은 제외
+                    continue
+                name = _local_name(child.tag)
+                if name in fields and not fields[name]:
+                    fields[name] = (child.text or "").strip()
+
+            yield FeedItem(
+                title=fields["title"],
+                link=fields["loc"],
+                description="",
+                pub_date=parse_iso_datetime(fields["publication_date"]),
+                raw_pub_date=fields["publication_date"],
+            )
+            elem.clear()
+    except ET.ParseError:
+        if not getattr(source, "truncated", False):
+            raise
+
+
+def select_items(
+    items: Iterable[FeedItem],
+    target_date: Optional[date] = None,
+    limit: Optional[int] = None,
+    include_undated: bool = False,
+    stop_at_older: bool = True,
+) -> List[FeedItem]:
+    """
+    기준일 item 선택 (조기 종료)
+
+    Args:
+        items: FeedItem 이터러블 (최신순 가정)
+        target_date: 기준일 (None이면 날짜 필터 없음)
+        limit: 최대 item 수 (None이면 제한 없음)
+        include_undated: pubDate 파싱 실패 item 포함 여부
+        stop_at_older: 기준일보다 오래된 item을 만나면 순회 종료
+
+    Returns:
+        선택된 FeedItem 리스트
+    """
+    selected: List[FeedItem] = []
+    if limit is not None and limit <= 0:
+        return selected
+
+    for item in items:
+        if target_date is not None:
+            item_date = item.local_date
+            if item_date is None:
+                if not include_undated:
+                    continue
+            elif item_date < target_date:
+                if stop_at_older:
+                    break
+                continue
+            elif item_date != target_date:
+                continue
+
+        selected.append(item)
+        if limit is not None and len(selected) >= limit:
+            break
+
+    return selected
+
+
+def parse_feed(
+    source: Union[bytes, str, IO[bytes]],
+    target_date: Optional[date] = None,
+    limit: Optional[int] = None,
+    include_undated: bool = False,
+    stop_at_older: bool = True,
+) -> List[FeedItem]:
+    """
+    RSS 문서에서 기준일 item을 최대 limit개 추출
+
+    Args:
+        source: XML 본문 또는 바이너리 파일 객체
+        target_date: 기준일 (None이면 날짜 필터 없음)
+        limit: 최대 item 수
+        include_undated: pubDate 파싱 실패 item 포함 여부
+        stop_at_older: 기준일보다 오래된 item에서 파싱 종료
+
+    Returns:
+        FeedItem 리스트
+    """
+    return select_items(
+        iter_feed_items(source),
+        target_date=target_date,
+        limit=limit,
+        include_undated=include_undated,
+        stop_at_older=stop_at_older,
+    )
+
+
+def parse_news_sitemap(
+    source: Union[bytes, str, IO[bytes]],
+    target_date: Optional[date] = None,
+    limit: Optional[int] = None,
+    predicate: Optional[Callable[[FeedItem], bool]] = None,
+) -> List[FeedItem]:
+    """
+    Google News 사이트맵에서 기준일 기사를 최대 limit개 추출
+
+    사이트맵은 정렬 순서가 보장되지 않으므로 오래된 항목에서 멈추지 않고,
+    limit개를 확보하면 종료합니다. 제목 없는 항목은 제외합니다.
+
+    Args:
+        source: XML 본문 또는 바이너리 파일 객체
+        target_date: 기준일 (None이면 날짜 필터 없음)
+        limit: 최대 기사 수
+        predicate: 추가 필터 (예: 카테고리 URL)
+
+    Returns:
+        FeedItem 리스트
+    """
+    items = (
+        item
+        for item in iter_sitemap_items(source)
+        if item.title and item.link and (predicate is None or predicate(item))
+    )
+    return select_items(items, target_date=target_date, limit=limit, stop_at_older=False)
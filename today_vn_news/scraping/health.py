@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+호스트별 서킷 브레이커 및 소스 상태 점수판
+- 목적: 다운된 사이트(nhandan.vn, igp-vast.vn 등)에 매일 3회 × 타임아웃을 낭비하지 않도록 방지
+- 기능: 호스트별 closed/open/half-open 서킷 브레이커(실행 간 유지),
+        호스트·소스별 p50/p95 지연·실패율·바이트 기록, 과거 지연 기반 적응형 타임아웃,
+        느리거나 불안정한 소스를 수집 순서 뒤로 배치
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from today_vn_news.logger import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 호스트/소스별로 보관할 최근 표본 수
+SAMPLE_WINDOW = 50
+OUTCOME_WINDOW = 30
+
+
+class CircuitOpenError(requests.RequestException):
+    """서킷이 열린 호스트로의 요청 (재시도하지 않고 즉시 실패)"""
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    최근접 순위 백분위수
+
+    Args:
+        values: 표본
+        q: 0~100
+
+    Returns:
+        백분위수 (표본이 없으면 0.0)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class HostHealth:
+    """호스트 하나의 브레이커 상태와 요청 통계"""
+
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    requests: int = 0
+    failures: int = 0
+    bytes: int = 0
+    probing: bool = False  # half-open 탐색 요청 진행 중 (저장하지 않음)
+
+    def to_dict(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_at": self.opened_at,
+            "latencies": [round(v, 3) for v in self.latencies],
+            "requests": self.requests,
+            "failures": self.failures,
+            "bytes": self.bytes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "HostHealth":
+        return cls(
+            state=data.get("state", CLOSED),
+            consecutive_failures=data.get("consecutive_failures", 0),
+            opened_at=data.get("opened_at", 0.0),
+            latencies=list(data.get("latencies", [])),
+            requests=data.get("requests", 0),
+            failures=data.get("failures", 0),
+            bytes=data.get("bytes", 0),
+        )
+
+
+@dataclass
+class SourceHealth:
+    """소스 하나의 실행별 수집 통계"""
+
+    durations: List[float] = field(default_factory=list)
+    outcomes: List[bool] = field(default_factory=list)
+    bytes: int = 0  # 현재 실행에서 받은 바이트 (기록 시 last_bytes로 이동)
+    last_bytes: int = 0
+
+    @property
+    def p50(self) -> float:
+        return percentile(self.durations, 50)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.durations, 95)
+
+    @property
+    def failure_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def to_dict(self) -> Dict:
+        return {
+            "durations": [round(v, 3) for v in self.durations],
+            "outcomes": self.outcomes,
+            "last_bytes": self.last_bytes,
+            "p50": round(self.p50, 3),
+            "p95": round(self.p95, 3),
+            "failure_rate": round(self.failure_rate, 3),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SourceHealth":
+        return cls(
+            durations=list(data.get("durations", [])),
+            outcomes=list(data.get("outcomes", [])),
+            last_bytes=data.get("last_bytes", 0),
+        )
+
+
+def _append(values: List, value, window: int) -> None:
+    values.append(value)
+    del values[:-window]
+
+
+class HealthBoard:
+    """
+    호스트 서킷 브레이커 + 소스 상태 점수판 (스레드 안전, JSON 파일로 실행 간 유지).
+
+    - closed: 정상. 연속 실패가 failure_threshold에 도달하면 open
+    - open: 요청 즉시 실패(CircuitOpenError). cooldown 경과 후 half-open
+    - half-open: 탐색 요청 1건만 허용, 성공 시 closed / 실패 시 바로 open
+
+    Example:
+        >>> health_board.configure(path="data/scrape_health.json")
+        >>> health_board.before_request("nhandan.vn")   # open이면 CircuitOpenError
+        >>> health_board.record_request("nhandan.vn", 0.8, 52_000, ok=True)
+        >>> health_board.save()
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        enabled: bool = False,
+        failure_threshold: int = 3,
+        cooldown: float = 1800.0,
+        timeout_multiplier: float = 3.0,
+        min_timeout: float = 3.0,
+        min_samples: int = 5,
+    ):
+        self.path = Path(path) if path else None
+        self.enabled = enabled
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.timeout_multiplier = timeout_multiplier
+        self.min_timeout = min_timeout
+        self.min_samples = min_samples
+        self.hosts: Dict[str, HostHealth] = {}
+        self.sources: Dict[str, SourceHealth] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        path: str,
+        enabled: bool = True,
+        failure_threshold: int = 3,
+        cooldown: float = 1800.0,
+        timeout_multiplier: float = 3.0,
+        min_timeout: float = 3.0,
+    ) -> None:
+        """설정 변경 및 저장된 상태 로드"""
+        with self._lock:
+            self.path = Path(path)
+            self.enabled = enabled
+            self.failure_threshold = max(1, failure_threshold)
+            self.cooldown = cooldown
+            self.timeout_multiplier = timeout_multiplier
+            self.min_timeout = min_timeout
+            self.hosts = {}
+            self.sources = {}
+        if enabled:
+            self.load()
+
+    def _host(self, host: str) -> HostHealth:
+        health = self.hosts.get(host)
+        if health is None:
+            health = self.hosts[host] = HostHealth()
+        return health
+
+    def _source(self, name: str) -> SourceHealth:
+        health = self.sources.get(name)
+        if health is None:
+            health = self.sources[name] = SourceHealth()
+        return health
+
+    # ------------------------------------------------------------------
+    # 서킷 브레이커
+    # ------------------------------------------------------------------
+
+    def before_request(self, host: str) -> None:
+        """
+        요청 허용 여부 확인 (open → cooldown 경과 시 half-open 전환)
+
+        Args:
+            host: 요청 호스트
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있거나 half-open 탐색 요청이 진행 중일 때
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            health = self._host(host)
+            if health.state == OPEN:
+                if time.time() - health.opened_at < self.cooldown:
+                    raise CircuitOpenError(f"서킷 열림: {host} (연속 실패 {health.consecutive_failures}회)")
+                health.state = HALF_OPEN
+                health.probing = False
+                logger.info(f"서킷 half-open: {host} (탐색 요청 1건 허용)")
+            if health.state == HALF_OPEN:
+                if health.probing:
+                    raise CircuitOpenError(f"서킷 half-open 탐색 중: {host}")
+                health.probing = True
+
+    def release(self, host: str) -> None:
+        """
+        결과를 집계하지 않고 half-open 탐색 슬롯만 반납
+
+        수집 마감으로 잘린 요청처럼 호스트 상태와 무관하게 끝난 요청에 사용
+
+        Args:
+            host: 요청 호스트
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._host(host).probing = False
+
+    def record_request(self, host: str, elapsed: float, nbytes: int, ok: bool, source: Optional[str] = None) -> None:
+        """
+        요청 결과 기록 (브레이커 상태 전이 포함)
+
+        Args:
+            host: 요청 호스트
+            elapsed: 소요 시간 (초)
+            nbytes: 응답 바이트 수
+            ok: 성공 여부 (네트워크 오류·타임아웃·5xx는 실패)
+            source: 요청을 보낸 소스 이름 (바이트 집계용)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            health = self._host(host)
+            health.requests += 1
+            health.bytes += nbytes
+            health.probing = False
+            if source:
+                self._source(source).bytes += nbytes
+
+            if ok:
+                _append(health.latencies, elapsed, SAMPLE_WINDOW)
+                if health.state != CLOSED:
+                    logger.info(f"서킷 닫힘: {host} (요청 성공)")
+                health.state = CLOSED
+                health.consecutive_failures = 0
+                return
+
+            health.failures += 1
+            health.consecutive_failures += 1
+            reopen = health.state == HALF_OPEN
+            if reopen or (health.state == CLOSED and health.consecutive_failures >= self.failure_threshold):
+                health.state = OPEN
+                health.opened_at = time.time()
+                logger.warning(f"서킷 열림: {host} (연속 실패 {health.consecutive_failures}회)")
+
+    def record_bytes(self, host: str, nbytes: int, source: Optional[str] = None) -> None:
+        """
+        스트리밍 본문 바이트 추가 기록 (응답 헤더 수신 시점에 record_request 호출 후)
+
+        Args:
+            host: 요청 호스트
+            nbytes: 읽은 본문 바이트 수
+            source: 요청을 보낸 소스 이름
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._host(host).bytes += nbytes
+            if source:
+                self._source(source).bytes += nbytes
+
+    def state_of(self, host: str) -> str:
+        """호스트 브레이커 상태"""
+        with self._lock:
+            health = self.hosts.get(host)
+            return health.state if health else CLOSED
+
+    def timeout_for(self, host: str, default: float) -> float:
+        """
+        적응형 타임아웃 (과거 p95 지연 × 배수, min_timeout ~ default 범위)
+
+        Args:
+            host: 요청 호스트
+            default: 설정된 타임아웃 (상한)
+
+        Returns:
+            적용할 타임아웃 (초)
+        """
+        if not self.enabled:
+            return default
+        with self._lock:
+            health = self.hosts.get(host)
+            if health is None or len(health.latencies) < self.min_samples:
+                return default
+            adaptive = percentile(health.latencies, 95) * self.timeout_multiplier
+        return max(self.min_timeout, min(default, adaptive))
+
+    # ------------------------------------------------------------------
+    # 소스 점수판
+    # ------------------------------------------------------------------
+
+    def record_source(self, name: str, elapsed: float, ok: bool) -> None:
+        """
+        소스 수집 결과 기록 (실행당 1회)
+
+        Args:
+            name: 소스 이름
+            elapsed: 수집 소요 시간 (초)
+            ok: 성공 여부
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            health = self._source(name)
+            _append(health.durations, elapsed, OUTCOME_WINDOW)
+            _append(health.outcomes, ok, OUTCOME_WINDOW)
+            health.last_bytes, health.bytes = health.bytes, 0
+
+    def schedule(self, names: Iterable[str]) -> List[str]:
+        """
+        수집 순서 결정 (실패율 높은 소스 → p95 느린 소스 순으로 뒤에 배치, 동률은 기존 순서)
+
+        Args:
+            names: 소스 이름 (설정 순서)
+
+        Returns:
+            수집 순서
+        """
+        names = list(names)
+        if not self.enabled:
+            return names
+        with self._lock:
+            def key(name: str):
+                health = self.sources.get(name)
+                if health is None:
+                    return (0.0, 0.0)
+                return (round(health.failure_rate, 1), round(health.p95, 1))
+
+            return sorted(names, key=key)
+
+    def report(self) -> List[str]:
+        """소스별 점수판 요약 (로그용)"""
+        with self._lock:
+            return [
+                f"{name}: p50 {h.p50:.2f}초, p95 {h.p95:.2f}초, "
+                f"실패율 {h.failure_rate:.0%}, {h.last_bytes / 1024:.0f}KB"
+                for name, h in self.sources.items()
+            ]
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        """저장된 상태 로드 (파일 없거나 손상되면 빈 상태)"""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"상태 점수판 로드 실패 ({self.path}): {e}")
+            return
+        with self._lock:
+            self.hosts = {k: HostHealth.from_dict(v) for k, v in data.get("hosts", {}).items()}
+            self.sources = {k: SourceHealth.from_dict(v) for k, v in data.get("sources", {}).items()}
+
+    def save(self) -> None:
+        """상태 저장 (임시 파일 후 원자적 교체)"""
+        if not self.enabled or self.path is None:
+            return
+        with self._lock:
+            data = {
+                "updated": time.time(),
+                "hosts": {k: v.to_dict() for k, v in self.hosts.items()},
+                "sources": {k: v.to_dict() for k, v in self.sources.items()},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+# 전역 점수판 (scrape_and_save에서 설정, _conditional_get에서 사용)
+health_board = HealthBoard()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+HTML 추출 레이어
+- 목적: 대형 뉴스 홈페이지에서 필요한 기사 노드만 빠르게 파싱
+- 기능: lxml 백엔드 자동 선택 (미설치 시 html.parser), SoupStrainer 부분 파싱, 소스별 파싱 시간 기록
+"""
+
+import time
+from typing import Optional, Sequence
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from today_vn_news.logger import logger
+
+try:
+    import lxml  # noqa: F401
+
+    DEFAULT_BACKEND = "lxml"
+except ImportError:
+    DEFAULT_BACKEND = "html.parser"
+
+
+def parse_html(
+    markup: str | bytes,
+    parse_only: Optional[SoupStrainer] = None,
+    source: str = "",
+    backend: Optional[str] = None,
+) -> BeautifulSoup:
+    """
+    HTML 파싱 (부분 파싱 + 소요 시간 로깅)
+
+    Args:
+        markup: HTML 본문
+        parse_only: 파싱할 요소 필터 (None이면 전체 문서)
+        source: 로그에 표시할 소스 이름
+        backend: 파서 백엔드 (None이면 DEFAULT_BACKEND)
+
+    Returns:
+        BeautifulSoup 객체
+    """
+    backend = backend or DEFAULT_BACKEND
+    start = time.perf_counter()
+    soup = BeautifulSoup(markup, backend, parse_only=parse_only)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    mode = "부분 파싱" if parse_only is not None else "전체 파싱"
+    logger.info(f"[파싱 시간] {source or 'HTML'}: {elapsed_ms:.1f}ms ({backend}, {mode})")
+    return soup
+
+
+def parse_first_match(
+    markup: str | bytes,
+    strainers: Sequence[SoupStrainer],
+    source: str = "",
+    backend: Optional[str] = None,
+) -> Optional[BeautifulSoup]:
+    """
+    셀렉터 폴백 순서대로 부분 파싱하여 요소가 있는 첫 결과 반환
+
+    기존 `soup.find_all("article") or soup.select(...)` 폴백을
+    전체 문서 파싱 없이 수행합니다.
+
+    Args:
+        markup: HTML 본문
+        strainers: 우선순위 순 SoupStrainer 목록
+        source: 로그에 표시할 소스 이름
+        backend: 파서 백엔드
+
+    Returns:
+        요소가 하나 이상 있는 BeautifulSoup (모두 비어 있으면 None)
+    """
+    for strainer in strainers:
+        soup = parse_html(markup, parse_only=strainer, source=source, backend=backend)
+        if soup.find(True) is not None:
+            return soup
+    return None
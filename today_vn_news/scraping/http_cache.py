@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+HTTP 조건부 GET 디스크 캐시
+- 목적: 같은 날짜 재실행/추가 에디션 실행 시 변경되지 않은 피드/홈페이지 재다운로드 방지
+- 기능: ETag/Last-Modified 저장, If-None-Match/If-Modified-Since 재검증, 소스별 TTL, 적중/미스 통계,
+        스트리밍 조기 종료 본문은 partial로 표시하여 저장 (스트리밍 요청에만 재사용)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from today_vn_news.logger import logger
+
+# 캐시에 보존할 응답 헤더
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+
+@dataclass
+class CachedResponse:
+    """디스크에 저장된 응답"""
+
+    url: str
+    body: bytes
+    headers: Dict[str, str]
+    encoding: Optional[str]
+    stored_at: float
+    partial: bool = False  # 스트리밍 조기 종료로 본문 앞부분만 저장
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified")
+
+    def age(self) -> float:
+        """저장 후 경과 시간 (초)"""
+        return time.time() - self.stored_at
+
+    def validators(self) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        validators = {}
+        if self.etag:
+            validators["If-None-Match"] = self.etag
+        if self.last_modified:
+            validators["If-Modified-Since"] = self.last_modified
+        return validators
+
+    def to_response(self) -> requests.Response:
+        """requests.Response로 복원 (스크래퍼 코드 변경 없이 사용)"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.reason = "OK (cache)"
+        return response
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중/미스 카운터"""
+
+    fresh_hits: int = 0  # TTL 이내, 네트워크 요청 없음
+    revalidated: int = 0  # 304 Not Modified
+    misses: int = 0  # 200 전체 다운로드
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, kind: str) -> None:
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+    @property
+    def hits(self) -> int:
+        return self.fresh_hits + self.revalidated
+
+    def reset(self) -> None:
+        with self._lock:
+            self.fresh_hits = self.revalidated = self.misses = 0
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        ratio = (self.hits / total * 100) if total else 0.0
+        return (
+            f"HTTP 캐시: 적중 {self.hits}회 (TTL {self.fresh_hits}, 304 {self.revalidated}), "
+            f"미스 {self.misses}회, 적중률 {ratio:.0f}%"
+        )
+
+
+class HttpCache:
+    """
+    URL 단위 조건부 GET 캐시.
+
+    응답 본문과 검증자(ETag/Last-Modified)를 cache_dir에 저장합니다.
+    TTL 이내 응답은 요청 없이 반환하고, TTL이 지나면 조건부 요청으로
+    재검증하여 304 응답 시 저장된 본문을 재사용합니다.
+
+    Args:
+        cache_dir: 캐시 디렉토리 (기본값: data/http_cache)
+        default_ttl: 규칙에 없는 URL의 TTL (초, 0이면 항상 재검증)
+        ttl_rules: {URL prefix(스킴 제외): TTL 초} (가장 긴 prefix 우선)
+        enabled: 비활성화 시 항상 네트워크 요청
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "data/http_cache",
+        default_ttl: int = 0,
+        ttl_rules: Optional[Dict[str, int]] = None,
+        enabled: bool = True,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.default_ttl = default_ttl
+        self.ttl_rules = dict(ttl_rules or {})
+        self.enabled = enabled
+        self.stats = CacheStats()
+
+    def configure(
+        self,
+        cache_dir: str,
+        default_ttl: int,
+        ttl_rules: Dict[str, int],
+        enabled: bool,
+    ) -> None:
+        """설정 변경 및 통계 초기화"""
+        self.cache_dir = Path(cache_dir)
+        self.default_ttl = default_ttl
+        self.ttl_rules = dict(ttl_rules or {})
+        self.enabled = enabled
+        self.stats.reset()
+
+    def ttl_for(self, url: str) -> int:
+        """
+        URL에 적용할 TTL 조회
+
+        Args:
+            url: 요청 URL
+
+        Returns:
+            TTL (초)
+        """
+        parts = urlsplit(url)
+        target = f"{parts.hostname or ''}{parts.path}"
+        if target.startswith("www."):
+            target = target[4:]
+
+        best_prefix = ""
+        ttl = self.default_ttl
+        for prefix, rule_ttl in self.ttl_rules.items():
+            if target.startswith(prefix) and len(prefix) > len(best_prefix):
+                best_prefix = prefix
+                ttl = rule_ttl
+        return ttl
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """
+        저장된 응답 조회
+
+        Args:
+            url: 요청 URL (쿼리 포함)
+
+        Returns:
+            CachedResponse 또는 None (캐시 없음/손상)
+        """
+        if not self.enabled:
+            return None
+
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        digest = meta.get("sha256")
+        if digest and digest != hashlib.sha256(body).hexdigest():
+            return None  # 동시 저장으로 다른 응답의 본문과 짝지어진 메타데이터 (검증자 재사용 금지)
+
+        return CachedResponse(
+            url=meta["url"],
+            body=body,
+            headers=meta.get("headers", {}),
+            encoding=meta.get("encoding"),
+            stored_at=meta.get("stored_at", 0.0),
+            partial=meta.get("partial", False),
+        )
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """TTL 이내 응답인지 여부"""
+        ttl = self.ttl_for(entry.url)
+        return ttl > 0 and entry.age() < ttl
+
+    def store(self, url: str, response: requests.Response, partial: bool = False) -> None:
+        """
+        200 응답 저장 (임시 파일 작성 후 교체)
+
+        Args:
+            url: 요청 URL (쿼리 포함)
+            response: 저장할 응답
+            partial: 본문 앞부분만 받은 스트리밍 응답 여부 (검증자는 그대로 저장)
+        """
+        if not self.enabled or response.status_code != 200:
+            return
+
+        headers = {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers}
+        self._write(url, response.content, headers, response.encoding, partial)
+
+    def touch(self, entry: CachedResponse, response: Optional[requests.Response] = None) -> None:
+        """
+        304 재검증 후 저장 시각 갱신 (새 검증자가 있으면 반영)
+
+        Args:
+            entry: 재검증된 캐시 항목
+            response: 304 응답 (선택 사항)
+        """
+        if response is not None:
+            for key in ("ETag", "Last-Modified"):
+                if key in response.headers:
+                    entry.headers[key] = response.headers[key]
+        self._write(entry.url, entry.body, entry.headers, entry.encoding, entry.partial)
+
+    def _write(
+        self, url: str, body: bytes, headers: Dict[str, str], encoding: Optional[str], partial: bool = False
+    ) -> None:
+        meta_path, body_path = self._paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            meta = {
+                "url": url,
+                "headers": headers,
+                "encoding": encoding,
+                "stored_at": time.time(),
+                "partial": partial,
+                "sha256": hashlib.sha256(body).hexdigest(),
+            }
+            # 본문 먼저, 메타데이터(검증자) 마지막 교체. 스레드별 임시 파일 이름은 겹치지 않게 uuid 사용
+            for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode("utf-8"))):
+                tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"HTTP 캐시 저장 실패: {url} ({e})")
+
+
+# 전역 HTTP 캐시 (scraper._fetch_url에서 사용)
+http_cache = HttpCache()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+원본 페이지 보관소 (콘텐츠 주소 저장)
+- 목적: 선택자 버그 수정 후 지난 날짜의 기사를 재수집 없이 다시 추출
+- 기능: 수집한 본문을 SHA-256 주소의 압축 객체로 저장(zstd, 미설치 시 gzip, 같은 본문은 1회),
+        기준일별 색인(URL/소스/객체 주소), 색인으로 재생 아카이브 구성(reparse)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+from today_vn_news.logger import logger
+from today_vn_news.scraping.engine import current_source
+from today_vn_news.scraping.replay import ReplayEntry
+
+try:
+    import zstandard
+
+    DEFAULT_CODEC = "zst"
+except ImportError:
+    zstandard = None
+    DEFAULT_CODEC = "gz"
+
+# 색인에 보존할 응답 헤더 (재생 시 인코딩 판별용)
+_KEPT_HEADERS = ("Content-Type",)
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zst":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zst":
+        if zstandard is None:
+            raise RuntimeError("zstd 객체를 읽으려면 zstandard 패키지가 필요합니다 (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class PageStore:
+    """
+    원본 페이지 보관소 (objects/ab/<sha256>.zst + index/<기준일>.jsonl).
+
+    begin()부터 end()까지 record()로 받은 본문을 저장합니다. 본문은 내용 해시로
+    저장하므로 매일 바뀌지 않는 피드/재실행 본문은 색인 줄만 추가됩니다.
+    같은 URL이 여러 번 기록되면 마지막 기록을 사용합니다.
+
+    Args:
+        root: 보관소 디렉토리
+        enabled: 저장 여부
+
+    Example:
+        >>> page_store.begin("2026-02-11")
+        >>> scrape_and_save(...)
+        >>> page_store.end()
+        >>> entries = page_store.load("2026-02-11")  # {URL: [ReplayEntry]}
+    """
+
+    def __init__(self, root: str = "data/raw_pages", enabled: bool = True, codec: str = DEFAULT_CODEC):
+        self.root = Path(root)
+        self.enabled = enabled
+        self.codec = codec
+        self.date_str: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def configure(self, root: str, enabled: bool = True) -> None:
+        """
+        보관소 경로/활성화 설정
+
+        Args:
+            root: 보관소 디렉토리
+            enabled: 저장 여부
+        """
+        self.root = Path(root)
+        self.enabled = enabled
+
+    @property
+    def active(self) -> bool:
+        """현재 수집 본문을 저장 중인지 여부"""
+        return self.enabled and self.date_str is not None
+
+    def begin(self, date_str: str) -> None:
+        """
+        기준일 저장 시작 (비활성화 상태면 무시)
+
+        Args:
+            date_str: 기준일 (YYYY-MM-DD)
+        """
+        if self.enabled:
+            self.date_str = date_str
+
+    def end(self) -> None:
+        """저장 종료"""
+        self.date_str = None
+
+    def _object_path(self, digest: str, codec: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.{codec}"
+
+    def _index_path(self, date_str: str) -> Path:
+        return self.root / "index" / f"{date_str}.jsonl"
+
+    def put(self, body: bytes) -> str:
+        """
+        본문 객체 저장 (이미 있으면 건너뜀)
+
+        Args:
+            body: 원본 바이트
+
+        Returns:
+            SHA-256 주소 (hex)
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest, self.codec)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_bytes(_compress(body, self.codec))
+        os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+        본문 객체 읽기 (저장 시 코덱과 무관하게 zst/gz 모두 조회)
+
+        Args:
+            digest: SHA-256 주소
+
+        Returns:
+            원본 바이트
+
+        Raises:
+            FileNotFoundError: 객체 없음
+        """
+        for codec in (self.codec, "zst", "gz"):
+            path = self._object_path(digest, codec)
+            if path.exists():
+                return _decompress(path.read_bytes(), codec)
+        raise FileNotFoundError(f"원본 페이지 객체 없음: {digest}")
+
+    def record(self, url: str, response: requests.Response, complete: bool = True) -> None:
+        """
+        수집한 본문 저장 + 색인 추가 (저장 중이 아니거나 오류 응답이면 무시)
+
+        Args:
+            url: 요청 URL (쿼리 포함, 재생 키)
+            response: 최종 응답 (캐시 응답 포함)
+            complete: 본문 전체 여부 (스트리밍 조기 종료면 False)
+        """
+        date_str = self.date_str
+        if not self.enabled or date_str is None or response.status_code >= 400:
+            return
+        try:
+            digest = self.put(response.content or b"")
+            entry = {
+                "url": url,
+                "source": current_source(),
+                "sha256": digest,
+                "status": response.status_code,
+                "encoding": response.encoding,
+                "headers": {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers},
+                "complete": complete,
+                "fetched_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            index_path = self._index_path(date_str)
+            with self._lock:
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(index_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"원본 페이지 저장 실패 ({url}): {e}")
+
+    def index(self, date_str: str) -> List[Dict]:
+        """
+        기준일 색인 읽기
+
+        Args:
+            date_str: 기준일 (YYYY-MM-DD)
+
+        Returns:
+            색인 항목 리스트 (기록 순서, 색인이 없으면 빈 리스트)
+        """
+        path = self._index_path(date_str)
+        if not path.exists():
+            return []
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def load(self, date_str: str) -> Dict[str, List[ReplayEntry]]:
+        """
+        기준일 색인을 재생 아카이브 형식으로 로드 (URL별 마지막 기록)
+
+        Args:
+            date_str: 기준일 (YYYY-MM-DD)
+
+        Returns:
+            {URL: [ReplayEntry]} (HttpReplay.start_replay_entries 입력)
+        """
+        latest = {entry["url"]: entry for entry in self.index(date_str)}
+        entries: Dict[str, List[ReplayEntry]] = {}
+        for url, entry in latest.items():
+            try:
+                body = self.get(entry["sha256"])
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"원본 페이지 로드 실패 ({url}): {e}")
+                continue
+            entries[url] = [
+                ReplayEntry(
+                    url=url,
+                    status=entry.get("status", 200),
+                    headers=entry.get("headers", {}),
+                    encoding=entry.get("encoding"),
+                    body=body,
+                )
+            ]
+        return entries
+
+
+# 전역 보관소 (scrape_and_save에서 설정, scraper HTTP 헬퍼에서 기록)
+page_store = PageStore()
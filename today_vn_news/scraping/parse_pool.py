@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+HTML 파싱 프로세스 풀
+- 목적: 수집이 병렬화된 뒤 남는 CPU 작업(BeautifulSoup 파싱, clean_text NFKC 정규화)이
+        GIL 때문에 코어 하나에 묶이는 문제 해소
+- 기능: 받은 본문을 ProcessPoolExecutor에서 파싱·추출·정규화하고 기사 딕셔너리만 반환,
+        비활성화(processes=0) 시 호출 스레드에서 그대로 실행
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from today_vn_news.logger import logger
+from today_vn_news.scraping.engine import DeadlineExceeded, current_source, remaining_time
+
+
+class ParsePool:
+    """
+    HTML 추출 함수 실행기 (스레드 안전, 프로세스 풀은 첫 사용 시 생성).
+
+    추출 함수와 인자(본문 문자열, 기준일, SourceSpec)는 pickle 가능해야 하며
+    반환값(기사 딕셔너리 리스트)만 프로세스 간에 전달됩니다.
+
+    Args:
+        processes: 프로세스 수 (0이면 호출 스레드에서 실행)
+
+    Example:
+        >>> parse_pool.configure(4)
+        >>> articles = parse_pool.run(_extract_nhandan, markup, date_str, source)
+        >>> parse_pool.shutdown()
+    """
+
+    def __init__(self, processes: int = 0):
+        self.processes = max(0, processes)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.processes > 0
+
+    def configure(self, processes: int) -> None:
+        """
+        프로세스 수 변경 (실행 중인 풀은 종료 후 다음 사용 시 재생성)
+
+        Args:
+            processes: 프로세스 수 (0이면 비활성화)
+        """
+        self.shutdown()
+        self.processes = max(0, processes)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.processes)
+            return self._executor
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        추출 함수 실행 (풀 활성 시 별도 프로세스, 소스 마감 시간까지 대기)
+
+        Args:
+            func: 모듈 최상위 추출 함수
+            *args: 추출 함수 인자
+
+        Returns:
+            추출 함수 반환값
+
+        Raises:
+            DeadlineExceeded: 소스 마감 시간 안에 파싱이 끝나지 않은 경우
+        """
+        if not self.enabled:
+            return func(*args)
+
+        try:
+            future = self._pool().submit(func, *args)
+        except (BrokenProcessPool, RuntimeError) as e:
+            logger.warning(f"파싱 프로세스 풀 사용 불가, 현재 스레드에서 파싱: {e}")
+            self.shutdown()
+            return func(*args)
+
+        remaining = remaining_time()
+        try:
+            return future.result(timeout=max(0.0, remaining) if remaining is not None else None)
+        except FutureTimeoutError:
+            future.cancel()
+            raise DeadlineExceeded(f"수집 마감 시간 초과 (파싱 중): {current_source()}")
+        except BrokenProcessPool as e:
+            logger.warning(f"파싱 프로세스 비정상 종료, 현재 스레드에서 다시 파싱: {e}")
+            self.shutdown()
+            return func(*args)
+
+    def shutdown(self) -> None:
+        """풀 종료 (대기 중인 작업 취소)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# 전역 파싱 풀 (scrape_and_save에서 config.parse_processes로 설정)
+parse_pool = ParsePool()
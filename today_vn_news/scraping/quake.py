@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+지진 정보 관련성 필터
+- 목적: IGP-VAST 피드의 당일 지진을 위치와 무관하게 모두 방송하지 않도록 방지
+- 기능: 설명문에서 규모/위도/경도/깊이 추출, 설정 도시까지의 대원 거리 일괄 계산(NumPy),
+        거리별 최소 규모 기준을 넘는 지진만 유지
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+# 가장 가까운 도시까지 거리(km) 이내 → 최소 규모 (마지막 구간 밖은 마지막 규모 적용)
+DEFAULT_RULES: List[Tuple[float, float]] = [
+    (100.0, 2.5),
+    (300.0, 4.0),
+    (1000.0, 5.5),
+    (20000.0, 7.0),
+]
+
+_NUMBER = r"(-?\d+(?:[.,]\d+)?)"
+_MAGNITUDE_RE = re.compile(
+    r"(?:magnitude|độ lớn|cường độ|\bM[LSWw]?)\s*(?:of|là|\(M\))?\s*[:=]?\s*" + _NUMBER, re.IGNORECASE
+)
+_LAT_RES = (
+    re.compile(r"(?:latitude|vĩ độ)\D{0,15}?" + _NUMBER, re.IGNORECASE),
+    re.compile(_NUMBER + r"\s*°?\s*(?:độ\s*)?(?:vĩ\s*(?:độ\s*)?)?(?:N\b|North|Bắc)", re.IGNORECASE),
+)
+_LON_RES = (
+    re.compile(r"(?:longitude|kinh độ)\D{0,15}?" + _NUMBER, re.IGNORECASE),
+    re.compile(_NUMBER + r"\s*°?\s*(?:độ\s*)?(?:kinh\s*(?:độ\s*)?)?(?:E\b|East|Đông)", re.IGNORECASE),
+)
+_DEPTH_RE = re.compile(r"(?:depth|độ sâu)\D{0,15}?" + _NUMBER + r"\s*km", re.IGNORECASE)
+
+
+@dataclass
+class QuakeEvent:
+    """설명문에서 추출한 지진 정보 (추출 실패 항목은 None)"""
+
+    magnitude: Optional[float] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    depth_km: Optional[float] = None
+
+    @property
+    def located(self) -> bool:
+        """규모와 좌표를 모두 추출했는지 여부"""
+        return None not in (self.magnitude, self.latitude, self.longitude)
+
+
+def _search(patterns, text: str) -> Optional[float]:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return float(match.group(1).replace(",", "."))
+    return None
+
+
+def parse_quake(text: str) -> QuakeEvent:
+    """
+    지진 설명문에서 규모/위도/경도/깊이 추출 (영문·베트남어 표기)
+
+    Args:
+        text: 태그 제거된 설명문 (예: "magnitude 4.1 ... 15.21N, 108.05E, depth 10 km")
+
+    Returns:
+        QuakeEvent
+    """
+    return QuakeEvent(
+        magnitude=_search((_MAGNITUDE_RE,), text),
+        latitude=_search(_LAT_RES, text),
+        longitude=_search(_LON_RES, text),
+        depth_km=_search((_DEPTH_RE,), text),
+    )
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    대원 거리 (브로드캐스팅: 지진 N개 × 도시 M개를 한 번에 계산)
+
+    Args:
+        lat1, lon1: 위도/경도 배열 (도)
+        lat2, lon2: 위도/경도 배열 (도)
+
+    Returns:
+        거리 배열 (km)
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def relevant_mask(
+    events: Sequence[QuakeEvent],
+    locations: Sequence[Dict],
+    rules: Sequence[Tuple[float, float]] = DEFAULT_RULES,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    거리별 최소 규모 기준으로 방송할 지진 선택
+
+    규모·좌표를 추출하지 못한 지진은 판단할 수 없으므로 유지합니다.
+
+    Args:
+        events: 지진 목록
+        locations: [{'name', 'latitude', 'longitude'}] 도시 목록
+        rules: [(거리 km 이내, 최소 규모)] (거리 오름차순)
+
+    Returns:
+        (유지 여부, 가장 가까운 도시 인덱스, 그 거리 km) 배열 — 좌표가 없으면 거리 NaN
+    """
+    count = len(events)
+    if count == 0 or not locations:
+        return np.ones(count, dtype=bool), np.zeros(count, dtype=int), np.full(count, np.nan)
+
+    lat = np.array([np.nan if e.latitude is None else e.latitude for e in events])
+    lon = np.array([np.nan if e.longitude is None else e.longitude for e in events])
+    magnitude = np.array([np.nan if e.magnitude is None else e.magnitude for e in events])
+    city_lat = np.array([loc["latitude"] for loc in locations], dtype=float)
+    city_lon = np.array([loc["longitude"] for loc in locations], dtype=float)
+
+    distances = haversine_km(lat[:, None], lon[:, None], city_lat[None, :], city_lon[None, :])
+    located = ~(np.isnan(lat) | np.isnan(lon) | np.isnan(magnitude))
+    nearest = np.where(located, np.argmin(np.nan_to_num(distances, nan=np.inf), axis=1), 0)
+    nearest_km = np.where(located, distances[np.arange(count), nearest], np.nan)
+
+    limits = np.array([limit for limit, _ in rules], dtype=float)
+    thresholds = np.array([minimum for _, minimum in rules], dtype=float)
+    rule_index = np.minimum(np.searchsorted(limits, np.nan_to_num(nearest_km), side="left"), len(rules) - 1)
+    keep = ~located | (np.nan_to_num(magnitude) >= thresholds[rule_index])
+    return keep, nearest, nearest_km
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+선언형 소스 레지스트리
+- 목적: 뉴스/안전 소스 목록을 config.yaml 한 곳에서 관리 (스크래핑·번역 순서 공용)
+- 기능: 소스별 URL·파서 유형·셀렉터·수집 한도·우선순위·타임아웃·활성화 설정,
+        활성화된 소스의 스크래퍼만 지연 import
+"""
+
+import importlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import yaml
+
+from today_vn_news.logger import logger
+from today_vn_news.exceptions import TodayVnNewsError
+
+SAFETY_SECTION = "안전 및 기상 관제"
+
+SOURCE_TYPES = ("rss", "html", "api")
+SOURCE_GROUPS = ("news", "safety")
+PRIORITIES = ("P0", "P1", "P2")
+
+# 파서 유형별 기본 스크래퍼 (scraper 미지정 시)
+DEFAULT_SCRAPERS = {
+    "rss": "today_vn_news.scraper:scrape_rss_source",
+}
+
+# 프로젝트 기본 설정 파일 (지정한 설정 파일 또는 scraper.sources가 없을 때 사용)
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[2] / "config.yaml"
+
+
+@dataclass
+class SourceSpec:
+    """소스 하나의 선언형 설정"""
+
+    key: str
+    name: str
+    scraper: str  # "모듈:함수" 경로 (지연 import)
+    type: str = "html"
+    group: str = "news"
+    urls: List[Tuple[str, str]] = field(default_factory=list)  # [(라벨, URL)]
+    selectors: Dict[str, Any] = field(default_factory=dict)
+    params: Dict[str, Any] = field(default_factory=dict)
+    limit: Optional[int] = None  # 소스 전체 최대 기사 수
+    per_feed_limit: Optional[int] = None  # RSS 피드별 최대 기사 수
+    scan_limit: Optional[int] = None  # HTML 후보 요소 검사 수
+    max_bytes: Optional[int] = None  # 스트리밍 수집 최대 바이트 (None이면 기본값)
+    sitemap: Optional[str] = None  # Google News 사이트맵 URL (HTML보다 먼저 시도)
+    result_ttl: Optional[int] = None  # 수집 결과 재사용 시간 (초, 안전 데이터 캐시)
+    priority: str = "P2"
+    timeout: int = 10
+    enabled: bool = True
+
+    @classmethod
+    def from_dict(cls, key: str, data: Dict[str, Any]) -> "SourceSpec":
+        """
+        설정 딕셔너리 → SourceSpec 변환
+
+        Args:
+            key: 소스 식별자
+            data: 소스 설정 (urls는 URL 리스트 또는 {라벨: URL} 매핑)
+
+        Returns:
+            SourceSpec
+
+        Raises:
+            TodayVnNewsError: 필수 항목 누락 또는 잘못된 값
+        """
+        data = dict(data or {})
+        source_type = data.get("type", "html")
+        group = data.get("group", "news")
+        priority = data.get("priority", "P2")
+
+        if source_type not in SOURCE_TYPES:
+            raise TodayVnNewsError(f"소스 {key}: 알 수 없는 type '{source_type}'")
+        if group not in SOURCE_GROUPS:
+            raise TodayVnNewsError(f"소스 {key}: 알 수 없는 group '{group}'")
+        if priority not in PRIORITIES:
+            raise TodayVnNewsError(f"소스 {key}: 알 수 없는 priority '{priority}'")
+
+        scraper = data.get("scraper") or DEFAULT_SCRAPERS.get(source_type)
+        if not scraper:
+            raise TodayVnNewsError(f"소스 {key}: {source_type} 유형은 scraper 지정 필요")
+
+        name = data.get("name", key)
+        raw_urls = data.get("urls") or ([data["url"]] if data.get("url") else [])
+        if isinstance(raw_urls, dict):
+            urls = [(str(label), url) for label, url in raw_urls.items()]
+        else:
+            urls = [(name, url) for url in raw_urls]
+
+        return cls(
+            key=key,
+            name=name,
+            scraper=scraper,
+            type=source_type,
+            group=group,
+            urls=urls,
+            selectors=data.get("selectors", {}) or {},
+            params=data.get("params", {}) or {},
+            limit=data.get("limit"),
+            per_feed_limit=data.get("per_feed_limit"),
+            scan_limit=data.get("scan_limit"),
+            max_bytes=data.get("max_bytes"),
+            sitemap=data.get("sitemap"),
+            result_ttl=data.get("result_ttl"),
+            priority=priority,
+            timeout=data.get("timeout", 10),
+            enabled=data.get("enabled", True),
+        )
+
+    @property
+    def url(self) -> str:
+        """대표 URL (첫 번째 URL)"""
+        return self.urls[0][1] if self.urls else ""
+
+    @property
+    def hosts(self) -> List[str]:
+        """소스가 요청하는 호스트 목록 (중복 제거)"""
+        hosts = []
+        for _, url in self.urls + ([("sitemap", self.sitemap)] if self.sitemap else []):
+            host = urlsplit(url).hostname
+            if host and host not in hosts:
+                hosts.append(host)
+        return hosts
+
+    def load_scraper(self) -> Callable:
+        """
+        스크래퍼 함수 지연 import
+
+        Returns:
+            scraper(date_str, source=spec) 형태의 호출 가능 객체
+
+        Raises:
+            TodayVnNewsError: 모듈 또는 함수를 찾을 수 없을 때
+        """
+        module_name, _, func_name = self.scraper.partition(":")
+        try:
+            module = importlib.import_module(module_name)
+            return getattr(module, func_name)
+        except (ImportError, AttributeError) as e:
+            raise TodayVnNewsError(f"소스 {self.key}: 스크래퍼 로드 실패 ({self.scraper}): {e}")
+
+
+class SourceRegistry:
+    """
+    소스 레지스트리.
+
+    설정 순서가 원본 YAML 섹션 순서이며, 번역 순서는 우선순위(P0 → P2)로
+    안정 정렬한 순서입니다. 비활성화된 소스는 목록에서 제외되어
+    스크래퍼 모듈도 import되지 않습니다.
+
+    Example:
+        >>> registry = SourceRegistry.from_yaml()
+        >>> [spec.name for spec in registry.enabled("news")]
+    """
+
+    def __init__(self, sources: List[SourceSpec]):
+        self.sources = list(sources)
+
+        names = [spec.name for spec in self.enabled()]
+        duplicates = {name for name in names if names.count(name) > 1}
+        if duplicates:
+            raise TodayVnNewsError(f"활성 소스 이름 중복: {', '.join(sorted(duplicates))}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[str, Any]]) -> "SourceRegistry":
+        """
+        {소스 키: 설정} 매핑으로 레지스트리 생성
+
+        Args:
+            data: 소스 설정 매핑 (삽입 순서 유지)
+
+        Returns:
+            SourceRegistry
+        """
+        return cls([SourceSpec.from_dict(key, spec) for key, spec in data.items()])
+
+    @classmethod
+    def default(cls) -> "SourceRegistry":
+        """기본 소스 레지스트리 (프로젝트 config.yaml의 scraper.sources)"""
+        return cls.from_dict(load_source_configs())
+
+    @classmethod
+    def from_yaml(cls, path: str = "config.yaml") -> "SourceRegistry":
+        """
+        YAML 설정 로딩 (scraper.sources 섹션)
+
+        Args:
+            path: 설정 파일 경로
+
+        Returns:
+            SourceRegistry (파일 또는 섹션이 없으면 기본 소스)
+
+        Raises:
+            TodayVnNewsError: YAML 파싱 실패 또는 잘못된 소스 설정
+        """
+        if not Path(path).exists():
+            logger.warning(f"설정 파일 없음 ({path}), 기본 소스 사용")
+            return cls.default()
+
+        sources = _read_sources(Path(path))
+        if not sources:
+            return cls.default()
+        return cls.from_dict(sources)
+
+    def enabled(self, group: Optional[str] = None) -> List[SourceSpec]:
+        """
+        활성화된 소스 목록 (설정 순서)
+
+        Args:
+            group: "news" 또는 "safety" (None이면 전체)
+
+        Returns:
+            SourceSpec 리스트
+        """
+        return [
+            spec for spec in self.sources
+            if spec.enabled and (group is None or spec.group == group)
+        ]
+
+    def get(self, name: str) -> Optional[SourceSpec]:
+        """
+        활성 소스 이름(섹션 이름)으로 조회
+
+        Args:
+            name: 소스 이름
+
+        Returns:
+            SourceSpec 또는 None
+        """
+        for spec in self.enabled():
+            if spec.name == name:
+                return spec
+        return None
+
+    def hosts(self) -> List[str]:
+        """활성 소스가 요청하는 호스트 목록 (DNS 예열용)"""
+        hosts = []
+        for spec in self.enabled():
+            for host in spec.hosts:
+                if host not in hosts:
+                    hosts.append(host)
+        return hosts
+
+    def priority_of(self, name: str) -> str:
+        """
+        섹션 우선순위 조회
+
+        Args:
+            name: 섹션 이름
+
+        Returns:
+            "P0"/"P1"/"P2" (안전 섹션은 P0, 미등록 소스는 P2)
+        """
+        if name == SAFETY_SECTION:
+            return "P0"
+        spec = self.get(name)
+        return spec.priority if spec else "P2"
+
+    def translation_order(self) -> List[str]:
+        """뉴스 섹션 번역 순서 (우선순위 안정 정렬)"""
+        news = self.enabled("news")
+        return [spec.name for spec in sorted(news, key=lambda s: PRIORITIES.index(s.priority))]
+
+
+_registry: Optional[SourceRegistry] = None
+
+
+def get_registry() -> SourceRegistry:
+    """
+    전역 소스 레지스트리 반환 (최초 호출 시 config.yaml에서 로드)
+
+    Returns:
+        SourceRegistry
+    """
+    global _registry
+    if _registry is None:
+        _registry = SourceRegistry.from_yaml()
+    return _registry
+
+
+def default_source(key: str) -> SourceSpec:
+    """
+    전역 레지스트리의 소스 설정 조회 (스크래퍼를 직접 호출할 때 사용, 비활성 소스 포함)
+
+    Args:
+        key: 소스 키 (config.yaml scraper.sources의 키)
+
+    Returns:
+        SourceSpec
+
+    Raises:
+        TodayVnNewsError: 등록되지 않은 소스 키
+    """
+    for spec in get_registry().sources:
+        if spec.key == key:
+            return spec
+    raise TodayVnNewsError(f"등록되지 않은 소스: {key}")
+
+
+def _read_sources(path: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """설정 파일의 scraper.sources 섹션 (없으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+    except yaml.YAMLError as e:
+        logger.error(f"YAML 파싱 실패: {e}")
+        raise TodayVnNewsError(f"설정 파일 파싱 실패: {e}")
+    return (data.get("scraper", {}) or {}).get("sources") or None
+
+
+def load_source_configs(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    소스 설정 원본 매핑 로드 (소스 정의는 config.yaml에만 둠)
+
+    Args:
+        path: 설정 파일 경로 (None이면 프로젝트 config.yaml)
+
+    Returns:
+        {소스 키: 설정} 매핑 (설정 순서 = 원본 YAML 섹션 순서)
+
+    Raises:
+        TodayVnNewsError: 설정 파일 또는 scraper.sources 섹션이 없을 때
+    """
+    config_path = Path(path) if path else DEFAULT_CONFIG_PATH
+    if not config_path.exists():
+        raise TodayVnNewsError(f"소스 설정 파일 없음: {config_path}")
+    sources = _read_sources(config_path)
+    if not sources:
+        raise TodayVnNewsError(f"소스 설정 없음 (scraper.sources): {config_path}")
+    return sources
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+HTTP 녹화/재생 모드
+- 목적: 라이브 사이트 없이 과거 실행의 페이지로 스크래퍼/파서를 결정적으로 벤치마크
+- 기능: _fetch_url 요청·응답(실패 포함)을 gzip 압축 아카이브로 저장, 아카이브에서 재생,
+        재생 시 고정/녹화 지연 시간 시뮬레이션
+"""
+
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from today_vn_news.logger import logger
+
+ARCHIVE_FORMAT = 1
+
+# 아카이브에 보존할 응답 헤더
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+# 재생 지연 모드: 녹화된 소요 시간 사용
+RECORDED_LATENCY = "recorded"
+
+
+class ReplayMissError(requests.ConnectionError):
+    """
+    재생 아카이브에 없는 URL 요청 (오프라인 네트워크 오류로 취급).
+
+    다시 요청해도 결과가 같으므로 재시도하지 않습니다 (retryable = False, retry.classify_error).
+    """
+
+    retryable = False
+
+
+@dataclass
+class ReplayEntry:
+    """녹화된 요청 하나"""
+
+    url: str
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    encoding: Optional[str] = None
+    body: bytes = b""
+    elapsed: float = 0.0
+    error: Optional[str] = None  # 네트워크 오류 메시지 (응답 없음)
+
+    def to_dict(self) -> Dict:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "encoding": self.encoding,
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "elapsed": round(self.elapsed, 4),
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ReplayEntry":
+        return cls(
+            url=data["url"],
+            status=data.get("status", 200),
+            headers=data.get("headers", {}),
+            encoding=data.get("encoding"),
+            body=base64.b64decode(data.get("body", "")),
+            elapsed=data.get("elapsed", 0.0),
+            error=data.get("error"),
+        )
+
+    def to_response(self) -> requests.Response:
+        """requests.Response로 복원"""
+        response = requests.Response()
+        response.status_code = self.status
+        response.url = self.url
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.reason = "OK (replay)" if self.status < 400 else "Error (replay)"
+        return response
+
+
+class HttpReplay:
+    """
+    HTTP 녹화/재생 컨트롤러.
+
+    녹화 모드에서는 요청마다 최종 응답(또는 네트워크 오류)을 순서대로 기록하고
+    stop() 시 gzip JSON Lines 아카이브로 저장합니다. 재생 모드에서는 같은 URL의
+    기록을 녹화 순서대로 반환하며(재시도 시퀀스 포함), 마지막 기록은 반복 사용합니다.
+
+    Example:
+        >>> http_replay.start_recording("data/replay/260211.jsonl.gz", date_str="2026-02-11")
+        >>> scrape_and_save(...)
+        >>> http_replay.stop()
+        >>> http_replay.start_replay("data/replay/260211.jsonl.gz", latency="recorded")
+    """
+
+    def __init__(self):
+        self.mode = "off"  # off | record | replay
+        self.path: Optional[Path] = None
+        self.date_str: Optional[str] = None
+        self.latency: Union[None, float, str] = None
+        self._entries: Dict[str, List[ReplayEntry]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def start_recording(self, path: str, date_str: Optional[str] = None) -> None:
+        """
+        녹화 시작
+
+        Args:
+            path: 저장할 아카이브 경로 (.jsonl.gz)
+            date_str: 녹화 기준일 (재생 시 같은 날짜로 필터링하기 위해 저장)
+        """
+        with self._lock:
+            self.mode = "record"
+            self.path = Path(path)
+            self.date_str = date_str
+            self._entries = {}
+            self._cursor = {}
+        logger.info(f"HTTP 녹화 시작: {path}")
+
+    def start_replay(self, path: str, latency: Union[None, float, str] = None) -> None:
+        """
+        재생 시작
+
+        Args:
+            path: 아카이브 경로
+            latency: 요청당 지연 (None: 없음, 초 단위 숫자: 고정, "recorded": 녹화된 소요 시간)
+        """
+        entries, date_str = load_archive(path)
+        self.start_replay_entries(entries, date_str, latency=latency, label=str(path))
+        self.path = Path(path)
+
+    def start_replay_entries(
+        self,
+        entries: Dict[str, List[ReplayEntry]],
+        date_str: Optional[str],
+        latency: Union[None, float, str] = None,
+        label: str = "메모리",
+    ) -> None:
+        """
+        로드된 응답으로 재생 시작 (원본 페이지 보관소 재파싱 등)
+
+        Args:
+            entries: {URL: [ReplayEntry]}
+            date_str: 기준일
+            latency: 요청당 지연 (start_replay와 동일)
+            label: 로그에 표시할 출처
+        """
+        with self._lock:
+            self.mode = "replay"
+            self.path = None
+            self.date_str = date_str
+            self.latency = latency
+            self._entries = entries
+            self._cursor = {}
+        total = sum(len(v) for v in entries.values())
+        logger.info(f"HTTP 재생 시작: {label} ({len(entries)}개 URL, {total}개 응답, 기준일 {date_str})")
+
+    def stop(self) -> Optional[Path]:
+        """
+        녹화/재생 종료 (녹화 중이면 아카이브 저장)
+
+        Returns:
+            저장된 아카이브 경로 (녹화 모드가 아니면 None)
+        """
+        with self._lock:
+            mode, self.mode = self.mode, "off"
+            entries = self._entries
+        if mode != "record" or self.path is None:
+            return None
+        save_archive(self.path, entries, self.date_str)
+        total = sum(len(v) for v in entries.values())
+        logger.info(f"HTTP 녹화 저장 완료: {self.path} ({total}개 응답)")
+        return self.path
+
+    def record(self, url: str, response: requests.Response, elapsed: float) -> None:
+        """
+        응답 기록 (녹화 모드가 아니면 무시)
+
+        Args:
+            url: 요청 URL (쿼리 포함)
+            response: 최종 응답
+            elapsed: 소요 시간 (초)
+        """
+        if not self.recording:
+            return
+        entry = ReplayEntry(
+            url=url,
+            status=response.status_code,
+            headers={k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers},
+            encoding=response.encoding,
+            body=response.content,
+            elapsed=elapsed,
+        )
+        with self._lock:
+            self._entries.setdefault(url, []).append(entry)
+
+    def record_error(self, url: str, error: requests.RequestException, elapsed: float) -> None:
+        """
+        요청 실패 기록 (HTTP 오류는 상태 코드, 네트워크 오류는 메시지)
+
+        Args:
+            url: 요청 URL
+            error: 발생한 예외
+            elapsed: 소요 시간 (초)
+        """
+        if not self.recording:
+            return
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            self.record(url, error.response, elapsed)
+            return
+        entry = ReplayEntry(url=url, status=0, elapsed=elapsed, error=f"{type(error).__name__}: {error}")
+        with self._lock:
+            self._entries.setdefault(url, []).append(entry)
+
+    def serve(self, url: str) -> requests.Response:
+        """
+        녹화된 응답 반환 (녹화 순서대로, 지연 시뮬레이션 포함)
+
+        Args:
+            url: 요청 URL (쿼리 포함)
+
+        Returns:
+            재구성된 Response
+
+        Raises:
+            ReplayMissError: 아카이브에 없는 URL (재시도하지 않음)
+            requests.ConnectionError: 녹화된 네트워크 오류 (녹화 당시처럼 재시도 대상)
+            requests.HTTPError: 녹화된 HTTP 오류 응답
+        """
+        with self._lock:
+            entries = self._entries.get(url)
+            if not entries:
+                raise ReplayMissError(f"재생 아카이브에 없는 URL: {url}")
+            index = self._cursor.get(url, 0)
+            self._cursor[url] = index + 1
+            entry = entries[min(index, len(entries) - 1)]
+
+        if self.latency == RECORDED_LATENCY:
+            time.sleep(entry.elapsed)
+        elif self.latency:
+            time.sleep(float(self.latency))
+
+        if entry.error:
+            raise requests.ConnectionError(f"녹화된 네트워크 오류 ({url}): {entry.error}")
+
+        response = entry.to_response()
+        response.raise_for_status()
+        return response
+
+
+def save_archive(path: Path, entries: Dict[str, List[ReplayEntry]], date_str: Optional[str]) -> None:
+    """
+    아카이브 저장 (첫 줄 메타데이터 + 응답별 JSON Lines, gzip, 원자적 교체)
+
+    Args:
+        path: 아카이브 경로
+        entries: {URL: [ReplayEntry]}
+        date_str: 녹화 기준일
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        meta = {"format": ARCHIVE_FORMAT, "date": date_str, "created": time.time()}
+        f.write(json.dumps(meta) + "\n")
+        for url_entries in entries.values():
+            for entry in url_entries:
+                f.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+
+
+def load_archive(path: str) -> tuple[Dict[str, List[ReplayEntry]], Optional[str]]:
+    """
+    아카이브 로드
+
+    Args:
+        path: 아카이브 경로
+
+    Returns:
+        ({URL: [ReplayEntry]}, 녹화 기준일)
+
+    Raises:
+        FileNotFoundError: 아카이브 없음
+        ValueError: 지원하지 않는 형식
+    """
+    entries: Dict[str, List[ReplayEntry]] = {}
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        meta = json.loads(f.readline() or "{}")
+        if meta.get("format") != ARCHIVE_FORMAT:
+            raise ValueError(f"지원하지 않는 재생 아카이브 형식: {meta.get('format')}")
+        for line in f:
+            if line.strip():
+                entry = ReplayEntry.from_dict(json.loads(line))
+                entries.setdefault(entry.url, []).append(entry)
+    return entries, meta.get("date")
+
+
+def read_archive_date(path: str) -> Optional[str]:
+    """
+    아카이브 녹화 기준일만 읽기 (응답 본문은 로드하지 않음)
+
+    재생 실행의 YYMMDD 산출물 경로와 완료 마커를 녹화 기준일로 맞추는 데 사용
+
+    Args:
+        path: 아카이브 경로
+
+    Returns:
+        녹화 기준일 (YYYY-MM-DD) 또는 None
+
+    Raises:
+        FileNotFoundError: 아카이브 없음
+        ValueError: 지원하지 않는 형식
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        meta = json.loads(f.readline() or "{}")
+    if meta.get("format") != ARCHIVE_FORMAT:
+        raise ValueError(f"지원하지 않는 재생 아카이브 형식: {meta.get('format')}")
+    return meta.get("date")
+
+
+def parse_latency(value: Optional[str]) -> Union[None, float, str]:
+    """
+    --replay-latency 인자 파싱
+
+    Args:
+        value: "recorded" 또는 초 단위 숫자 문자열
+
+    Returns:
+        RECORDED_LATENCY, float, 또는 None
+    """
+    if not value:
+        return None
+    if value == RECORDED_LATENCY:
+        return RECORDED_LATENCY
+    return float(value)
+
+
+http_replay = HttpReplay()
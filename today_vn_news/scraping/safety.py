@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+안전 데이터 결과 캐시
+- 목적: 기상/공기질(시간 단위 갱신)·지진 정보를 재실행마다 다시 수집하지 않도록 방지
+- 기능: 소스별 TTL(result_ttl)로 파싱된 수집 결과를 JSON 파일에 저장,
+        TTL 이내 재실행은 네트워크 요청·파싱 없이 저장된 결과 사용
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from today_vn_news.logger import logger
+
+
+def is_cacheable(value: Any) -> bool:
+    """
+    캐시할 수집 결과인지 판단
+
+    기상/공기질 스크래퍼는 실패 시 예외 대신 빈 값 딕셔너리를 반환하므로
+    값이 모두 비어 있으면 저장하지 않습니다 (지진 0건 리스트는 정상 결과).
+
+    Args:
+        value: 스크래퍼 반환값
+
+    Returns:
+        저장 여부
+    """
+    if value is None:
+        return False
+    if isinstance(value, dict):
+        return any(value.values())
+    return True
+
+
+class SafetyCache:
+    """
+    소스별 TTL 수집 결과 캐시 (JSON 파일 하나, 메인 스레드에서 사용).
+
+    항목은 기준일과 함께 저장하며, 기준일이 다르거나 TTL이 지나면 무효입니다.
+
+    Args:
+        path: 캐시 파일 경로
+
+    Example:
+        >>> cache = SafetyCache("data/safety_cache.json")
+        >>> cache.put("air_quality", "2026-02-11", {"aqi": "87", ...})
+        >>> cache.get("air_quality", "2026-02-11", ttl=3600)
+        (True, {'aqi': '87', ...})
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"안전 데이터 캐시 로드 실패 ({self.path}): {e}")
+            self._entries = {}
+
+    def get(self, key: str, date_str: str, ttl: float) -> Tuple[bool, Any]:
+        """
+        TTL 이내 결과 조회
+
+        Args:
+            key: 소스 key
+            date_str: 기준일 (YYYY-MM-DD)
+            ttl: 유효 시간 (초)
+
+        Returns:
+            (적중 여부, 수집 결과)
+        """
+        entry = self._entries.get(key)
+        if not entry or entry.get("date") != date_str:
+            return False, None
+        age = time.time() - entry.get("stored_at", 0)
+        if age >= ttl:
+            return False, None
+        return True, entry.get("value")
+
+    def put(self, key: str, date_str: str, value: Any) -> None:
+        """
+        수집 결과 저장 (임시 파일 후 원자적 교체)
+
+        Args:
+            key: 소스 key
+            date_str: 기준일 (YYYY-MM-DD)
+            value: JSON 직렬화 가능한 수집 결과
+        """
+        self._entries[key] = {"date": date_str, "stored_at": time.time(), "value": value}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self._entries, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
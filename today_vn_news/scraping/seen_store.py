@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+방송된 기사 저장소
+- 목적: 며칠씩 홈페이지에 남아 있는 기사를 매일 다시 번역·합성하지 않도록 방지
+- 기능: SQLite(data/)에 URL 해시 + 제목 지문 + 최초 방송일 저장,
+        최근 N일 내 방송된 기사 제외(인덱스 조회), 보관 기간 지난 행 자동 정리
+"""
+
+import hashlib
+import sqlite3
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from today_vn_news.logger import logger
+from today_vn_news.scraping.dedup import canonicalize_url, fold_vietnamese
+from today_vn_news.scraping.registry import SAFETY_SECTION
+
+DEFAULT_PATH = "data/seen_articles.sqlite3"
+DEFAULT_WINDOW_DAYS = 7
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_articles (
+    url_hash TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    source TEXT,
+    title TEXT,
+    first_aired TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_content ON seen_articles (content_hash);
+CREATE INDEX IF NOT EXISTS idx_seen_aired ON seen_articles (first_aired);
+"""
+
+
+def url_hash(url: str) -> str:
+    """정규화 URL 해시 (빈 URL은 빈 문자열)"""
+    canonical = canonicalize_url(url or "")
+    if not canonical:
+        return ""
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def content_hash(title: str) -> str:
+    """
+    제목 지문 (성조 제거·소문자·공백 정규화 후 해시)
+
+    같은 기사가 URL만 바뀌어 다시 노출되는 경우를 잡기 위해 사용합니다.
+
+    Args:
+        title: 기사 제목 (베트남어 원문)
+
+    Returns:
+        16바이트 hex 해시 (빈 제목은 빈 문자열)
+    """
+    folded = " ".join(fold_vietnamese(title or "").split())
+    if not folded:
+        return ""
+    return hashlib.blake2b(folded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _shift(date_str: str, days: int) -> str:
+    return (date.fromisoformat(date_str) + timedelta(days=days)).isoformat()
+
+
+class SeenStore:
+    """
+    방송된 기사 저장소 (SQLite, 스레드 안전).
+
+    기준일보다 이전 N일 안에 방송된 기사만 제외하므로, 같은 날 파이프라인을
+    재실행해도 결과가 바뀌지 않습니다. 조회 전용 경로는 DB 파일이 없으면
+    만들지 않습니다.
+
+    Args:
+        path: SQLite 파일 경로 (":memory:" 가능)
+        window_days: 제외 기간 (일), 이보다 오래된 행은 기록 시 자동 삭제
+
+    Example:
+        >>> store = SeenStore("data/seen_articles.sqlite3", window_days=7)
+        >>> scraped_data = store.filter_scraped(scraped_data, "2026-02-11")
+        >>> store.mark_aired(scraped_data, "2026-02-11")
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, window_days: int = DEFAULT_WINDOW_DAYS):
+        self.path = path
+        self.window_days = window_days
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self, create: bool) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
+        if self.path != ":memory:":
+            db_path = Path(self.path)
+            if not db_path.exists():
+                if not create:
+                    return None
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def first_aired(self, article: Dict, date_str: str) -> Optional[str]:
+        """
+        기준일 이전 제외 기간 내 최초 방송일 조회
+
+        Args:
+            article: 기사 딕셔너리 (url, title)
+            date_str: 기준일 (YYYY-MM-DD)
+
+        Returns:
+            최초 방송일 (YYYY-MM-DD) 또는 None
+        """
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return None
+            return self._lookup(conn, article, date_str)
+
+    def _lookup(self, conn: sqlite3.Connection, article: Dict, date_str: str) -> Optional[str]:
+        keys = (url_hash(article.get("url", "")), content_hash(article.get("title", "")))
+        row = conn.execute(
+            "SELECT first_aired FROM seen_articles"
+            " WHERE (url_hash = ? OR content_hash = ?) AND first_aired >= ? AND first_aired < ?"
+            " LIMIT 1",
+            (keys[0] or None, keys[1] or None, _shift(date_str, -self.window_days), date_str),
+        ).fetchone()
+        return row[0] if row else None
+
+    def filter_scraped(
+        self, scraped_data: Dict[str, List[Dict]], date_str: str
+    ) -> Dict[str, List[Dict]]:
+        """
+        최근 방송된 기사 제외 (안전 및 기상 관제 섹션은 그대로 유지)
+
+        Args:
+            scraped_data: {섹션 이름: 기사 리스트}
+            date_str: 기준일 (YYYY-MM-DD)
+
+        Returns:
+            제외 후 데이터 (섹션 순서 유지)
+        """
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return scraped_data
+
+            result: Dict[str, List[Dict]] = {}
+            skipped = 0
+            for name, articles in scraped_data.items():
+                if name == SAFETY_SECTION or not articles:
+                    result[name] = articles
+                    continue
+                result[name] = []
+                for article in articles:
+                    aired = self._lookup(conn, article, date_str)
+                    if aired:
+                        skipped += 1
+                        logger.info(f"방송된 기사 제외 ({aired}): [{name}] {article.get('title', '')}")
+                        continue
+                    result[name].append(article)
+
+        if skipped:
+            logger.info(f"최근 {self.window_days}일 내 방송된 기사 {skipped}개 제외")
+        return result
+
+    def mark_aired(self, scraped_data: Dict[str, List[Dict]], date_str: str) -> int:
+        """
+        방송 기사 기록 + 보관 기간 지난 행 정리
+
+        이미 기록된 URL은 최초 방송일을 유지합니다. 중복 제거로 합쳐진
+        also_reported_by URL도 같은 지문으로 함께 기록합니다.
+
+        Args:
+            scraped_data: {섹션 이름: 기사 리스트}
+            date_str: 방송일 (YYYY-MM-DD)
+
+        Returns:
+            새로 기록된 행 수
+        """
+        rows: List[Tuple[str, str, str, str, str]] = []
+        for name, articles in scraped_data.items():
+            if name == SAFETY_SECTION:
+                continue
+            for article in articles or []:
+                title = article.get("title", "")
+                fingerprint = content_hash(title)
+                urls = [article.get("url", "")]
+                urls += [other.get("url", "") for other in article.get("also_reported_by", [])]
+                for url in urls:
+                    key = url_hash(url)
+                    if key:
+                        rows.append((key, fingerprint, name, title, date_str))
+
+        with self._lock:
+            conn = self._connect(create=True)
+            with conn:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO seen_articles"
+                    " (url_hash, content_hash, source, title, first_aired) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                added = conn.total_changes - before
+                pruned = conn.execute(
+                    "DELETE FROM seen_articles WHERE first_aired < ?",
+                    (_shift(date_str, -self.window_days),),
+                ).rowcount
+
+        logger.info(f"방송 기사 기록: {added}개 추가, {pruned}개 정리 ({self.path})")
+        return added
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+제한 스트리밍 수집
+- 목적: 기사 5개·요약 200자만 쓰는데 홈페이지/피드 전체를 받아 파싱하는 낭비 제거
+- 기능: stream=True 응답을 청크 단위로 읽는 파일 객체(점진적 파서에 직접 전달),
+        소스별 최대 바이트 제한, 조기 종료 시 절약한 바이트/시간 집계
+- 참고: item 개수로 조기 종료하는 것은 점진적 파서를 쓰는 RSS 피드뿐이며,
+        홈페이지 HTML은 본문 전체를 파싱하므로 최대 바이트 제한만 적용됩니다
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from today_vn_news.logger import logger
+from today_vn_news.scraping.engine import DeadlineExceeded, current_source, remaining_time
+
+# 소스 설정(max_bytes)이 없을 때의 최대 바이트
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+CHUNK_SIZE = 16 * 1024
+
+
+class StreamedBody:
+    """
+    스트리밍 응답 본문 (읽은 만큼만 다운로드하는 바이너리 파일 객체).
+
+    ET.iterparse처럼 read()를 호출하는 점진적 파서에 그대로 넘길 수 있습니다.
+    파서가 필요한 item을 모두 얻어 순회를 멈추면 close()에서 연결을 끊어
+    나머지 본문은 받지 않습니다. max_bytes에 도달하면 그 앞부분까지만 반환하고
+    truncated를 표시합니다. 캐시/재생 응답처럼 본문이 이미 메모리에 있으면
+    같은 인터페이스로 메모리 본문을 읽습니다.
+
+    Args:
+        response: requests 응답 (stream=True 또는 본문 로드 완료)
+        max_bytes: 최대 바이트 (None이면 제한 없음)
+        chunk_size: 청크 크기
+        on_close: 닫을 때 호출할 콜백 (인자: StreamedBody)
+
+    Example:
+        >>> with StreamedBody(response, max_bytes=512 * 1024) as body:
+        ...     items = parse_feed(body, target_date, limit=5)
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        chunk_size: int = CHUNK_SIZE,
+        on_close: Optional[Callable[["StreamedBody"], None]] = None,
+    ):
+        self.response = response
+        self.max_bytes = max_bytes
+        self.live = response.raw is not None
+        self.truncated = False  # max_bytes에서 잘림
+        self.complete = False  # 본문 끝까지 읽음
+        self.closed = False
+        self.failed = False  # 수신/파싱 중 예외로 종료 (받은 본문이 불완전할 수 있음)
+        self.started = time.perf_counter()
+        self._on_close = on_close
+        self._received = bytearray()
+        self._pending = b""
+        if self.live:
+            self._chunks = response.iter_content(chunk_size)
+        else:
+            self._chunks = iter([response.content or b""])
+
+    def __enter__(self) -> "StreamedBody":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.failed = True
+        self.close()
+
+    @property
+    def data(self) -> bytes:
+        """지금까지 받은 본문"""
+        return bytes(self._received)
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Content-Length 헤더 (전송 바이트, 없으면 None)"""
+        try:
+            return int(self.response.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    def wire_bytes(self) -> int:
+        """네트워크에서 읽은 바이트 (압축 전송이면 압축된 크기)"""
+        tell = getattr(self.response.raw, "tell", None) if self.live else None
+        if callable(tell):
+            try:
+                return int(tell())
+            except (TypeError, ValueError, OSError):
+                pass
+        return len(self._received)
+
+    @property
+    def stopped_early(self) -> bool:
+        """본문 끝까지 받기 전에 종료 (조기 종료 또는 바이트 제한)"""
+        return not self.complete
+
+    def _pull(self) -> None:
+        remaining = remaining_time()
+        if self.live and remaining is not None and remaining <= 0:
+            # 마감 시간이 지난 소스는 다음 청크를 받지 않음 (협조적 취소)
+            self.failed = True
+            raise DeadlineExceeded(f"수집 마감 시간 초과 (본문 수신 중): {current_source()}")
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.complete = True
+            return
+        except Exception:
+            self.failed = True
+            raise
+        if self.max_bytes is not None and len(self._received) + len(chunk) > self.max_bytes:
+            chunk = chunk[: max(0, self.max_bytes - len(self._received))]
+            self.truncated = True
+        self._received += chunk
+        self._pending += chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        본문 읽기 (필요한 청크만 다운로드)
+
+        Args:
+            size: 최대 바이트 (음수면 끝 또는 max_bytes까지)
+
+        Returns:
+            읽은 바이트 (끝에 도달하면 b"")
+        """
+        while (size < 0 or len(self._pending) < size) and not (self.complete or self.truncated):
+            self._pull()
+        if size < 0:
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def text(self) -> str:
+        """
+        본문 전체(max_bytes까지)를 문자열로 디코딩
+
+        잘린 본문은 마지막 멀티바이트 문자가 깨질 수 있어 대체 문자로 처리합니다.
+
+        Returns:
+            디코딩된 본문
+        """
+        data = self.read()
+        try:
+            return data.decode(self.response.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return data.decode("utf-8", errors="replace")
+
+    def to_response(self) -> requests.Response:
+        """받은 본문으로 requests.Response 재구성 (캐시 저장/녹화용)"""
+        response = requests.Response()
+        response.status_code = self.response.status_code
+        response.url = self.response.url
+        response._content = self.data
+        response.headers = self.response.headers
+        response.encoding = self.response.encoding
+        response.reason = self.response.reason
+        return response
+
+    def close(self) -> None:
+        """연결 종료 (남은 본문은 받지 않음) 후 콜백 호출"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.live:
+            self.response.close()
+        if self._on_close is not None:
+            self._on_close(self)
+
+
+@dataclass
+class SourceStreamStats:
+    """소스 하나의 스트리밍 수집 통계"""
+
+    fetches: int = 0
+    early_stops: int = 0
+    truncated: int = 0
+    bytes_read: int = 0
+    bytes_saved: int = 0
+    time_saved: float = 0.0
+
+
+@dataclass
+class StreamStats:
+    """소스별 스트리밍 절약 집계 (스레드 안전)"""
+
+    sources: Dict[str, SourceStreamStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, source: str, body: StreamedBody, elapsed: float) -> None:
+        """
+        네트워크 스트리밍 요청 1건 기록
+
+        절약 바이트는 Content-Length - 읽은 바이트, 절약 시간은 읽은 구간의
+        전송 속도로 나머지 바이트를 받는 데 걸렸을 시간으로 추정합니다.
+        Content-Length가 없으면(chunked) 절약량은 집계하지 않습니다.
+
+        Args:
+            source: 소스 이름 (없으면 호스트)
+            body: 닫힌 스트리밍 본문
+            elapsed: 요청 시작부터 종료까지 소요 시간 (초)
+        """
+        read = body.wire_bytes
+        total = body.content_length
+        saved = max(0, total - read) if (total is not None and body.stopped_early) else 0
+        time_saved = elapsed * saved / read if read else 0.0
+        if body.stopped_early:
+            logger.debug(
+                f"스트리밍 조기 종료: {source} {read / 1024:.0f}KB 읽음"
+                + (f" / 전체 {total / 1024:.0f}KB" if total is not None else "")
+                + (" (최대 바이트 도달)" if body.truncated else "")
+            )
+        with self._lock:
+            stats = self.sources.setdefault(source, SourceStreamStats())
+            stats.fetches += 1
+            stats.early_stops += int(body.stopped_early)
+            stats.truncated += int(body.truncated)
+            stats.bytes_read += read
+            stats.bytes_saved += saved
+            stats.time_saved += time_saved
+
+    def reset(self) -> None:
+        with self._lock:
+            self.sources = {}
+
+    def report(self) -> List[str]:
+        """소스별 절약 요약 (로그용)"""
+        with self._lock:
+            return [
+                f"{name}: {s.bytes_read / 1024:.0f}KB 읽음, {s.bytes_saved / 1024:.0f}KB·"
+                f"약 {s.time_saved:.2f}초 절약 (요청 {s.fetches}건 중 조기 종료 {s.early_stops}건"
+                + (f", 최대 바이트 도달 {s.truncated}건" if s.truncated else "")
+                + ")"
+                for name, s in self.sources.items()
+            ]
+
+
+# 전역 집계 (scrape_and_save에서 초기화/출력, _finish_stream에서 기록)
+stream_stats = StreamStats()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+텍스트 정규화 파이프라인
+- 목적: 기사 제목/본문을 한 번만 정제하고 이후 단계에서 재정제 생략
+- 기능: 사전 컴파일 정규식, 단일 translate 테이블 따옴표 제거, 기사 일괄 정규화, normalized 플래그
+"""
+
+import html
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# 정규화 완료 표시 키 (기사 딕셔너리에 추가)
+NORMALIZED_KEY = "normalized"
+
+# 기본 정규화 대상 필드
+TEXT_FIELDS = ("title", "content")
+
+# 홑따옴표 제거 테이블 (', ‘, ’)
+_QUOTE_TABLE = str.maketrans("", "", "'‘’")
+
+# 연속 공백 (개행/탭 포함) → 단일 공백
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def clean_text(text: str) -> str:
+    """
+    텍스트 정제 및 정규화 (저장 전 필수 처리)
+
+    Args:
+        text: 정제할 텍스트
+
+    Returns:
+        정제된 텍스트
+        - 유니코드 정규화 (NFKC)
+        - HTML 엔티티 변환
+        - 홑따옴표(') 제거
+        - 연속된 공백/개행/탭 → 단일 공백
+        - 앞뒤 공백 제거
+    """
+    if not text:
+        return text
+
+    # 유니코드 정규화 (ASCII는 NFKC 결과가 동일하므로 생략)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+
+    # HTML 엔티티 변환
+    if "&" in text:
+        text = html.unescape(text)
+
+    # 홑따옴표 제거 → 공백 정리
+    text = text.translate(_QUOTE_TABLE)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def normalize_article(
+    article: Dict,
+    fields: Sequence[str] = TEXT_FIELDS,
+) -> Dict:
+    """
+    기사 하나의 텍스트 필드 정규화 (이미 정규화된 기사는 그대로 반환)
+
+    Args:
+        article: 기사 딕셔너리 (제자리 수정)
+        fields: 정규화할 필드
+
+    Returns:
+        normalized 플래그가 설정된 기사 딕셔너리
+    """
+    if article.get(NORMALIZED_KEY):
+        return article
+
+    for name in fields:
+        value = article.get(name)
+        if isinstance(value, str):
+            article[name] = clean_text(value)
+    article[NORMALIZED_KEY] = True
+    return article
+
+
+def normalize_articles(
+    articles: Iterable[Dict],
+    fields: Sequence[str] = TEXT_FIELDS,
+    max_lengths: Optional[Dict[str, int]] = None,
+) -> List[Dict]:
+    """
+    기사 목록 일괄 정규화 (스크래퍼 결과 반환 직전 1회 호출)
+
+    Args:
+        articles: 기사 딕셔너리 목록 (제자리 수정)
+        fields: 정규화할 필드
+        max_lengths: 정규화 후 필드별 최대 길이 (예: {"content": 200})
+
+    Returns:
+        정규화된 기사 리스트
+    """
+    normalized = []
+    for article in articles:
+        already = article.get(NORMALIZED_KEY)
+        normalize_article(article, fields)
+        if max_lengths and not already:
+            for name, max_length in max_lengths.items():
+                value = article.get(name)
+                if isinstance(value, str):
+                    article[name] = value[:max_length]
+        normalized.append(article)
+    return normalized
+
+
+def is_normalized(article: Dict) -> bool:
+    """
+    정규화 완료 여부
+
+    Args:
+        article: 기사 딕셔너리
+
+    Returns:
+        normalized 플래그 값
+    """
+    return bool(article.get(NORMALIZED_KEY))
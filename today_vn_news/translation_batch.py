@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+번역 요청 묶음 계획
+- 목적: 소스마다 1~5개 기사를 같은 지침 블록(약 40줄)과 함께 따로 보내면서 생기는
+        요청당 오버헤드와 반복되는 프롬프트 접두부 비용 절감
+- 기능: 기사에 고정 ID 부여, 요청 단위(per-source | packed | per-article) 선택,
+        packed는 여러 소스의 기사를 입력 토큰 예산 안에서 한 요청에 채움,
+        응답 항목을 ID(→ URL → 순서)로 원문 기사에 되돌림
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from today_vn_news.llm_scheduler import estimate_tokens
+
+GRANULARITIES = ("per-source", "packed", "per-article")
+
+# 기사 하나를 프롬프트에 넣을 때 붙는 머리말(ID, 소스명, 필드 라벨) 토큰 추정치
+ARTICLE_OVERHEAD_TOKENS = 20
+
+
+@dataclass(frozen=True)
+class BatchArticle:
+    """요청에 들어가는 기사 하나 (id: "소스 번호-기사 번호", 같은 입력이면 항상 같음)"""
+
+    id: str
+    source_name: str
+    article: Dict
+
+
+@dataclass
+class TranslationBatch:
+    """API 요청 하나에 담을 기사 묶음"""
+
+    articles: List[BatchArticle] = field(default_factory=list)
+    tokens: int = 0
+
+    @property
+    def sources(self) -> List[str]:
+        """묶음에 포함된 소스 이름 (첫 등장 순서)"""
+        return list(dict.fromkeys(item.source_name for item in self.articles))
+
+
+def article_tokens(article: Dict) -> int:
+    """
+    기사 하나의 프롬프트 입력 토큰 추정
+
+    Args:
+        article: 기사 딕셔너리 (title, content, url)
+
+    Returns:
+        추정 토큰 수
+    """
+    text = f"{article.get('title', '')}{article.get('url', '')}{article.get('content', '')}"
+    return estimate_tokens(text) + ARTICLE_OVERHEAD_TOKENS
+
+
+def assign_ids(groups: Sequence[Tuple[str, Sequence[Dict]]]) -> List[List[BatchArticle]]:
+    """
+    소스별 기사에 고정 ID 부여
+
+    Args:
+        groups: [(소스 이름, 기사 리스트)] (번역 순서)
+
+    Returns:
+        groups와 같은 모양의 BatchArticle 리스트
+    """
+    return [
+        [BatchArticle(f"{source_no}-{article_no}", source_name, article) for article_no, article in enumerate(articles, 1)]
+        for source_no, (source_name, articles) in enumerate(groups, 1)
+    ]
+
+
+def plan_batches(
+    groups: Sequence[Sequence[BatchArticle]],
+    granularity: str = "packed",
+    token_budget: int = 6000,
+    prompt_tokens: int = 0,
+) -> List[TranslationBatch]:
+    """
+    요청 단위별 기사 묶음 계획
+
+    packed는 순서를 유지하며 앞에서부터 채우고(기사는 쪼개지 않음), 예산을 넘는 기사는
+    단독 요청으로 보냅니다.
+
+    Args:
+        groups: assign_ids() 결과 (소스별 BatchArticle 리스트)
+        granularity: per-source (소스당 1요청) | packed (예산까지 소스 합침) | per-article (기사당 1요청)
+        token_budget: packed 요청 하나의 입력 토큰 예산 (지침 블록 포함)
+        prompt_tokens: 요청마다 반복되는 지침 블록 토큰 추정
+
+    Returns:
+        TranslationBatch 리스트 (빈 소스 제외)
+
+    Raises:
+        ValueError: 알 수 없는 granularity
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"알 수 없는 번역 요청 단위: {granularity} (가능: {', '.join(GRANULARITIES)})")
+
+    if granularity == "per-source":
+        units = [list(group) for group in groups if group]
+    else:
+        units = [[item] for group in groups for item in group]
+    if granularity != "packed":
+        return [
+            TranslationBatch(unit, prompt_tokens + sum(article_tokens(item.article) for item in unit))
+            for unit in units
+        ]
+
+    batches: List[TranslationBatch] = []
+    current: Optional[TranslationBatch] = None
+    for (item,) in units:
+        cost = article_tokens(item.article)
+        if current is None or (current.articles and current.tokens + cost > token_budget):
+            current = TranslationBatch(tokens=prompt_tokens)
+            batches.append(current)
+        current.articles.append(item)
+        current.tokens += cost
+    return batches
+
+
+def split_items(batch: TranslationBatch, items: Sequence) -> Dict[str, Dict]:
+    """
+    응답 항목을 기사 ID로 되돌림 (ID 우선, 다음 URL, 개수가 같으면 순서)
+
+    Args:
+        batch: 요청한 기사 묶음
+        items: 파싱된 응답 항목 리스트
+
+    Returns:
+        {기사 ID: 번역 항목 (title, content, url=원문 URL)}, 대응하지 못한 기사는 빠짐
+    """
+    items = [item for item in items if isinstance(item, dict)]
+    by_id = {str(item.get("id", "")).strip(): item for item in items if item.get("id") is not None}
+    by_url = {item.get("url"): item for item in items if item.get("url")}
+
+    matched: Dict[str, Dict] = {}
+    used = set()
+    for entry in batch.articles:
+        item = by_id.get(entry.id)
+        if item is None:
+            item = by_url.get(entry.article.get("url"))
+        if item is not None and id(item) not in used:
+            matched[entry.id] = item
+            used.add(id(item))
+
+    if len(matched) < len(batch.articles) and len(items) == len(batch.articles):
+        for entry, item in zip(batch.articles, items):
+            if entry.id not in matched and id(item) not in used:
+                matched[entry.id] = item
+                used.add(id(item))
+
+    return {
+        entry.id: {
+            **{k: v for k, v in matched[entry.id].items() if k != "id"},
+            "url": entry.article.get("url", ""),
+        }
+        for entry in batch.articles
+        if entry.id in matched
+    }
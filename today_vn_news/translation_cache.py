@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+번역 결과 캐시
+- 목적: 2단계 재실행(YAML 저장 실패 후 재시도 등)이나 다음 날 같은 기사 번역 시 LLM 재호출 방지
+- 기능: SQLite(data/)에 기사별 번역 저장 (키: 정제된 제목+본문 해시, 모델명, 프롬프트 버전),
+        적중 기사는 API 호출 없이 반환, 나이/개수 기준 정리, 적중률 집계
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from today_vn_news.logger import logger
+from today_vn_news.scraping.text import clean_text
+
+DEFAULT_PATH = "data/translation_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    content_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    item TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (content_hash, model, prompt_version)
+);
+CREATE INDEX IF NOT EXISTS idx_translations_used ON translations (last_used);
+"""
+
+
+def article_hash(article: Dict) -> str:
+    """
+    기사 내용 해시 (clean_text 정제 후 제목 + 본문)
+
+    URL은 키에 포함하지 않으므로 같은 기사가 다른 URL로 다시 노출되어도 적중합니다.
+
+    Args:
+        article: 기사 딕셔너리 (title, content)
+
+    Returns:
+        16바이트 hex 해시
+    """
+    text = f"{clean_text(article.get('title') or '')}\n{clean_text(article.get('content') or '')}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class TranslationCacheStats:
+    """번역 캐시 적중/미스 카운터"""
+
+    hits: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"번역 캐시: 적중 {self.hits}개, 미스 {self.misses}개 (API 번역), "
+            f"적중률 {self.hit_ratio * 100:.0f}%"
+        )
+
+
+class TranslationCache:
+    """
+    기사 단위 번역 캐시 (SQLite, 스레드 안전).
+
+    Args:
+        path: SQLite 파일 경로 (":memory:" 가능)
+        max_age_days: 마지막 사용 후 보관 기간 (일)
+        max_entries: 최대 항목 수 (초과 시 오래 사용하지 않은 항목부터 삭제)
+
+    Example:
+        >>> cache = TranslationCache("data/translation_cache.sqlite3")
+        >>> cached = cache.lookup(articles, "gemma-4-31b-it", "3")  # 미스는 None
+        >>> cache.store([(article, item)], "gemma-4-31b-it", "3")
+        >>> cache.prune()
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, max_age_days: int = 30, max_entries: int = 5000):
+        self.path = path
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self.stats = TranslationCacheStats()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def lookup(self, articles: Sequence[Dict], model: str, prompt_version: str) -> List[Optional[Dict]]:
+        """
+        기사별 저장된 번역 조회 (적중 항목은 마지막 사용 시각 갱신)
+
+        Args:
+            articles: 원문 기사 리스트
+            model: 번역 모델명
+            prompt_version: 프롬프트 템플릿 버전
+
+        Returns:
+            articles와 같은 순서의 번역 항목 (url은 현재 기사 URL, 미스는 None)
+        """
+        keys = [article_hash(article) for article in articles]
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            found: Dict[str, Dict] = {}
+            for key in set(keys):
+                row = conn.execute(
+                    "SELECT item FROM translations WHERE content_hash = ? AND model = ? AND prompt_version = ?",
+                    (key, model, prompt_version),
+                ).fetchone()
+                if row:
+                    found[key] = json.loads(row[0])
+            if found:
+                with conn:
+                    conn.executemany(
+                        "UPDATE translations SET last_used = ?"
+                        " WHERE content_hash = ? AND model = ? AND prompt_version = ?",
+                        [(now, key, model, prompt_version) for key in found],
+                    )
+
+        results = [
+            {**found[key], "url": article.get("url", "")} if key in found else None
+            for key, article in zip(keys, articles)
+        ]
+        hits = sum(item is not None for item in results)
+        self.stats.record(hits, len(results) - hits)
+        return results
+
+    def store(self, pairs: Sequence[Tuple[Dict, Dict]], model: str, prompt_version: str) -> None:
+        """
+        번역 결과 저장
+
+        Args:
+            pairs: [(원문 기사, 번역 항목 {'title', 'content', ...})]
+            model: 번역 모델명
+            prompt_version: 프롬프트 템플릿 버전
+        """
+        now = time.time()
+        rows = [
+            (
+                article_hash(article),
+                model,
+                prompt_version,
+                json.dumps({k: v for k, v in item.items() if k != "url"}, ensure_ascii=False),
+                now,
+                now,
+            )
+            for article, item in pairs
+        ]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def prune(self) -> int:
+        """
+        보관 기간이 지났거나 최대 개수를 넘는 항목 삭제 (오래 사용하지 않은 순)
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                expired = conn.execute(
+                    "DELETE FROM translations WHERE last_used < ?",
+                    (time.time() - self.max_age_days * 86400,),
+                ).rowcount
+                overflow = conn.execute(
+                    "DELETE FROM translations WHERE rowid IN ("
+                    " SELECT rowid FROM translations ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+        removed = expired + overflow
+        if removed:
+            logger.info(f"번역 캐시 정리: {removed}개 삭제 ({self.path})")
+        return removed
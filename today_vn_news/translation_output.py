@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+번역 응답 구조화 출력
+- 목적: 자유 형식 YAML 응답 파싱(코드 블록 제거 → safe_load → 콜론 치환 재파싱)이 한 곳만
+        깨져도 소스 전체가 원문으로 떨어지는 문제 해소
+- 기능: 응답 스키마(JSON, 기사 ID 포함) 요청 설정, 스키마 미지원 모델 기억(일반 요청으로 재시도),
+        관대한 스트리밍 JSON 항목 파서(항목 단위로 디코딩하여 깨진 항목만 버림),
+        모델별 항목 파싱 성공률 집계
+"""
+
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from today_vn_news.logger import logger
+
+# 응답 스키마: {"items": [{"id", "title", "content", "url"}]}
+TRANSLATION_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "items": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "id": {"type": "STRING"},
+                    "title": {"type": "STRING"},
+                    "content": {"type": "STRING"},
+                    "url": {"type": "STRING"},
+                },
+                "required": ["id", "title", "content"],
+            },
+        },
+    },
+    "required": ["items"],
+}
+
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+@dataclass
+class ParsedItems:
+    """항목 파싱 결과"""
+
+    items: List[Dict] = field(default_factory=list)
+    failed: int = 0
+
+    @property
+    def found_json(self) -> bool:
+        """응답에서 JSON 객체를 하나라도 찾았는지 여부"""
+        return bool(self.items) or self.failed > 0
+
+
+def _decode(text: str) -> Optional[Dict]:
+    """객체 하나 디코딩 (문자열 안 제어 문자 허용, 실패 시 끝 쉼표 제거 후 재시도)"""
+    for candidate in (text, _TRAILING_COMMA.sub(r"\1", text)):
+        try:
+            value = json.loads(candidate, strict=False)
+        except ValueError:
+            continue
+        return value if isinstance(value, dict) else None
+    return None
+
+
+class JsonItemStream:
+    """
+    관대한 스트리밍 JSON 항목 파서.
+
+    응답 조각을 받는 대로 문자열/이스케이프 상태와 중괄호 깊이만 추적하여, 안쪽에
+    객체가 없는 객체(= 번역 항목)가 닫힐 때마다 그 부분만 디코딩합니다. 코드 블록,
+    앞뒤 설명문, {"items": [...]} 또는 [...] 최상위 형태를 모두 허용하며, 깨지거나
+    잘린 항목은 failed로만 세고 나머지 항목은 그대로 반환합니다.
+
+    Example:
+        >>> stream = JsonItemStream()
+        >>> items = stream.feed('{"items": [{"id": "1", "title": "제목"}')
+        >>> result = stream.close()  # result.items, result.failed
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._in_string = False
+        self._escape = False
+        self._starts: List[int] = []  # 열린 객체 시작 위치
+        self._nested: List[bool] = []  # 열린 객체 안에 객체가 있었는지
+        self.result = ParsedItems()
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """
+        응답 조각 추가
+
+        Args:
+            chunk: 응답 텍스트 조각
+
+        Returns:
+            이번 조각에서 완성된 항목 리스트
+        """
+        self._buffer += chunk
+        completed = []
+        buffer = self._buffer
+        for i in range(self._pos, len(buffer)):
+            char = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = bool(self._starts)  # 객체 밖 따옴표(설명문)는 무시
+            elif char == "{":
+                if self._nested:
+                    self._nested[-1] = True
+                self._starts.append(i)
+                self._nested.append(False)
+            elif char == "}" and self._starts:
+                start = self._starts.pop()
+                if not self._nested.pop():
+                    item = _decode(buffer[start:i + 1])
+                    if item is not None and ("title" in item or "content" in item):
+                        completed.append(item)
+                    else:
+                        self.result.failed += 1
+        self._pos = len(buffer)
+        self.result.items.extend(completed)
+        return completed
+
+    def close(self) -> ParsedItems:
+        """
+        입력 종료 (닫히지 않은 항목은 실패로 집계)
+
+        Returns:
+            ParsedItems
+        """
+        if self._starts and not self._nested[-1]:
+            self.result.failed += 1
+        self._starts.clear()
+        self._nested.clear()
+        return self.result
+
+
+def parse_items(text: str) -> ParsedItems:
+    """
+    응답 전체 텍스트에서 번역 항목 파싱
+
+    Args:
+        text: 모델 응답 텍스트
+
+    Returns:
+        ParsedItems
+    """
+    stream = JsonItemStream()
+    stream.feed(text or "")
+    return stream.close()
+
+
+@dataclass
+class ModelParseStats:
+    """모델 하나의 항목 파싱 집계"""
+
+    ok: int = 0
+    failed: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        total = self.ok + self.failed
+        return self.ok / total if total else 0.0
+
+
+class StructuredOutput:
+    """
+    구조화 출력 설정 + 모델별 파싱 성공률 (스레드 안전).
+
+    Args:
+        enabled: 응답 스키마(JSON) 요청 여부 (False면 프롬프트 지시만으로 JSON 요청)
+
+    Example:
+        >>> structured_output.configure(True)
+        >>> config = structured_output.config_for("gemma-4-31b-it")
+        >>> structured_output.record("gemma-4-31b-it", ok=4, failed=1)
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._unsupported: set = set()
+        self._stats: Dict[str, ModelParseStats] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, enabled: bool) -> None:
+        """
+        설정 변경 및 통계 초기화 (번역 단계 시작 시)
+
+        Args:
+            enabled: 응답 스키마 요청 여부
+        """
+        with self._lock:
+            self.enabled = enabled
+            self._stats.clear()
+
+    def config_for(self, model: str) -> Optional[Dict]:
+        """
+        모델 요청에 붙일 생성 설정
+
+        Args:
+            model: 모델명
+
+        Returns:
+            GenerateContentConfig 딕셔너리 (비활성화 또는 스키마 미지원 모델이면 None)
+        """
+        with self._lock:
+            if not self.enabled or model in self._unsupported:
+                return None
+        return {"response_mime_type": "application/json", "response_schema": TRANSLATION_SCHEMA}
+
+    def mark_unsupported(self, model: str, error: BaseException) -> None:
+        """응답 스키마를 거부한 모델 기록 (프로세스가 끝날 때까지 일반 요청 사용)"""
+        with self._lock:
+            self._unsupported.add(model)
+        logger.warning(f"{model} 응답 스키마 미지원, 프롬프트 지시만으로 JSON 요청: {error}")
+
+    def record(self, model: str, ok: int, failed: int) -> None:
+        """
+        응답 하나의 항목 파싱 결과 집계
+
+        Args:
+            model: 모델명
+            ok: 파싱된 항목 수
+            failed: 버린 항목 수 (응답 전체가 파싱 불가면 1)
+        """
+        with self._lock:
+            stats = self._stats.setdefault(model, ModelParseStats())
+            stats.ok += ok
+            stats.failed += failed
+
+    def stats(self, model: str) -> ModelParseStats:
+        with self._lock:
+            stats = self._stats.get(model, ModelParseStats())
+            return ModelParseStats(stats.ok, stats.failed)
+
+    def summaries(self) -> List[str]:
+        with self._lock:
+            return [
+                f"번역 응답 파싱 [{model}]: 항목 {s.ok}/{s.ok + s.failed}개 성공 ({s.success_rate * 100:.0f}%)"
+                for model, s in self._stats.items()
+            ]
+
+
+# 전역 구조화 출력 설정 (번역 단계 시작 시 TranslatorConfig로 설정)
+structured_output = StructuredOutput()
@@ -13,7 +13,17 @@ import asyncio
 
 from today_vn_news.logger import logger
 from today_vn_news.exceptions import TranslationError
-from today_vn_news.retry import with_api_retry
+from today_vn_news.retry import status_of, with_api_retry
+from today_vn_news.scraping.registry import SAFETY_SECTION, SourceRegistry, get_registry
+from today_vn_news.config.translator_config import TranslatorConfig
+from today_vn_news.translation_cache import TranslationCache
+from today_vn_news.llm_scheduler import estimate_tokens, llm_scheduler
+from today_vn_news.translation_batch import TranslationBatch, assign_ids, plan_batches, split_items
+from today_vn_news.translation_output import parse_items, structured_output
+
+# 번역 프롬프트 템플릿 버전 (프롬프트/출력 형식 변경 시 증가 → 번역 캐시 무효화)
+# 2: YAML → 기사 번호(id)가 있는 JSON 출력
+PROMPT_VERSION = 2
 
 
 def get_genai_client() -> tuple[genai.Client, str]:
@@ -51,14 +61,15 @@ def get_genai_client() -> tuple[genai.Client, str]:
 
 
 @with_api_retry(max_attempts=2)
-def _call_gemma_api(client, model_name: str, prompt: str):
+def _call_gemma_api(client, model_name: str, prompt: str, config: Optional[Dict] = None):
     """
-    Gemma API 호출 (재시도 적용)
+    Gemma API 호출 (재시도 적용, 시도마다 공유 LLM 스케줄러 슬롯 점유)
 
     Args:
         client: GenAI 클라이언트
         model_name: 사용할 모델명
         prompt: 전송할 프롬프트
+        config: 생성 설정 (응답 스키마 등, None이면 생략)
 
     Returns:
         API 응답 객체
@@ -66,9 +77,69 @@ def _call_gemma_api(client, model_name: str, prompt: str):
     Raises:
         Exception: API 호출 실패 시 (최대 2회 재시도 후)
     """
-    return client.models.generate_content(
-        model=model_name, contents=prompt
-    )
+    extra = {"config": config} if config else {}
+    with llm_scheduler.request(tokens=estimate_tokens(prompt)):
+        return client.models.generate_content(
+            model=model_name, contents=prompt, **extra
+        )
+
+
+@with_api_retry(max_attempts=2)
+async def _call_gemma_api_async(client, model_name: str, prompt: str, config: Optional[Dict] = None):
+    """
+    Gemma API 비동기 호출 (client.aio, 재시도 적용, 시도마다 공유 LLM 스케줄러 슬롯 점유)
+
+    Args:
+        client: GenAI 클라이언트
+        model_name: 사용할 모델명
+        prompt: 전송할 프롬프트
+        config: 생성 설정 (응답 스키마 등, None이면 생략)
+
+    Returns:
+        API 응답 객체
+
+    Raises:
+        Exception: API 호출 실패 시 (최대 2회 재시도 후)
+    """
+    extra = {"config": config} if config else {}
+    async with llm_scheduler.arequest(tokens=estimate_tokens(prompt)):
+        return await client.aio.models.generate_content(
+            model=model_name, contents=prompt, **extra
+        )
+
+
+def _translate_request(client, model_name: str, prompt: str):
+    """
+    번역 요청 (응답 스키마 설정 포함, 모델이 스키마를 거부하면(HTTP 400) 설정 없이 한 번 더)
+
+    Args:
+        client: GenAI 클라이언트
+        model_name: 사용할 모델명
+        prompt: 번역 프롬프트
+
+    Returns:
+        API 응답 객체
+    """
+    config = structured_output.config_for(model_name)
+    try:
+        return _call_gemma_api(client, model_name, prompt, config)
+    except Exception as e:
+        if config is None or status_of(e) != 400:
+            raise
+        structured_output.mark_unsupported(model_name, e)
+    return _call_gemma_api(client, model_name, prompt)
+
+
+async def _translate_request_async(client, model_name: str, prompt: str):
+    """_translate_request의 async 버전"""
+    config = structured_output.config_for(model_name)
+    try:
+        return await _call_gemma_api_async(client, model_name, prompt, config)
+    except Exception as e:
+        if config is None or status_of(e) != 400:
+            raise
+        structured_output.mark_unsupported(model_name, e)
+    return await _call_gemma_api_async(client, model_name, prompt)
 
 
 def translate_weather_condition(condition: str) -> str:
@@ -120,20 +191,79 @@ def translate_weather_condition(condition: str) -> str:
     return translated
 
 
+def format_safety_item(item: Dict, include_placeholder: bool = False) -> Optional[Dict[str, str]]:
+    """
+    스크래핑된 안전 및 기상 관제 항목을 방송용 항목으로 변환
+
+    1단계 결과(name 필드로 기상/공기/도시/지진/플레이스홀더 구분)와 원본 YAML에서
+    다시 읽은 항목(이미 title/content/url 형태)을 모두 처리합니다.
+
+    Args:
+        item: 안전 데이터 항목
+        include_placeholder: 플레이스홀더 항목 포함 여부
+
+    Returns:
+        {'title', 'content', 'url'} 딕셔너리 (제외 대상이면 None)
+    """
+    name = item.get("name")
+    url = item.get("url", "")
+
+    if name == "기상":
+        condition = translate_weather_condition(item.get("condition", ""))
+        content = f"{condition}, 온도 {item.get('temp', '')}, 습도 {item.get('humidity', '')}"
+        return {"title": "기상 (NCHMF)", "content": content, "url": url}
+    if name == "공기":
+        return {"title": f"공기질 (IQAir) - AQI {item.get('aqi', '')}", "content": item["content"], "url": url}
+    if name == "도시":
+        aqi = item.get("aqi", "")
+        title = f"{item.get('city', '')} 기상·공기질" + (f" - AQI {aqi}" if aqi else "")
+        return {"title": title, "content": item["content"], "url": url}
+    if name == "지진":
+        return {"title": item["title"], "content": item["content"], "url": url}
+    if name == "플레이스홀더":
+        if not include_placeholder:
+            return None
+        return {"title": SAFETY_SECTION, "content": item["content"], "url": url}
+    if name is None and item.get("title"):
+        return {"title": item["title"], "content": item.get("content", ""), "url": url}
+    return None
+
+
+def build_safety_items(items: List[Dict], include_placeholder: bool = False) -> List[Dict[str, str]]:
+    """
+    안전 및 기상 관제 섹션 항목 변환 (번역 단계 공통)
+
+    Args:
+        items: 스크래핑된 안전 데이터 항목 리스트
+        include_placeholder: 플레이스홀더 항목 포함 여부
+
+    Returns:
+        방송용 항목 리스트
+    """
+    formatted = (format_safety_item(item, include_placeholder) for item in items)
+    return [item for item in formatted if item is not None]
+
+
 def translate_articles(
     articles: List[Dict[str, str]],
     source_name: str,
     today_str: str,
     max_articles: int = 2,
+    cache: Optional[TranslationCache] = None,
 ) -> Optional[List[Dict[str, str]]]:
     """
     베트남어 기사 리스트를 한국어로 번역 및 요약
 
+    cache가 있으면 기사별로 저장된 번역을 먼저 조회하고, 미스 기사만 한 번의
+    API 호출로 번역한 뒤 저장합니다 (모든 기사가 적중하면 API 호출 없음).
+    미스 번역 요청이 실패하면 캐시 적중 항목은 유지하고 미스 기사만 원문으로 채웁니다.
+
     Args:
         articles: 베트남어 기사 리스트 [{'title': str, 'content': str, 'url': str, 'date': str}]
         source_name: 뉴스 소스 이름
         today_str: 기준일 표시용
         max_articles: 번역할 최대 기사 수
+        cache: 번역 결과 캐시 (None이면 항상 API 호출)
 
     Returns:
         번역된 기사 리스트 [{'title': str, 'content': str, 'url': str}]
@@ -145,6 +275,165 @@ def translate_articles(
     # 번역할 기사 제한
     articles_to_translate = articles[:max_articles]
 
+    # API 클라이언트 생성 (모델명은 캐시 키에 포함)
+    client, model_name = get_genai_client()
+
+    if cache is None:
+        return _translate_batch(articles_to_translate, source_name, today_str, client, model_name)
+
+    cached, misses = _lookup_cached(articles_to_translate, source_name, model_name, cache)
+    if not misses:
+        return cached
+
+    try:
+        items = _translate_batch(misses, source_name, today_str, client, model_name) or []
+    except TranslationError as e:
+        return _fill_misses(cached, misses, source_name, e)
+    return _merge_translated(cached, misses, items, source_name, model_name, cache)
+
+
+def _lookup_cached(
+    articles: List[Dict[str, str]],
+    source_name: str,
+    model_name: str,
+    cache: TranslationCache,
+) -> tuple[List[Optional[Dict]], List[Dict[str, str]]]:
+    """
+    번역 캐시 조회
+
+    Returns:
+        (articles와 같은 순서의 캐시 항목(미스는 None), 번역할 미스 기사 리스트)
+    """
+    cached = cache.lookup(articles, model_name, prompt_version(source_name))
+    misses = [article for article, item in zip(articles, cached) if item is None]
+    if not misses:
+        logger.info(f"{source_name} 번역 캐시 적중: {len(cached)}개 (API 호출 없음)")
+    elif len(misses) < len(cached):
+        logger.info(f"{source_name} 번역 캐시 적중 {len(cached) - len(misses)}개, 미스 {len(misses)}개만 번역")
+    return cached, misses
+
+
+def _merge_translated(
+    cached: List[Optional[Dict]],
+    misses: List[Dict[str, str]],
+    items: List,
+    source_name: str,
+    model_name: str,
+    cache: TranslationCache,
+) -> List[Dict[str, str]]:
+    """
+    미스 번역 결과 저장 + 원래 기사 순서로 병합 (기사와 대응시키지 못한 번역 항목은 뒤에 추가)
+
+    Returns:
+        번역된 기사 리스트
+    """
+    matched = _match_items(misses, items)
+    cache.store(
+        [(article, item) for article, item in zip(misses, matched) if item], model_name, prompt_version(source_name)
+    )
+
+    translated = iter(matched)
+    merged = [item if item is not None else next(translated) for item in cached]
+    used = {id(item) for item in matched if item is not None}
+    leftovers = [item for item in items if id(item) not in used]
+    return [item for item in merged if item is not None] + leftovers
+
+
+def _original_item(article: Dict[str, str]) -> Dict[str, str]:
+    """번역하지 못한 기사를 원문 그대로 방송용 항목으로 변환"""
+    return {"title": article["title"], "content": article["content"], "url": article["url"]}
+
+
+def _fill_misses(
+    cached: List[Optional[Dict]],
+    misses: List[Dict[str, str]],
+    source_name: str,
+    error: TranslationError,
+) -> List[Dict[str, str]]:
+    """
+    미스 번역 요청 실패 시 캐시 적중 항목은 유지하고 미스 기사만 원문으로 채움
+
+    Raises:
+        TranslationError: 캐시 적중이 하나도 없으면 원래 예외 그대로 (섹션 전체 원문 대체)
+    """
+    if not any(cached):
+        raise error
+    logger.warning(f"{source_name} 번역 누락 {len(misses)}개, 원문 그대로 저장 (요청 실패: {error})")
+    pending = iter(misses)
+    return [item if item is not None else _original_item(next(pending)) for item in cached]
+
+
+def prompt_version(source_name: str) -> str:
+    """
+    번역 캐시 키용 프롬프트 버전 (소스별 추가 규칙이 있으면 구분)
+
+    Args:
+        source_name: 뉴스 소스 이름
+
+    Returns:
+        프롬프트 버전 문자열
+    """
+    if "Thanh Niên" in source_name:
+        return f"{PROMPT_VERSION}-thanhnien"
+    return str(PROMPT_VERSION)
+
+
+def _resolve_ids(articles: List[Dict], items: List[Dict]) -> List[Dict]:
+    """
+    응답 항목의 기사 번호(id)를 원문 URL로 바꾸고 입력 순서로 정렬
+
+    Args:
+        articles: 프롬프트에 1부터 번호를 붙여 넣은 원문 기사 리스트
+        items: 파싱된 번역 항목 리스트
+
+    Returns:
+        id 키를 제거한 번역 항목 (번호로 대응하지 못한 항목은 뒤에 원래 순서대로)
+    """
+    numbered = {str(i): article for i, article in enumerate(articles, 1)}
+    ordered: Dict[str, Dict] = {}
+    rest = []
+    for item in items:
+        item = dict(item)
+        key = str(item.pop("id", "")).strip()
+        article = numbered.get(key)
+        if article is not None and key not in ordered:
+            item["url"] = article.get("url") or item.get("url", "")
+            ordered[key] = item
+        else:
+            rest.append(item)
+    return [ordered[key] for key in numbered if key in ordered] + rest
+
+
+def _match_items(articles: List[Dict], items: List) -> List[Optional[Dict]]:
+    """
+    번역 항목을 원문 기사와 대응 (URL 우선, 개수가 같으면 순서)
+
+    Args:
+        articles: 원문 기사 리스트
+        items: 번역 결과 항목 리스트
+
+    Returns:
+        articles와 같은 순서의 번역 항목 (대응하지 못하면 None)
+    """
+    by_url = {item.get("url"): item for item in items if isinstance(item, dict) and item.get("url")}
+    matched = [by_url.get(article.get("url")) for article in articles]
+    if None in matched and len(items) == len(articles):
+        matched = [item if isinstance(item, dict) else None for item in items]
+    return matched
+
+
+def _build_prompt(articles: List[Dict[str, str]], source_name: str, today_str: str) -> str:
+    """
+    번역 프롬프트 구성
+
+    Args:
+        articles: 번역할 기사 리스트
+        source_name: 뉴스 소스 이름
+        today_str: 기준일 표시용
+
+    Returns:
+        프롬프트 문자열
+    """
     # Gemma 프롬프트 구성
     prompt = f"""다음 베트남어 뉴스 기사들을 한국어로 번역하고, 각각 3줄 요약을 작성해주세요.
 
@@ -154,132 +443,278 @@ def translate_articles(
 **입력 기사**:
 """
 
-    for i, article in enumerate(articles_to_translate, 1):
-        # 번역 전 제목에서 콜론 제거 (YAML 파싱 오류 방지)
+    for i, article in enumerate(articles, 1):
+        # 번역 전 제목에서 콜론 제거 (자막/음성용 제목 형식 유지)
         clean_title = article["title"].replace(":", " -")
         prompt += f"""
-{i}. 제목: {clean_title}
+[{i}] 제목: {clean_title}
     URL: {article["url"]}
     내용: {article["content"]}
 """
 
-    prompt += """
-**출력 형식 (반드시 YAML만 출력)**:
-items:
-  - title: "한국어 번역된 기사 제목"
-    content: "한국어 번역된 3줄 요약"
-    url: "원문 링크"
+    prompt += _output_rules("입력 기사 번호", "1", "Thanh Niên" in source_name)
+    return prompt
+
+
+def _output_rules(id_label: str, id_example: str, thanhnien: bool) -> str:
+    """
+    출력 형식(JSON) + 번역 지침 블록
+
+    Args:
+        id_label: 출력 id 설명 ("입력 기사 번호" 등)
+        id_example: 예시 id 값
+        thanhnien: Thanh Niên 추가 최적화 규칙 포함 여부
+
+    Returns:
+        프롬프트 뒷부분 문자열
+    """
+    rules = f"""
+**출력 형식 (반드시 JSON만 출력, 입력 기사마다 항목 하나)**:
+{{"items": [{{"id": "{id_label}", "title": "한국어 번역된 기사 제목", "content": "한국어 번역된 3줄 요약", "url": "원문 링크"}}]}}
 
 **중요한 지침**:
 1. 제목과 내용을 자연스러운 한국어 문장체로 번역하세요.
 2. 요약은 3줄로 작성하고, 한국인이 이해하기 쉽게 작성하세요.
-3. YAML 형식만 출력하고, 다른 설명은 하지 마세요.
-4. **모든 값(title, content, url)은 반드시 큰따옴표(")로 감싸야 합니다.**
-5. 작은따옴표(')와 홑따옴표(')는 절대 사용하지 마세요.
-6. 올바른 YAML 문법을 따르세요.
-7. 제목이나 내용에 콜론(:)이 포함될 경우, 반드시 따옴표로 감싸야 합니다.
+3. JSON만 출력하고, 코드 블록이나 다른 설명은 하지 마세요.
+4. 문자열 안의 큰따옴표는 \\"로, 줄바꿈은 \\n으로 이스케이프하세요.
+5. id는 {id_label}를 그대로 쓰고, 기사를 합치거나 빠뜨리지 마세요.
+6. **모든 기사 TTS 최적화**: 영어 약어, 통화 단위 등은 그대로 사용합니다.
+   - 5G, 4G, 3G, AI, API, AWS, SaaS, USD, VND 등은 원래대로 읽습니다.
 """
 
-    # 사이트별 TTS 최적화 규칙 추가
-    tts_rules = """
-    8. **모든 기사 TTS 최적화**: 영어 약어, 통화 단위 등은 그대로 사용합니다.
-       - 5G, 4G, 3G, AI, API, AWS, SaaS, USD, VND 등은 원래대로 읽습니다.
+    if thanhnien:
+        rules += """7. **Thanh Niên 기사 추가 최적화**: 불필요한 수식어 및 자극적인 문장 부호(!!!, ???)를 제거하세요. 느낌표는 최대 1개만, 물음표는 최대 2개까지만 허용합니다.
 """
 
-    # 사이트별 추가 최적화 규칙
-    if "Thanh Niên" in source_name:
-        tts_rules += """
-    9. **Thanh Niên 추가 최적화**: 불필요한 수식어 및 자극적인 문장 부호(!!!, ???)를 제거하세요. 느낌표는 최대 1개만, 물음표는 최대 2개까지만 허용합니다.
+    rules += f"""
+**올바른 출력 예시**:
+{{"items": [{{"id": "{id_example}", "title": "한국어 제목", "content": "한국어 내용 3줄 요약입니다. 두 번째 줄입니다. 세 번째 줄입니다.", "url": "https://example.com/article"}}]}}
+
 """
+    return rules
 
-    prompt += tts_rules
 
-    prompt += """
-**올바른 출력 예시**:
-```yaml
-items:
-  - title: 한국어 제목
-    content: 한국어 내용 3줄 요약입니다. 두 번째 줄입니다. 세 번째 줄입니다.
-    url: https://example.com/article
-```
+def _build_packed_prompt(batch: TranslationBatch, today_str: str) -> str:
+    """
+    여러 소스 기사를 한 요청에 담는 번역 프롬프트 구성 (기사별 ID로 응답을 되돌림)
+
+    Args:
+        batch: 기사 묶음 (비어 있으면 지침 블록만 반환 — 토큰 추정용)
+        today_str: 기준일 표시용
 
+    Returns:
+        프롬프트 문자열
+    """
+    prompt = f"""다음 베트남어 뉴스 기사들을 한국어로 번역하고, 각각 3줄 요약을 작성해주세요.
+기사마다 뉴스 소스가 다르며, 각 기사는 대괄호 안의 ID로 구분합니다.
+
+**기준일**: {today_str}
+
+**입력 기사**:
 """
 
-    # API 클라이언트 생성
-    try:
-        client, model_name = get_genai_client()
-    except TranslationError:
-        raise
+    for entry in batch.articles:
+        # 번역 전 제목에서 콜론 제거 (자막/음성용 제목 형식 유지)
+        clean_title = entry.article["title"].replace(":", " -")
+        prompt += f"""
+[{entry.id}] 소스: {entry.source_name}
+    제목: {clean_title}
+    URL: {entry.article["url"]}
+    내용: {entry.article["content"]}
+"""
 
-    try:
-        logger.info(f"{source_name} 기사 {len(articles_to_translate)}개 번역 시작")
+    prompt += _output_rules("입력 기사 ID", "1-1", any("Thanh Niên" in source for source in batch.sources))
+    return prompt
 
-        response = _call_gemma_api(client, model_name, prompt)
 
-        if response.text:
-            # YAML 파싱
-            import yaml
+def _parse_translation(text: Optional[str], source_name: str, model_name: str) -> List[Dict[str, str]]:
+    """
+    번역 응답 파싱 (항목 단위 JSON, 깨진 항목만 버림) + 모델별 파싱 성공률 집계
 
-            content = response.text.strip()
+    응답에 JSON 객체가 하나도 없으면(스키마 미지원 모델이 YAML로 답한 경우 등)
+    기존 YAML 파서로 한 번 더 시도합니다.
 
-            # 마크다운 코드 블록 제거
-            if "```yaml" in content:
-                content = content.split("```yaml")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
+    Args:
+        text: 모델 응답 텍스트
+        source_name: 뉴스 소스 이름 (로그용)
+        model_name: 모델명 (성공률 집계 키)
 
-            # 홑따옴표 제거 (새로운 로직)
-            content = content.replace("'''", "").replace("'''", "")
+    Returns:
+        번역된 기사 리스트 (id 포함, 제목 콜론은 대시로 치환)
 
-            try:
-                parsed_yaml = yaml.safe_load(content)
+    Raises:
+        TranslationError: 사용할 수 있는 항목이 하나도 없을 때
+    """
+    parsed = parse_items(text or "")
+    if parsed.found_json:
+        items = parsed.items
+        structured_output.record(model_name, len(items), parsed.failed)
+        if parsed.failed:
+            logger.warning(f"{source_name} 응답 항목 {parsed.failed}개 파싱 실패 (나머지 {len(items)}개 사용)")
+        if not items:
+            raise TranslationError(f"{source_name}: Translation result parsing failed - no valid items")
+        logger.info(f"{source_name} 번역 완료: {len(items)}개 기사")
+    else:
+        try:
+            items = _parse_yaml_translation(text, source_name) or []
+        except TranslationError:
+            structured_output.record(model_name, 0, 1)
+            raise
+        structured_output.record(model_name, len(items), 0 if items else 1)
+        if not items:
+            raise TranslationError(f"{source_name}: Translation result parsing failed - empty response")
+
+    # 번역 후 제목에서 콜론 제거 (이중 안전장치)
+    for item in items:
+        if isinstance(item.get("title"), str):
+            item["title"] = item["title"].replace(":", " -")
+    return items
+
+
+def _parse_yaml_translation(text: Optional[str], source_name: str) -> Optional[List[Dict[str, str]]]:
+    """
+    번역 응답 YAML 파싱 (JSON이 없는 응답용 하위 호환)
+
+    Args:
+        text: 모델 응답 텍스트
+        source_name: 뉴스 소스 이름
+
+    Returns:
+        번역된 기사 리스트 (빈 응답이면 None)
+
+    Raises:
+        TranslationError: 응답 파싱 실패 시
+    """
+    if not text:
+        return None
+
+    # YAML 파싱
+    import yaml
+
+    content = text.strip()
+
+    # 마크다운 코드 블록 제거
+    if "```yaml" in content:
+        content = content.split("```yaml")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
 
+    # 홑따옴표 제거 (새로운 로직)
+    content = content.replace("'''", "").replace("'''", "")
+
+    try:
+        parsed_yaml = yaml.safe_load(content)
+
+        if isinstance(parsed_yaml, dict) and "items" in parsed_yaml:
+            items = parsed_yaml["items"]
+            # 번역 후 제목에서 콜론 제거 (이중 안전장치)
+            for item in items:
+                if "title" in item and item["title"]:
+                    item["title"] = item["title"].replace(":", " -")
+            logger.info(f"{source_name} 번역 완료: {len(items)}개 기사")
+            return items
+        elif isinstance(parsed_yaml, list):
+            # 번역 후 제목에서 콜론 제거 (이중 안전장치)
+            for item in parsed_yaml:
+                if "title" in item and item["title"]:
+                    item["title"] = item["title"].replace(":", " -")
+            logger.info(f"{source_name} 번역 완료: {len(parsed_yaml)}개 기사")
+            return parsed_yaml
+        else:
+            logger.error(f"{source_name} 번역 결과 파싱 실패 - 빈값 또는 잘못된 형식")
+            raise TranslationError(f"{source_name}: Translation result parsing failed - empty or invalid format")
+    except yaml.YAMLError as e:
+        # 콜론으로 인한 파싱 실패 시, 콜론 치환 후 재시도
+        if "mapping values are not allowed here" in str(e):
+            logger.warning(f"{source_name} YAML 파싱 실패 (콜론 문제), 콜론 치환 후 재시도")
+            # 모든 콜론을 대시로 치환 (YAML key-value 구분자 문제 해결)
+            fixed_content = content.replace(":", " -")
+            try:
+                parsed_yaml = yaml.safe_load(fixed_content)
                 if isinstance(parsed_yaml, dict) and "items" in parsed_yaml:
                     items = parsed_yaml["items"]
-                    # 번역 후 제목에서 콜론 제거 (이중 안전장치)
                     for item in items:
                         if "title" in item and item["title"]:
-                            item["title"] = item["title"].replace(":", " -")
-                    logger.info(f"{source_name} 번역 완료: {len(items)}개 기사")
+                            item["title"] = item["title"].replace(" -", " -")  # 이미 치환됨
+                    logger.info(f"{source_name} 번역 완료 (복구됨): {len(items)}개 기사")
                     return items
                 elif isinstance(parsed_yaml, list):
-                    # 번역 후 제목에서 콜론 제거 (이중 안전장치)
                     for item in parsed_yaml:
                         if "title" in item and item["title"]:
-                            item["title"] = item["title"].replace(":", " -")
-                    logger.info(f"{source_name} 번역 완료: {len(parsed_yaml)}개 기사")
+                            item["title"] = item["title"].replace(" -", " -")
+                    logger.info(f"{source_name} 번역 완료 (복구됨): {len(parsed_yaml)}개 기사")
                     return parsed_yaml
-                else:
-                    logger.error(f"{source_name} 번역 결과 파싱 실패 - 빈값 또는 잘못된 형식")
-                    raise TranslationError(f"{source_name}: Translation result parsing failed - empty or invalid format")
-            except yaml.YAMLError as e:
-                # 콜론으로 인한 파싱 실패 시, 콜론 치환 후 재시도
-                if "mapping values are not allowed here" in str(e):
-                    logger.warning(f"{source_name} YAML 파싱 실패 (콜론 문제), 콜론 치환 후 재시도")
-                    # 모든 콜론을 대시로 치환 (YAML key-value 구분자 문제 해결)
-                    fixed_content = content.replace(":", " -")
-                    try:
-                        parsed_yaml = yaml.safe_load(fixed_content)
-                        if isinstance(parsed_yaml, dict) and "items" in parsed_yaml:
-                            items = parsed_yaml["items"]
-                            for item in items:
-                                if "title" in item and item["title"]:
-                                    item["title"] = item["title"].replace(" -", " -")  # 이미 치환됨
-                            logger.info(f"{source_name} 번역 완료 (복구됨): {len(items)}개 기사")
-                            return items
-                        elif isinstance(parsed_yaml, list):
-                            for item in parsed_yaml:
-                                if "title" in item and item["title"]:
-                                    item["title"] = item["title"].replace(" -", " -")
-                            logger.info(f"{source_name} 번역 완료 (복구됨): {len(parsed_yaml)}개 기사")
-                            return parsed_yaml
-                    except yaml.YAMLError as e2:
-                        logger.error(f"{source_name} YAML 파싱 재시도 실패: {str(e2)}", exc_info=True)
-                        raise TranslationError(f"{source_name}: YAML parsing failed after retry: {str(e2)}")
-
-                logger.error(f"{source_name} YAML 파싱 실패: {str(e)}", exc_info=True)
-                raise TranslationError(f"{source_name}: YAML parsing failed: {str(e)}")
+            except yaml.YAMLError as e2:
+                logger.error(f"{source_name} YAML 파싱 재시도 실패: {str(e2)}", exc_info=True)
+                raise TranslationError(f"{source_name}: YAML parsing failed after retry: {str(e2)}")
+
+        logger.error(f"{source_name} YAML 파싱 실패: {str(e)}", exc_info=True)
+        raise TranslationError(f"{source_name}: YAML parsing failed: {str(e)}")
+
+
+def _translate_batch(
+    articles: List[Dict[str, str]],
+    source_name: str,
+    today_str: str,
+    client,
+    model_name: str,
+) -> List[Dict[str, str]]:
+    """
+    기사 묶음을 한 번의 API 호출로 번역 (프롬프트 구성 + 응답 YAML 파싱)
+
+    Args:
+        articles: 번역할 기사 리스트
+        source_name: 뉴스 소스 이름
+        today_str: 기준일 표시용
+        client: GenAI 클라이언트
+        model_name: 사용할 모델명
+
+    Returns:
+        번역된 기사 리스트
 
+    Raises:
+        TranslationError: API 호출 또는 응답 파싱 실패 시
+    """
+    prompt = _build_prompt(articles, source_name, today_str)
+    try:
+        logger.info(f"{source_name} 기사 {len(articles)}개 번역 시작")
+        response = _translate_request(client, model_name, prompt)
+        return _resolve_ids(articles, _parse_translation(response.text, source_name, model_name))
+    except Exception as e:
+        if isinstance(e, TranslationError):
+            raise
+        logger.error(f"{source_name} 번역 실패", exc_info=True)
+        raise TranslationError(f"Translation failed for {source_name}: {str(e)}")
+
+
+async def _translate_batch_async(
+    articles: List[Dict[str, str]],
+    source_name: str,
+    today_str: str,
+    client,
+    model_name: str,
+) -> List[Dict[str, str]]:
+    """
+    _translate_batch의 async 버전 (client.aio, 재시도 대기는 asyncio.sleep)
+
+    Args:
+        articles: 번역할 기사 리스트
+        source_name: 뉴스 소스 이름
+        today_str: 기준일 표시용
+        client: GenAI 클라이언트 (실행 전체에서 공유)
+        model_name: 사용할 모델명
+
+    Returns:
+        번역된 기사 리스트
+
+    Raises:
+        TranslationError: API 호출 또는 응답 파싱 실패 시
+    """
+    prompt = _build_prompt(articles, source_name, today_str)
+    try:
+        logger.info(f"{source_name} 기사 {len(articles)}개 번역 시작")
+        response = await _translate_request_async(client, model_name, prompt)
+        return _resolve_ids(articles, _parse_translation(response.text, source_name, model_name))
     except Exception as e:
         if isinstance(e, TranslationError):
             raise
@@ -292,35 +727,237 @@ async def translate_articles_async(
     source_name: str,
     today_str: str,
     max_articles: int = 2,
-    semaphore: asyncio.Semaphore = None,
+    cache: Optional[TranslationCache] = None,
+    client=None,
+    model_name: Optional[str] = None,
 ) -> Optional[List[Dict[str, str]]]:
     """
-    비동기 번역 작업 (세마포어로 동시성 제어)
+    translate_articles의 네이티브 async 버전 (client.aio 사용, 스레드 점유 없음)
+
+    동시성은 공유 LLM 스케줄러가 API 호출 단위로 제어합니다.
 
     Args:
         articles: 번역할 기사 리스트
         source_name: 뉴스 소스 이름
         today_str: 기준일 표시용
         max_articles: 번역할 최대 기사 수
-        semaphore: 동시성 제어 세마포어 (기본 3개)
+        cache: 번역 결과 캐시
+        client: 실행 전체에서 공유하는 GenAI 클라이언트 (None이면 새로 생성)
+        model_name: client와 함께 받은 모델명
 
     Returns:
         번역된 기사 리스트 또는 None
     """
-    if semaphore is None:
-        semaphore = asyncio.Semaphore(3)  # AI Gateway 요금 제한 고려
+    if not articles:
+        return []
 
-    async with semaphore:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            translate_articles,  # 기존 동기 함수
-            articles, source_name, today_str, max_articles
-        )
+    articles_to_translate = articles[:max_articles]
+    if client is None:
+        client, model_name = get_genai_client()
+
+    if cache is None:
+        return await _translate_batch_async(articles_to_translate, source_name, today_str, client, model_name)
+
+    cached, misses = _lookup_cached(articles_to_translate, source_name, model_name, cache)
+    if not misses:
+        return cached
+
+    try:
+        items = await _translate_batch_async(misses, source_name, today_str, client, model_name) or []
+    except TranslationError as e:
+        return _fill_misses(cached, misses, source_name, e)
+    return _merge_translated(cached, misses, items, source_name, model_name, cache)
+
+
+async def _translate_packed_async(
+    batch: TranslationBatch,
+    today_str: str,
+    client,
+    model_name: str,
+) -> Dict[str, Dict[str, str]]:
+    """
+    기사 묶음 하나를 한 번의 API 호출로 번역
+
+    소스가 하나뿐인 묶음(per-source, per-article)은 기존 소스별 프롬프트를,
+    여러 소스를 합친 묶음은 ID 기반 packed 프롬프트를 사용합니다.
+
+    Args:
+        batch: 기사 묶음
+        today_str: 기준일 표시용
+        client: 실행 전체에서 공유하는 GenAI 클라이언트
+        model_name: 사용할 모델명
+
+    Returns:
+        {기사 ID: 번역 항목} (대응하지 못한 기사는 빠짐)
+
+    Raises:
+        TranslationError: API 호출 또는 응답 파싱 실패 시
+    """
+    sources = batch.sources
+    label = sources[0] if len(sources) == 1 else f"묶음({', '.join(sources)})"
+    articles = [entry.article for entry in batch.articles]
+    if len(sources) == 1:
+        prompt = _build_prompt(articles, sources[0], today_str)
+    else:
+        prompt = _build_packed_prompt(batch, today_str)
+
+    try:
+        logger.info(f"{label} 기사 {len(batch.articles)}개 번역 시작 (추정 입력 {batch.tokens}토큰)")
+        response = await _translate_request_async(client, model_name, prompt)
+        items = _parse_translation(response.text, label, model_name)
+        if len(sources) == 1:
+            items = _resolve_ids(articles, items)
+    except Exception as e:
+        if isinstance(e, TranslationError):
+            raise
+        logger.error(f"{label} 번역 실패", exc_info=True)
+        raise TranslationError(f"Translation failed for {label}: {str(e)}")
+    return split_items(batch, items)
+
+
+async def _translate_planned(
+    translation_tasks: List[tuple],
+    today_str: str,
+    cache: Optional[TranslationCache],
+    client,
+    model_name: str,
+    config: TranslatorConfig,
+) -> List:
+    """
+    요청 단위 계획(packed, per-article)에 따라 번역 후 소스별 결과로 되돌림
+
+    캐시 적중 기사는 계획에서 빠지고, 요청 실패나 응답 누락으로 번역하지 못한 기사만
+    원문 그대로 채웁니다 (캐시 적중 없이 소스의 모든 기사가 실패하면 그 소스 결과는 예외).
+
+    Args:
+        translation_tasks: [(소스 이름, 기사 리스트)] (번역 순서)
+        today_str: 기준일 표시용
+        cache: 번역 결과 캐시
+        client: 실행 전체에서 공유하는 GenAI 클라이언트
+        model_name: 사용할 모델명
+        config: 번역 설정 (batch_granularity, batch_token_budget)
+
+    Returns:
+        translation_tasks와 같은 순서의 결과 (번역된 기사 리스트 또는 예외)
+    """
+    cached_by_source = []
+    groups = []
+    for source_name, articles in translation_tasks:
+        if cache is not None:
+            cached, misses = _lookup_cached(articles, source_name, model_name, cache)
+        else:
+            cached, misses = [None] * len(articles), list(articles)
+        cached_by_source.append(cached)
+        groups.append((source_name, misses))
+
+    entries = assign_ids(groups)
+    batches = plan_batches(
+        entries,
+        config.batch_granularity,
+        config.batch_token_budget,
+        prompt_tokens=estimate_tokens(_build_packed_prompt(TranslationBatch(), today_str)),
+    )
+    logger.info(
+        f"번역 요청 계획 ({config.batch_granularity}): 기사 {sum(len(group) for group in entries)}개 → "
+        f"요청 {len(batches)}개 (입력 예산 {config.batch_token_budget}토큰)"
+    )
+
+    outcomes = await asyncio.gather(
+        *[_translate_packed_async(batch, today_str, client, model_name) for batch in batches],
+        return_exceptions=True,
+    )
+    translated: Dict[str, Dict] = {}
+    errors: Dict[str, BaseException] = {}
+    for batch, outcome in zip(batches, outcomes):
+        if isinstance(outcome, BaseException):
+            for source_name in batch.sources:
+                errors[source_name] = outcome
+        else:
+            translated.update(outcome)
+
+    results = []
+    for (source_name, _), cached, group in zip(translation_tasks, cached_by_source, entries):
+        done = [(entry, translated[entry.id]) for entry in group if entry.id in translated]
+        if cache is not None:
+            cache.store([(entry.article, item) for entry, item in done], model_name, prompt_version(source_name))
+        if group and not done and source_name in errors and not any(cached):
+            results.append(errors[source_name])
+            continue
+        if len(done) < len(group):
+            reason = f" (요청 실패: {errors[source_name]})" if source_name in errors else ""
+            logger.warning(f"{source_name} 번역 누락 {len(group) - len(done)}개, 원문 그대로 저장{reason}")
+
+        pending = iter(group)
+        items = []
+        for item in cached:
+            if item is None:
+                entry = next(pending)
+                item = translated.get(entry.id) or _original_item(entry.article)
+            items.append(item)
+        results.append(items)
+    return results
+
+
+async def _close_async_client(client) -> None:
+    """공유 GenAI 클라이언트의 async 연결 풀 종료"""
+    try:
+        await client.aio.aclose()
+    except Exception as e:
+        logger.debug(f"GenAI async 클라이언트 종료 실패: {e}")
+
+
+def configure_llm_scheduler(config: TranslatorConfig) -> None:
+    """
+    번역 단계 시작 시 공유 LLM 스케줄러 한도 + 구조화 출력 설정 (통계 초기화)
+
+    Args:
+        config: 번역 설정
+    """
+    structured_output.configure(config.structured_output)
+    llm_scheduler.configure(
+        max_concurrency=config.llm_max_concurrency,
+        min_concurrency=config.llm_min_concurrency,
+        initial_concurrency=config.llm_initial_concurrency,
+        latency_target=config.llm_latency_target,
+        rpm=config.llm_rpm,
+        tpm=config.llm_tpm,
+    )
+
+
+def open_translation_cache(config: Optional[TranslatorConfig] = None) -> Optional[TranslationCache]:
+    """
+    설정에 따른 번역 결과 캐시 생성
+
+    Args:
+        config: 번역 설정 (None이면 config.yaml에서 로드)
+
+    Returns:
+        TranslationCache (비활성화 시 None)
+    """
+    if config is None:
+        config = TranslatorConfig.from_yaml()
+    if not config.cache_enabled:
+        return None
+    return TranslationCache(config.cache_path, config.cache_max_age_days, config.cache_max_entries)
+
+
+def _finish_translation_stage(cache: Optional[TranslationCache]) -> None:
+    """단계 종료 시 적중률·LLM 스케줄러·파싱 성공률 기록 + 오래된 캐시 항목 정리"""
+    logger.info(llm_scheduler.summary())
+    for summary in structured_output.summaries():
+        logger.info(summary)
+    if cache is None:
+        return
+    logger.info(cache.stats.summary())
+    cache.prune()
+    cache.close()
 
 
 async def translate_all_sources_parallel(
-    scraped_data: Dict, date_str: str
+    scraped_data: Dict,
+    date_str: str,
+    registry: Optional[SourceRegistry] = None,
+    config: Optional[TranslatorConfig] = None,
 ) -> List[Dict]:
     """
     모든 뉴스 소스를 비동기 병렬로 번역
@@ -328,6 +965,8 @@ async def translate_all_sources_parallel(
     Args:
         scraped_data: 스크래핑된 원본 데이터 (안전 및 기상 관제 제외)
         date_str: 기준일 표시용
+        registry: 소스 레지스트리 (None이면 config.yaml에서 로드)
+        config: 번역 설정 (None이면 config.yaml에서 로드, 번역 캐시 설정)
 
     Returns:
         번역된 섹션 리스트
@@ -335,53 +974,59 @@ async def translate_all_sources_parallel(
     logger.info("비동기 병렬 번역 시작")
 
     # 우선순위별 순서 (안전 및 기상 관제 제외)
-    source_order = [
-        "Sức khỏe & Đời sống",
-        "Nhân Dân",
-        "Tuổi Trẻ",
-        "VietnamNet",
-        "VnExpress",
-        "Thanh Niên",
-        "The Saigon Times",
-        "VietnamNet 정보통신",
-        "VnExpress IT/과학",
+    if registry is None:
+        registry = get_registry()
+    source_order = registry.translation_order()
+    if config is None:
+        config = TranslatorConfig.from_yaml()
+    configure_llm_scheduler(config)
+    cache = open_translation_cache(config)
+
+    # 번역할 소스 목록
+    translation_tasks = [
+        (source_name, scraped_data[source_name])
+        for source_name in source_order
+        if scraped_data.get(source_name)
     ]
 
-    # 병렬 번역 작업 생성
-    translation_tasks = []
-    for source_name in source_order:
-        if source_name not in scraped_data:
-            continue
-
-        articles = scraped_data[source_name]
-        if not articles:
-            continue
-
-        # 비동기 번역 작업 추가
-        task = translate_articles_async(
-            articles=articles,
-            source_name=source_name,
-            today_str=date_str,
-            max_articles=len(articles),
-        )
-        translation_tasks.append((source_name, task))
-
     # 모든 번역 작업 병렬 실행
     translated_sections = []
     section_id = 2  # 안전 및 기상 관제가 ID 1이므로 2부터 시작
 
     if translation_tasks:
-        semaphore = asyncio.Semaphore(3)  # AI Gateway 요금 제한 고려
-        results = await asyncio.gather(
-            *[task for _, task in translation_tasks],
-            return_exceptions=True
-        )
+        try:
+            # 클라이언트 하나를 모든 소스가 공유 (aio 연결 풀 재사용, 동시 호출 수는 스케줄러가 제한)
+            client, model_name = get_genai_client()
+        except TranslationError as e:
+            results = [e] * len(translation_tasks)
+        else:
+            try:
+                if config.batch_granularity == "per-source":
+                    results = await asyncio.gather(
+                        *[
+                            translate_articles_async(
+                                articles=articles,
+                                source_name=source_name,
+                                today_str=date_str,
+                                max_articles=len(articles),
+                                cache=cache,
+                                client=client,
+                                model_name=model_name,
+                            )
+                            for source_name, articles in translation_tasks
+                        ],
+                        return_exceptions=True
+                    )
+                else:
+                    results = await _translate_planned(translation_tasks, date_str, cache, client, model_name, config)
+            finally:
+                await _close_async_client(client)
 
         for (source_name, _), result in zip(translation_tasks, results):
             section = {
                 "id": str(section_id),
                 "name": source_name,
-                "priority": "P0" if "Sức khỏe" in source_name else "P2",
+                "priority": registry.priority_of(source_name),
                 "items": [],
             }
 
@@ -424,6 +1069,7 @@ async def translate_all_sources_parallel(
 
             section_id += 1
 
+    _finish_translation_stage(cache)
     logger.info(f"비동기 병렬 번역 완료: {len(translated_sections)}개 섹션")
     return translated_sections
 
@@ -471,7 +1117,13 @@ def save_translated_yaml(
     return True
 
 
-def translate_and_save(scraped_data: Dict, date_str: str, output_path: str) -> bool:
+def translate_and_save(
+    scraped_data: Dict,
+    date_str: str,
+    output_path: str,
+    registry: Optional[SourceRegistry] = None,
+    config: Optional[TranslatorConfig] = None,
+) -> bool:
     """
     모든 스크래핑 데이터를 번역 및 번역된 YAML 저장
 
@@ -479,6 +1131,8 @@ def translate_and_save(scraped_data: Dict, date_str: str, output_path: str) -> b
         scraped_data: 스크래핑된 원본 데이터
         date_str: 기준일 표시용
         output_path: 출력 파일 경로
+        registry: 소스 레지스트리 (None이면 config.yaml에서 로드)
+        config: 번역 설정 (None이면 config.yaml에서 로드, 번역 캐시 설정)
 
     Returns:
         성공 여부
@@ -489,18 +1143,13 @@ def translate_and_save(scraped_data: Dict, date_str: str, output_path: str) -> b
     section_id = 1
 
     # 우선순위별 순서: 안전 및 기상(P0) → 건강(P0) → 정부(P1) → 로컬(P2)
-    source_order = [
-        "안전 및 기상 관제",
-        "Sức khỏe & Đời sống",
-        "Nhân Dân",
-        "Tuổi Trẻ",
-        "VietnamNet",
-        "VnExpress",
-        "Thanh Niên",
-        "The Saigon Times",
-        "VietnamNet 정보통신",
-        "VnExpress IT/과학",
-    ]
+    if registry is None:
+        registry = get_registry()
+    source_order = [SAFETY_SECTION] + registry.translation_order()
+    if config is None:
+        config = TranslatorConfig.from_yaml()
+    configure_llm_scheduler(config)
+    cache = open_translation_cache(config)
 
     # 순서대로 처리
     for source_name in source_order:
@@ -510,58 +1159,11 @@ def translate_and_save(scraped_data: Dict, date_str: str, output_path: str) -> b
         articles = scraped_data[source_name]
 
         # 안전 및 기상 관제 (이미 스크래핑된 데이터 번역)
-        if source_name == "안전 및 기상 관제":
+        if source_name == SAFETY_SECTION:
             section = {"id": str(section_id), "name": source_name, "priority": "P0", "items": []}
 
             # 스크래핑된 안전 데이터를 그대로 사용 (이미 베트남어/한국어 혼합)
-            for item in articles:
-                # 플레이스홀더인 경우 그대로 사용
-                if item.get("name") == "플레이스홀더":
-                    section["items"].append(
-                        {
-                            "title": "안전 및 기상 관제",
-                            "content": item["content"],
-                            "url": item["url"],
-                        }
-                    )
-                else:
-                    # 기상/공기질/지진 데이터 처리
-                    if item.get("name") == "기상":
-                        # 기상 상태 번역
-                        condition = item.get("condition", "")
-                        translated_condition = translate_weather_condition(condition)
-
-                        # 온도/습도 포맷팅
-                        temp = item.get("temp", "")
-                        humidity = item.get("humidity", "")
-
-                        content = (
-                            f"{translated_condition}, 온도 {temp}, 습도 {humidity}"
-                        )
-
-                        section["items"].append(
-                            {
-                                "title": f"기상 (NCHMF)",
-                                "content": content,
-                                "url": item["url"],
-                            }
-                        )
-                    elif item.get("name") == "공기":
-                        section["items"].append(
-                            {
-                                "title": f"공기질 (IQAir) - AQI {item.get('aqi', '')}",
-                                "content": item["content"],
-                                "url": item["url"],
-                            }
-                        )
-                    elif item.get("name") == "지진":
-                        section["items"].append(
-                            {
-                                "title": item["title"],
-                                "content": item["content"],
-                                "url": item["url"],
-                            }
-                        )
+            section["items"] = build_safety_items(articles, include_placeholder=True)
 
             if section["items"]:
                 translated_sections.append(section)
@@ -574,14 +1176,14 @@ def translate_and_save(scraped_data: Dict, date_str: str, output_path: str) -> b
             section = {
                 "id": str(section_id),
                 "name": source_name,
-                "priority": "P0" if "Sức khỏe" in source_name else "P2",
+                "priority": registry.priority_of(source_name),
                 "items": [],
             }
 
             # 번역
             try:
                 translated_items = translate_articles(
-                    articles, source_name, date_str, len(articles)
+                    articles, source_name, date_str, len(articles), cache=cache
                 )
             except TranslationError:
                 translated_items = None
@@ -605,6 +1207,8 @@ def translate_and_save(scraped_data: Dict, date_str: str, output_path: str) -> b
 
             section_id += 1
 
+    _finish_translation_stage(cache)
+
     if not translated_sections:
         logger.error("번역된 뉴스가 전혀 없습니다.")
         return False
@@ -11,6 +11,7 @@ from googleapiclient.http import MediaFileUpload
 from today_vn_news.logger import logger
 from today_vn_news.exceptions import UploadError
 from today_vn_news.config import YOUTUBE_PLAYLIST_ID
+from today_vn_news.retry import RETRYABLE_EXCEPTIONS, RetryPolicy
 
 """
 YouTube 업로드 모듈 (YouTube Data API v3 Wrapper)
@@ -28,6 +29,15 @@ SCOPES = [
 # 기본 재생 목록 ID (오늘의 베트남 뉴스)
 DEFAULT_PLAYLIST_ID = YOUTUBE_PLAYLIST_ID
 
+# YouTube API 재시도 정책 (HttpError는 상태 코드로 분류, 재개 업로드는 마지막 청크부터 재시도)
+UPLOAD_RETRY = RetryPolicy(
+    max_attempts=5,
+    initial_delay=2.0,
+    max_delay=60.0,
+    retry_exceptions=RETRYABLE_EXCEPTIONS + (OSError,),
+    budget="upload",
+)
+
 def get_authenticated_service(data_dir: str = "data"):
     """
     OAuth2 인증을 통해 유튜브 API 서비스 객체 생성 및 반환
@@ -112,7 +122,7 @@ def add_video_to_playlist(youtube, video_id, playlist_id):
                 }
             }
         )
-        response = request.execute()
+        response = UPLOAD_RETRY.call(request.execute)
         logger.info(f"재생 목록 추가 완료! Item ID: {response.get('id')}")
         return True
     except Exception as e:
@@ -181,7 +191,7 @@ def upload_video(yymmdd: str, data_dir: str = "data", video_path: str = None):
     response = None
     try:
         while response is None:
-            status, response = request.next_chunk()
+            status, response = UPLOAD_RETRY.call(request.next_chunk)
             if status:
                 logger.info(f"업로드 진행 중: {int(status.progress() * 100)}%")
     except Exception as e: